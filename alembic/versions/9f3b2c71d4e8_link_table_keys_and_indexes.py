@@ -0,0 +1,83 @@
+"""link table keys and indexes
+
+Revision ID: 9f3b2c71d4e8
+Revises: 5c6a2cd73ad0
+Create Date: 2026-10-16 10:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f3b2c71d4e8'
+down_revision: Union[str, None] = '5c6a2cd73ad0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, key columns, reverse index)
+LINK_TABLES = (
+    ('album_tags', ('album_id', 'tag_id'), 'ix_album_tags_tag_id_album_id'),
+    ('album_atomic_tags', ('album_id', 'atomic_tag_id'), 'ix_album_atomic_tags_atomic_tag_id_album_id'),
+)
+
+ALBUM_INDEXES = ('release_year', 'country', 'genre')
+
+
+def table_exists(table_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+def index_exists_on_table(table_name, index_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx['name'] == index_name for idx in inspector.get_indexes(table_name))
+
+def primary_key_columns(table_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return tuple(inspector.get_pk_constraint(table_name).get('constrained_columns') or ())
+
+
+def upgrade() -> None:
+    for table, key, reverse_index in LINK_TABLES:
+        if not table_exists(table):
+            continue
+        if primary_key_columns(table) != key:
+            # Links without both ends and duplicate links cannot be keyed; keep one of each pair
+            first, second = key
+            op.execute(f"DELETE FROM {table} WHERE {first} IS NULL OR {second} IS NULL")
+            op.execute(
+                f"DELETE FROM {table} WHERE rowid NOT IN "
+                f"(SELECT MIN(rowid) FROM {table} GROUP BY {first}, {second})"
+            )
+            with op.batch_alter_table(table, recreate='always') as batch_op:
+                for column in key:
+                    batch_op.alter_column(column, existing_type=sa.String(), nullable=False)
+                batch_op.create_primary_key(f'pk_{table}', list(key))
+        if not index_exists_on_table(table, reverse_index):
+            op.create_index(reverse_index, table, [key[1], key[0]])
+
+    for column in ALBUM_INDEXES:
+        if not index_exists_on_table('albums', f'ix_albums_{column}'):
+            op.create_index(f'ix_albums_{column}', 'albums', [column])
+
+
+def downgrade() -> None:
+    for column in ALBUM_INDEXES:
+        if index_exists_on_table('albums', f'ix_albums_{column}'):
+            op.drop_index(f'ix_albums_{column}', table_name='albums')
+
+    for table, key, reverse_index in LINK_TABLES:
+        if not table_exists(table):
+            continue
+        if index_exists_on_table(table, reverse_index):
+            op.drop_index(reverse_index, table_name=table)
+        if primary_key_columns(table) == key:
+            with op.batch_alter_table(table, recreate='always') as batch_op:
+                batch_op.drop_constraint(f'pk_{table}', type_='primary')
+                for column in key:
+                    batch_op.alter_column(column, existing_type=sa.String(), nullable=True)
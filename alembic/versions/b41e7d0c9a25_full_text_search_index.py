@@ -0,0 +1,74 @@
+"""full text search index
+
+Revision ID: b41e7d0c9a25
+Revises: 9f3b2c71d4e8
+Create Date: 2026-10-16 14:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e7d0c9a25'
+down_revision: Union[str, None] = '9f3b2c71d4e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ALBUM_COLUMNS = ('title', 'pa_artist_name_on_album', 'genre', 'raw_tags')
+TOKENIZER = "unicode61 remove_diacritics 2"
+
+
+def table_exists(table_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+def columns_exist_on_table(table_name, column_names):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return set(column_names) <= {col['name'] for col in inspector.get_columns(table_name)}
+
+
+def upgrade() -> None:
+    columns = ", ".join(ALBUM_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in ALBUM_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in ALBUM_COLUMNS)
+
+    # An index is only created over a content table that exists with the indexed columns;
+    # search.create_search_index adds it later, when create_all has brought the table up to date
+    if table_exists('albums') and columns_exist_on_table('albums', ALBUM_COLUMNS):
+        op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS albums_fts USING fts5({columns}, "
+                   f"content='albums', content_rowid='rowid', tokenize='{TOKENIZER}')")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS albums_fts_insert AFTER INSERT ON albums BEGIN "
+                   f"INSERT INTO albums_fts(rowid, {columns}) VALUES (new.rowid, {new_values}); END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS albums_fts_delete AFTER DELETE ON albums BEGIN "
+                   f"INSERT INTO albums_fts(albums_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values}); END")
+        op.execute(f"CREATE TRIGGER IF NOT EXISTS albums_fts_update AFTER UPDATE OF {columns} ON albums BEGIN "
+                   f"INSERT INTO albums_fts(albums_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values}); "
+                   f"INSERT INTO albums_fts(rowid, {columns}) VALUES (new.rowid, {new_values}); END")
+        # Index the rows already in the database
+        op.execute("INSERT INTO albums_fts(albums_fts) VALUES ('rebuild')")
+
+    if table_exists('reviews') and columns_exist_on_table('reviews', ('review_text',)):
+        op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(review_text, "
+                   f"content='reviews', content_rowid='rowid', tokenize='{TOKENIZER}')")
+        op.execute("CREATE TRIGGER IF NOT EXISTS reviews_fts_insert AFTER INSERT ON reviews BEGIN "
+                   "INSERT INTO reviews_fts(rowid, review_text) VALUES (new.rowid, new.review_text); END")
+        op.execute("CREATE TRIGGER IF NOT EXISTS reviews_fts_delete AFTER DELETE ON reviews BEGIN "
+                   "INSERT INTO reviews_fts(reviews_fts, rowid, review_text) "
+                   "VALUES ('delete', old.rowid, old.review_text); END")
+        op.execute("CREATE TRIGGER IF NOT EXISTS reviews_fts_update AFTER UPDATE OF review_text ON reviews BEGIN "
+                   "INSERT INTO reviews_fts(reviews_fts, rowid, review_text) "
+                   "VALUES ('delete', old.rowid, old.review_text); "
+                   "INSERT INTO reviews_fts(rowid, review_text) VALUES (new.rowid, new.review_text); END")
+        op.execute("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    for table in ('albums', 'reviews'):
+        for trigger in ('insert', 'delete', 'update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{trigger}")
+        op.execute(f"DROP TABLE IF EXISTS {table}_fts")
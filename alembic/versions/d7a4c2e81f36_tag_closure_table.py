@@ -0,0 +1,74 @@
+"""tag closure table
+
+Revision ID: d7a4c2e81f36
+Revises: b41e7d0c9a25
+Create Date: 2026-10-16 16:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a4c2e81f36'
+down_revision: Union[str, None] = 'b41e7d0c9a25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEX_NAME = 'ix_tag_closure_descendant_id_ancestor_id'
+
+
+def table_exists(table_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+def index_exists_on_table(table_name, index_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx['name'] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    if not table_exists('tag_closure'):
+        op.create_table('tag_closure',
+        sa.Column('ancestor_id', sa.String(), nullable=False),
+        sa.Column('descendant_id', sa.String(), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['tags.id'], ),
+        sa.ForeignKeyConstraint(['descendant_id'], ['tags.id'], ),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id')
+        )
+    if not index_exists_on_table('tag_closure', INDEX_NAME):
+        op.create_index(INDEX_NAME, 'tag_closure', ['descendant_id', 'ancestor_id'])
+
+    # A closure already filled by create_all is kept
+    if op.get_bind().execute(sa.text("SELECT 1 FROM tag_closure LIMIT 1")).first() is not None:
+        return
+
+    # Every (ancestor, descendant) pair of the existing hierarchy at its shortest depth;
+    # the depth bound stops the walk on a cyclic hierarchy
+    op.execute("""
+        WITH RECURSIVE walk(ancestor_id, descendant_id, depth) AS (
+            SELECT parent_id, child_id, 1 FROM tag_hierarchy
+            WHERE parent_id IS NOT NULL AND child_id IS NOT NULL AND parent_id != child_id
+            UNION
+            SELECT walk.ancestor_id, tag_hierarchy.child_id, walk.depth + 1
+            FROM walk JOIN tag_hierarchy ON tag_hierarchy.parent_id = walk.descendant_id
+            WHERE walk.depth < 64
+        )
+        INSERT INTO tag_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, MIN(depth) FROM walk
+        WHERE ancestor_id != descendant_id
+        GROUP BY ancestor_id, descendant_id
+    """)
+
+
+def downgrade() -> None:
+    if table_exists('tag_closure'):
+        if index_exists_on_table('tag_closure', INDEX_NAME):
+            op.drop_index(INDEX_NAME, table_name='tag_closure')
+        op.drop_table('tag_closure')
@@ -0,0 +1,42 @@
+"""tag decomposition index
+
+Revision ID: e2c8f5a1b7d3
+Revises: d7a4c2e81f36
+Create Date: 2026-10-16 18:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c8f5a1b7d3'
+down_revision: Union[str, None] = 'd7a4c2e81f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = 'ix_tag_decompositions_composite_tag_id'
+
+
+def table_exists(table_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+def index_exists_on_table(table_name, index_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx['name'] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    # Atomic links are derived by joining album_tags to the decompositions of each tag
+    if table_exists('tag_decompositions') and not index_exists_on_table('tag_decompositions', INDEX_NAME):
+        op.create_index(INDEX_NAME, 'tag_decompositions', ['composite_tag_id'])
+
+
+def downgrade() -> None:
+    if table_exists('tag_decompositions') and index_exists_on_table('tag_decompositions', INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name='tag_decompositions')
@@ -0,0 +1,91 @@
+"""source manifest and album source paths
+
+Revision ID: f4b9d2e6a813
+Revises: e2c8f5a1b7d3
+Create Date: 2026-10-16 18:40:00.000000
+
+"""
+from collections import defaultdict
+from pathlib import PurePath
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b9d2e6a813'
+down_revision: Union[str, None] = 'e2c8f5a1b7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Album columns naming the CSV an album was ingested from, each indexed
+SOURCE_COLUMNS = ('source_file', 'source_path')
+
+
+def table_exists(table_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+def column_exists_on_table(table_name, column_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(col['name'] == column_name for col in inspector.get_columns(table_name))
+
+def index_exists_on_table(table_name, index_name):
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(idx['name'] == index_name for idx in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    # Source manifest of the persistent database
+    if not table_exists('source_files'):
+        op.create_table('source_files',
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('mtime_ns', sa.Integer(), nullable=False),
+        sa.Column('content_hash', sa.String(), nullable=False),
+        sa.Column('album_count', sa.Integer(), nullable=True),
+        sa.Column('ingested_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('path')
+        )
+    if not table_exists('excluded_source_files'):
+        op.create_table('excluded_source_files',
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('excluded_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('path')
+        )
+
+    # Albums keep the file name, for the release year, and the resolved path the manifest is keyed by
+    for column in SOURCE_COLUMNS:
+        if not column_exists_on_table('albums', column):
+            op.add_column('albums', sa.Column(column, sa.String(), nullable=True))
+        if not index_exists_on_table('albums', f'ix_albums_{column}'):
+            op.create_index(f'ix_albums_{column}', 'albums', [column])
+
+    # Existing albums only know their file name; a name the manifest holds once maps back to its path
+    conn = op.get_bind()
+    by_name = defaultdict(list)
+    for (path,) in conn.execute(sa.text("SELECT path FROM source_files")):
+        by_name[PurePath(path).name].append(path)
+    for name, paths in by_name.items():
+        if len(paths) == 1:
+            conn.execute(
+                sa.text("UPDATE albums SET source_path = :path WHERE source_file = :name AND source_path IS NULL"),
+                {'path': paths[0], 'name': name}
+            )
+
+
+def downgrade() -> None:
+    for column in reversed(SOURCE_COLUMNS):
+        if index_exists_on_table('albums', f'ix_albums_{column}'):
+            op.drop_index(f'ix_albums_{column}', table_name='albums')
+        if column_exists_on_table('albums', column):
+            with op.batch_alter_table('albums') as batch_op:
+                batch_op.drop_column(column)
+    if table_exists('excluded_source_files'):
+        op.drop_table('excluded_source_files')
+    if table_exists('source_files'):
+        op.drop_table('source_files')
@@ -29,7 +29,7 @@ def export_tags(output_dir, use_enhanced, max_count, min_count):
     output_path.mkdir(exist_ok=True, parents=True)
     
     session = get_session()
-    normalizer = TagNormalizer()
+    normalizer = TagNormalizer(persistent_cache=True)
     
     # Get all tags with their usage counts
     tag_stats = (
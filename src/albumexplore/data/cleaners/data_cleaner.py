@@ -4,6 +4,9 @@ import pycountry
 import logging
 from datetime import datetime
 
+# Bump when cleaning output changes so cached parse snapshots are rebuilt
+CLEANER_VERSION = "1"
+
 class DataCleaner:
 	"""Handles data cleaning and standardization for album data."""
 	
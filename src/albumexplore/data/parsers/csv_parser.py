@@ -1,19 +1,78 @@
 """CSV parsing module."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Union, List, Tuple
+from typing import Union, List, Tuple, Optional, Iterable, Iterator
 import pandas as pd
 import logging
 from datetime import datetime
 from ..cleaners.data_cleaner import DataCleaner
+from .snapshot_cache import ParsedCSVCache, SNAPSHOT_VERSION
 
 logger = logging.getLogger("albumexplore.database")
 
+
+def _parse_file(file_path: Path, snapshot_dir: Optional[Path], snapshot_version: str) -> pd.DataFrame:
+    """Parse one file in a worker process; the snapshot is written from there."""
+    cache = ParsedCSVCache(snapshot_dir, snapshot_version) if snapshot_dir is not None else None
+    return CSVParser(file_path, cache).parse_single_csv(file_path)
+
+
+def iter_parsed_csv(file_paths: Iterable[Union[str, Path]], workers: int = 1,
+                    snapshot_cache: Optional[ParsedCSVCache] = None
+                    ) -> Iterator[Tuple[Path, Optional[pd.DataFrame], Optional[Exception]]]:
+    """Yield (path, DataFrame, error) for each file, in input order.
+
+    With workers > 1, files without a snapshot are parsed in a process pool
+    while earlier results are consumed; snapshot hits are read in this
+    process. Closing the generator early cancels files not yet started.
+
+    Workers are spawned rather than forked: callers such as the data loader
+    run this from a thread of a multithreaded Qt process, where a fork can
+    deadlock on locks held by other threads.
+    """
+    files = [Path(p) for p in file_paths]
+    misses = [p for p in files if snapshot_cache is None or not snapshot_cache.contains(p)]
+    executor = None
+    futures = {}
+    if workers > 1 and len(misses) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(misses)),
+                                       mp_context=multiprocessing.get_context("spawn"))
+        snapshot_dir = snapshot_cache.cache_dir if snapshot_cache is not None else None
+        version = snapshot_cache.version if snapshot_cache is not None else SNAPSHOT_VERSION
+        futures = {p: executor.submit(_parse_file, p, snapshot_dir, version) for p in misses}
+
+    try:
+        for file_path in files:
+            try:
+                future = futures.get(file_path)
+                if future is not None:
+                    df = future.result()
+                else:
+                    df = CSVParser(file_path, snapshot_cache).parse_single_csv(file_path)
+            except Exception as e:
+                yield file_path, None, e
+                continue
+            yield file_path, df, None
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 class CSVParser:
     """Parser for album CSV/TSV files."""
     
-    def __init__(self, path: Union[str, Path]):
-        """Initialize parser with file or directory path."""
+    def __init__(self, path: Union[str, Path], snapshot_cache: Optional[ParsedCSVCache] = None,
+                 workers: int = 1):
+        """Initialize parser with file or directory path.
+
+        With a snapshot cache, parse_single_csv reuses the cleaned DataFrame of
+        files that have not changed since they were last parsed. With workers > 1,
+        parse_multiple_csv parses the files of a directory in worker processes.
+        """
         self.file_path = Path(path)  # Use file_path consistently
+        self.snapshot_cache = snapshot_cache
+        self.workers = workers
         self._data = None
         self._delimiter = None  # Will be set during parsing
         self.data_cleaner = DataCleaner()
@@ -114,6 +173,20 @@ class CSVParser:
 
     def parse_single_csv(self, file_path: Path) -> pd.DataFrame:
         """Parse a single CSV/TSV file and return a cleaned DataFrame."""
+        if self.snapshot_cache is None:
+            return self._parse_single_csv(file_path)
+
+        df = self.snapshot_cache.get(file_path)
+        if df is not None:
+            logger.debug(f"Loaded {len(df)} rows for {file_path} from snapshot")
+            return df
+        df = self._parse_single_csv(file_path)
+        # Empty results are also what a failed parse returns, so they are not stored
+        if not df.empty:
+            self.snapshot_cache.put(file_path, df)
+        return df
+
+    def _parse_single_csv(self, file_path: Path) -> pd.DataFrame:
         logger.debug(f"Parsing file: {file_path}")
         try:
             # Try to determine delimiter from extension
@@ -185,10 +258,12 @@ class CSVParser:
                 logger.warning("No CSV files found")
                 return pd.DataFrame(columns=self.column_names)
             
-            # Parse each file
-            for file_path in csv_files:
+            # Parse each file; results arrive in file order so dedupe keeps the first-seen row
+            for file_path, df, error in iter_parsed_csv(csv_files, self.workers, self.snapshot_cache):
                 logger.debug(f"Processing file: {file_path}")
-                df = self.parse_single_csv(file_path)
+                if error is not None:
+                    logger.error(f"Error parsing {file_path}: {error}")
+                    continue
                 if not df.empty:
                     df['_source_file'] = file_path.name
                     all_dfs.append(df)
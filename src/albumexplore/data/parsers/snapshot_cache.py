@@ -0,0 +1,115 @@
+"""Columnar snapshots of parsed CSV files.
+
+Parsing a yearly CSV means detecting the header row, trying several
+encodings and running the DataCleaner over every row. The cleaned
+DataFrame of each file is stored as a Parquet snapshot so reopening the
+same files only reads the snapshots back.
+
+A snapshot is named after the resolved source path and a fingerprint of
+the source's mtime and size plus the parser version, so an edited file or
+a parser/cleaner change simply misses. Writing a new snapshot removes the
+older ones for the same source. Snapshots are written to a temporary file
+and renamed into place, so concurrent readers never see a partial file.
+They live in ``csv_snapshots`` under the per-user cache directory, or
+under ``ALBUMEXPLORE_CACHE_DIR`` when that is set.
+"""
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..cleaners.data_cleaner import CLEANER_VERSION
+from albumexplore.utils.paths import get_cache_dir
+
+logger = logging.getLogger("albumexplore.database")
+
+# Bump when parse_single_csv output changes so cached snapshots are rebuilt
+PARSER_VERSION = "1"
+SNAPSHOT_VERSION = f"{PARSER_VERSION}.{CLEANER_VERSION}"
+
+
+def default_cache_dir() -> Path:
+    """Snapshot directory under ALBUMEXPLORE_CACHE_DIR, else under the per-user cache directory."""
+    return get_cache_dir() / 'csv_snapshots'
+
+
+class ParsedCSVCache:
+    """Directory of Parquet snapshots of cleaned per-file DataFrames."""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, version: str = SNAPSHOT_VERSION):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+    def _source_key(self, path: Path) -> str:
+        return hashlib.sha256(str(path.resolve()).encode('utf-8')).hexdigest()[:32]
+
+    def snapshot_path(self, path: Union[str, Path]) -> Optional[Path]:
+        """Snapshot location for the current state of ``path``, or None if it is missing."""
+        path = Path(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        fingerprint = f"{st.st_mtime_ns}\0{st.st_size}\0{self.version}"
+        digest = hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{self._source_key(path)}-{digest}.parquet"
+
+    def contains(self, path: Union[str, Path]) -> bool:
+        snapshot = self.snapshot_path(path)
+        return snapshot is not None and snapshot.exists()
+
+    def get(self, path: Union[str, Path]) -> Optional[pd.DataFrame]:
+        snapshot = self.snapshot_path(path)
+        if snapshot is None or not snapshot.exists():
+            self.misses += 1
+            return None
+        try:
+            df = pd.read_parquet(snapshot)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable snapshot {snapshot.name}: {e}")
+            snapshot.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._restore_lists(df)
+
+    def put(self, path: Union[str, Path], df: pd.DataFrame) -> bool:
+        """Store a snapshot of ``df`` for ``path``; returns False if it could not be written."""
+        snapshot = self.snapshot_path(path)
+        if snapshot is None:
+            return False
+        tmp = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp)
+            os.replace(tmp, snapshot)
+        except Exception as e:
+            # Columns with mixed types cannot always be stored; the file is just parsed again
+            logger.debug(f"Could not snapshot {Path(path).name}: {e}")
+            tmp.unlink(missing_ok=True)
+            return False
+        for stale in self.cache_dir.glob(f"{self._source_key(Path(path))}-*.parquet"):
+            if stale != snapshot:
+                stale.unlink(missing_ok=True)
+        return True
+
+    def clear(self) -> None:
+        for snapshot in self.cache_dir.glob('*.parquet'):
+            snapshot.unlink(missing_ok=True)
+
+    @staticmethod
+    def _restore_lists(df: pd.DataFrame) -> pd.DataFrame:
+        # Parquet list columns come back as NumPy arrays; the parsers produce lists
+        for col in df.columns:
+            if df[col].dtype != object:
+                continue
+            values = df[col].dropna()
+            if len(values) and isinstance(values.iloc[0], np.ndarray):
+                df[col] = [v.tolist() if isinstance(v, np.ndarray) else v for v in df[col]]
+        return df
@@ -1,31 +1,82 @@
 """Database initialization and configuration."""
 import os
-from contextlib import contextmanager
+import sqlite3
+from contextlib import closing, contextmanager
 from typing import Iterator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from albumexplore.database.models import Base
+from albumexplore.database import search  # Creates the full-text index along with the tables
+from albumexplore.database import tag_closure  # Fills the tag closure of older databases
+from albumexplore.database import change_tracking  # Versions tables on every write, for the caches
+from albumexplore.database import source_manifest  # Adds source paths to the albums of older databases
 from albumexplore.gui.gui_logging import db_logger
 
 _engine = None
 _SessionFactory = None
 _TestSessionFactory = None
 
-def init_db(database_url: str = None) -> None:
-    """Initialize database connection."""
+# Connection settings for SQLite databases: WAL lets readers run during an
+# ingest, NORMAL sync is safe under WAL, and reads go through a 256 MB
+# memory map and a 64 MB page cache
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("mmap_size", 256 * 1024 * 1024),
+    ("cache_size", -64 * 1024),
+)
+
+def configure_sqlite(engine: Engine) -> Engine:
+    """Apply SQLITE_PRAGMAS to every new connection of a SQLite engine."""
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in SQLITE_PRAGMAS:
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+    return engine
+
+def _has_manifest(db_path: str) -> bool:
+    """Whether a SQLite file has the source manifest table."""
+    try:
+        with closing(sqlite3.connect(db_path)) as conn:
+            return conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'source_files'"
+            ).fetchone() is not None
+    except sqlite3.Error:
+        return False
+
+def init_db(database_url: str = None, persistent: bool = True) -> None:
+    """Initialize database connection.
+
+    Without a URL the SQLite file in the project root is used. In persistent
+    mode it is kept between runs and only the files missing from its source
+    manifest are ingested (see source_manifest); otherwise it is deleted for
+    a clean start. A file without a manifest was written by the clean-start
+    mode and is deleted too.
+    """
     global _engine, _SessionFactory
     
     if not database_url:
         # Default to SQLite database in project root instead of src folder
         db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'albumexplore.db')
         
-        # Delete existing database file for a clean start
-        if os.path.exists(db_path):
+        if os.path.exists(db_path) and (not persistent or not _has_manifest(db_path)):
             try:
                 os.remove(db_path)
+                # A WAL left behind would be replayed into the new database
+                for suffix in ("-wal", "-shm"):
+                    if os.path.exists(db_path + suffix):
+                        os.remove(db_path + suffix)
                 db_logger.info(f"Removed existing database at {db_path}")
             except OSError as e:
                 db_logger.error(f"Error removing database file {db_path}: {e}")
+        elif os.path.exists(db_path):
+            db_logger.info(f"Reusing existing database at {db_path}")
 
         database_url = f"sqlite:///{db_path}"
     
@@ -40,6 +91,7 @@ def init_db(database_url: str = None) -> None:
         },
         pool_pre_ping=True  # Enable automatic reconnection
     )
+    configure_sqlite(_engine)
     
     # Create all tables
     Base.metadata.create_all(_engine)
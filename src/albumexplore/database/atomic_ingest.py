@@ -0,0 +1,166 @@
+"""Atomic tag stage of bulk ingest.
+
+Each tag is decomposed into its atomic components once, when it is first
+seen: ``decompose_tags`` runs the normalizer over every distinct tag name
+that has no decomposition yet and bulk-inserts the ``AtomicTag`` and
+``TagDecomposition`` rows. ``link_atomic_tags`` then derives the
+``album_atomic_tags`` links from the ``album_tags`` links with one
+INSERT ... SELECT per batch of albums, so atomic queries and views read
+precomputed links instead of decomposing album tags in Python.
+
+The caller owns the transaction; nothing is committed here.
+"""
+import json
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import DateTime, and_, exists, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from .models import AtomicTag, Tag, TagDecomposition, album_atomic_tags, album_tags
+from albumexplore.gui.gui_logging import db_logger, performance_logger
+
+# Ids per INSERT ... SELECT, well below SQLite's bound parameter limit
+LINK_BATCH_SIZE = 500
+
+RULE_SOURCE = 'automatic'
+
+
+def _get_normalizer():
+    from albumexplore.tags.normalizer.tag_normalizer import get_shared_normalizer
+    return get_shared_normalizer()
+
+
+def decompose_tags(session: Session, normalizer=None) -> List[str]:
+    """
+    Decompose the tags that have not been decomposed yet.
+
+    Creates missing atomic tags, one decomposition row per component and
+    fills the tag's atomic columns. A tag without a decomposition rule
+    decomposes to its normalized self. Returns the ids of the tags
+    decomposed.
+    """
+    pending = session.execute(
+        select(Tag.id, Tag.name, Tag.normalized_name).where(Tag.last_atomic_update.is_(None))
+    ).all()
+    if not pending:
+        return []
+    normalizer = normalizer or _get_normalizer()
+    now = datetime.utcnow()
+
+    atomic_ids: Dict[str, str] = dict(session.execute(select(AtomicTag.name, AtomicTag.id)).all())
+    components_of: Dict[str, List[str]] = {}
+    new_atomic_tags = []
+    decompositions = []
+    tag_updates = []
+    for tag_id, name, normalized_name in pending:
+        key = normalized_name or name
+        components = components_of.get(key)
+        if components is None:
+            components = list(dict.fromkeys(c for c in normalizer.normalize_to_atomic(key) if c))
+            components_of[key] = components
+        ids = []
+        for component in components:
+            atomic_id = atomic_ids.get(component)
+            if atomic_id is None:
+                atomic_id = atomic_ids[component] = str(uuid.uuid4())
+                new_atomic_tags.append({
+                    'id': atomic_id,
+                    'name': component,
+                    'is_core': normalizer.validate_atomic_tag(component),
+                    'created_at': now
+                })
+            ids.append(atomic_id)
+            decompositions.append({
+                'composite_tag_id': tag_id,
+                'atomic_tag_id': atomic_id,
+                'rule_source': RULE_SOURCE,
+                'confidence': 1.0,
+                'created_at': now
+            })
+        tag_updates.append({
+            'id': tag_id,
+            'is_atomic': components == [key],
+            'is_composite': len(components) > 1,
+            'atomic_components': json.dumps(ids),
+            'decomposition_confidence': 1.0 if components else None,
+            'last_atomic_update': now
+        })
+
+    if new_atomic_tags:
+        session.execute(insert(AtomicTag), new_atomic_tags)
+    if decompositions:
+        session.execute(insert(TagDecomposition), decompositions)
+    session.execute(update(Tag), tag_updates)
+    db_logger.info(
+        f"Decomposed {len(pending)} tags ({len(components_of)} distinct names) into "
+        f"{len(decompositions)} components, {len(new_atomic_tags)} new atomic tags"
+    )
+    return [tag_id for tag_id, _, _ in pending]
+
+
+def _batches(ids: Sequence[str]) -> Iterable[Sequence[str]]:
+    for start in range(0, len(ids), LINK_BATCH_SIZE):
+        yield ids[start:start + LINK_BATCH_SIZE]
+
+
+def link_atomic_tags(session: Session, album_ids: Optional[Iterable[str]] = None,
+                     tag_ids: Iterable[str] = ()) -> int:
+    """
+    Derive the atomic links of albums from their tag links and decompositions.
+
+    Links the albums in ``album_ids`` (every album when None) and the
+    albums carrying any of ``tag_ids``. An atomic tag reached through
+    several of an album's tags is linked once, from the first of them.
+    Existing links are kept. Returns the number of links inserted.
+    """
+    now = literal(datetime.utcnow(), DateTime)
+    linked = exists().where(and_(
+        album_atomic_tags.c.album_id == album_tags.c.album_id,
+        album_atomic_tags.c.atomic_tag_id == TagDecomposition.atomic_tag_id
+    ))
+    derived = (
+        select(
+            album_tags.c.album_id,
+            TagDecomposition.atomic_tag_id,
+            func.min(album_tags.c.tag_id),
+            func.max(func.coalesce(TagDecomposition.confidence, 1.0)),
+            now
+        )
+        .join(TagDecomposition, TagDecomposition.composite_tag_id == album_tags.c.tag_id)
+        .where(~linked)
+        .group_by(album_tags.c.album_id, TagDecomposition.atomic_tag_id)
+    )
+    columns = ['album_id', 'atomic_tag_id', 'source_tag_id', 'confidence', 'created_at']
+
+    def run(query) -> int:
+        return session.execute(insert(album_atomic_tags).from_select(columns, query)).rowcount
+
+    if album_ids is None:
+        return run(derived)
+    inserted = 0
+    for batch in _batches(list(album_ids)):
+        inserted += run(derived.where(album_tags.c.album_id.in_(batch)))
+    for batch in _batches(list(tag_ids)):
+        inserted += run(derived.where(album_tags.c.tag_id.in_(batch)))
+    return inserted
+
+
+def build_atomic_tags(session: Session, album_ids: Optional[Iterable[str]] = None,
+                      normalizer=None) -> Dict[str, int]:
+    """
+    Decompose new tags and link the atomic tags of ``album_ids``.
+
+    With ``album_ids`` None every album is linked, which also fills the
+    atomic links of a database ingested before this stage existed. Albums
+    carrying a tag decomposed for the first time are linked either way.
+    """
+    start = datetime.now()
+    decomposed = decompose_tags(session, normalizer)
+    links = link_atomic_tags(session, album_ids, decomposed)
+    elapsed = (datetime.now() - start).total_seconds()
+    performance_logger.info(
+        f"[PERF] Atomic tags: {len(decomposed)} tags decomposed, {links} album links in {elapsed:.2f}s"
+    )
+    return {'tags': len(decomposed), 'links': links}
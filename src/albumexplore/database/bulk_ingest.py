@@ -0,0 +1,148 @@
+"""Set-based bulk ingest for album/tag data.
+
+The row-by-row loaders in ``csv_loader`` look up every tag with its own
+``SELECT`` and ``flush()``. ``BulkIngestBuffer`` instead preloads the tag
+dictionary once, collects albums, new tags and ``album_tags`` links in memory
+and writes them with executemany ``insert()`` batches. The caller owns the
+transaction, so several files can be flushed and committed together; a
+caller that rolls part of it back restores the buffer to a ``checkpoint()``
+taken before.
+"""
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from albumexplore.database.models import Album, Tag, album_tags
+from albumexplore.gui.gui_logging import db_logger, performance_logger
+
+
+def _get_performance_monitor():
+    """Return the global performance monitor if it is available."""
+    try:
+        from albumexplore.performance.performance_monitor import global_performance_monitor
+        return global_performance_monitor
+    except ImportError:
+        return None
+
+
+class BulkIngestBuffer:
+    """Collects albums and tag links and writes them in batches."""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.tag_ids: Dict[str, str] = {}
+        self._pending_albums: List[Dict[str, Any]] = []
+        self._pending_tags: List[Dict[str, Any]] = []
+        self._pending_links: List[Dict[str, str]] = []
+        self.totals = {'albums': 0, 'tags': 0, 'links': 0}
+        self._load_tag_dictionary()
+
+    def _load_tag_dictionary(self) -> None:
+        """Load the normalized-name -> tag id map in a single query."""
+        for tag_id, name, normalized_name in self.session.query(Tag.id, Tag.name, Tag.normalized_name):
+            key = normalized_name or name
+            # Keep the first tag seen for a name, like query(...).first() did
+            self.tag_ids.setdefault(key, tag_id)
+        db_logger.info(f"Bulk ingest: preloaded {len(self.tag_ids)} tags")
+
+    def get_or_create_tag_id(self, normalized_name: str) -> str:
+        """Return the id for a normalized tag name, queueing a new tag if needed."""
+        tag_id = self.tag_ids.get(normalized_name)
+        if tag_id is None:
+            tag_id = str(uuid.uuid4())
+            self.tag_ids[normalized_name] = tag_id
+            self._pending_tags.append({
+                'id': tag_id,
+                'name': normalized_name,
+                'normalized_name': normalized_name,
+                'is_canonical': 1
+            })
+        return tag_id
+
+    def add_album(self, album_values: Dict[str, Any], tag_names: Iterable[str]) -> str:
+        """Queue an album row and its tag links. Returns the album id."""
+        album_id = album_values.get('id') or str(uuid.uuid4())
+        album_values['id'] = album_id
+        self._pending_albums.append(album_values)
+
+        seen = set()
+        for name in tag_names:
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            self._pending_links.append({
+                'album_id': album_id,
+                'tag_id': self.get_or_create_tag_id(name)
+            })
+        return album_id
+
+    @property
+    def pending_albums(self) -> int:
+        return len(self._pending_albums)
+
+    def checkpoint(self) -> Tuple[Dict[str, str], int, int, int]:
+        """Capture the tag dictionary and queue lengths, for ``restore``."""
+        return dict(self.tag_ids), len(self._pending_albums), len(self._pending_tags), len(self._pending_links)
+
+    def restore(self, checkpoint: Tuple[Dict[str, str], int, int, int]) -> None:
+        """Drop the rows queued and the tag ids handed out since ``checkpoint``."""
+        tag_ids, albums, tags, links = checkpoint
+        self.tag_ids = dict(tag_ids)
+        del self._pending_albums[albums:]
+        del self._pending_tags[tags:]
+        del self._pending_links[links:]
+
+    def flush(self, label: Optional[str] = None) -> Dict[str, int]:
+        """Write all queued rows. Does not commit.
+
+        On failure the queue is dropped as well and the exception re-raised;
+        the caller rolls back what was written.
+        """
+        counts = {
+            'albums': len(self._pending_albums),
+            'tags': len(self._pending_tags),
+            'links': len(self._pending_links)
+        }
+        if not any(counts.values()):
+            return counts
+
+        monitor = _get_performance_monitor()
+        operation = f"Bulk Insert ({label})" if label else "Bulk Insert"
+        if monitor:
+            monitor.start_operation(operation)
+        start = datetime.now()
+
+        # Tags first so the link rows satisfy their foreign keys. The queue is
+        # emptied either way, so a failed batch is not retried by the next flush
+        try:
+            if self._pending_tags:
+                self.session.execute(insert(Tag), self._pending_tags)
+            if self._pending_albums:
+                self.session.execute(insert(Album), self._pending_albums)
+            if self._pending_links:
+                self.session.execute(insert(album_tags), self._pending_links)
+        except Exception:
+            # The caller rolls these inserts back; their tags must not be reused
+            for tag in self._pending_tags:
+                if self.tag_ids.get(tag['normalized_name']) == tag['id']:
+                    del self.tag_ids[tag['normalized_name']]
+            raise
+        finally:
+            self._pending_albums = []
+            self._pending_tags = []
+            self._pending_links = []
+        for key, value in counts.items():
+            self.totals[key] += value
+
+        elapsed = (datetime.now() - start).total_seconds()
+        performance_logger.info(
+            f"[PERF] Bulk insert{f' for {label}' if label else ''}: "
+            f"{counts['albums']} albums, {counts['tags']} new tags, "
+            f"{counts['links']} links in {elapsed:.2f}s"
+        )
+        if monitor:
+            monitor.complete_operation(operation, counts['albums'])
+        return counts
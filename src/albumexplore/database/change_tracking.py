@@ -0,0 +1,76 @@
+"""Change detection for tables backing in-memory caches.
+
+Every INSERT, UPDATE or DELETE run through a SQLAlchemy engine in this
+process bumps a version of the table it writes, once per statement
+(executemany included), so edits in place and delete-then-reinsert are
+seen as well as plain inserts. The version is bumped again when the
+transaction commits or rolls back, so a cache built from another
+connection while the write was uncommitted is not reused afterwards.
+
+Per-row SQLite triggers would also catch writes from other processes, but
+they more than double the cost of the bulk loaders' inserts; those writes
+are still noticed through the row count and highest rowid, which the
+version key carries along.
+"""
+import itertools
+import re
+from typing import Dict, Tuple
+
+from sqlalchemy import Table, event, func, literal_column, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+# Target table of a write statement, whether compiled or plain SQL
+_WRITE_PATTERN = re.compile(
+    r'^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+["`\[]?(\w+)',
+    re.IGNORECASE
+)
+
+# Tick of the last write to each (engine, table); ticks only grow
+_ticks = itertools.count(1)
+_versions: Dict[Tuple[int, str], int] = {}
+
+
+def _bump(connection: Connection, tables) -> None:
+    engine_id = id(connection.engine)
+    for name in tables:
+        _versions[(engine_id, name)] = next(_ticks)
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _record_write(connection, cursor, statement, parameters, context, executemany):
+    match = _WRITE_PATTERN.match(statement)
+    if match:
+        name = match.group(1).lower()
+        connection.info.setdefault('changed_tables', set()).add(name)
+        _bump(connection, (name,))
+
+
+@event.listens_for(Engine, 'commit')
+@event.listens_for(Engine, 'rollback')
+def _record_transaction_end(connection):
+    changed = connection.info.pop('changed_tables', None)
+    if changed:
+        _bump(connection, changed)
+
+
+def table_version(bind, table: Table) -> int:
+    """Tick of the last write to ``table`` through ``bind`` in this process, 0 if none."""
+    return _versions.get((id(getattr(bind, 'engine', bind)), table.name.lower()), 0)
+
+
+def change_counter(session: Session, *tables: Table) -> Tuple[int, ...]:
+    """
+    Write version, row count and highest rowid of each table.
+
+    The key changes after any write to one of the tables through this
+    process, and after inserts or deletes made by other processes.
+    """
+    bind = session.get_bind()
+    key = []
+    for table in tables:
+        count, max_rowid = session.execute(
+            select(func.count(), func.max(literal_column('rowid'))).select_from(table)
+        ).one()
+        key.extend((table_version(bind, table), count, max_rowid or 0))
+    return tuple(key)
@@ -0,0 +1,108 @@
+"""Tag co-occurrence counts as a sparse tag x tag matrix.
+
+Links are grouped per album into a CSR album x tag matrix X; X^T X then
+holds, for every pair of tags, the number of albums carrying both. Results
+are cached per database and rebuilt when the link table changes.
+"""
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import Table, select
+from sqlalchemy.orm import Session
+
+from .change_tracking import change_counter
+from .models import album_atomic_tags, album_tags
+from albumexplore.gui.gui_logging import db_logger
+
+
+class CoOccurrenceMatrix:
+    """Symmetric tag x tag album counts; the diagonal is kept apart as tag frequencies."""
+
+    def __init__(self, links: Sequence[Tuple[str, str]]):
+        pairs = [(album_id, tag_id) for album_id, tag_id in links if album_id is not None and tag_id is not None]
+        if not pairs:
+            self.tag_ids = np.empty(0, dtype=object)
+            self.frequencies = np.empty(0, dtype=np.int64)
+            self.matrix = sparse.csr_matrix((0, 0), dtype=np.int64)
+            self._positions = {}
+            return
+        album_ids, rows = np.unique(np.array([p[0] for p in pairs], dtype=object), return_inverse=True)
+        self.tag_ids, cols = np.unique(np.array([p[1] for p in pairs], dtype=object), return_inverse=True)
+
+        albums_x_tags = sparse.csr_matrix(
+            (np.ones(len(pairs), dtype=np.int64), (rows, cols)), shape=(len(album_ids), len(self.tag_ids))
+        )
+        # A tag linked twice to one album counts once
+        albums_x_tags.sum_duplicates()
+        albums_x_tags.data[:] = 1
+
+        matrix = (albums_x_tags.T @ albums_x_tags).tocsr()
+        self.frequencies = matrix.diagonal()
+        matrix.setdiag(0)
+        matrix.eliminate_zeros()
+        self.matrix = matrix
+        self._positions = {tag_id: i for i, tag_id in enumerate(self.tag_ids)}
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+    def pairs(self, min_count: int = 1, tag_ids: Optional[Sequence[str]] = None) -> List[Tuple[str, str, int]]:
+        """(tag id, tag id, count) for each pair, first id lower, sorted by count descending."""
+        if tag_ids is None:
+            positions = np.arange(len(self.tag_ids))
+            matrix = self.matrix
+        else:
+            positions = np.unique([self._positions[t] for t in tag_ids if t in self._positions]).astype(np.intp)
+            matrix = self.matrix[positions][:, positions]
+        upper = sparse.triu(matrix, k=1).tocoo()
+        keep = upper.data >= min_count
+        rows, cols, counts = positions[upper.row[keep]], positions[upper.col[keep]], upper.data[keep]
+        # Stable on (row, col), which follows id order since tag ids are sorted
+        order = np.lexsort((cols, rows, -counts))
+        return [(self.tag_ids[rows[k]], self.tag_ids[cols[k]], int(counts[k])) for k in order]
+
+    def neighbours(self, tag_id: str) -> Dict[str, int]:
+        """Co-occurrence counts of one tag with every other tag."""
+        i = self._positions.get(tag_id)
+        if i is None:
+            return {}
+        row = slice(self.matrix.indptr[i], self.matrix.indptr[i + 1])
+        return {self.tag_ids[j]: int(c) for j, c in zip(self.matrix.indices[row], self.matrix.data[row])}
+
+    def top_tags(self, limit: int) -> List[str]:
+        """Most frequent tag ids, ties by id."""
+        order = np.lexsort((np.arange(len(self)), -self.frequencies))
+        return [self.tag_ids[i] for i in order[:limit]]
+
+
+_cache: Dict[Tuple[int, str], Tuple[Tuple[int, ...], CoOccurrenceMatrix]] = {}
+_cache_lock = threading.Lock()
+
+
+def _link_table(atomic: bool) -> Tuple[Table, str]:
+    if atomic:
+        return album_atomic_tags, 'atomic_tag_id'
+    return album_tags, 'tag_id'
+
+
+def get_co_occurrence(session: Session, atomic: bool = False) -> CoOccurrenceMatrix:
+    """Co-occurrence matrix of composite (or atomic) tags, cached until the link table changes."""
+    table, tag_column = _link_table(atomic)
+    key = (id(session.get_bind()), table.name)
+    version = change_counter(session, table)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        links = session.execute(select(table.c.album_id, table.c[tag_column])).all()
+        matrix = CoOccurrenceMatrix(links)
+        _cache[key] = (version, matrix)
+        db_logger.info(f"Built {table.name} co-occurrence matrix: {len(matrix)} tags, {matrix.matrix.nnz // 2} pairs")
+        return matrix
+
+
+def clear_co_occurrence_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -4,6 +4,7 @@ from typing import Dict, Any, Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from .models import Album, Tag, TagRelation
+from . import tag_closure
 from .db_utils import log_update
 from .update_manager import UpdateManager
 
@@ -135,7 +136,12 @@ def delete_tag(db: Session, tag_id: str) -> None:
         with db.begin():
             tag = db.query(Tag).filter(Tag.id == tag_id).first()
             if tag:
+                in_hierarchy = bool(tag.parent_tags or tag.child_tags)
                 db.delete(tag)
+                if in_hierarchy:
+                    # Deleting the tag removes its links; paths through it go from the closure
+                    db.flush()
+                    tag_closure.rebuild_tag_closure(db.connection())
                 UpdateManager(db).log_update('tag', tag_id, 'delete', {})
     except Exception as e:
         db.rollback()
@@ -146,8 +152,9 @@ def add_parent_tag(db: Session, child_id: str, parent_id: str) -> bool:
     try:
         child_tag = get_tag(db, child_id)
         parent_tag = get_tag(db, parent_id)
-        if child_tag and parent_tag:
+        if child_tag and parent_tag and not tag_closure.would_create_cycle(db, parent_id, child_id):
             child_tag.parent_tags.append(parent_tag)
+            tag_closure.add_edge(db, parent_id, child_id)
             UpdateManager(db).log_update('tag', child_id, 'update', {'added_parent': parent_id})
             db.commit()
             return True
@@ -163,6 +170,7 @@ def remove_parent_tag(db: Session, child_id: str, parent_id: str) -> bool:
         parent_tag = get_tag(db, parent_id)
         if child_tag and parent_tag and parent_tag in child_tag.parent_tags:
             child_tag.parent_tags.remove(parent_tag)
+            tag_closure.remove_edge(db, parent_id, child_id)
             UpdateManager(db).log_update('tag', child_id, 'update', {'removed_parent': parent_id})
             db.commit()
             return True
@@ -174,47 +182,13 @@ def remove_parent_tag(db: Session, child_id: str, parent_id: str) -> bool:
 def get_inherited_tags(db: Session, tag_id: str, depth: int = -1) -> List[Tag]:
     """Get all inherited tags up to specified depth (-1 for unlimited)."""
     try:
-        tag = get_tag(db, tag_id)
-        if not tag:
-            return []
-        
-        inherited = set()
-        to_process = [(tag, 0)]
-        
-        while to_process:
-            current_tag, current_depth = to_process.pop(0)
-            if depth != -1 and current_depth >= depth:
-                continue
-                
-            for parent in current_tag.parent_tags:
-                if parent.id not in inherited:
-                    inherited.add(parent.id)
-                    to_process.append((parent, current_depth + 1))
-        
-        return [get_tag(db, tag_id) for tag_id in inherited]
+        return tag_closure.ancestors(db, tag_id, None if depth == -1 else depth)
     except Exception as e:
         raise ValueError(f"Error getting inherited tags: {e}") from e
 
 def get_tag_children(db: Session, tag_id: str, depth: int = -1) -> List[Tag]:
     """Get all child tags up to specified depth (-1 for unlimited)."""
     try:
-        tag = get_tag(db, tag_id)
-        if not tag:
-            return []
-        
-        children = set()
-        to_process = [(tag, 0)]
-        
-        while to_process:
-            current_tag, current_depth = to_process.pop(0)
-            if depth != -1 and current_depth >= depth:
-                continue
-                
-            for child in current_tag.child_tags:
-                if child.id not in children:
-                    children.add(child.id)
-                    to_process.append((child, current_depth + 1))
-        
-        return [get_tag(db, tag_id) for tag_id in children]
+        return tag_closure.descendants(db, tag_id, None if depth == -1 else depth)
     except Exception as e:
         raise ValueError(f"Error getting tag children: {e}") from e
@@ -1,8 +1,9 @@
 """CSV data loader for album database."""
 import csv
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Set, List, Optional
+from typing import Any, Dict, Iterator, Set, List, Optional
 from datetime import datetime
 import re
 import uuid # Added import for uuid
@@ -12,12 +13,12 @@ from sqlalchemy.orm import Session
 
 from albumexplore.database import get_session
 from albumexplore.database.models import Album, Tag, TagCategory
+from albumexplore.database.bulk_ingest import BulkIngestBuffer, _get_performance_monitor
 from albumexplore.gui.gui_logging import db_logger
-from albumexplore.tags.normalizer.tag_normalizer import TagNormalizer
+from albumexplore.tags.normalizer.tag_normalizer import get_shared_normalizer
 from albumexplore.database.tag_validator import TagValidationFilter
 
-# Initialize advanced tag normalizer and validator
-_tag_normalizer = TagNormalizer()
+# Initialize advanced tag validator; the shared normalizer is created on first use
 _tag_validator = TagValidationFilter(strict_mode=False)  # Allow warnings but block errors
 
 # Regex to identify "Month Day" strings (e.g., "Jan 1", "Feb 23", "March 3")
@@ -179,7 +180,7 @@ def normalize_tag(tag: str) -> str:
     """Normalize tag string using advanced normalization system."""
     if not tag:
         return tag
-    return _tag_normalizer.normalize(tag)
+    return get_shared_normalizer().normalize(tag)
 
 def is_iso_date(val_str: str) -> bool:
     """Check if string is in ISO date format (YYYY-MM-DD)."""
@@ -213,8 +214,77 @@ def is_format_string(val_str: str) -> bool:
         
     return False
 
-def load_dataframe_data(df, session: Session):
-    """Load data from a pandas DataFrame into the database."""
+def _collect_album_tag_names(genre_and_tags_str: str, country_str: str,
+                             vocal_style_tags: List[str], context: Dict[str, str]) -> List[str]:
+    """Validate and normalize the genre, country and vocal style tags of one album.
+
+    Returns the unique normalized tag names in the order they should be linked.
+    """
+    tag_names: List[str] = []
+    seen: Set[str] = set()
+
+    if genre_and_tags_str:
+        # Split by commas and semicolons
+        raw_tags = [tag.strip() for tag in re.split(r'[;,]', str(genre_and_tags_str)) if tag.strip()]
+        valid_tags, rejected_tags, validation_info = _tag_validator.filter_tags(raw_tags, context)
+        if rejected_tags:
+            db_logger.warning(f"Rejected {len(rejected_tags)} invalid tags for {context.get('artist')} - {context.get('album')}: {rejected_tags}")
+        for validated_tag in valid_tags:
+            normalized_tag = normalize_tag(validated_tag)
+            if normalized_tag and normalized_tag not in seen:
+                seen.add(normalized_tag)
+                tag_names.append(normalized_tag)
+
+    if country_str:
+        countries = [c.strip() for c in re.split(r'[;,]', str(country_str)) if c.strip()]
+        for country_name in countries:
+            normalized_country = normalize_tag(country_name)
+            if normalized_country and normalized_country not in seen:
+                seen.add(normalized_country)
+                tag_names.append(normalized_country)
+
+    # Vocal style tags are already canonical
+    for vocal_style in vocal_style_tags:
+        if vocal_style not in seen:
+            seen.add(vocal_style)
+            tag_names.append(vocal_style)
+
+    return tag_names
+
+def _get_or_create_tag(session: Session, normalized_name: str) -> Tag:
+    """Fetch a tag by normalized name, creating it if it does not exist."""
+    existing_tag = session.query(Tag).filter(Tag.normalized_name == normalized_name).first()
+    if existing_tag:
+        return existing_tag
+
+    new_tag = Tag(
+        id=str(uuid.uuid4()),
+        name=normalized_name,  # Use normalized form as primary name
+        normalized_name=normalized_name,
+        is_canonical=1
+    )
+    session.add(new_tag)
+    session.flush()  # Flush so the next lookup finds it
+    return new_tag
+
+def _add_album(session: Session, album_values: Dict, tag_names: List[str],
+               bulk_buffer: Optional[BulkIngestBuffer] = None) -> str:
+    """Add an album and its tag links either through the ORM or the bulk buffer."""
+    if bulk_buffer is not None:
+        return bulk_buffer.add_album(album_values, tag_names)
+
+    album = Album(**album_values)
+    session.add(album)
+    for name in tag_names:
+        album.tags.append(_get_or_create_tag(session, name))
+    return album.id
+
+def load_dataframe_data(df, session: Session, bulk: bool = False):
+    """Load data from a pandas DataFrame into the database.
+
+    With ``bulk=True`` tags are resolved from a preloaded dictionary and albums,
+    tags and links are written with batched inserts instead of per-tag queries.
+    """
     db_logger.info(f"Loading data from DataFrame into database. Rows: {len(df)}")
     load_start_time = datetime.now()
 
@@ -234,6 +304,13 @@ def load_dataframe_data(df, session: Session):
         if not required_cols.issubset(df.columns):
             raise ValueError(f"DataFrame must contain 'artist' and 'album' columns. Found: {df.columns}")
 
+        # In bulk mode tags are resolved from an in-memory dictionary and all
+        # rows are written with executemany inserts before the single commit
+        bulk_buffer = BulkIngestBuffer(session) if bulk else None
+        perf_monitor = _get_performance_monitor()
+        if perf_monitor:
+            perf_monitor.start_operation("DataFrame Ingest")
+
         # Process each row in the DataFrame
         processed_count = 0
         for index, row in df.iterrows():
@@ -344,141 +421,43 @@ def load_dataframe_data(df, session: Session):
             if processed_count < 5:  # Only log first 5 rows to avoid spam
                 db_logger.info(f"Row {processed_count}: genre_and_tags_str='{genre_and_tags_str}', vocal_style_str='{vocal_style_str}', country_str='{country_str}'")
 
-            # Create Album object
-            album = Album(
-                id=str(uuid.uuid4()),
-                pa_artist_name_on_album=artist,
-                title=album_title,
-                release_date=release_date_obj,
-                release_year=release_year,
-                vocal_style=vocal_style_display or None,
-                genre=genre_and_tags_str,
-                country=country_str,
-                raw_tags=combined_raw_tags,
-                last_updated=datetime.now()
-            )
-            
-            session.add(album)
-            
-            # Handle tags and genres - similar to CSV processing logic
-            if genre_and_tags_str:
-                # Split by commas and semicolons
-                raw_tags = [tag.strip() for tag in re.split(r'[;,]', str(genre_and_tags_str)) if tag.strip()]
-                if processed_count < 5:  # Debug log for first few rows
-                    db_logger.info(f"Row {processed_count}: raw tags: {raw_tags}")
-                
-                # Validate tags first
-                context = {
-                    'artist': artist,
-                    'album': album_title,
-                    'source': 'dataframe_import'
-                }
-                valid_tags, rejected_tags, validation_info = _tag_validator.filter_tags(raw_tags, context)
-                
-                if rejected_tags:
-                    db_logger.warning(f"Rejected {len(rejected_tags)} invalid tags for {artist} - {album_title}: {rejected_tags}")
-                
-                if processed_count < 5:  # Debug log for first few rows
-                    db_logger.info(f"Row {processed_count}: validation - valid: {len(valid_tags)}, rejected: {len(rejected_tags)}")
-                
-                processed_tags = set()  # Use set to avoid duplicates after normalization
-                for validated_tag in valid_tags:
-                    normalized_tag = normalize_tag(validated_tag)
-                    if normalized_tag and normalized_tag not in processed_tags:
-                        processed_tags.add(normalized_tag)
-                        
-                        # Check if tag already exists (by normalized name)
-                        existing_tag = session.query(Tag).filter(Tag.normalized_name == normalized_tag).first()
-                        if not existing_tag:
-                            # Create a new tag with a unique ID
-                            tag_id = str(uuid.uuid4())
-                            category = _tag_normalizer.get_category(normalized_tag)
-                            new_tag = Tag(
-                                id=tag_id,
-                                name=normalized_tag,  # Use normalized form as primary name
-                                normalized_name=normalized_tag,
-                                is_canonical=1
-                            )
-                            session.add(new_tag)
-                            session.flush()  # Flush to get the tag ID
-                            # Add the relationship between album and tag
-                            album.tags.append(new_tag)
-                        else:
-                            # Use the existing tag
-                            album.tags.append(existing_tag)
-                    
-                if processed_count < 5:  # Debug log for first few rows
-                    db_logger.info(f"Row {processed_count}: final normalized tags: {list(processed_tags)}")
-            
-            # Handle country tags if available
-            if country_str:
-                countries = [c.strip() for c in re.split(r'[;,]', str(country_str)) if c.strip()]
-                processed_countries = set()  # Use set to avoid duplicates after normalization
-                for country_name in countries:
-                    normalized_country = normalize_tag(country_name)
-                    if normalized_country and normalized_country not in processed_countries:
-                        processed_countries.add(normalized_country)
-                        
-                        # Check if country tag already exists (by normalized name)
-                        existing_country_tag = session.query(Tag).filter(Tag.normalized_name == normalized_country).first()
-                        if not existing_country_tag:
-                            # Create a new country tag with a unique ID
-                            country_tag_id = str(uuid.uuid4())
-                            new_country_tag = Tag(
-                                id=country_tag_id,
-                                name=normalized_country,  # Use normalized form as primary name
-                                normalized_name=normalized_country,
-                                is_canonical=1
-                            )
-                            session.add(new_country_tag)
-                            session.flush()  # Flush to get the tag ID
-                            # Add the relationship between album and country tag
-                            album.tags.append(new_country_tag)
-                        else:
-                            # Use the existing country tag
-                            album.tags.append(existing_country_tag)
-            
-            # Handle vocal style tags if available
-            if vocal_style_tags:
-                processed_vocal_styles = set()
-
-                if processed_count < 5:
-                    db_logger.info(f"Row {processed_count}: vocal style tags: {vocal_style_tags}")
-
-                for normalized_vocal_style in vocal_style_tags:
-                    if normalized_vocal_style in processed_vocal_styles:
-                        continue
-
-                    processed_vocal_styles.add(normalized_vocal_style)
-
-                    existing_vocal_tag = session.query(Tag).filter(Tag.normalized_name == normalized_vocal_style).first()
-                    if not existing_vocal_tag:
-                        vocal_tag_id = str(uuid.uuid4())
-                        new_vocal_tag = Tag(
-                            id=vocal_tag_id,
-                            name=normalized_vocal_style,
-                            normalized_name=normalized_vocal_style,
-                            is_canonical=1
-                        )
-                        session.add(new_vocal_tag)
-                        session.flush()
-                        album.tags.append(new_vocal_tag)
-
-                        if processed_count < 5:
-                            db_logger.info(f"Row {processed_count}: created new vocal style tag '{normalized_vocal_style}' for {artist} - {album_title}")
-                    else:
-                        album.tags.append(existing_vocal_tag)
-
-                        if processed_count < 5:
-                            db_logger.info(f"Row {processed_count}: using existing vocal style tag '{normalized_vocal_style}' for {artist} - {album_title}")
+            # Collect validated, normalized genre/country/vocal style tags
+            context = {
+                'artist': artist,
+                'album': album_title,
+                'source': 'dataframe_import'
+            }
+            tag_names = _collect_album_tag_names(genre_and_tags_str, country_str, vocal_style_tags, context)
+            if processed_count < 5:  # Debug log for first few rows
+                db_logger.info(f"Row {processed_count}: final normalized tags: {tag_names}")
+
+            album_values = {
+                'id': str(uuid.uuid4()),
+                'pa_artist_name_on_album': artist,
+                'title': album_title,
+                'release_date': release_date_obj,
+                'release_year': release_year,
+                'vocal_style': vocal_style_display or None,
+                'genre': genre_and_tags_str,
+                'country': country_str,
+                'raw_tags': combined_raw_tags,
+                'source_file': row.get('_source_file') or None,
+                'source_path': row.get('_source_path') or None,
+                'last_updated': datetime.now()
+            }
+            _add_album(session, album_values, tag_names, bulk_buffer)
             
             # Add to existing albums set to handle duplicates within the dataframe
             existing_albums.add((artist, album_title))
             processed_count += 1
 
+        if bulk_buffer is not None:
+            bulk_buffer.flush(label="DataFrame")
         session.commit()
         load_end_time = datetime.now()
         processing_time = load_end_time - load_start_time
+        if perf_monitor:
+            perf_monitor.complete_operation("DataFrame Ingest", processed_count)
         
         # Consolidate any duplicate tags created during loading
         consolidate_duplicate_tags(session)
@@ -495,8 +474,28 @@ def load_dataframe_data(df, session: Session):
     finally:
         session.close()
 
-def load_csv_data(csv_dir: Path) -> None:
-    """Load data from CSV files into database."""
+@contextmanager
+def _file_savepoint(session: Session, bulk_buffer: Optional[BulkIngestBuffer] = None) -> Iterator[None]:
+    """Write one file inside a savepoint; a file that raises leaves nothing behind."""
+    checkpoint = bulk_buffer.checkpoint() if bulk_buffer is not None else None
+    savepoint = session.begin_nested()
+    try:
+        yield
+        savepoint.commit()
+    except Exception:
+        savepoint.rollback()
+        if bulk_buffer is not None:
+            bulk_buffer.restore(checkpoint)
+        raise
+
+def load_csv_data(csv_dir: Path, bulk: bool = False) -> None:
+    """Load data from CSV files into database.
+
+    With ``bulk=True`` the tag dictionary is loaded once, every file is written
+    with batched inserts and all files are committed in a single transaction.
+    Each file is written in its own savepoint, so a file that fails part-way
+    is left out entirely and the other files are still loaded.
+    """
     db_logger.info(f"Loading CSV data from {csv_dir}")
     
     # Check if CSV data has already been loaded to prevent duplicates
@@ -536,13 +535,22 @@ def load_csv_data(csv_dir: Path) -> None:
         csv_files = list(csv_dir.glob('*.csv'))
         db_logger.info(f"Found {len(csv_files)} CSV files to process")
         
+        bulk_buffer = BulkIngestBuffer(session) if bulk else None
+        perf_monitor = _get_performance_monitor()
+        
         for csv_file in csv_files:
             try:
                 year = extract_year(csv_file.name)
                 if year:
                     file_start_time = datetime.now()
                     db_logger.info(f"Processing {csv_file.name} for year {year}, started at {file_start_time.strftime('%H:%M:%S')}")
-                    _process_csv_file(csv_file, year, session)
+                    operation = f"CSV Ingest ({csv_file.name})"
+                    if perf_monitor:
+                        perf_monitor.start_operation(operation)
+                    with _file_savepoint(session, bulk_buffer):
+                        result = _process_csv_file(csv_file, year, session, bulk_buffer)
+                    if perf_monitor:
+                        perf_monitor.complete_operation(operation, result["processed"] if result else 0)
                     file_end_time = datetime.now()
                     file_processing_time = file_end_time - file_start_time
                     db_logger.info(f"Finished processing {csv_file.name} in {file_processing_time.total_seconds():.2f} seconds")
@@ -565,8 +573,15 @@ def load_csv_data(csv_dir: Path) -> None:
     finally:
         session.close()
 
-def _process_csv_file(csv_file: Path, year: int, session: Session) -> None:
-    """Process a single CSV file."""
+def _process_csv_file(csv_file: Path, year: int, session: Session,
+                      bulk_buffer: Optional[BulkIngestBuffer] = None) -> Optional[Dict[str, Any]]:
+    """Process a single CSV file.
+
+    When ``bulk_buffer`` is given, rows are queued on it and written with one
+    batch of inserts at the end of the file instead of per-row ORM operations.
+    Returns the file's row counts, timings and processed albums, or None when
+    its header cannot be read.
+    """
     debug_log_counts = {}
     MAX_DEBUG_LOGS_PER_TYPE = 10
     
@@ -862,136 +877,34 @@ def _process_csv_file(csv_file: Path, year: int, session: Session) -> None:
                     release_date_obj = datetime(year, 1, 1)  # January 1st of the year from the filename
                     db_logger.debug(f"Using default date {release_date_obj.strftime('%Y-%m-%d')} for {artist} - {album_title}")
                 
+                # Collect validated, normalized genre/country/vocal style tags
+                context = {
+                    'artist': artist,
+                    'album': album_title,
+                    'source': 'dataframe_import'
+                }
+                tag_names = _collect_album_tag_names(genre_and_tags_str, country_str, vocal_style_tags, context)
+                if processed_count < 5:  # Debug log for first few rows
+                    db_logger.info(f"Row {processed_count}: final normalized tags: {tag_names}")
+
                 # Generate a unique ID for the album
                 album_id = str(uuid.uuid4())
-                
-                # Create the album object
-                album = Album(
-                    id=album_id,
-                    title=album_title,
-                    pa_artist_name_on_album=artist,
-                    release_date=release_date_obj,
-                    release_year=release_date_obj.year,
-                    length=length_info if not format_info else length_info,
-                    vocal_style=vocal_style_display or None,
-                    genre=genre_and_tags_str,
-                    country=country_str,
-                    raw_tags=combined_raw_tags,
-                    last_updated=datetime.now()
-                )
-                session.add(album)
-                
-                # Handle tags and genres
-                if genre_and_tags_str:
-                    # Split by commas and semicolons
-                    raw_tags = [tag.strip() for tag in re.split(r'[;,]', str(genre_and_tags_str)) if tag.strip()]
-                    if processed_count < 5:  # Debug log for first few rows
-                        db_logger.info(f"Row {processed_count}: raw tags: {raw_tags}")
-                    
-                    # Validate tags first
-                    context = {
-                        'artist': artist,
-                        'album': album_title,
-                        'source': 'dataframe_import'
-                    }
-                    valid_tags, rejected_tags, validation_info = _tag_validator.filter_tags(raw_tags, context)
-                    
-                    if rejected_tags:
-                        db_logger.warning(f"Rejected {len(rejected_tags)} invalid tags for {artist} - {album_title}: {rejected_tags}")
-                    
-                    if processed_count < 5:  # Debug log for first few rows
-                        db_logger.info(f"Row {processed_count}: validation - valid: {len(valid_tags)}, rejected: {len(rejected_tags)}")
-                    
-                    processed_tags = set()  # Use set to avoid duplicates after normalization
-                    for validated_tag in valid_tags:
-                        normalized_tag = normalize_tag(validated_tag)
-                        if normalized_tag and normalized_tag not in processed_tags:
-                            processed_tags.add(normalized_tag)
-                            
-                            # Check if tag already exists (by normalized name)
-                            existing_tag = session.query(Tag).filter(Tag.normalized_name == normalized_tag).first()
-                            if not existing_tag:
-                                # Create a new tag with a unique ID
-                                tag_id = str(uuid.uuid4())
-                                category = _tag_normalizer.get_category(normalized_tag)
-                                new_tag = Tag(
-                                    id=tag_id,
-                                    name=normalized_tag,  # Use normalized form as primary name
-                                    normalized_name=normalized_tag,
-                                    is_canonical=1
-                                )
-                                session.add(new_tag)
-                                session.flush()  # Flush to get the tag ID
-                                # Add the relationship between album and tag
-                                album.tags.append(new_tag)
-                            else:
-                                # Use the existing tag
-                                album.tags.append(existing_tag)
-                    
-                    if processed_count < 5:  # Debug log for first few rows
-                        db_logger.info(f"Row {processed_count}: final normalized tags: {list(processed_tags)}")
-                
-                # Handle country tags if available
-                if country_str:
-                    countries = [c.strip() for c in re.split(r'[;,]', country_str) if c.strip()]
-                    processed_countries = set()  # Use set to avoid duplicates after normalization
-                    for country_name in countries:
-                        normalized_country = normalize_tag(country_name)
-                        if normalized_country and normalized_country not in processed_countries:
-                            processed_countries.add(normalized_country)
-                            
-                            # Check if country tag already exists (by normalized name)
-                            existing_country_tag = session.query(Tag).filter(Tag.normalized_name == normalized_country).first()
-                            if not existing_country_tag:
-                                # Create a new country tag with a unique ID
-                                country_tag_id = str(uuid.uuid4())
-                                new_country_tag = Tag(
-                                    id=country_tag_id,
-                                    name=normalized_country,  # Use normalized form as primary name
-                                    normalized_name=normalized_country,
-                                    is_canonical=1
-                                )
-                                session.add(new_country_tag)
-                                session.flush()  # Flush to get the tag ID
-                                # Add the relationship between album and country tag
-                                album.tags.append(new_country_tag)
-                            else:
-                                # Use the existing country tag
-                                album.tags.append(existing_country_tag)
-                
-                # Handle vocal style tags if available
-                if vocal_style_tags:
-                    processed_vocal_styles = set()
-
-                    if processed_count < 5:
-                        db_logger.info(f"Row {processed_count}: vocal style tags: {vocal_style_tags}")
-
-                    for normalized_vocal_style in vocal_style_tags:
-                        if normalized_vocal_style in processed_vocal_styles:
-                            continue
-
-                        processed_vocal_styles.add(normalized_vocal_style)
-
-                        existing_vocal_tag = session.query(Tag).filter(Tag.normalized_name == normalized_vocal_style).first()
-                        if not existing_vocal_tag:
-                            vocal_tag_id = str(uuid.uuid4())
-                            new_vocal_tag = Tag(
-                                id=vocal_tag_id,
-                                name=normalized_vocal_style,
-                                normalized_name=normalized_vocal_style,
-                                is_canonical=1
-                            )
-                            session.add(new_vocal_tag)
-                            session.flush()
-                            album.tags.append(new_vocal_tag)
-
-                            if processed_count < 5:
-                                db_logger.info(f"Row {processed_count}: created new vocal style tag '{normalized_vocal_style}' for {artist} - {album_title}")
-                        else:
-                            album.tags.append(existing_vocal_tag)
-
-                            if processed_count < 5:
-                                db_logger.info(f"Row {processed_count}: using existing vocal style tag '{normalized_vocal_style}' for {artist} - {album_title}")
+                album_values = {
+                    'id': album_id,
+                    'title': album_title,
+                    'pa_artist_name_on_album': artist,
+                    'release_date': release_date_obj,
+                    'release_year': release_date_obj.year,
+                    'length': length_info if not format_info else length_info,
+                    'vocal_style': vocal_style_display or None,
+                    'genre': genre_and_tags_str,
+                    'country': country_str,
+                    'raw_tags': combined_raw_tags,
+                    'source_file': csv_file.name,
+                    'source_path': str(csv_file.resolve()),
+                    'last_updated': datetime.now()
+                }
+                _add_album(session, album_values, tag_names, bulk_buffer)
                 
                 processed_count += 1
                 db_logger.debug(f"Added album: {artist} - {album_title} (ID: {album_id}, Release Date: {release_date_obj.strftime('%Y-%m-%d')})")
@@ -1005,7 +918,7 @@ def _process_csv_file(csv_file: Path, year: int, session: Session) -> None:
                 })
                 
                 # Every 50 rows, try to commit to avoid large transactions
-                if processed_count % 50 == 0:
+                if bulk_buffer is None and processed_count % 50 == 0:
                     try:
                         session.flush()
                         db_logger.debug(f"Flushed after {processed_count} rows")
@@ -1018,6 +931,9 @@ def _process_csv_file(csv_file: Path, year: int, session: Session) -> None:
                 skipped_count += 1
                 continue
     
+    if bulk_buffer is not None:
+        bulk_buffer.flush(label=csv_file.name)
+
     # Add an info log at the end of processing each file
     end_time = datetime.now()
     elapsed_time = end_time - start_time
@@ -10,28 +10,33 @@ class Base(DeclarativeBase):
 """Database models."""
 from datetime import datetime
 from typing import List
-from sqlalchemy import Column, Integer, String, ForeignKey, Table, Float, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, Float, DateTime, Text, Boolean, Index
 from sqlalchemy.orm import relationship, DeclarativeBase
 
 class Base(DeclarativeBase):
     pass
 
 # Association tables
+# Link tables are keyed (album, tag), which also covers album -> tags lookups;
+# the (tag, album) index covers tag -> albums. They keep their rowid, which
+# change_tracking relies on.
 album_tags = Table(
     'album_tags',
     Base.metadata,
-    Column('album_id', String, ForeignKey('albums.id')),
-    Column('tag_id', String, ForeignKey('tags.id'))
+    Column('album_id', String, ForeignKey('albums.id'), primary_key=True),
+    Column('tag_id', String, ForeignKey('tags.id'), primary_key=True),
+    Index('ix_album_tags_tag_id_album_id', 'tag_id', 'album_id')
 )
 
 album_atomic_tags = Table(
     'album_atomic_tags',
     Base.metadata,
-    Column('album_id', String, ForeignKey('albums.id')),
-    Column('atomic_tag_id', String, ForeignKey('atomic_tags.id')),
+    Column('album_id', String, ForeignKey('albums.id'), primary_key=True),
+    Column('atomic_tag_id', String, ForeignKey('atomic_tags.id'), primary_key=True),
     Column('source_tag_id', String, ForeignKey('tags.id'), nullable=True),
     Column('confidence', Float, nullable=False, default=1.0),
-    Column('created_at', DateTime, nullable=False, default=datetime.utcnow)
+    Column('created_at', DateTime, nullable=False, default=datetime.utcnow),
+    Index('ix_album_atomic_tags_atomic_tag_id_album_id', 'atomic_tag_id', 'album_id')
 )
 
 tag_hierarchy = Table(
@@ -42,6 +47,18 @@ tag_hierarchy = Table(
     extend_existing=True
 )
 
+# Transitive closure of tag_hierarchy: a row per (ancestor, descendant) pair
+# with the length of the shortest path between them, kept by tag_closure.py.
+# The key serves descendant lookups, the (descendant, ancestor) index ancestors.
+tag_closure = Table(
+    'tag_closure',
+    Base.metadata,
+    Column('ancestor_id', String, ForeignKey('tags.id'), primary_key=True),
+    Column('descendant_id', String, ForeignKey('tags.id'), primary_key=True),
+    Column('depth', Integer, nullable=False),
+    Index('ix_tag_closure_descendant_id_ancestor_id', 'descendant_id', 'ancestor_id')
+)
+
 class Album(Base):
     """Album model."""
     __tablename__ = 'albums'
@@ -57,12 +74,14 @@ class Album(Base):
     pa_rating_count = Column(Integer, nullable=True)  # ProgArchives rating count
     pa_review_count = Column(Integer, nullable=True)  # ProgArchives review count
     source_html_file = Column(String, nullable=True) # Source HTML file for the album data
+    source_file = Column(String, nullable=True, index=True) # Name of the CSV file the album was ingested from
+    source_path = Column(String, nullable=True, index=True) # Resolved path of that file, the source manifest's key
     release_date = Column(DateTime)
-    release_year = Column(Integer)
+    release_year = Column(Integer, index=True)
     length = Column(String)
     vocal_style = Column(String)
-    country = Column(String)
-    genre = Column(String)
+    country = Column(String, index=True)
+    genre = Column(String, index=True)
     latitude = Column(Float)
     longitude = Column(Float)
     x = Column(Float)
@@ -158,7 +177,7 @@ class TagDecomposition(Base):
     __tablename__ = "tag_decompositions"
     
     id = Column(Integer, primary_key=True)
-    composite_tag_id = Column(String, ForeignKey('tags.id'), nullable=False)
+    composite_tag_id = Column(String, ForeignKey('tags.id'), nullable=False, index=True)
     atomic_tag_id = Column(String, ForeignKey('atomic_tags.id'), nullable=False)
     rule_source = Column(String, nullable=True)  # "manual", "automatic", "inferred"
     confidence = Column(Float, default=1.0)
@@ -254,4 +273,28 @@ class Review(Base):
     album = relationship("Album", back_populates="reviews")
 
     def __repr__(self):
-        return f"<Review for {self.album_id} by {self.reviewer_name} - {self.rating}>"
\ No newline at end of file
+        return f"<Review for {self.album_id} by {self.reviewer_name} - {self.rating}>"
+
+class SourceFile(Base):
+    """Manifest entry of a source file ingested into the persistent database."""
+    __tablename__ = "source_files"
+
+    path = Column(String, primary_key=True)  # Resolved path
+    size = Column(Integer, nullable=False)
+    mtime_ns = Column(Integer, nullable=False)
+    content_hash = Column(String, nullable=False)  # SHA-256 of the file contents
+    album_count = Column(Integer, nullable=True)
+    ingested_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SourceFile {self.path}>"
+
+class ExcludedSourceFile(Base):
+    """Source file left out of a load on purpose, so the startup update does not ingest it."""
+    __tablename__ = "excluded_source_files"
+
+    path = Column(String, primary_key=True)  # Resolved path
+    excluded_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ExcludedSourceFile {self.path}>"
@@ -14,8 +14,9 @@ from sqlalchemy import text
 
 from albumexplore.database import get_session
 from albumexplore.database.models import Album, Tag, TagCategory
+from albumexplore.database.atomic_ingest import build_atomic_tags
 from albumexplore.gui.gui_logging import db_logger, performance_logger
-from albumexplore.tags.normalizer.tag_normalizer import TagNormalizer
+from albumexplore.tags.normalizer.tag_normalizer import get_shared_normalizer
 from albumexplore.database.tag_validator import TagValidationFilter
 
 # Import vocal-style helpers (now with length checks)
@@ -24,8 +25,7 @@ from albumexplore.database.csv_loader import (
     build_raw_tags_string
 )
 
-# Initialize advanced tag normalizer and validator
-_tag_normalizer = TagNormalizer()
+# Initialize advanced tag validator; the shared normalizer is created on first use
 _tag_validator = TagValidationFilter(strict_mode=False)
 
 # Pre-compiled regex patterns for performance
@@ -166,10 +166,11 @@ def load_dataframe_data_optimized(df: pd.DataFrame, session: Session) -> None:
             db_logger.warning(f"Rejected tags: {rejected_tags[:10]}...")  # Show first 10
         
         # Batch normalize all valid tags using more efficient comprehension
+        tag_normalizer = get_shared_normalizer()
         tag_normalization_cache = {
             tag: normalized 
             for tag in valid_tags 
-            if (normalized := _tag_normalizer.normalize(tag)) is not None
+            if (normalized := tag_normalizer.normalize(tag)) is not None
         }
         
         db_logger.info(f"Normalized {len(tag_normalization_cache)} tags")
@@ -275,6 +276,8 @@ def load_dataframe_data_optimized(df: pd.DataFrame, session: Session) -> None:
                 'genre': genre_and_tags_str,
                 'country': country_str,
                 'raw_tags': combined_raw_tags,
+                'source_file': row.get('_source_file') or None,
+                'source_path': row.get('_source_path') or None,
                 'last_updated': current_time
             }
             albums_to_insert.append(album_dict)
@@ -312,26 +315,40 @@ def load_dataframe_data_optimized(df: pd.DataFrame, session: Session) -> None:
         if perf_monitor:
             perf_monitor.complete_operation("Album Creation", len(albums_to_insert))
 
-        # === PHASE 5: Final Commit ===
+        # === PHASE 5: Atomic Tag Decomposition ===
         phase_start = datetime.now()
-        db_logger.info("Phase 5: Final commit...")
+        db_logger.info("Phase 5: Atomic tag decomposition...")
+        if perf_monitor:
+            perf_monitor.start_operation("Atomic Tags")
         
-        session.commit()
+        # New tags are decomposed once and the new albums' atomic links derived from album_tags
+        atomic_counts = build_atomic_tags(session, album_id_map.values(), tag_normalizer)
         
         phase_time = (datetime.now() - phase_start).total_seconds()
         performance_logger.info(f"[PERF] Phase 5 completed in {phase_time:.2f}s")
+        if perf_monitor:
+            perf_monitor.complete_operation("Atomic Tags", atomic_counts['links'])
+
+        # === PHASE 6: Final Commit ===
+        phase_start = datetime.now()
+        db_logger.info("Phase 6: Final commit...")
+        
+        session.commit()
+        
+        phase_time = (datetime.now() - phase_start).total_seconds()
+        performance_logger.info(f"[PERF] Phase 6 completed in {phase_time:.2f}s")
 
         # === SUMMARY ===
         total_time = (datetime.now() - start_time).total_seconds()
         total_tags = session.query(Tag).count()
         
         db_logger.info(f"Optimized data loading completed successfully in {total_time:.2f} seconds")
-        db_logger.info(f"Processed {len(albums_to_create)} new albums. Total tags in database: {total_tags}")
-        performance_logger.info(f"[PERF] Total optimized load time: {total_time:.2f}s for {len(albums_to_create)} albums")
+        db_logger.info(f"Processed {len(albums_to_insert)} new albums. Total tags in database: {total_tags}")
+        performance_logger.info(f"[PERF] Total optimized load time: {total_time:.2f}s for {len(albums_to_insert)} albums")
         
         # Complete overall performance monitoring
         if perf_monitor:
-            perf_monitor.complete_operation("Optimized Data Loading", len(albums_to_create))
+            perf_monitor.complete_operation("Optimized Data Loading", len(albums_to_insert))
 
     except Exception as e:
         session.rollback()
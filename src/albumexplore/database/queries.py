@@ -1,8 +1,10 @@
 """Database queries."""
 from typing import List, Tuple, Set, Dict, Optional
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, select
 from .models import Album, Tag, AtomicTag, TagDecomposition, album_tags, album_atomic_tags
+from .co_occurrence import get_co_occurrence
+from . import search as fulltext
 
 def get_albums_with_tags(session: Session) -> List[Album]:
     """Get all albums with their tags eagerly loaded to prevent N+1 queries."""
@@ -46,39 +48,22 @@ def get_related_albums(session: Session, album_id: int, min_shared_tags: int = 2
     return related
 
 def get_tag_co_occurrences(session: Session, min_count: int = 2) -> List[Tuple[Tag, Tag, int]]:
-    """Get tag co-occurrence counts."""
-    # First get all album-tag pairs
-    pairs = session.query(
-        album_tags.c.album_id,
-        album_tags.c.tag_id
-    ).all()
-    
-    # Build co-occurrence dictionary
-    co_occurrences = {}
-    for album_id, tag1_id in pairs:
-        for _, tag2_id in pairs:
-            if tag1_id < tag2_id:  # Avoid counting both (a,b) and (b,a)
-                key = (tag1_id, tag2_id)
-                co_occurrences[key] = co_occurrences.get(key, 0) + 1
-    
-    # Filter and format results
-    results = []
-    for (tag1_id, tag2_id), count in co_occurrences.items():
-        if count >= min_count:
-            tag1 = session.query(Tag).get(tag1_id)
-            tag2 = session.query(Tag).get(tag2_id)
-            results.append((tag1, tag2, count))
-    
-    return sorted(results, key=lambda x: x[2], reverse=True)
+    """Get tag co-occurrence counts (albums carrying both tags), highest first."""
+    pairs = get_co_occurrence(session).pairs(min_count)
+    return _resolve_tag_pairs(session, Tag, pairs)
 
-def search_albums(session: Session, query: str) -> List[Album]:
-    """Search albums by artist or title."""
-    return session.query(Album).filter(
-        or_(
-            Album.pa_artist_name_on_album.ilike(f"%{query}%"),
-            Album.title.ilike(f"%{query}%")
-        )
-    ).all()
+def _resolve_tag_pairs(session: Session, model, pairs: List[Tuple[str, str, int]]) -> List[Tuple]:
+    """Replace tag ids in pairs with model rows, fetched in one IN query."""
+    if not pairs:
+        return []
+    ids = {tag_id for tag1_id, tag2_id, _ in pairs for tag_id in (tag1_id, tag2_id)}
+    tags = {t.id: t for t in session.query(model).filter(model.id.in_(ids)).all()}
+    return [(tags[tag1_id], tags[tag2_id], count) for tag1_id, tag2_id, count in pairs
+            if tag1_id in tags and tag2_id in tags]
+
+def search_albums(session: Session, query: str, limit: Optional[int] = None) -> List[Album]:
+    """Search albums by artist, title, genre, tags and review text, best matches first."""
+    return [album for album, _ in fulltext.search_albums(session, query, limit=limit, prefix_last=True)]
 
 def get_albums_by_year(session: Session, year: int) -> List[Album]:
     """Get albums from a specific year."""
@@ -86,7 +71,9 @@ def get_albums_by_year(session: Session, year: int) -> List[Album]:
 
 def get_albums_by_genre(session: Session, genre: str) -> List[Album]:
     """Get albums of a specific genre."""
-    return session.query(Album).filter(Album.genre.ilike(f"%{genre}%")).all()
+    return [album for album, _ in fulltext.search_albums(
+        session, genre, limit=None, columns=('genre',), prefix_last=True
+    )]
 
 def get_most_common_tags(session: Session, limit: int = 20) -> List[Tuple[Tag, int]]:
     """Get most commonly used tags."""
@@ -169,6 +156,8 @@ def filter_albums_by_atomic_components(
         query = query.group_by(Album.id).having(
             func.count(album_atomic_tags.c.atomic_tag_id) == len(atomic_tag_ids)
         )
+    else:
+        query = query.distinct()
     
     return query.all()
 
@@ -222,37 +211,8 @@ def get_albums_by_atomic_tag(session: Session, atomic_tag_name: str) -> List[Alb
 
 def get_atomic_tag_co_occurrences(session: Session, min_count: int = 2) -> List[Tuple[AtomicTag, AtomicTag, int]]:
     """Get atomic tag co-occurrence counts across albums."""
-    # Get all album-atomic tag pairs
-    pairs = session.query(
-        album_atomic_tags.c.album_id,
-        album_atomic_tags.c.atomic_tag_id
-    ).all()
-    
-    # Build co-occurrence dictionary by album
-    album_tags = {}
-    for album_id, atomic_tag_id in pairs:
-        if album_id not in album_tags:
-            album_tags[album_id] = []
-        album_tags[album_id].append(atomic_tag_id)
-    
-    # Count co-occurrences
-    co_occurrences = {}
-    for album_id, tag_ids in album_tags.items():
-        for i, tag1_id in enumerate(tag_ids):
-            for tag2_id in tag_ids[i+1:]:
-                key = (min(tag1_id, tag2_id), max(tag1_id, tag2_id))
-                co_occurrences[key] = co_occurrences.get(key, 0) + 1
-    
-    # Filter and format results
-    results = []
-    for (tag1_id, tag2_id), count in co_occurrences.items():
-        if count >= min_count:
-            tag1 = session.query(AtomicTag).get(tag1_id)
-            tag2 = session.query(AtomicTag).get(tag2_id)
-            if tag1 and tag2:
-                results.append((tag1, tag2, count))
-    
-    return sorted(results, key=lambda x: x[2], reverse=True)
+    pairs = get_co_occurrence(session, atomic=True).pairs(min_count)
+    return _resolve_tag_pairs(session, AtomicTag, pairs)
 
 
 def search_albums_by_atomic_tags(
@@ -272,23 +232,14 @@ def search_albums_by_atomic_tags(
     if not include_composite:
         return atomic_albums
     
-    # Also search composite tags that contain these atomic components
-    composite_albums = set()
-    for atomic_name in atomic_tag_names:
-        # Find composite tags that decompose to this atomic tag
-        decompositions = session.query(TagDecomposition).join(AtomicTag).filter(
-            AtomicTag.name == atomic_name
-        ).all()
-        
-        for decomp in decompositions:
-            # Get albums tagged with this composite tag
-            albums = session.query(Album).join(album_tags).filter(
-                album_tags.c.tag_id == decomp.composite_tag_id
-            ).all()
-            composite_albums.update(albums)
+    # Also albums tagged with composite tags that decompose to these atomic components
+    composite_album_ids = select(album_tags.c.album_id).join(
+        TagDecomposition, TagDecomposition.composite_tag_id == album_tags.c.tag_id
+    ).join(AtomicTag).where(AtomicTag.name.in_(atomic_tag_names))
+    composite_albums = session.query(Album).filter(Album.id.in_(composite_album_ids)).all()
     
     # Combine and deduplicate results
-    all_albums = set(atomic_albums) | composite_albums
+    all_albums = set(atomic_albums) | set(composite_albums)
     return list(all_albums)
 
 
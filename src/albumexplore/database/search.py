@@ -0,0 +1,206 @@
+"""Full-text search over albums and their reviews.
+
+Two SQLite FTS5 external-content tables index the text without keeping a
+second copy of it: ``albums_fts`` over album title, artist name, genre and
+raw tags, and ``reviews_fts`` over review text. Triggers on ``albums`` and
+``reviews`` keep them in step with every insert, delete and text edit,
+including the bulk loaders' plain SQL inserts.
+
+Results are ranked by bm25, with album text weighted above review text.
+Queries accept bare words (all must match), ``"quoted phrases"`` and
+``prefix*`` terms.
+
+The index rows point at the rowids of the content tables. A VACUUM may
+renumber those, so run ``rebuild_search_index`` after one.
+"""
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, or_, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from .models import Album, Base
+from albumexplore.gui.gui_logging import db_logger
+
+# Indexed album columns and their bm25 weights
+ALBUM_COLUMNS = ('title', 'pa_artist_name_on_album', 'genre', 'raw_tags')
+ALBUM_WEIGHTS = (10.0, 8.0, 4.0, 2.0)
+
+# A match in a review counts for half a match in the album text
+REVIEW_WEIGHT = 0.5
+
+_TOKENIZER = "unicode61 remove_diacritics 2"
+
+
+def _index_statements() -> List[str]:
+    columns = ", ".join(ALBUM_COLUMNS)
+    new_values = ", ".join(f"new.{c}" for c in ALBUM_COLUMNS)
+    old_values = ", ".join(f"old.{c}" for c in ALBUM_COLUMNS)
+    return [
+        f"CREATE VIRTUAL TABLE albums_fts USING fts5({columns}, "
+        f"content='albums', content_rowid='rowid', tokenize='{_TOKENIZER}')",
+        f"CREATE TRIGGER albums_fts_insert AFTER INSERT ON albums BEGIN "
+        f"INSERT INTO albums_fts(rowid, {columns}) VALUES (new.rowid, {new_values}); END",
+        f"CREATE TRIGGER albums_fts_delete AFTER DELETE ON albums BEGIN "
+        f"INSERT INTO albums_fts(albums_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values}); END",
+        f"CREATE TRIGGER albums_fts_update AFTER UPDATE OF {columns} ON albums BEGIN "
+        f"INSERT INTO albums_fts(albums_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values}); "
+        f"INSERT INTO albums_fts(rowid, {columns}) VALUES (new.rowid, {new_values}); END",
+        f"CREATE VIRTUAL TABLE reviews_fts USING fts5(review_text, "
+        f"content='reviews', content_rowid='rowid', tokenize='{_TOKENIZER}')",
+        "CREATE TRIGGER reviews_fts_insert AFTER INSERT ON reviews BEGIN "
+        "INSERT INTO reviews_fts(rowid, review_text) VALUES (new.rowid, new.review_text); END",
+        "CREATE TRIGGER reviews_fts_delete AFTER DELETE ON reviews BEGIN "
+        "INSERT INTO reviews_fts(reviews_fts, rowid, review_text) VALUES ('delete', old.rowid, old.review_text); END",
+        "CREATE TRIGGER reviews_fts_update AFTER UPDATE OF review_text ON reviews BEGIN "
+        "INSERT INTO reviews_fts(reviews_fts, rowid, review_text) VALUES ('delete', old.rowid, old.review_text); "
+        "INSERT INTO reviews_fts(rowid, review_text) VALUES (new.rowid, new.review_text); END",
+    ]
+
+
+def search_index_exists(connection: Connection) -> bool:
+    if connection.dialect.name != 'sqlite':
+        return False
+    return connection.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'albums_fts'"
+    )).first() is not None
+
+
+def create_search_index(connection: Connection) -> bool:
+    """
+    Create the index tables and triggers if missing, indexing existing rows.
+
+    Returns whether the index is available: False for other databases and
+    SQLite builds without FTS5.
+    """
+    if connection.dialect.name != 'sqlite':
+        return False
+    if search_index_exists(connection):
+        return True
+    try:
+        with connection.begin_nested():
+            for statement in _index_statements():
+                connection.execute(text(statement))
+            rebuild_search_index(connection)
+    except OperationalError as e:
+        db_logger.warning(f"Full-text search unavailable: {e}")
+        return False
+    db_logger.info("Created full-text search index")
+    return True
+
+
+def drop_search_index(connection: Connection) -> None:
+    for table in ('albums', 'reviews'):
+        for trigger in ('insert', 'delete', 'update'):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {table}_fts_{trigger}"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {table}_fts"))
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Re-index every album and review from the content tables."""
+    connection.execute(text("INSERT INTO albums_fts(albums_fts) VALUES ('rebuild')"))
+    connection.execute(text("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')"))
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _create_after_tables(target, connection, **kw):
+    create_search_index(connection)
+
+
+@event.listens_for(Base.metadata, 'before_drop')
+def _drop_before_tables(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        drop_search_index(connection)
+
+
+_TOKEN = re.compile(r'"([^"]*)"(\*?)|(\S+)')
+_WORD = re.compile(r'\w+')
+
+
+def fts_query(query: str, prefix_last: bool = False) -> Optional[str]:
+    """
+    FTS5 MATCH expression for a user query, or None when it has no words.
+
+    Words are quoted, so FTS5 operators and punctuation in the input are
+    taken literally; a word the tokenizer splits (``prog-metal``) becomes
+    a phrase. ``prefix_last`` makes the last bare word a prefix, for
+    search-as-you-type.
+    """
+    terms = []
+    for phrase, phrase_star, word in _TOKEN.findall(query):
+        words = _WORD.findall(phrase if not word else word)
+        if not words:
+            continue
+        star = phrase_star or (word.endswith('*') and '*')
+        terms.append(['"' + " ".join(words) + '"', bool(star), bool(word)])
+    if not terms:
+        return None
+    if prefix_last and terms[-1][2]:
+        terms[-1][1] = True
+    return " ".join(term + (" *" if star else "") for term, star, _ in terms)
+
+
+def search_album_ids(session: Session, query: str, limit: Optional[int] = 50,
+                     columns: Optional[Sequence[str]] = None,
+                     prefix_last: bool = False) -> List[Tuple[str, float]]:
+    """
+    (album id, relevance) for albums matching a query, best first.
+
+    ``columns`` restricts the match to those album columns and leaves out
+    reviews. Relevance is the negated bm25 score, higher is better. Albums
+    are matched through their own text or any of their reviews, taking
+    the better of the two.
+    """
+    match = fts_query(query, prefix_last)
+    if match is None:
+        return []
+    if not search_index_exists(session.connection()):
+        return _search_like(session, query, limit, columns)
+    weights = ", ".join(map(str, ALBUM_WEIGHTS))
+    if columns:
+        match = "{" + " ".join(columns) + "} : (" + match + ")"
+    params = {'match': match, 'review_weight': REVIEW_WEIGHT, 'limit': -1 if limit is None else limit}
+    # bm25 is only available next to the MATCH, so the hits are materialized
+    # before the joins. Each album has one row here, so its top hits suffice.
+    sql = (
+        "WITH album_hits AS MATERIALIZED ("
+        f"SELECT rowid, bm25(albums_fts, {weights}) AS score FROM albums_fts WHERE albums_fts MATCH :match "
+        "ORDER BY score LIMIT :limit)"
+    )
+    hits = "SELECT albums.id AS album_id, album_hits.score FROM album_hits JOIN albums ON albums.rowid = album_hits.rowid"
+    if not columns:
+        sql += (
+            ", review_hits AS MATERIALIZED ("
+            "SELECT rowid, bm25(reviews_fts) * :review_weight AS score FROM reviews_fts WHERE reviews_fts MATCH :match)"
+        )
+        hits += (
+            " UNION ALL SELECT reviews.album_id, review_hits.score "
+            "FROM review_hits JOIN reviews ON reviews.rowid = review_hits.rowid"
+        )
+    sql += f" SELECT album_id, MIN(score) AS score FROM ({hits}) GROUP BY album_id ORDER BY score LIMIT :limit"
+    return [(album_id, -score) for album_id, score in session.execute(text(sql), params)]
+
+
+def search_albums(session: Session, query: str, limit: Optional[int] = 50,
+                  columns: Optional[Sequence[str]] = None,
+                  prefix_last: bool = False) -> List[Tuple[Album, float]]:
+    """(album, relevance) for albums matching a query, best first; see search_album_ids."""
+    hits = search_album_ids(session, query, limit, columns, prefix_last)
+    albums = {a.id: a for a in session.query(Album).filter(Album.id.in_([album_id for album_id, _ in hits]))}
+    return [(albums[album_id], score) for album_id, score in hits if album_id in albums]
+
+
+def _search_like(session: Session, query: str, limit: Optional[int],
+                 columns: Optional[Sequence[str]]) -> List[Tuple[str, float]]:
+    """Unranked substring match, for databases without the index."""
+    words = _WORD.findall(query)
+    fields = [getattr(Album, c) for c in (columns or ALBUM_COLUMNS)]
+    q = session.query(Album.id)
+    for word in words:
+        q = q.filter(or_(*(field.ilike(f"%{word}%") for field in fields)))
+    if limit is not None:
+        q = q.limit(limit)
+    return [(album_id, 0.0) for album_id, in q]
+
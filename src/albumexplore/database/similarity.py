@@ -1,7 +1,323 @@
-"""Album similarity calculation module."""
-from typing import List, Tuple, Set, Dict, Any
+"""Album similarity calculation module.
+
+Similarity is computed by ``SimilarityEngine`` on sparse album x tag and
+album x atomic-tag matrices built once from the link tables. A lookup scores
+all candidates in a few vectorized operations and returns lightweight
+``AlbumSummary`` records, so no ORM objects are loaded. Top-K neighbours per
+album can be precomputed and persisted for instant lookups.
+"""
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Tuple, Dict, Any, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
-from .models import Album, Tag
+from .change_tracking import change_counter
+from .models import Album, Tag, album_tags, album_atomic_tags
+from albumexplore.gui.gui_logging import db_logger
+from albumexplore.utils.paths import get_cache_dir
+
+WEIGHTS = {
+    'composite_tags': 0.40,
+    'atomic_tags': 0.30,
+    'genre': 0.15,
+    'year': 0.10,
+    'country': 0.05
+}
+
+# Albums this many years apart or more get no year similarity
+YEAR_WINDOW = 20.0
+
+TOP_K_FILE_NAME = 'similarity_top_k.npz'
+
+
+def default_top_k_path() -> Path:
+    """Top-K file in ALBUMEXPLORE_CACHE_DIR, else in the per-user cache directory."""
+    return get_cache_dir() / TOP_K_FILE_NAME
+
+
+@dataclass(frozen=True)
+class AlbumSummary:
+    """Album fields needed to display a similarity result."""
+    id: str
+    title: str
+    pa_artist_name_on_album: Optional[str]
+    genre: Optional[str]
+    release_year: Optional[int]
+    country: Optional[str]
+
+
+def _codes(values: Sequence[Optional[str]]) -> np.ndarray:
+    """Integer code per value; empty values get -1 so they never match."""
+    mapping: Dict[str, int] = {}
+    return np.array([mapping.setdefault(v, len(mapping)) if v else -1 for v in values], dtype=np.int32)
+
+
+def _gather_rows(matrix: sparse.csr_matrix, rows: np.ndarray) -> np.ndarray:
+    """Concatenated column indices of the given CSR rows."""
+    starts = matrix.indptr[rows]
+    lengths = matrix.indptr[rows + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=matrix.indices.dtype)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return matrix.indices[offsets + np.arange(total)]
+
+
+class SimilarityEngine:
+    """
+    Vectorized album similarity over CSR album x tag matrices.
+
+    The score is the weighted sum of composite-tag Jaccard, atomic-tag
+    Jaccard, genre match, year proximity and country match (see WEIGHTS).
+    Candidates are the albums sharing a composite tag with the target, or
+    every album if the target only has atomic tags.
+    """
+
+    def __init__(self, albums: List[AlbumSummary], tag_links: Sequence[Tuple[str, str]],
+                 atomic_links: Sequence[Tuple[str, str]], tag_names: Dict[str, str]):
+        self.albums = albums
+        self.album_count = len(albums)
+        self.positions = {album.id: i for i, album in enumerate(albums)}
+
+        self.tags, self.tag_ids = self._build_matrix(tag_links)
+        self.atomic_tags, _ = self._build_matrix(atomic_links)
+        # Tag -> albums, for gathering candidates from postings
+        self.tag_postings = self.tags.T.tocsr()
+        self.tag_degree = np.diff(self.tags.indptr)
+        self.atomic_degree = np.diff(self.atomic_tags.indptr)
+        self.tag_names = [tag_names.get(tag_id, tag_id) for tag_id in self.tag_ids]
+
+        self.genre_codes = _codes([a.genre for a in albums])
+        self.country_codes = _codes([a.country for a in albums])
+        # Missing (None or 0) years are NaN so they never score
+        self.years = np.array([a.release_year or np.nan for a in albums], dtype=np.float64)
+
+        self.top_k_neighbours: Optional[np.ndarray] = None
+        self.top_k_min_similarity = 0.0
+        self.signature = self._signature()
+
+    @classmethod
+    def from_session(cls, session: Session) -> 'SimilarityEngine':
+        """Build the engine from the album, tag and link tables (four queries, no ORM objects)."""
+        rows = session.execute(select(
+            Album.id, Album.title, Album.pa_artist_name_on_album, Album.genre, Album.release_year, Album.country
+        ).order_by(Album.id)).all()
+        albums = [AlbumSummary(*row) for row in rows]
+        tag_links = session.execute(select(album_tags.c.album_id, album_tags.c.tag_id)).all()
+        atomic_links = session.execute(select(album_atomic_tags.c.album_id, album_atomic_tags.c.atomic_tag_id)).all()
+        tag_names = dict(session.execute(select(Tag.id, Tag.name)).all())
+        return cls(albums, tag_links, atomic_links, tag_names)
+
+    def _build_matrix(self, links: Sequence[Tuple[str, str]]) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        pairs = [(self.positions[album_id], tag_id) for album_id, tag_id in links
+                 if album_id in self.positions and tag_id is not None]
+        if not pairs:
+            return sparse.csr_matrix((self.album_count, 0), dtype=np.int32), np.empty(0, dtype=object)
+        rows = np.fromiter((p[0] for p in pairs), dtype=np.int32, count=len(pairs))
+        tag_ids, cols = np.unique(np.array([p[1] for p in pairs], dtype=object), return_inverse=True)
+        matrix = sparse.csr_matrix((np.ones(len(pairs), dtype=np.int32), (rows, cols)),
+                                   shape=(self.album_count, len(tag_ids)))
+        # Duplicate links count once
+        matrix.sum_duplicates()
+        matrix.data[:] = 1
+        return matrix, tag_ids
+
+    def _signature(self) -> str:
+        digest = hashlib.sha256(repr(sorted(WEIGHTS.items())).encode())
+        digest.update('\0'.join(a.id for a in self.albums).encode())
+        for array in (self.tags.indptr, self.tags.indices, self.atomic_tags.indptr, self.atomic_tags.indices,
+                      self.genre_codes, self.country_codes, self.years):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        digest.update('\0'.join(str(t) for t in self.tag_ids).encode())
+        return digest.hexdigest()
+
+    def _candidates(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate positions for album i and their shared composite tag counts."""
+        tags_i = self.tags.indices[self.tags.indptr[i]:self.tags.indptr[i + 1]]
+        if len(tags_i) == 0:
+            cols = np.delete(np.arange(self.album_count), i)
+            return cols, np.zeros(len(cols), dtype=np.int64)
+        counts = np.bincount(_gather_rows(self.tag_postings, tags_i), minlength=self.album_count)
+        counts[i] = 0
+        cols = np.flatnonzero(counts)
+        return cols, counts[cols]
+
+    def _shared(self, matrix: sparse.csr_matrix, i: int, cols: np.ndarray) -> np.ndarray:
+        if matrix.shape[1] == 0 or len(cols) == 0:
+            return np.zeros(len(cols), dtype=np.int64)
+        return (matrix[cols] @ matrix[i].T).toarray().ravel()
+
+    def _components(self, i: int, cols: np.ndarray, shared: np.ndarray,
+                    shared_atomic: np.ndarray) -> Dict[str, np.ndarray]:
+        union = self.tag_degree[i] + self.tag_degree[cols] - shared
+        atomic_union = self.atomic_degree[i] + self.atomic_degree[cols] - shared_atomic
+        with np.errstate(invalid='ignore', divide='ignore'):
+            tag_similarity = np.where(union > 0, shared / np.maximum(union, 1), 0.0)
+            atomic_similarity = np.where(atomic_union > 0, shared_atomic / np.maximum(atomic_union, 1), 0.0)
+        year_diff = np.abs(self.years[cols] - self.years[i])
+        year_similarity = np.nan_to_num(np.maximum(0.0, 1.0 - year_diff / YEAR_WINDOW), nan=0.0)
+        genre_match = (self.genre_codes[cols] == self.genre_codes[i]) & (self.genre_codes[i] >= 0)
+        country_match = (self.country_codes[cols] == self.country_codes[i]) & (self.country_codes[i] >= 0)
+        score = (tag_similarity * WEIGHTS['composite_tags'] +
+                 atomic_similarity * WEIGHTS['atomic_tags'] +
+                 genre_match * WEIGHTS['genre'] +
+                 year_similarity * WEIGHTS['year'] +
+                 country_match * WEIGHTS['country'])
+        return {
+            'score': score, 'shared': shared, 'shared_atomic': shared_atomic,
+            'tag_similarity': tag_similarity, 'atomic_similarity': atomic_similarity,
+            'genre_match': genre_match, 'year_similarity': year_similarity,
+            'year_diff': year_diff, 'country_match': country_match,
+        }
+
+    @staticmethod
+    def _top(cols: np.ndarray, scores: np.ndarray, limit: int, min_similarity: float) -> np.ndarray:
+        """Indices into cols of the best scores, highest first, ties by album position."""
+        keep = np.flatnonzero(scores >= min_similarity)
+        order = np.lexsort((cols[keep], -scores[keep]))
+        return keep[order[:limit]]
+
+    def similar(self, album_id: str, limit: int = 50,
+                min_similarity: float = 0.3) -> List[Tuple[AlbumSummary, float, Dict[str, Any]]]:
+        """Most similar albums as (album, score, breakdown), sorted by score descending."""
+        i = self.positions.get(album_id)
+        if i is None or (self.tag_degree[i] == 0 and self.atomic_degree[i] == 0):
+            return []
+
+        neighbours = self.top_k_neighbours
+        if (neighbours is not None and limit <= neighbours.shape[1] and neighbours[i, 0] != -2
+                and min_similarity >= self.top_k_min_similarity):
+            cols = neighbours[i][neighbours[i] >= 0].astype(np.intp)
+            shared = self._shared(self.tags, i, cols)
+        else:
+            cols, shared = self._candidates(i)
+        components = self._components(i, cols, shared, self._shared(self.atomic_tags, i, cols))
+        top = self._top(cols, components['score'], limit, min_similarity)
+
+        tags_i = self.tags.indices[self.tags.indptr[i]:self.tags.indptr[i + 1]]
+        results = []
+        for j in top:
+            col = int(cols[j])
+            tags_c = self.tags.indices[self.tags.indptr[col]:self.tags.indptr[col + 1]]
+            shared_names = [self.tag_names[t] for t in np.intersect1d(tags_i, tags_c)[:10]]
+            year_diff = components['year_diff'][j]
+            breakdown = {
+                'shared_tags_count': int(components['shared'][j]),
+                'total_tags': int(self.tag_degree[i]),
+                'shared_atomic_count': int(components['shared_atomic'][j]),
+                'total_atomic': int(self.atomic_degree[i]),
+                'tag_similarity': float(components['tag_similarity'][j]),
+                'atomic_similarity': float(components['atomic_similarity'][j]),
+                'genre_match': bool(components['genre_match'][j]),
+                'year_proximity': float(components['year_similarity'][j]),
+                'year_diff': None if np.isnan(year_diff) else int(year_diff),
+                'country_match': bool(components['country_match'][j]),
+                'shared_tag_names': shared_names,  # Max 10 for display
+            }
+            results.append((self.albums[col], float(components['score'][j]), breakdown))
+        return results
+
+    def precompute_top_k(self, k: int = 100, min_similarity: float = 0.0, block_size: int = 256) -> None:
+        """
+        Precompute the k best neighbours of every album with composite tags.
+
+        Shared tag counts come from blocked sparse products, so no dense
+        album x album matrix is built. Albums with only atomic tags are marked
+        (-2) and keep being scored on demand.
+        """
+        neighbours = np.full((self.album_count, k), -1, dtype=np.int32)
+        tags_t, atomic_t = self.tags.T.tocsr(), self.atomic_tags.T.tocsr()
+        for start in range(0, self.album_count, block_size):
+            stop = min(start + block_size, self.album_count)
+            shared_block = (self.tags[start:stop] @ tags_t).tocsr()
+            atomic_block = (self.atomic_tags[start:stop] @ atomic_t).tocsr()
+            shared_block.sort_indices()
+            atomic_block.sort_indices()
+            for r in range(stop - start):
+                i = start + r
+                if self.tag_degree[i] == 0:
+                    neighbours[i, 0] = -2
+                    continue
+                row = slice(shared_block.indptr[r], shared_block.indptr[r + 1])
+                cols, shared = shared_block.indices[row], shared_block.data[row]
+                not_self = cols != i
+                cols, shared = cols[not_self], shared[not_self]
+
+                # Align the atomic overlaps with the composite candidates
+                arow = slice(atomic_block.indptr[r], atomic_block.indptr[r + 1])
+                a_cols, a_data = atomic_block.indices[arow], atomic_block.data[arow]
+                shared_atomic = np.zeros(len(cols), dtype=np.int64)
+                if len(a_cols):
+                    pos = np.minimum(np.searchsorted(a_cols, cols), len(a_cols) - 1)
+                    hit = a_cols[pos] == cols
+                    shared_atomic[hit] = a_data[pos[hit]]
+
+                scores = self._components(i, cols, shared, shared_atomic)['score']
+                top = cols[self._top(cols, scores, k, min_similarity)]
+                neighbours[i, :len(top)] = top
+        self.top_k_neighbours = neighbours
+        self.top_k_min_similarity = min_similarity
+        db_logger.info(f"Precomputed top-{k} similar albums for {self.album_count} albums")
+
+    def save_top_k(self, path: Optional[Path] = None) -> None:
+        if self.top_k_neighbours is None:
+            raise ValueError("No top-K neighbours to save; call precompute_top_k() first")
+        path = Path(path) if path else default_top_k_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, neighbours=self.top_k_neighbours, min_similarity=self.top_k_min_similarity,
+                     signature=np.array(self.signature))
+
+    def load_top_k(self, path: Optional[Path] = None) -> bool:
+        """Load persisted neighbours if they were computed for the same data."""
+        path = Path(path) if path else default_top_k_path()
+        if not path.exists():
+            return False
+        try:
+            with np.load(path) as data:
+                if str(data['signature']) != self.signature:
+                    db_logger.info("Persisted similarity neighbours are stale, ignoring them")
+                    return False
+                self.top_k_neighbours = data['neighbours']
+                self.top_k_min_similarity = float(data['min_similarity'])
+        except (OSError, KeyError, ValueError) as e:
+            db_logger.warning(f"Could not load similarity neighbours from {path}: {e}")
+            return False
+        return True
+
+
+_engines: Dict[int, Tuple[Tuple[int, ...], SimilarityEngine]] = {}
+_engines_lock = threading.Lock()
+
+
+def get_similarity_engine(session: Session, top_k_path: Optional[Path] = None) -> SimilarityEngine:
+    """
+    Return the engine for the session's database, rebuilding it when albums or links change.
+
+    Persisted top-K neighbours are loaded when they match the data. Call
+    invalidate_similarity_engines() after album edits made by another process.
+    """
+    key = id(session.get_bind())
+    version = change_counter(session, Album.__table__, Tag.__table__, album_tags, album_atomic_tags)
+    with _engines_lock:
+        cached = _engines.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        engine = SimilarityEngine.from_session(session)
+        engine.load_top_k(top_k_path)
+        _engines[key] = (version, engine)
+        db_logger.info(f"Built similarity engine for {engine.album_count} albums")
+        return engine
+
+
+def invalidate_similarity_engines() -> None:
+    with _engines_lock:
+        _engines.clear()
 
 
 def calculate_album_similarity_optimized(
@@ -22,129 +338,12 @@ def calculate_album_similarity_optimized(
     Returns:
         List of (album, similarity_score, breakdown_dict) tuples, sorted by score descending
     """
-    # 1. Get target album with preloaded tags (1 query)
-    album = session.query(Album).options(
-        joinedload(Album.tags),
-        joinedload(Album.atomic_tags)
-    ).filter(Album.id == album_id).first()
-    
-    if not album:
+    results = get_similarity_engine(session).similar(album_id, limit, min_similarity)
+    if not results:
         return []
-    
-    # 2. Extract album attributes
-    album_tag_ids = {t.id for t in album.tags}
-    album_atomic_ids = {t.id for t in album.atomic_tags}
-    album_genre = album.genre
-    album_year = album.release_year
-    album_country = album.country
-    
-    # If album has no tags, can't find similar albums by tag
-    if not album_tag_ids and not album_atomic_ids:
-        return []
-    
-    # 3. Bulk query: Get all candidate albums with tags (optimized)
-    # Query albums that share at least one tag OR atomic tag
-    query = session.query(Album).options(
-        joinedload(Album.tags),
-        joinedload(Album.atomic_tags)
-    ).filter(Album.id != album_id)
-    
-    # Join with tags if we have composite tags
-    if album_tag_ids:
-        query = query.join(Album.tags).filter(Tag.id.in_(album_tag_ids))
-    
-    candidate_albums = query.distinct().all()
-    
-    # 4. Calculate similarity scores (in-memory, fast)
-    similarities = []
-    for candidate in candidate_albums:
-        score, breakdown = _calculate_similarity(
-            album, candidate,
-            album_tag_ids, album_atomic_ids,
-            album_genre, album_year, album_country
-        )
-        
-        if score >= min_similarity:
-            similarities.append((candidate, score, breakdown))
-    
-    # 5. Sort by score and limit results
-    similarities.sort(key=lambda x: x[1], reverse=True)
-    return similarities[:limit]
-
-
-def _calculate_similarity(
-    album1: Album,
-    album2: Album,
-    album1_tag_ids: Set[str],
-    album1_atomic_ids: Set[str],
-    album1_genre: str,
-    album1_year: int,
-    album1_country: str
-) -> Tuple[float, Dict[str, Any]]:
-    """
-    Calculate similarity score between two albums with detailed breakdown.
-    
-    Returns:
-        Tuple of (total_similarity_score, breakdown_dict)
-    """
-    # Composite tag similarity (Jaccard similarity)
-    album2_tag_ids = {t.id for t in album2.tags}
-    shared_tags = album1_tag_ids & album2_tag_ids
-    union_tags = album1_tag_ids | album2_tag_ids
-    tag_similarity = len(shared_tags) / len(union_tags) if union_tags else 0
-    
-    # Atomic tag similarity (more granular)
-    album2_atomic_ids = {t.id for t in album2.atomic_tags}
-    shared_atomic = album1_atomic_ids & album2_atomic_ids
-    union_atomic = album1_atomic_ids | album2_atomic_ids
-    atomic_similarity = len(shared_atomic) / len(union_atomic) if union_atomic else 0
-    
-    # Genre similarity (exact match)
-    genre_similarity = 1.0 if album1_genre and album2.genre and album1_genre == album2.genre else 0.0
-    
-    # Year proximity (albums within 5 years = 1.0, decays linearly to 0 at 20 years)
-    if album1_year and album2.release_year:
-        year_diff = abs(album1_year - album2.release_year)
-        year_similarity = max(0, 1.0 - (year_diff / 20.0))
-    else:
-        year_similarity = 0.0
-    
-    # Country match (exact match)
-    country_similarity = 1.0 if album1_country and album2.country and album1_country == album2.country else 0.0
-    
-    # Weighted combination
-    weights = {
-        'composite_tags': 0.40,
-        'atomic_tags': 0.30,
-        'genre': 0.15,
-        'year': 0.10,
-        'country': 0.05
-    }
-    
-    total_score = (
-        tag_similarity * weights['composite_tags'] +
-        atomic_similarity * weights['atomic_tags'] +
-        genre_similarity * weights['genre'] +
-        year_similarity * weights['year'] +
-        country_similarity * weights['country']
-    )
-    
-    # Build breakdown dictionary for tooltip/details
-    breakdown = {
-        'shared_tags_count': len(shared_tags),
-        'total_tags': len(album1_tag_ids),
-        'shared_atomic_count': len(shared_atomic),
-        'total_atomic': len(album1_atomic_ids),
-        'tag_similarity': tag_similarity,
-        'atomic_similarity': atomic_similarity,
-        'genre_match': genre_similarity > 0,
-        'year_proximity': year_similarity,
-        'year_diff': abs(album1_year - album2.release_year) if album1_year and album2.release_year else None,
-        'country_match': country_similarity > 0,
-        'shared_tag_names': [album2.tags[i].name for i, tag_id in enumerate(album2_tag_ids) if tag_id in shared_tags][:10],  # Max 10 for display
-    }
-    
-    return total_score, breakdown
+    # Load only the result albums, in one query
+    albums = {a.id: a for a in session.query(Album).filter(Album.id.in_([r[0].id for r in results])).all()}
+    return [(albums[summary.id], score, breakdown) for summary, score, breakdown in results if summary.id in albums]
 
 
 def get_shared_tags(
@@ -0,0 +1,206 @@
+"""Manifest of the source files ingested into the persistent database.
+
+Each ingested CSV is recorded with its resolved path, size, mtime and a
+SHA-256 of its contents. On startup only files that are new or whose
+contents changed need ingesting: an unchanged size and mtime skip the
+file without reading it, and a file that was only touched is recognised
+by its hash. Albums remember the resolved path of the file they came
+from, the manifest's key, so the albums of a changed file are deleted
+before it is ingested again without touching those of a same-named file
+elsewhere.
+
+Files left out of a load on purpose are recorded as excluded, losing the
+albums they had, and are never reported as pending until they are loaded
+explicitly.
+"""
+import hashlib
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from sqlalchemy import delete, event, func, inspect, select, text, update
+from sqlalchemy.orm import Session
+
+from .models import Album, Base, ExcludedSourceFile, SourceFile, album_atomic_tags, album_tags
+from albumexplore.gui.gui_logging import db_logger
+
+_CHUNK_SIZE = 1 << 20
+
+
+def content_hash(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _key(path: Union[str, Path]) -> str:
+    return str(Path(path).resolve())
+
+
+class SourceManifest:
+    """Ingested source files of a database, read through a session.
+
+    The caller owns the transaction: ``pending`` refreshes the mtime of
+    touched but unchanged files, ``forget``, ``record`` and ``exclude``
+    stage their changes, and nothing is committed here.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def entries(self) -> Dict[str, SourceFile]:
+        return {entry.path: entry for entry in self.session.scalars(select(SourceFile))}
+
+    def excluded(self) -> Set[str]:
+        return set(self.session.scalars(select(ExcludedSourceFile.path)))
+
+    def pending(self, paths: Iterable[Union[str, Path]]) -> List[Path]:
+        """The files among ``paths`` that are not ingested in their current state, in input order.
+
+        Excluded files are left out.
+        """
+        entries = self.entries()
+        excluded = self.excluded()
+        result = []
+        for path in map(Path, paths):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            key = _key(path)
+            if key in excluded:
+                continue
+            entry = entries.get(key)
+            if entry is None:
+                result.append(path)
+            elif entry.size == st.st_size and entry.mtime_ns == st.st_mtime_ns:
+                continue
+            elif entry.size == st.st_size and entry.content_hash == content_hash(path):
+                entry.mtime_ns = st.st_mtime_ns
+            else:
+                result.append(path)
+        return result
+
+    def forget(self, path: Union[str, Path]) -> int:
+        """Delete the albums ingested from a file and its manifest entry; returns the album count."""
+        path = Path(path)
+        key = _key(path)
+        album_ids = select(Album.id).where(Album.source_path == key).scalar_subquery()
+        self.session.execute(delete(album_tags).where(album_tags.c.album_id.in_(album_ids)))
+        self.session.execute(delete(album_atomic_tags).where(album_atomic_tags.c.album_id.in_(album_ids)))
+        removed = self.session.execute(
+            delete(Album).where(Album.source_path == key).execution_options(synchronize_session=False)
+        ).rowcount
+        entry = self.session.get(SourceFile, key)
+        if entry is not None:
+            self.session.delete(entry)
+        if removed:
+            db_logger.info(f"Removed {removed} albums previously ingested from {path.name}")
+        return removed
+
+    def record(self, path: Union[str, Path], album_count: Optional[int] = None) -> SourceFile:
+        """Record a file as ingested in its current state; an excluded file no longer is."""
+        path = Path(path)
+        st = path.stat()
+        key = _key(path)
+        self.session.execute(delete(ExcludedSourceFile).where(ExcludedSourceFile.path == key))
+        entry = self.session.get(SourceFile, key)
+        if entry is None:
+            entry = SourceFile(path=key)
+            self.session.add(entry)
+        entry.size = st.st_size
+        entry.mtime_ns = st.st_mtime_ns
+        entry.content_hash = content_hash(path)
+        entry.album_count = album_count
+        entry.ingested_at = datetime.utcnow()
+        return entry
+
+    def exclude(self, paths: Iterable[Union[str, Path]]) -> int:
+        """Record files left out of a load on purpose; returns the albums removed.
+
+        The albums of files that were ingested before are deleted, so the
+        files picked for a load are the ones whose albums are in the database.
+        """
+        ingested = set(self.entries())
+        excluded = self.excluded()
+        removed = 0
+        for key in dict.fromkeys(map(_key, paths)):
+            if key in ingested:
+                removed += self.forget(key)
+            if key not in excluded:
+                self.session.add(ExcludedSourceFile(path=key))
+        return removed
+
+    def album_counts(self, paths: Iterable[Union[str, Path]]) -> Dict[str, int]:
+        """Albums in the database per resolved source path."""
+        keys = [_key(p) for p in paths]
+        counts = dict.fromkeys(keys, 0)
+        counts.update(self.session.execute(
+            select(Album.source_path, func.count()).where(Album.source_path.in_(keys)).group_by(Album.source_path)
+        ).all())
+        return counts
+
+
+def clear_derived_caches() -> None:
+    """Drop the in-memory album store, similarity and co-occurrence caches built from the database."""
+    from albumexplore.visualization.album_store import clear_album_store_cache
+    from .co_occurrence import clear_co_occurrence_cache
+    from .similarity import invalidate_similarity_engines
+
+    clear_album_store_cache()
+    invalidate_similarity_engines()
+    clear_co_occurrence_cache()
+
+
+def ingest_sources(session: Session, dataframe, paths: Iterable[Union[str, Path]],
+                   excluded: Iterable[Union[str, Path]] = ()) -> None:
+    """
+    Load the parsed rows of ``paths`` and record the files in the manifest.
+
+    Albums left from an earlier version of any of the files are deleted
+    first, so a changed file replaces its albums instead of adding to them.
+    Rows carry the file name in ``_source_file`` and its resolved path in
+    ``_source_path``; rows without a path get it from their file name.
+    ``excluded`` are the files deliberately left out of this load; albums
+    ingested from them earlier are deleted.
+    """
+    from .optimized_csv_loader import load_dataframe_data_optimized
+
+    paths = [Path(p) for p in paths]
+    if '_source_path' not in dataframe.columns:
+        dataframe = dataframe.assign(_source_path=dataframe['_source_file'].map({p.name: _key(p) for p in paths}))
+    manifest = SourceManifest(session)
+    for path in paths:
+        manifest.forget(path)
+    load_dataframe_data_optimized(dataframe, session)
+    counts = manifest.album_counts(paths)
+    for path in paths:
+        manifest.record(path, counts[_key(path)])
+    manifest.exclude(excluded)
+    session.commit()
+    clear_derived_caches()
+    db_logger.info(f"Recorded {len(paths)} ingested source files")
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _add_source_path(target, connection, **kw):
+    # Albums of a database from before source_path only know their file name;
+    # the names the manifest holds once map back to their path
+    inspector = inspect(connection)
+    if not (inspector.has_table('albums') and inspector.has_table('source_files')) \
+            or 'source_path' in {column['name'] for column in inspector.get_columns('albums')}:
+        return
+    connection.execute(text("ALTER TABLE albums ADD COLUMN source_path VARCHAR"))
+    connection.execute(text("CREATE INDEX ix_albums_source_path ON albums (source_path)"))
+    by_name = defaultdict(list)
+    for path in connection.scalars(select(SourceFile.path)):
+        by_name[Path(path).name].append(path)
+    albums = Album.__table__
+    for name, paths in by_name.items():
+        if len(paths) == 1:
+            connection.execute(update(albums).where(albums.c.source_file == name).values(source_path=paths[0]))
+    db_logger.info(f"Added source paths to the albums of {sum(len(p) == 1 for p in by_name.values())} source files")
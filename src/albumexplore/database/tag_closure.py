@@ -0,0 +1,193 @@
+"""Materialized transitive closure of the tag hierarchy.
+
+``tag_closure`` holds a row for every (ancestor, descendant) pair of
+``tag_hierarchy`` with the length of the shortest path between them, so
+ancestor, descendant and subgenre lookups are a single indexed SELECT
+instead of a walk over ``Tag.parent_tags``/``child_tags``.
+
+The table is kept incrementally: call ``add_edge`` when a parent -> child
+link is created and ``remove_edge`` after one is removed. Anything else
+that rewrites ``tag_hierarchy`` in bulk, or deletes tags that have links,
+should call ``rebuild_tag_closure`` afterwards.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, insert, select, text, union_all, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Subquery
+
+from .models import Base, Tag, tag_closure, tag_hierarchy
+from albumexplore.gui.gui_logging import db_logger
+
+# Bounds the rebuild walk should tag_hierarchy contain a cycle
+MAX_DEPTH = 64
+
+_REBUILD_SQL = f"""
+WITH RECURSIVE walk(ancestor_id, descendant_id, depth) AS (
+    SELECT parent_id, child_id, 1 FROM tag_hierarchy
+    WHERE parent_id IS NOT NULL AND child_id IS NOT NULL AND parent_id != child_id
+    UNION
+    SELECT walk.ancestor_id, tag_hierarchy.child_id, walk.depth + 1
+    FROM walk JOIN tag_hierarchy ON tag_hierarchy.parent_id = walk.descendant_id
+    WHERE walk.depth < {MAX_DEPTH}
+)
+INSERT INTO tag_closure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, MIN(depth) FROM walk
+WHERE ancestor_id != descendant_id
+GROUP BY ancestor_id, descendant_id
+"""
+
+
+def rebuild_tag_closure(connection: Connection) -> int:
+    """Recompute the whole closure from tag_hierarchy; returns the number of pairs."""
+    connection.execute(delete(tag_closure))
+    connection.execute(text(_REBUILD_SQL))
+    count = connection.execute(select(func.count()).select_from(tag_closure)).scalar_one()
+    db_logger.info(f"Rebuilt tag closure: {count} ancestor/descendant pairs")
+    return count
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _fill_after_tables(target, connection, **kw):
+    # A database from before the closure table has links but no pairs yet
+    if connection.execute(select(tag_closure.c.ancestor_id).limit(1)).first() is None \
+            and connection.execute(select(tag_hierarchy.c.parent_id).limit(1)).first() is not None:
+        rebuild_tag_closure(connection)
+
+
+def _ancestor_depths(session: Session, tag_id: str) -> Dict[str, int]:
+    """The tag itself at depth 0 and its ancestors at their depth."""
+    depths = {tag_id: 0}
+    depths.update(session.execute(
+        select(tag_closure.c.ancestor_id, tag_closure.c.depth).where(tag_closure.c.descendant_id == tag_id)
+    ).all())
+    return depths
+
+
+def _descendant_depths(session: Session, tag_id: str) -> Dict[str, int]:
+    """The tag itself at depth 0 and its descendants at their depth."""
+    depths = {tag_id: 0}
+    depths.update(session.execute(
+        select(tag_closure.c.descendant_id, tag_closure.c.depth).where(tag_closure.c.ancestor_id == tag_id)
+    ).all())
+    return depths
+
+
+def _paths_through(session: Session, parent_id: str, child_id: str) -> Dict[Tuple[str, str], int]:
+    """Shortest depth of every pair connected through the parent -> child link."""
+    ups = _ancestor_depths(session, parent_id)
+    downs = _descendant_depths(session, child_id)
+    return {(a, d): up + 1 + down for a, up in ups.items() for d, down in downs.items()}
+
+
+def _merge(session: Session, pairs: Dict[Tuple[str, str], int]) -> None:
+    """Insert new pairs and shorten the depth of existing ones."""
+    if not pairs:
+        return
+    ancestors = {a for a, _ in pairs}
+    descendants = {d for _, d in pairs}
+    existing = {
+        (a, d): depth for a, d, depth in session.execute(
+            select(tag_closure.c.ancestor_id, tag_closure.c.descendant_id, tag_closure.c.depth).where(
+                tag_closure.c.ancestor_id.in_(ancestors), tag_closure.c.descendant_id.in_(descendants)
+            )
+        )
+    }
+    new = [{'ancestor_id': a, 'descendant_id': d, 'depth': depth}
+           for (a, d), depth in pairs.items() if (a, d) not in existing]
+    if new:
+        session.execute(insert(tag_closure), new)
+    for (a, d), depth in pairs.items():
+        if (a, d) in existing and depth < existing[(a, d)]:
+            session.execute(update(tag_closure).where(
+                tag_closure.c.ancestor_id == a, tag_closure.c.descendant_id == d
+            ).values(depth=depth))
+
+
+def add_edge(session: Session, parent_id: str, child_id: str) -> None:
+    """
+    Record a parent -> child link in the closure.
+
+    Raises ValueError if the link would make a tag its own ancestor; check
+    ``would_create_cycle`` first to refuse it before touching tag_hierarchy.
+    """
+    if would_create_cycle(session, parent_id, child_id):
+        raise ValueError(f"Tag {child_id} is already an ancestor of {parent_id}")
+    _merge(session, _paths_through(session, parent_id, child_id))
+
+
+def remove_edge(session: Session, parent_id: str, child_id: str) -> None:
+    """
+    Update the closure after a parent -> child link was removed from tag_hierarchy.
+
+    Only pairs from outside the child's subtree into it can have gone
+    through the link; they are deleted and re-derived from the links that
+    still enter the subtree.
+    """
+    session.flush()
+    subtree = set(_descendant_depths(session, child_id))
+    session.execute(delete(tag_closure).where(
+        tag_closure.c.descendant_id.in_(subtree), tag_closure.c.ancestor_id.notin_(subtree)
+    ))
+    pairs: Dict[Tuple[str, str], int] = {}
+    entering = session.execute(
+        select(tag_hierarchy.c.parent_id, tag_hierarchy.c.child_id).where(
+            tag_hierarchy.c.child_id.in_(subtree), tag_hierarchy.c.parent_id.notin_(subtree)
+        )
+    ).all()
+    for p, c in entering:
+        for pair, depth in _paths_through(session, p, c).items():
+            if depth < pairs.get(pair, MAX_DEPTH + 1):
+                pairs[pair] = depth
+    _merge(session, pairs)
+
+
+def would_create_cycle(session: Session, parent_id: str, child_id: str) -> bool:
+    """Whether a parent -> child link would make a tag its own ancestor."""
+    return parent_id == child_id or is_descendant(session, parent_id, child_id)
+
+
+def is_descendant(session: Session, tag_id: str, ancestor_id: str) -> bool:
+    """Whether ``tag_id`` is below ``ancestor_id`` in the hierarchy."""
+    return session.execute(
+        select(tag_closure.c.depth).where(
+            tag_closure.c.ancestor_id == ancestor_id, tag_closure.c.descendant_id == tag_id
+        )
+    ).first() is not None
+
+
+def ancestors(session: Session, tag_id: str, max_depth: Optional[int] = None) -> List[Tag]:
+    """Ancestor tags, nearest first, up to ``max_depth`` links away (all when None)."""
+    query = select(Tag).join(tag_closure, Tag.id == tag_closure.c.ancestor_id).where(
+        tag_closure.c.descendant_id == tag_id
+    )
+    if max_depth is not None:
+        query = query.where(tag_closure.c.depth <= max_depth)
+    return list(session.scalars(query.order_by(tag_closure.c.depth, Tag.name)))
+
+
+def descendants(session: Session, tag_id: str, max_depth: Optional[int] = None) -> List[Tag]:
+    """Descendant tags, nearest first, up to ``max_depth`` links away (all when None)."""
+    query = select(Tag).join(tag_closure, Tag.id == tag_closure.c.descendant_id).where(
+        tag_closure.c.ancestor_id == tag_id
+    )
+    if max_depth is not None:
+        query = query.where(tag_closure.c.depth <= max_depth)
+    return list(session.scalars(query.order_by(tag_closure.c.depth, Tag.name)))
+
+
+def subgenre_expansion(tag_ids: Iterable[str]) -> Subquery:
+    """
+    (tag_id, descendant_id) rows pairing each tag with itself and every descendant.
+
+    Joining ``descendant_id`` to a link table's tag column matches albums
+    carrying a tag or any of its subgenres; ``tag_id`` says which of the
+    requested tags a row stands for.
+    """
+    tag_ids = list(set(tag_ids))
+    return union_all(
+        select(tag_closure.c.ancestor_id.label('tag_id'), tag_closure.c.descendant_id)
+        .where(tag_closure.c.ancestor_id.in_(tag_ids)),
+        select(Tag.id.label('tag_id'), Tag.id.label('descendant_id')).where(Tag.id.in_(tag_ids)),
+    ).subquery('subgenres')
@@ -3,7 +3,8 @@
 from typing import Dict, List, Set, Tuple
 from sqlalchemy.orm import Session
 from .models import Tag, TagVariant
-from ..visualization.data_interface import TagNormalizer
+from .tag_closure import rebuild_tag_closure
+from albumexplore.tags.normalizer.tag_normalizer import TagNormalizer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,7 @@ class TagConsolidator:
         other_tags = [t for t in tags if t != canonical]
         
         logger.info(f"Merging {len(other_tags)} variants into canonical tag '{canonical.name}'")
+        in_hierarchy = False
         
         # Create variants for other tags
         for tag in other_tags:
@@ -63,7 +65,13 @@ class TagConsolidator:
                 album.tags.remove(tag)
             
             # Delete old tag
+            in_hierarchy = in_hierarchy or bool(tag.parent_tags or tag.child_tags)
             self.db.delete(tag)
         
+        if in_hierarchy:
+            # Deleting the tags removes their links; paths through them go from the closure
+            self.db.flush()
+            rebuild_tag_closure(self.db.connection())
+        
         canonical.normalized_name = normalized_name
         self.db.commit()
\ No newline at end of file
@@ -8,6 +8,7 @@ from sqlalchemy import and_
 
 from albumexplore.database import get_session
 from albumexplore.database.models import Tag, TagCategory, tag_hierarchy
+from albumexplore.database import tag_closure
 from albumexplore.gui.gui_logging import db_logger
 
 class TagHierarchyManager:
@@ -95,42 +96,21 @@ class TagHierarchyManager:
     
     def get_all_descendants(self, tag: Tag) -> Set[Tag]:
         """Get all descendant tags (children, grandchildren, etc.) for a given tag."""
-        descendants = set()
-        to_process = [tag]
-        
-        while to_process:
-            current_tag = to_process.pop()
-            children = self.get_child_tags(current_tag)
-            for child in children:
-                if child not in descendants:
-                    descendants.add(child)
-                    to_process.append(child)
-        
-        return descendants
+        return set(tag_closure.descendants(self.session, tag.id))
     
     def get_all_ancestors(self, tag: Tag) -> Set[Tag]:
         """Get all ancestor tags (parents, grandparents, etc.) for a given tag."""
-        ancestors = set()
-        to_process = [tag]
-        
-        while to_process:
-            current_tag = to_process.pop()
-            parents = self.get_parent_tags(current_tag)
-            for parent in parents:
-                if parent not in ancestors:
-                    ancestors.add(parent)
-                    to_process.append(parent)
-        
-        return ancestors
+        return set(tag_closure.ancestors(self.session, tag.id))
     
     def get_root_genre(self, tag: Tag) -> Optional[Tag]:
         """Get the root genre for a given tag."""
-        ancestors = self.get_all_ancestors(tag)
+        # Ancestors come nearest first, so the last one without parents is the farthest root
+        ancestors = tag_closure.ancestors(self.session, tag.id)
         if not ancestors:
             return tag  # Tag itself is a root
         
         # Find the ancestor with no parents
-        for ancestor in ancestors:
+        for ancestor in reversed(ancestors):
             if not self.get_parent_tags(ancestor):
                 return ancestor
         
@@ -138,8 +118,7 @@ class TagHierarchyManager:
     
     def is_subgenre_of(self, child_tag: Tag, parent_tag: Tag) -> bool:
         """Check if child_tag is a subgenre of parent_tag."""
-        ancestors = self.get_all_ancestors(child_tag)
-        return parent_tag in ancestors
+        return tag_closure.is_descendant(self.session, child_tag.id, parent_tag.id)
     
     def find_related_tags(self, tag: Tag, max_distance: int = 2) -> Dict[str, List[Tag]]:
         """Find tags related to the given tag within a certain hierarchical distance."""
@@ -220,6 +199,7 @@ class TagHierarchyManager:
         try:
             if child_tag in parent_tag.child_tags:
                 parent_tag.child_tags.remove(child_tag)
+                tag_closure.remove_edge(self.session, parent_tag.id, child_tag.id)
                 self.session.commit()
                 db_logger.info(f"Removed hierarchy relationship: {parent_tag.name} -> {child_tag.name}")
                 return True
@@ -298,13 +278,14 @@ class TagHierarchyManager:
                     return False
             
             # Prevent circular dependencies
-            if self.is_subgenre_of(parent_tag, child_tag):
+            if tag_closure.would_create_cycle(self.session, parent_tag.id, child_tag.id):
                 db_logger.warning(f"Circular dependency detected: {parent_tag.name} -> {child_tag.name}")
                 return False
             
             # Create the relationship
             if child_tag not in parent_tag.child_tags:
                 parent_tag.child_tags.append(child_tag)
+                tag_closure.add_edge(self.session, parent_tag.id, child_tag.id)
                 db_logger.debug(f"Created hierarchy relationship: {parent_tag.name} -> {child_tag.name}")
                 return True
             
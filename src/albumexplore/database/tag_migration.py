@@ -12,6 +12,7 @@ from sqlalchemy import func
 
 from albumexplore.database import get_session
 from albumexplore.database.models import Album, Tag, TagVariant, TagCategory, UpdateHistory
+from albumexplore.database.tag_closure import rebuild_tag_closure
 from albumexplore.tags.normalizer.tag_normalizer import TagNormalizer
 from albumexplore.gui.gui_logging import db_logger
 
@@ -22,6 +23,7 @@ class TagMigrationManager:
         self.session = get_session()
         self.normalizer = TagNormalizer()
         self.dry_run = dry_run
+        self._hierarchy_changed = False  # A merged tag had parent or child links
         self.stats = {
             'tags_processed': 0,
             'tags_merged': 0,
@@ -153,6 +155,11 @@ class TagMigrationManager:
             if len(tags) > 1:
                 merged_count += self._merge_tag_group(normalized_name, tags)
         
+        if self._hierarchy_changed:
+            # Deleting the merged tags removed their links; paths through them go from the closure
+            self.session.flush()
+            rebuild_tag_closure(self.session.connection())
+        
         self.stats['tags_merged'] = merged_count
         db_logger.info(f"Merged {merged_count} duplicate tags")
     
@@ -185,6 +192,8 @@ class TagMigrationManager:
                     album.tags.remove(tag)
                 
                 # Delete the duplicate tag
+                if tag.parent_tags or tag.child_tags:
+                    self._hierarchy_changed = True
                 self.session.delete(tag)
         
         return len(other_tags)
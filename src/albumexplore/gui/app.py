@@ -4,7 +4,7 @@ import logging
 from pathlib import Path # Added Path
 from PyQt6.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget, QApplication, QStackedWidget
 from PyQt6.QtGui import QAction # Added QAction
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from .views.table_view import TableView
 from .views.similarity_bar_view import SimilarityBarChartView
 from albumexplore.visualization.views.tag_explorer_view import TagExplorerView # Corrected import
@@ -20,6 +20,8 @@ from albumexplore.visualization.view_manager import ViewManager
 from albumexplore.visualization.state import ViewType
 from albumexplore.gui.gui_logging import graphics_logger # Changed from gui_logger to graphics_logger
 from albumexplore.database import init_db, get_session # Added imports
+from albumexplore.database.models import Album
+from albumexplore.database.source_manifest import SourceManifest, clear_derived_caches, ingest_sources
 from albumexplore.database.csv_loader import load_dataframe_data # Added import
 # Removed auto-loading import: from albumexplore.database.csv_loader import load_csv_data
 from albumexplore.visualization.data_interface import DataInterface # Added import
@@ -43,6 +45,7 @@ class AlbumExplorer(QMainWindow):
             
             # Initialize views
             self.table_view = TableView()
+            self.table_view.set_session(self.session)
             self.tag_explorer_view = TagExplorerView()
             self.similarity_view = SimilarityBarChartView()
             self.similarity_view.set_session(self.session)
@@ -77,6 +80,14 @@ class AlbumExplorer(QMainWindow):
             # Show a welcome message instead of loading data
             self._show_welcome_view()
 
+            # Albums kept from an earlier run are shown straight away;
+            # CSV files added or changed since then are ingested in the background
+            album_count = self.session.query(Album).count()
+            if album_count:
+                self._show_loaded_data(album_count)
+            self._sync_worker = None
+            QTimer.singleShot(0, self._sync_sources)
+
             graphics_logger.info("Album Explorer initialized - ready for data loading")
             
         except Exception as e:
@@ -104,19 +115,62 @@ class AlbumExplorer(QMainWindow):
         self.stacked_widget.setCurrentWidget(welcome_widget)
         self.welcome_widget = welcome_widget
     
+    def _csv_directory(self) -> Path:
+        project_root = Path(__file__).resolve().parent.parent.parent.parent
+        return project_root / "csv"
+
     def _show_data_loader(self):
         """Show the data loader dialog."""
         from .data_loader_dialog import DataLoaderDialog
         
-        project_root = Path(__file__).resolve().parent.parent.parent.parent
-        csv_directory = project_root / "csv"
-        
-        dialog = DataLoaderDialog(self, csv_directory)
-        dialog.data_loaded.connect(self._on_data_loaded)
+        dialog = DataLoaderDialog(self, self._csv_directory())
+        dialog.data_loaded.connect(
+            lambda dataframe: self._on_data_loaded(dataframe, dialog.loaded_files, dialog.excluded_files))
         dialog.exec()
+
+    def _sync_sources(self):
+        """Ingest the CSV files that are new or changed since they were last ingested."""
+        from .data_loader_dialog import DataLoadWorker
+
+        csv_directory = self._csv_directory()
+        if not csv_directory.exists() or self._sync_worker is not None:
+            return
+        csv_files = sorted(list(csv_directory.glob("*.csv")) + list(csv_directory.glob("*.tsv")))
+        manifest = SourceManifest(self.session)
+        entries = manifest.entries()
+        if not entries:
+            # An empty database is filled through File > Load Data
+            return
+        # Files left out of earlier loads on purpose are excluded in the manifest
+        pending = manifest.pending(csv_files)
+        # Touched but unchanged files only had their mtime refreshed
+        self.session.commit()
+        if not pending:
+            return
+
+        graphics_logger.info(f"Ingesting {len(pending)} new or changed CSV files: {[p.name for p in pending]}")
+        self.statusBar().showMessage(f"Updating from {len(pending)} new or changed CSV files...")
+        worker = DataLoadWorker(pending)
+        parsed = []
+        worker.file_processed.connect(lambda name, rows, success: success and parsed.append(name))
+        worker.loading_complete.connect(
+            lambda dataframe: self._on_data_loaded(dataframe, [p for p in pending if p.name in parsed]))
+        worker.error_occurred.connect(lambda message: graphics_logger.error(f"CSV update failed: {message}"))
+        worker.finished.connect(self._on_sync_finished)
+        self._sync_worker = worker
+        worker.start()
+
+    def _on_sync_finished(self):
+        self._sync_worker = None
+        self.statusBar().clearMessage()
     
-    def _on_data_loaded(self, dataframe):
-        """Handle data loaded from the dialog."""
+    def _on_data_loaded(self, dataframe, files=None, excluded=()):
+        """Handle data loaded from the dialog or the startup update.
+
+        With the list of parsed files the albums are recorded in the source
+        manifest, replacing those of earlier versions of the files. Files in
+        ``excluded`` were left out on purpose and are not ingested on startup.
+        """
         graphics_logger.info(f"Data loaded: {len(dataframe)} rows. Saving to database with optimized processing...")
         
         # Debug: Check what columns are in the DataFrame
@@ -134,8 +188,11 @@ class AlbumExplorer(QMainWindow):
             session = get_session()
             
             # Use optimized loader for better performance
-            from albumexplore.database.optimized_csv_loader import load_dataframe_data_optimized
-            load_dataframe_data_optimized(dataframe, session)
+            if files:
+                ingest_sources(session, dataframe, files, excluded)
+            else:
+                from albumexplore.database.optimized_csv_loader import load_dataframe_data_optimized
+                load_dataframe_data_optimized(dataframe, session)
             graphics_logger.info("Successfully saved data to database using optimized processing.")
             
             # Debug: Check what was actually saved to the database
@@ -148,12 +205,20 @@ class AlbumExplorer(QMainWindow):
             graphics_logger.info("Falling back to original data loading method...")
             try:
                 from albumexplore.database.csv_loader import load_dataframe_data
-                load_dataframe_data(dataframe, session)
+                load_dataframe_data(dataframe, session, bulk=True)
                 graphics_logger.info("Successfully saved data using fallback method.")
             except Exception as fallback_error:
                 graphics_logger.error(f"Fallback method also failed: {fallback_error}", exc_info=True)
                 return
         
+        self._show_loaded_data(self.session.query(Album).count())
+
+    def _show_loaded_data(self, album_count: int):
+        """Enable the views and show the albums in the table view."""
+        # Caches and similarity results built from earlier data are dropped
+        clear_derived_caches()
+        self.similarity_view.invalidate_cache()
+
         # Enable view menu actions
         self.table_action.setEnabled(True)
         self.tag_explorer_action.setEnabled(True)
@@ -162,15 +227,16 @@ class AlbumExplorer(QMainWindow):
             self.map_action.setEnabled(True)
         
         # Update the window title
-        self.setWindowTitle(f"Album Explorer - {len(dataframe)} albums loaded")
+        self.setWindowTitle(f"Album Explorer - {album_count} albums loaded")
         
         # Switch to table view to show the data
         self.view_manager.switch_view(ViewType.TABLE)
         
         # Remove welcome widget if it exists
-        if hasattr(self, 'welcome_widget'):
+        if getattr(self, 'welcome_widget', None) is not None:
             self.stacked_widget.removeWidget(self.welcome_widget)
             self.welcome_widget.deleteLater()
+            self.welcome_widget = None
 
     def _setup_menu_bar(self):
         """Sets up the main menu bar with data loading and view switching actions."""
@@ -2,6 +2,8 @@
 Data Loader Dialog for selective CSV file processing.
 """
 import logging
+import os
+from contextlib import closing
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from PyQt6.QtWidgets import (
@@ -13,7 +15,8 @@ from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer
 from PyQt6.QtGui import QFont
 import pandas as pd
 
-from albumexplore.data.parsers.csv_parser import CSVParser
+from albumexplore.data.parsers.csv_parser import SNAPSHOT_VERSION, iter_parsed_csv
+from albumexplore.data.parsers.snapshot_cache import ParsedCSVCache
 from albumexplore.data.validators.data_validator import DataValidator
 
 logger = logging.getLogger(__name__)
@@ -28,11 +31,16 @@ class DataLoadWorker(QThread):
     error_occurred = pyqtSignal(str)  # error message
     log_message = pyqtSignal(str, str)  # level, message
     
-    def __init__(self, csv_files: List[Path], debug_level: str = "INFO"):
+    def __init__(self, csv_files: List[Path], debug_level: str = "INFO",
+                 snapshot_cache: Optional[ParsedCSVCache] = None, workers: int = 1):
         super().__init__()
         self.csv_files = csv_files
         self.debug_level = debug_level
+        # Number of processes parsing files concurrently; 1 parses them in this thread
+        self.workers = max(1, workers)
         self.should_cancel = False
+        # Cleaned DataFrames of files unchanged since the last load are read back from here
+        self.snapshot_cache = snapshot_cache or ParsedCSVCache(version=SNAPSHOT_VERSION)
         
     def _standardize_columns(self, df, filename):
         """Standardize column names across different CSV formats."""
@@ -94,46 +102,54 @@ class DataLoadWorker(QThread):
             all_dfs = []
             total_files = len(self.csv_files)
             
-            for i, csv_file in enumerate(self.csv_files):
-                if self.should_cancel:
-                    self.log_message.emit("INFO", "Processing cancelled by user")
-                    return
-                    
-                self.progress_updated.emit(
-                    int((i / total_files) * 100), 
-                    f"Processing {csv_file.name}..."
-                )
-                
-                try:
-                    # Process single file
-                    parser = CSVParser(csv_file)
-                    df = parser.parse_single_csv(csv_file)
-                    
-                    if not df.empty:
-                        # Standardize column names
-                        df = self._standardize_columns(df, csv_file.name)
-                        df['_source_file'] = csv_file.name
+            # Files are parsed ahead in worker processes but handed back in selection order
+            parsed = iter_parsed_csv(self.csv_files, self.workers, self.snapshot_cache)
+            with closing(parsed):
+                for i, csv_file in enumerate(self.csv_files):
+                    if self.should_cancel:
+                        self.log_message.emit("INFO", "Processing cancelled by user")
+                        return
                         
-                        # Log column information for debugging
-                        columns_info = list(df.columns)
-                        self.log_message.emit("DEBUG", f"Final columns in {csv_file.name}: {columns_info}")
+                    self.progress_updated.emit(
+                        int((i / total_files) * 100), 
+                        f"Processing {csv_file.name}..."
+                    )
+                    
+                    try:
+                        _, df, error = next(parsed)
+                        if error is not None:
+                            raise error
                         
-                        all_dfs.append(df)
-                        self.file_processed.emit(csv_file.name, len(df), True)
-                        self.log_message.emit("INFO", f"Successfully processed {csv_file.name}: {len(df)} rows")
-                    else:
+                        if not df.empty:
+                            # Standardize column names
+                            df = self._standardize_columns(df, csv_file.name)
+                            df['_source_file'] = csv_file.name
+                            df['_source_path'] = str(csv_file.resolve())
+                            
+                            # Log column information for debugging
+                            columns_info = list(df.columns)
+                            self.log_message.emit("DEBUG", f"Final columns in {csv_file.name}: {columns_info}")
+                            
+                            all_dfs.append(df)
+                            self.file_processed.emit(csv_file.name, len(df), True)
+                            self.log_message.emit("INFO", f"Successfully processed {csv_file.name}: {len(df)} rows")
+                        else:
+                            self.file_processed.emit(csv_file.name, 0, False)
+                            self.log_message.emit("WARNING", f"No data found in {csv_file.name}")
+                            
+                    except Exception as e:
                         self.file_processed.emit(csv_file.name, 0, False)
-                        self.log_message.emit("WARNING", f"No data found in {csv_file.name}")
-                        
-                except Exception as e:
-                    self.file_processed.emit(csv_file.name, 0, False)
-                    self.log_message.emit("ERROR", f"Error processing {csv_file.name}: {str(e)}")
-                    # Log more details for debugging
-                    import traceback
-                    self.log_message.emit("DEBUG", f"Full error trace for {csv_file.name}: {traceback.format_exc()}")
+                        self.log_message.emit("ERROR", f"Error processing {csv_file.name}: {str(e)}")
+                        # Log more details for debugging
+                        import traceback
+                        self.log_message.emit("DEBUG", f"Full error trace for {csv_file.name}: {traceback.format_exc()}")
                     
             # Combine all dataframes
             if all_dfs:
+                self.log_message.emit(
+                    "DEBUG",
+                    f"Snapshot cache: {self.snapshot_cache.hits} of {total_files} files read from snapshots"
+                )
                 self.progress_updated.emit(90, "Combining data...")
                 combined_df = pd.concat(all_dfs, ignore_index=True)
                 
@@ -203,6 +219,11 @@ class DataLoaderDialog(QDialog):
         self.csv_directory = csv_directory or Path("csv")
         self.worker = None
         self.loaded_data = None
+        # Files whose rows are in loaded_data
+        self.loaded_files: List[Path] = []
+        # Listed files left unchecked for that load; albums ingested from them are removed
+        self.excluded_files: List[Path] = []
+        self._selected_files: List[Path] = []
         
         self._setup_ui()
         self._discover_csv_files()
@@ -301,6 +322,18 @@ class DataLoaderDialog(QDialog):
         
         layout.addWidget(debug_group)
         
+        # Parallel parsing
+        workers_group = QGroupBox("Parse Workers")
+        workers_layout = QHBoxLayout(workers_group)
+        
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, os.cpu_count() or 1)
+        self.workers_spin.setValue(min(4, os.cpu_count() or 1))
+        self.workers_spin.setToolTip("Number of processes parsing files at the same time")
+        workers_layout.addWidget(self.workers_spin)
+        
+        layout.addWidget(workers_group)
+        
         return panel
         
     def _create_progress_panel(self):
@@ -401,13 +434,17 @@ class DataLoaderDialog(QDialog):
     def _start_loading(self):
         """Start loading the selected CSV files."""
         selected_files = []
+        unselected_files = []
         
         for i in range(self.file_list.count()):
             item = self.file_list.item(i)
+            file_path = item.data(Qt.ItemDataRole.UserRole)
+            if not file_path:
+                continue
             if item.checkState() == Qt.CheckState.Checked:
-                file_path = item.data(Qt.ItemDataRole.UserRole)
-                if file_path:
-                    selected_files.append(file_path)
+                selected_files.append(file_path)
+            else:
+                unselected_files.append(file_path)
                     
         if not selected_files:
             return
@@ -418,10 +455,13 @@ class DataLoaderDialog(QDialog):
         self.close_button.setEnabled(False)
         self.progress_bar.setValue(0)
         self.status_list.clear()
+        self._selected_files = selected_files
+        self.loaded_files = []
+        self.excluded_files = unselected_files
         
         # Create and start worker
         debug_level = self.debug_combo.currentText()
-        self.worker = DataLoadWorker(selected_files, debug_level)
+        self.worker = DataLoadWorker(selected_files, debug_level, workers=self.workers_spin.value())
         
         # Connect signals
         self.worker.progress_updated.connect(self._update_progress)
@@ -447,6 +487,8 @@ class DataLoaderDialog(QDialog):
         
     def _update_file_status(self, filename: str, row_count: int, success: bool):
         """Update the file processing status."""
+        if success:
+            self.loaded_files.extend(p for p in self._selected_files if p.name == filename)
         status_icon = "✓" if success else "✗"
         status_text = f"{status_icon} {filename}: {row_count} rows" if success else f"{status_icon} {filename}: Failed"
         self.status_list.addItem(status_text)
@@ -1,61 +1,273 @@
 """GUI models for data representation."""
-from typing import List, Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
+from albumexplore.visualization.album_store import AlbumView
+
+# (header, row field) of the album table columns
+ALBUM_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("Artist", "artist"),
+    ("Album", "album"),
+    ("Year", "year"),
+    ("Genre", "genre"),
+    ("Country", "country"),
+    ("Vocal Style", "vocal_style"),
+    ("Tags", "tags"),
+)
+
+# Album fields read straight from the album store columns when sorting
+_STORE_COLUMNS = {'artist': 'artist', 'album': 'title', 'genre': 'genre', 'country': 'country',
+                  'vocal_style': 'vocal_style'}
+
+
+def _year_text(row: Dict[str, Any]) -> str:
+    year = row.get('release_year') or row.get('year')
+    return str(year) if year is not None and str(year).strip() else ''
+
+
+def _cell_text(row: Dict[str, Any], field: str) -> str:
+    """Display text of one field of an album row dict."""
+    if field == 'year':
+        return _year_text(row)
+    if field == 'album':
+        return str(row.get('album') or row.get('title') or '')
+    if field == 'vocal_style':
+        value = row.get('vocal_style') or ''
+        if not value and row.get('vocal_styles'):
+            value = ", ".join(str(v) for v in row['vocal_styles'] if v)
+        return str(value)
+    if field == 'tags':
+        tags = row.get('tags') or []
+        return ", ".join(map(str, tags)) if isinstance(tags, (list, tuple)) else str(tags)
+    value = row.get(field)
+    return '' if value is None else str(value)
+
+
 class AlbumTableModel(QAbstractTableModel):
-    """Table model for album data."""
-    
-    COLUMNS = ["Artist", "Album", "Year", "Genre", "Country", "Tags"]
-    
-    def __init__(self):
-        super().__init__()
-        self._data: List[Dict[str, Any]] = []
-    
-    def rowCount(self, parent=None) -> int:
+    """
+    Virtualized album table over a sequence of album rows.
+
+    ``rows`` is the full album list, either row dicts or an AlbumView over
+    the album store, and is never copied. The table shows ``positions``
+    into it, the current filter result, in the current sort order, so a
+    filter change only swaps an index array. Cell text is formatted when
+    the view asks for it, i.e. for the rows on screen.
+
+    Sorting uses one stable permutation of all rows per column, computed
+    the first time the column is sorted; a sorted filter result is that
+    permutation masked by the filter.
+    """
+
+    # Rows whose formatted cells are kept; enough for several screens
+    DISPLAY_CACHE_SIZE = 4096
+
+    def __init__(self, columns: Sequence[Tuple[str, str]] = ALBUM_COLUMNS, parent=None):
+        super().__init__(parent)
+        self.columns = tuple(columns)
+        self._rows: Sequence[Dict[str, Any]] = []
+        self._filter: Optional[np.ndarray] = None
+        self._order = np.empty(0, dtype=np.intp)
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._permutations: Dict[int, np.ndarray] = {}
+        self._display: Dict[int, Tuple[str, ...]] = {}
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:
         """Get number of rows."""
-        return len(self._data)
-    
-    def columnCount(self, parent=None) -> int:
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
         """Get number of columns."""
-        return len(self.COLUMNS)
-    
+        return 0 if parent.isValid() else len(self.columns)
+
     def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole) -> Any:
         """Get data for cell."""
         if not index.isValid():
             return None
-            
         if role == Qt.ItemDataRole.DisplayRole:
-            row = self._data[index.row()]
-            column = self.COLUMNS[index.column()].lower()
-            return str(row.get(column, ""))
-            
+            return self._cells(int(self._order[index.row()]))[index.column()]
         if role == Qt.ItemDataRole.UserRole:
-            return self._data[index.row()].get("id")
-            
+            return self.album_id(index.row())
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._tooltip(int(self._order[index.row()]), index.column())
         return None
-    
-    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole) -> str:
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole) -> Any:
         """Get header data."""
         if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
-            return self.COLUMNS[section]
+            return self.columns[section][0]
         return None
-    
+
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
         """Get item flags."""
         if not index.isValid():
             return Qt.ItemFlag.NoItemFlags
         return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-    
-    def set_data(self, data: List[Dict[str, Any]]):
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Sort rows by a column; the filter result keeps the order."""
+        if not 0 <= column < len(self.columns):
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_order = self._order
+        persistent = self.persistentIndexList()
+        self._sort_column, self._sort_order = column, order
+        self._apply()
+        # Selected and current indexes follow their album to its new row
+        new_rows = np.empty(len(self._rows), dtype=np.intp)
+        new_rows[self._order] = np.arange(len(self._order), dtype=np.intp)
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(int(new_rows[old_order[index.row()]]), index.column()) for index in persistent]
+        )
+        self.layoutChanged.emit()
+
+    # Data
+
+    def fieldColumn(self, field: str) -> int:
+        """Column showing a row field, or -1."""
+        for column, (_, name) in enumerate(self.columns):
+            if name == field:
+                return column
+        return -1
+
+    def set_rows(self, rows: Sequence[Dict[str, Any]], positions: Optional[np.ndarray] = None):
+        """Show a new album list, filtered to ``positions`` (all rows when None)."""
+        self.beginResetModel()
+        self._rows = rows
+        self._permutations.clear()
+        self._display.clear()
+        self._filter = None if positions is None else np.asarray(positions, dtype=np.intp)
+        self._apply()
+        self.endResetModel()
+
+    def set_data(self, data: Sequence[Dict[str, Any]]):
         """Update model data."""
+        self.set_rows(data)
+
+    def set_filter(self, positions: Optional[np.ndarray]):
+        """Show only the rows at ``positions`` of the current album list (all rows when None)."""
         self.beginResetModel()
-        self._data = data
+        self._filter = None if positions is None else np.asarray(positions, dtype=np.intp)
+        self._apply()
         self.endResetModel()
-    
-    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
-        """Sort table data."""
+
+    def rows_changed(self):
+        """Reread the album list after it was changed in place.
+
+        Drops the sort permutations and formatted cells, and filter
+        positions past its new end; set_filter does not notice such a
+        change since the list is the same object.
+        """
         self.beginResetModel()
-        column_name = self.COLUMNS[column].lower()
-        reverse = order == Qt.SortOrder.DescendingOrder
-        self._data.sort(key=lambda x: str(x.get(column_name, "")), reverse=reverse)
-        self.endResetModel()
\ No newline at end of file
+        self._permutations.clear()
+        self._display.clear()
+        if self._filter is not None:
+            self._filter = self._filter[self._filter < len(self._rows)]
+        self._apply()
+        self.endResetModel()
+
+    @property
+    def rows(self) -> Sequence[Dict[str, Any]]:
+        """The album list the table rows point into."""
+        return self._rows
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Album list positions of the table rows, in display order."""
+        return self._order
+
+    def row_at(self, row: int) -> Dict[str, Any]:
+        """Album row dict shown at a table row."""
+        return self._rows[int(self._order[row])]
+
+    def album_id(self, row: int) -> Optional[str]:
+        if isinstance(self._rows, AlbumView):
+            return str(self._rows.store.ids[self._rows.indices[self._order[row]]])
+        return self.row_at(row).get('id')
+
+    def album_ids(self) -> List[Optional[str]]:
+        """Ids of all table rows, in display order."""
+        if isinstance(self._rows, AlbumView):
+            return [str(i) for i in self._rows.store.ids[self._rows.indices[self._order]].tolist()]
+        rows = self._rows
+        return [rows[i].get('id') for i in self._order.tolist()]
+
+    def positions_for_ids(self, ids: Iterable[str]) -> np.ndarray:
+        """Album list positions of the given album ids, for ``set_filter``."""
+        wanted = set(ids)
+        if isinstance(self._rows, AlbumView):
+            return np.flatnonzero(np.isin(self._rows.ids, list(wanted)))
+        return np.array([i for i, row in enumerate(self._rows) if row.get('id') in wanted], dtype=np.intp)
+
+    def rows_for_ids(self, ids: Iterable[str]) -> List[int]:
+        """Table rows of the given album ids."""
+        wanted = set(ids)
+        if not wanted:
+            return []
+        return [row for row, album_id in enumerate(self.album_ids()) if album_id in wanted]
+
+    def _apply(self):
+        n = len(self._rows)
+        if self._sort_column is None:
+            order = np.arange(n, dtype=np.intp) if self._filter is None else np.sort(self._filter)
+        else:
+            order = self._permutation(self._sort_column)
+            if self._sort_order == Qt.SortOrder.DescendingOrder:
+                order = order[::-1]
+            if self._filter is not None:
+                mask = np.zeros(n, dtype=bool)
+                mask[self._filter] = True
+                order = order[mask[order]]
+        self._order = np.ascontiguousarray(order, dtype=np.intp)
+
+    def _permutation(self, column: int) -> np.ndarray:
+        permutation = self._permutations.get(column)
+        if permutation is None:
+            permutation = np.argsort(self._sort_keys(self.columns[column][1]), kind='stable')
+            self._permutations[column] = permutation
+        return permutation
+
+    def _sort_keys(self, field: str) -> np.ndarray:
+        """Sort key of every row for a field: years as numbers, text case-insensitively."""
+        rows = self._rows
+        if isinstance(rows, AlbumView):
+            if field == 'year':
+                return rows.years
+            if field in _STORE_COLUMNS:
+                return np.array([str(v).casefold() for v in rows.column(_STORE_COLUMNS[field]).tolist()],
+                                dtype=object)
+        if field == 'year':
+            years = np.full(len(rows), -1, dtype=np.int64)
+            for i, row in enumerate(rows):
+                try:
+                    years[i] = int(float(_year_text(row)))
+                except ValueError:
+                    pass
+            return years
+        return np.array([_cell_text(row, field).casefold() for row in rows], dtype=object)
+
+    def _cells(self, position: int) -> Tuple[str, ...]:
+        cells = self._display.get(position)
+        if cells is None:
+            if len(self._display) >= self.DISPLAY_CACHE_SIZE:
+                self._display.clear()
+            row = self._rows[position]
+            cells = self._display[position] = tuple(_cell_text(row, field) for _, field in self.columns)
+        return cells
+
+    def _tooltip(self, position: int, column: int) -> str:
+        field = self.columns[column][1]
+        text = self._cells(position)[column]
+        if field == 'year':
+            return f"Release Year: {text}"
+        if field == 'tags':
+            tags = self._rows[position].get('tags') or []
+            if isinstance(tags, (list, tuple)) and len(tags) > 3:
+                text = "\n".join(map(str, tags))
+            return f"All Tags:\n{text}" if text else "All Tags: (none)"
+        return text
@@ -7,6 +7,10 @@ API:
   - matching_counts_for_visible(expr, visible_tags) -> list of {tag, count}
   - samples_for(expr, limit)
 
+The universe (union of all tag bitsets) used for NOT and empty expressions
+is cached. Assigning a new tag_map resets it; call invalidate_universe()
+after mutating the map or its bitsets in place.
+
 This mirrors the TypeScript TagFilter we added earlier so UI code can be
 implemented either in Python or TS depending on the view.
 """
@@ -21,6 +25,18 @@ class TagFilter:
     def __init__(self, tag_map: TagMap):
         self.tag_map = tag_map
 
+    @property
+    def tag_map(self) -> TagMap:
+        return self._tag_map
+
+    @tag_map.setter
+    def tag_map(self, tag_map: TagMap) -> None:
+        self._tag_map = tag_map
+        self._universe: Optional[BitSet] = None
+
+    def invalidate_universe(self) -> None:
+        self._universe = None
+
     def evaluate(self, expr) -> BitSet:
         if expr is None:
             # empty expression -> universe
@@ -38,20 +54,16 @@ class TagFilter:
             return BitSet()
 
     def universe(self) -> BitSet:
-        out: Optional[BitSet] = None
-        for k in self.tag_map:
-            if out is None:
-                out = self.tag_map[k].clone()
-            else:
-                out = out.union(self.tag_map[k])
-        return out or BitSet()
+        if self._universe is None:
+            self._universe = BitSet.union_all(self.tag_map.values())
+        return self._universe.clone()
 
     def matching_counts_for_visible(self, expr, visible_tags: List[str]):
         base = self.evaluate(expr) if expr is not None else None
         out = []
         for tag in visible_tags:
             b = self.tag_map.get(tag, BitSet())
-            c = base.intersect(b).size() if base is not None else b.size()
+            c = base.intersection_size(b) if base is not None else b.size()
             out.append({'tag': tag, 'count': c})
         return out
 
@@ -1,23 +1,77 @@
-"""Similarity bar chart visualization view."""
+"""Similarity bar chart visualization view.
+
+Similar albums are scored on a worker thread. The best ``MAX_RESULTS``
+candidates of an album are scored once, with no threshold, and kept in an
+LRU cache keyed by album id; threshold and limit changes only re-slice the
+cached list. After a lookup the top result, the album most likely to be
+opened next, is prefetched while the worker is idle.
+"""
+from collections import OrderedDict
 from typing import Dict, Any, List, Tuple, Optional
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
                                QSlider, QPushButton, QWidget, QTableWidget,
                                QTableWidgetItem, QHeaderView, QAbstractItemView)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QCoreApplication, QObject, QThread, QTimer
 from PyQt6.QtGui import QColor
+from sqlalchemy.orm import sessionmaker
 from .base_view import BaseView
 from .album_header_widget import AlbumHeaderWidget
 from albumexplore.visualization.state import ViewType
 from albumexplore.database.models import Album
-from albumexplore.database.similarity import calculate_album_similarity_optimized
+from albumexplore.database.similarity import AlbumSummary, get_similarity_engine
 from albumexplore.gui.gui_logging import graphics_logger
 
+SimilarityResult = Tuple[AlbumSummary, float, Dict[str, Any]]
+
+# Candidates scored and cached per album; the largest "Show top" choice
+MAX_RESULTS = 100
+
+
+class SimilarityWorker(QObject):
+    """Worker that scores similar albums in a background thread.
+
+    Requests carry a generation number; a request whose generation is no
+    longer the latest when the worker reaches it is dropped unscored.
+
+    Emits:
+        finished(int, str, list): generation, album id and its scored candidates
+        failed(int, str, str): generation, album id and error message
+    """
+    finished = pyqtSignal(int, str, object)
+    failed = pyqtSignal(int, str, str)
+
+    def __init__(self, session_factory):
+        super().__init__()
+        self.session_factory = session_factory
+        # Generation of the newest request; written by the GUI thread
+        self.latest_generation = 0
+
+    @pyqtSlot(int, str)
+    def compute(self, generation: int, album_id: str):
+        if generation != self.latest_generation:
+            return
+        session = self.session_factory()
+        try:
+            results = get_similarity_engine(session).similar(album_id, limit=MAX_RESULTS, min_similarity=0.0)
+        except Exception as e:
+            graphics_logger.error(f"Error calculating similarities: {e}", exc_info=True)
+            self.failed.emit(generation, album_id, str(e))
+            return
+        finally:
+            session.close()
+        self.finished.emit(generation, album_id, results)
+
 
 class SimilarityBarChartView(BaseView):
     """Similarity bar chart visualization view."""
     
     # Signal emitted when user wants to focus on a different album
     album_focus_requested = pyqtSignal(str)  # album_id
+    # Queued to the worker: generation, album id
+    _compute_requested = pyqtSignal(int, str)
+
+    # Albums whose scored candidates are kept
+    CACHE_SIZE = 64
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -25,7 +79,13 @@ class SimilarityBarChartView(BaseView):
         self.current_album_id: Optional[str] = None
         self.current_album: Optional[Album] = None
         self.session = None  # Will be set by main app
-        self.similarities: List[Tuple[Album, float, Dict[str, Any]]] = []
+        self.similarities: List[SimilarityResult] = []
+
+        # Album id -> all scored candidates, best first, least recently used first
+        self._results_cache: "OrderedDict[str, List[SimilarityResult]]" = OrderedDict()
+        self._generation = 0
+        self._worker: Optional[SimilarityWorker] = None
+        self._worker_thread: Optional[QThread] = None
         
         # Debounce timer for control updates
         self._update_timer = QTimer()
@@ -113,7 +173,45 @@ class SimilarityBarChartView(BaseView):
         
     def set_session(self, session):
         """Set the database session."""
+        self.shutdown()
         self.session = session
+        self._results_cache.clear()
+
+    def invalidate_cache(self):
+        """Drop cached results, e.g. after albums or tags were edited."""
+        self._results_cache.clear()
+
+    def shutdown(self):
+        """Stop the worker thread; pending requests are dropped."""
+        if self._worker_thread is None:
+            return
+        self._generation += 1
+        self._worker.latest_generation = self._generation
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+        self._worker.deleteLater()
+        self._worker_thread = None
+        self._worker = None
+
+    def closeEvent(self, event):
+        self.shutdown()
+        super().closeEvent(event)
+
+    def _ensure_worker(self) -> SimilarityWorker:
+        if self._worker is None:
+            # The worker thread gets its own sessions on the same database
+            self._worker = SimilarityWorker(sessionmaker(bind=self.session.get_bind()))
+            thread = QThread(self)
+            self._worker.moveToThread(thread)
+            self._compute_requested.connect(self._worker.compute)
+            self._worker.finished.connect(self._on_results_ready)
+            self._worker.failed.connect(self._on_results_failed)
+            self._worker_thread = thread
+            thread.start()
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.shutdown)
+        return self._worker
     
     def set_album(self, album_id: str):
         """Set the focus album and refresh similarity data."""
@@ -142,9 +240,12 @@ class SimilarityBarChartView(BaseView):
         graphics_logger.info(f"Similarity view focused on: {self.current_album.pa_artist_name_on_album} - {self.current_album.title}")
     
     def _schedule_refresh(self):
-        """Schedule a refresh with debouncing."""
+        """Schedule a refresh with debouncing; cached albums are re-sliced at once."""
         self._update_timer.stop()
-        self._update_timer.start(300)  # 300ms debounce
+        if self.current_album_id in self._results_cache:
+            self._perform_refresh()
+        else:
+            self._update_timer.start(300)  # 300ms debounce
     
     def _on_threshold_changed(self):
         """Handle threshold slider changes."""
@@ -153,33 +254,59 @@ class SimilarityBarChartView(BaseView):
         self._schedule_refresh()
     
     def _perform_refresh(self):
-        """Recalculate and display similarity data."""
+        """Display similarity data, scoring the album in the background if it is not cached."""
         if not self.current_album_id or not self.session:
             return
-        
-        # Get parameters
+
+        album_id = self.current_album_id
+        results = self._results_cache.get(album_id)
+        if results is not None:
+            self._results_cache.move_to_end(album_id)
+            self._show_results(results)
+            return
+
+        graphics_logger.debug(f"Requesting similarities for {album_id}")
+        self.results_label.setText("Calculating similar albums...")
+        self._request(album_id)
+
+    def _request(self, album_id: str, prefetch: bool = False):
+        """Queue a lookup; a new album makes every queued lookup stale."""
+        worker = self._ensure_worker()
+        if not prefetch:
+            self._generation += 1
+            worker.latest_generation = self._generation
+        self._compute_requested.emit(self._generation, album_id)
+
+    def _on_results_ready(self, generation: int, album_id: str, results: List[SimilarityResult]):
+        self._results_cache[album_id] = results
+        self._results_cache.move_to_end(album_id)
+        while len(self._results_cache) > self.CACHE_SIZE:
+            self._results_cache.popitem(last=False)
+        if generation != self._generation or album_id != self.current_album_id:
+            return
+        graphics_logger.info(f"Found {len(results)} similar albums")
+        self._show_results(results)
+        self._prefetch(results)
+
+    def _on_results_failed(self, generation: int, album_id: str, message: str):
+        if generation == self._generation and album_id == self.current_album_id:
+            self.results_label.setText(f"Error: {message}")
+
+    def _prefetch(self, results: List[SimilarityResult]):
+        """Score the closest match ahead of time; it is the likeliest next album."""
+        if results and results[0][0].id not in self._results_cache:
+            self._request(results[0][0].id, prefetch=True)
+
+    def _show_results(self, results: List[SimilarityResult]):
+        """Render the cached candidates passing the current threshold and limit."""
         limit = int(self.limit_combo.currentText())
         threshold = self.threshold_slider.value() / 100.0
-        
-        graphics_logger.debug(f"Calculating similarities: limit={limit}, threshold={threshold}")
-        
-        # Calculate similarities
-        try:
-            self.similarities = calculate_album_similarity_optimized(
-                self.session,
-                self.current_album_id,
-                limit=limit,
-                min_similarity=threshold
-            )
-            
-            graphics_logger.info(f"Found {len(self.similarities)} similar albums")
-            
-            # Update UI
-            self._render_results()
-            
-        except Exception as e:
-            graphics_logger.error(f"Error calculating similarities: {e}", exc_info=True)
-            self.results_label.setText(f"Error: {str(e)}")
+        # Candidates are sorted by score, so the passing ones are a prefix
+        count = 0
+        while count < len(results) and count < limit and results[count][1] >= threshold:
+            count += 1
+        self.similarities = results[:count]
+        self._render_results()
     
     def _render_results(self):
         """Render the similarity results in the table."""
@@ -232,7 +359,7 @@ class SimilarityBarChartView(BaseView):
             bar_item.setToolTip(tooltip)
             score_item.setToolTip(tooltip)
     
-    def _build_tooltip(self, album: Album, score: float, breakdown: Dict[str, Any]) -> str:
+    def _build_tooltip(self, album: AlbumSummary, score: float, breakdown: Dict[str, Any]) -> str:
         """Build tooltip text with similarity breakdown."""
         lines = [
             f"<b>{album.pa_artist_name_on_album} - {album.title}</b>",
@@ -292,6 +419,9 @@ class SimilarityBarChartView(BaseView):
         self.current_album_id = None
         self.current_album = None
         self.similarities = []
+        self._generation += 1
+        if self._worker is not None:
+            self._worker.latest_generation = self._generation
         self.table.setRowCount(0)
         self.header_widget.clear()
         self.results_label.setText("Select an album to see similar albums")
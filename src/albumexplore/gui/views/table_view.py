@@ -1,10 +1,11 @@
 """Table visualization view."""
 from typing import Dict, Any, Set, List
-from PyQt6.QtWidgets import (QTableWidget, QTableWidgetItem, QHeaderView,
-                          QAbstractItemView, QVBoxLayout, QMenu)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (QTableView, QHeaderView, QAbstractItemView, QVBoxLayout, QMenu, QLineEdit)
+from PyQt6.QtCore import Qt, pyqtSignal, QItemSelection, QItemSelectionModel, QTimer
 from PyQt6.QtGui import QAction
 from .base_view import BaseView
+from albumexplore.gui.models import AlbumTableModel
+from albumexplore.database.search import search_album_ids
 from albumexplore.visualization.state import ViewType
 from albumexplore.gui.gui_logging import graphics_logger
 
@@ -14,33 +15,48 @@ class TableView(BaseView):
     sort_changed = pyqtSignal(str, str)  # column, direction
     show_similar_requested = pyqtSignal(str)  # album_id - signal to request similarity view
     
+    # Delay between the last keystroke and running the search
+    SEARCH_DELAY_MS = 200
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.view_type = ViewType.TABLE
+        self.session = None
         self._setup_ui()
         graphics_logger.debug("Table view initialized")
     
     def _setup_ui(self):
         """Set up UI elements."""
-        # Create table
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            'Artist', 'Album', 'Year', 'Genre', 'Country', 'Vocal Style', 'Tags'
-        ])
+        # Create table; cells are read from the model for visible rows only
+        self.table = QTableView(self)
+        self.album_model = AlbumTableModel(parent=self)
+        self.table.setModel(self.album_model)
         
         # Configure selection
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         
-        # Configure headers
+        # Configure headers; sizing to contents re-measures rows after every reset
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
         header.setSectionsClickable(True)
         header.sectionClicked.connect(self._handle_sort)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        
+        # Full-text search box; matches filter the rows shown
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText("Search albums, artists, tags and reviews...")
+        self.search_input.setClearButtonEnabled(True)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+        self.search_input.textChanged.connect(self._search_timer.start)
         
         # Configure layout
         layout = self.layout() or QVBoxLayout(self)
+        layout.addWidget(self.search_input)
         layout.addWidget(self.table)
         layout.setContentsMargins(0, 0, 0, 0)
         
@@ -49,7 +65,14 @@ class TableView(BaseView):
         self.table.customContextMenuRequested.connect(self._show_context_menu)
         
         # Connect signals
-        self.table.itemSelectionChanged.connect(self._handle_selection)
+        self.table.selectionModel().selectionChanged.connect(self._handle_selection)
+    
+    def model(self) -> AlbumTableModel:
+        return self.album_model
+    
+    def set_session(self, session):
+        """Set the database session the search box queries."""
+        self.session = session
     
     def update_data(self, render_data: Dict[str, Any], edges=None):
         """Update table data."""
@@ -59,57 +82,38 @@ class TableView(BaseView):
             return
             
         rows = render_data['rows']
-        self.table.setRowCount(len(rows))
-        
-        for row_idx, row in enumerate(rows):
-            # Artist
-            artist_data = row.get('artist', '')
-            artist_name = str(artist_data) if artist_data is not None else ''
-            item = QTableWidgetItem(artist_name)
-            item.setData(Qt.ItemDataRole.UserRole, row.get('id'))
-            self.table.setItem(row_idx, 0, item)
-            
-            # Album
-            self.table.setItem(row_idx, 1, 
-                             QTableWidgetItem(row.get('album', '')))
-            
-            # Year
-            year_val = row.get('year', '')
-            graphics_logger.debug(f"TableView: Populating year for row {row_idx}, album '{row.get('album', '')}', year: '{year_val}', type: {type(year_val)}") # DEBUG
-            year_item = QTableWidgetItem()
-            year_item.setData(Qt.ItemDataRole.DisplayRole, year_val)
-            self.table.setItem(row_idx, 2, year_item)
-            
-            # Genre
-            self.table.setItem(row_idx, 3, 
-                             QTableWidgetItem(row.get('genre', '')))
-            
-            # Country
-            self.table.setItem(row_idx, 4, 
-                             QTableWidgetItem(row.get('country', '')))
-
-            # Vocal style
-            vocal_style_value = row.get('vocal_style', '')
-            self.table.setItem(row_idx, 5,
-                             QTableWidgetItem(vocal_style_value))
-            
-            # Tags
-            tags = row.get('tags', [])
-            self.table.setItem(row_idx, 6, 
-                             QTableWidgetItem(', '.join(tags)))
+        self.album_model.set_rows(rows)
+        if self.search_input.text().strip():
+            self._apply_search()
         
         # Update selection
-        self.table.clearSelection()
-        if 'selected_ids' in render_data:
-            selected_ids = set(render_data['selected_ids'])
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, 0)
-                if item and item.data(Qt.ItemDataRole.UserRole) in selected_ids:
-                    self.table.selectRow(row)
+        selection_model = self.table.selectionModel()
+        selection_model.blockSignals(True)
+        try:
+            self.table.clearSelection()
+            if render_data.get('selected_ids'):
+                selection = QItemSelection()
+                last_column = self.album_model.columnCount() - 1
+                for row in self.album_model.rows_for_ids(render_data['selected_ids']):
+                    selection.select(self.album_model.index(row, 0), self.album_model.index(row, last_column))
+                selection_model.select(selection, QItemSelectionModel.SelectionFlag.Select)
+        finally:
+            selection_model.blockSignals(False)
         
         graphics_logger.debug(f"Updated table view with {len(rows)} rows")
     
-    def _handle_selection(self, selected_ids=None):
+    def _apply_search(self):
+        """Show only the rows matching the search box, or all rows when it is empty."""
+        self._search_timer.stop()
+        query = self.search_input.text().strip()
+        if not query or self.session is None:
+            self.album_model.set_filter(None)
+            return
+        hits = search_album_ids(self.session, query, limit=None, prefix_last=True)
+        self.album_model.set_filter(self.album_model.positions_for_ids(album_id for album_id, _ in hits))
+        graphics_logger.debug(f"Search '{query}' matched {len(hits)} albums")
+    
+    def _handle_selection(self, selected_ids=None, deselected=None):
         """Handle table selection changes."""
         # Use instance variable for recursion protection (defined in BaseView)
         if self._is_processing_selection:
@@ -120,11 +124,10 @@ class TableView(BaseView):
             
             # Ignore the passed-in selected_ids parameter and calculate from table selection
             calculated_ids = set()
-            for item in self.table.selectedItems():
-                if item.column() == 0:  # Only process first column to avoid duplicates
-                    node_id = item.data(Qt.ItemDataRole.UserRole)
-                    if node_id:
-                        calculated_ids.add(node_id)
+            for index in self.table.selectionModel().selectedRows():
+                node_id = self.album_model.album_id(index.row())
+                if node_id:
+                    calculated_ids.add(node_id)
             
             self.selection_changed.emit(calculated_ids)
         finally:
@@ -138,27 +141,20 @@ class TableView(BaseView):
         # Map column index to name
         columns = ['artist', 'album', 'year', 'genre', 'country', 'vocal_style', 'tags']
         if 0 <= column_index < len(columns):
+            order = Qt.SortOrder.DescendingOrder if direction == "desc" else Qt.SortOrder.AscendingOrder
+            self.album_model.sort(column_index, order)
             self.sort_changed.emit(columns[column_index], direction)
             
             # Update sort indicator
-            self.table.horizontalHeader().setSortIndicator(
-                column_index,
-                Qt.SortOrder.DescendingOrder if direction == "desc"
-                else Qt.SortOrder.AscendingOrder
-            )
+            self.table.horizontalHeader().setSortIndicator(column_index, order)
     
     def _show_context_menu(self, position):
         """Show context menu for table row."""
-        item = self.table.itemAt(position)
-        if not item:
-            return
-        
-        row = item.row()
-        album_item = self.table.item(row, 0)
-        if not album_item:
+        index = self.table.indexAt(position)
+        if not index.isValid():
             return
         
-        album_id = album_item.data(Qt.ItemDataRole.UserRole)
+        album_id = self.album_model.album_id(index.row())
         if not album_id:
             return
         
@@ -78,7 +78,7 @@ def run_cli():
 		parser = CSVParser(csv_dir)
 		df = parser.parse()
 		
-		normalizer = TagNormalizer()
+		normalizer = TagNormalizer(persistent_cache=True)
 		relationships = TagRelationships(df)
 		all_tags = set()
 		
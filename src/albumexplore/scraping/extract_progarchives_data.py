@@ -8,6 +8,11 @@ import pandas as pd
 import logging
 import glob
 import re # For potential use in parsing
+import time
+import argparse
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path # Ensure Path is imported
 
 # Import the scraper
@@ -41,33 +46,41 @@ REVIEW_COLS = ['pa_album_id', 'raw_reviewer_name', 'raw_review_rating', 'raw_rev
 LINEUP_COLS = ['pa_album_id', 'raw_musician_name', 'raw_instruments_roles', 'is_guest']
 SUBGENRE_COLS = ['raw_subgenre_name', 'raw_subgenre_definition']
 
-# Logging Setup
-root_logger = logging.getLogger() # Get the root logger
-root_logger.setLevel(logging.DEBUG) # Set level on root logger TO DEBUG
+# Get a specific logger for this module, which will inherit root's handlers
+logger = logging.getLogger(__name__) 
 
-# Remove any existing handlers from the root logger to prevent duplication
-for handler in root_logger.handlers[:]:
-    handler.close() # Close handler before removing
-    root_logger.removeHandler(handler)
+# Scraper used by _parse_page; one per worker process (or the main process when serial)
+_worker_scraper = None
 
-# File Handler
-try:
-    file_handler = logging.FileHandler(LOG_FILE_PATH, mode='w')
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
-    root_logger.addHandler(file_handler)
-except Exception as e:
-    print(f"[CRITICAL LOGGING ERROR] Failed to create or add file handler: {e}")
+def setup_logging():
+    """Send root logging to the debug log file and the console.
 
-# Console Handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO) # Explicitly set console to INFO
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
-root_logger.addHandler(console_handler)
+    Called from main() rather than at import time so that worker processes,
+    which re-import this module, do not truncate the log file.
+    """
+    root_logger = logging.getLogger() # Get the root logger
+    root_logger.setLevel(logging.DEBUG) # Set level on root logger TO DEBUG
 
-root_logger.info("Orchestrator logging to file and console should be initiated.")
+    # Remove any existing handlers from the root logger to prevent duplication
+    for handler in root_logger.handlers[:]:
+        handler.close() # Close handler before removing
+        root_logger.removeHandler(handler)
 
-# Get a specific logger for this module, which will inherit root's handlers
-logger = logging.getLogger(__name__) 
+    # File Handler
+    try:
+        file_handler = logging.FileHandler(LOG_FILE_PATH, mode='w')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
+        root_logger.addHandler(file_handler)
+    except Exception as e:
+        print(f"[CRITICAL LOGGING ERROR] Failed to create or add file handler: {e}")
+
+    # Console Handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO) # Explicitly set console to INFO
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s'))
+    root_logger.addHandler(console_handler)
+
+    root_logger.info("Orchestrator logging to file and console should be initiated.")
 
 # --- Helper Functions ---
 
@@ -144,17 +157,183 @@ def parse_subgenre_file(file_path):
     
     return subgenres
 
+# --- Parsing Workers ---
+
+def _init_worker(html_base_dir):
+    """Create the scraper for this process; its parse cache is flushed on exit."""
+    global _worker_scraper
+    _worker_scraper = ProgArchivesScraper(local_data_root=Path(html_base_dir))
+    multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+
+def _parse_page(kind, file_path):
+    """Parse one album or artist page. Returns (path, data, seconds, cache_hit)."""
+    scraper = _worker_scraper
+    hits_before = scraper.parse_cache.hits
+    start = time.perf_counter()
+    if kind == 'album':
+        data = scraper.get_album_data(Path(file_path))
+    else:
+        data = scraper.get_band_details(Path(file_path))
+    return file_path, data, time.perf_counter() - start, scraper.parse_cache.hits > hits_before
+
+def _iter_parsed(kind, file_paths, executor, workers):
+    """Yield parse results in input order, from the pool if there is one."""
+    if executor is None:
+        return (_parse_page(kind, path) for path in file_paths)
+    # Small chunks keep the ordered stream flowing while amortizing IPC overhead
+    chunksize = max(1, min(32, len(file_paths) // (workers * 8)))
+    return executor.map(_parse_page, repeat(kind), file_paths, chunksize=chunksize)
+
+class ExtractionProgress:
+    """Logs throughput and ETA while pages are parsed, plus a timing summary."""
+
+    LOG_INTERVAL_SECONDS = 10
+
+    def __init__(self, label, total):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.cache_hits = 0
+        self.parse_seconds = 0.0
+        self.slowest = (0.0, None)
+        self.start = time.perf_counter()
+        self._last_log = self.start
+        self._log_every = max(1, total // 20)
+
+    def update(self, file_path, seconds, cache_hit):
+        self.done += 1
+        self.cache_hits += cache_hit
+        self.parse_seconds += seconds
+        if seconds > self.slowest[0]:
+            self.slowest = (seconds, file_path)
+        logger.debug(f"{self.label}: {Path(file_path).name} took {seconds * 1000:.1f} ms{' (cached)' if cache_hit else ''}")
+
+        now = time.perf_counter()
+        if self.done % self._log_every == 0 or now - self._last_log >= self.LOG_INTERVAL_SECONDS or self.done == self.total:
+            self._last_log = now
+            elapsed = now - self.start
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+            eta = (self.total - self.done) / rate if rate > 0 else 0.0
+            logger.info(f"{self.label}: {self.done}/{self.total} ({self.done * 100 // max(1, self.total)}%), "
+                        f"{rate:.1f} files/s, ETA {eta:.0f}s")
+
+    def summary(self):
+        wall = time.perf_counter() - self.start
+        mean_ms = self.parse_seconds / self.done * 1000 if self.done else 0.0
+        logger.info(f"{self.label}: parsed {self.done} files in {wall:.1f}s wall time "
+                    f"({self.parse_seconds:.1f}s parse time, mean {mean_ms:.1f} ms/file, "
+                    f"{self.cache_hits} from cache)")
+        if self.slowest[1]:
+            logger.info(f"{self.label}: slowest file {Path(self.slowest[1]).name} ({self.slowest[0] * 1000:.1f} ms)")
+
+# --- Record Building ---
+
+def build_album_records(album_file_path, parsed_data, index):
+    """Split one parsed album page into rows for the raw album, track, review and lineup CSVs."""
+    album_id = album_file_path.stem.replace('album', '') # album_id from filename like 'albumXXXX'
+
+    # Extract album info
+    album_info = {
+        'pa_album_id': album_id,
+        'raw_album_title': parsed_data.get('album_title', ''),
+        'raw_artist_name': parsed_data.get('artist_name', ''),
+        'raw_release_year': parsed_data.get('year'),
+        'raw_recording_type': parsed_data.get('album_type', ''),
+        'raw_subgenre_string': parsed_data.get('genre', ''), # This is the main genre string
+        'pa_average_rating': parsed_data.get('rating_value'),
+        'pa_rating_count': parsed_data.get('rating_count'),
+        'pa_review_count': parsed_data.get('review_count'), # Total reviews for the album
+        'pa_cover_image_url': parsed_data.get('cover_image_url', ''),
+        'pa_artist_page_link': parsed_data.get('artist_page_link_local', ''), # Store the local link
+        'pa_all_reviews_page_link': parsed_data.get('all_reviews_page_link_local', '') # Local link to all reviews page
+    }
+
+    # Extract tracks
+    tracks = []
+    if 'tracks' in parsed_data and parsed_data['tracks']:
+        for track_num, track_info in enumerate(parsed_data['tracks'], 1):
+            tracks.append({
+                'pa_album_id': album_id,
+                'raw_track_title': track_info.get('title', ''),
+                'raw_track_length': track_info.get('duration', ''),
+                'raw_track_number': track_info.get('number', track_num) # Use number if present, else enumerate
+            })
+
+    # Extract reviews from main album page
+    reviews = []
+    if 'reviews' in parsed_data and parsed_data['reviews']:
+        for review_info in parsed_data['reviews']:
+            reviews.append({
+                'pa_album_id': album_id, # Link review to album
+                'pa_review_id': review_info.get('review_id', ''),
+                'raw_reviewer_name': review_info.get('reviewer', ''),
+                'raw_review_date': review_info.get('date', ''),
+                'raw_review_rating': review_info.get('rating'),
+                'raw_review_text': review_info.get('text', ''),
+                'pa_review_source_page': album_file_path.name # Source: main album page
+            })
+    
+    # Extract lineup if available (assuming it's part of main album data for now)
+    # The scraper's get_album_data might need to be augmented if lineups are separate.
+    # For now, let's assume 'lineup' is a list of dicts like {'musician': name, 'instruments': roles_str}
+    album_lineup_data = parsed_data.get('lineup')
+    
+    if index < 5: # Log for the first 5 albums
+        logger.info(f"Album {album_id} (extract_progarchives_data.py) - Lineup data from scraper: {album_lineup_data}")
+
+    lineups = []
+    if album_lineup_data: # Check if lineup_data is not None and not empty
+        for lineup_member in album_lineup_data:
+            lineups.append({
+                'pa_album_id': album_id,
+                'raw_musician_name': lineup_member.get('musician', ''),
+                'raw_instruments_roles': lineup_member.get('instruments', '')
+            })
+    elif index < 5: # Log if lineup_data is missing or empty for the first 5 albums
+        logger.warning(f"Album {album_id} (extract_progarchives_data.py) - No lineup data found or lineup data is empty.")
+    
+    # TODO: Handle dedicated review pages if 'all_reviews_page_link_local' is present and scraper supports it
+    return album_info, tracks, reviews, lineups
+
+def build_artist_record(artist_link_local, parsed_artist_data, pa_artist_id):
+    """Build the raw artist CSV row for one artist page link."""
+    return {
+        'pa_artist_id': pa_artist_id, # From filename or generated
+        'raw_artist_name_canonical': parsed_artist_data.get('name', ''), # Corrected key to 'name'
+        'raw_artist_country': parsed_artist_data.get('country', ''),
+        'raw_artist_style_main': parsed_artist_data.get('genre', ''), # Corrected key to 'genre'
+        'raw_artist_style_secondary': parsed_artist_data.get('secondary_genre', ''), # Secondary genre
+        'raw_artist_status': parsed_artist_data.get('status', ''),
+        'pa_artist_page_link_original': artist_link_local, # The original link including params
+        'raw_artist_formation_year': parsed_artist_data.get('formation_year'),
+        'raw_artist_location': parsed_artist_data.get('location_info'), # City, State etc.
+        'raw_artist_related_artists_summary': ", ".join(parsed_artist_data.get('related_artists', [])), # Comma-sep string
+        'raw_artist_lineup_current_summary': parsed_artist_data.get('current_lineup_summary', ''),
+        'raw_artist_lineup_past_summary': parsed_artist_data.get('past_members_summary', ''),
+        'raw_artist_biography_summary': parsed_artist_data.get('biography', ''), # Corrected key to 'biography'
+        # Add other fields from get_band_details as needed
+    }
+
 # --- Main Orchestration ---
 
-def main():
+def main(workers=1):
+    global _worker_scraper
+    setup_logging()
+    executor = None
     try:
         logger.info("Starting Phase 2: Data Extraction from ProgArchives.")
 
         os.makedirs(RAW_DATA_OUTPUT_DIR, exist_ok=True)
         logger.info(f"Raw CSVs will be saved to: {RAW_DATA_OUTPUT_DIR}")
 
-        # Initialize the ProgArchivesScraper with the HTML base directory
-        scraper = ProgArchivesScraper(local_data_root=Path(PROGARCHIVES_HTML_BASE_DIR))
+        if workers > 1:
+            # Each worker process gets its own scraper via _init_worker
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(PROGARCHIVES_HTML_BASE_DIR,))
+            logger.info(f"Parsing with {workers} worker processes.")
+        else:
+            # Initialize the ProgArchivesScraper with the HTML base directory
+            _worker_scraper = ProgArchivesScraper(local_data_root=Path(PROGARCHIVES_HTML_BASE_DIR))
         logger.info(f"ProgArchivesScraper initialized with base HTML directory: {PROGARCHIVES_HTML_BASE_DIR}")
 
         # Initialize data lists
@@ -163,160 +342,77 @@ def main():
         all_tracks_data = []
         all_reviews_data = []
         all_lineups_data = []
-        unique_artist_page_links = set() # To collect unique artist file paths
+        unique_artist_page_links = {} # Artist links in first-seen order (dict keeps the output deterministic)
 
-        album_html_files = find_album_html_files(PROGARCHIVES_HTML_BASE_DIR)
+        album_html_files = sorted(find_album_html_files(PROGARCHIVES_HTML_BASE_DIR))
         logger.info(f"Found {len(album_html_files)} album HTML files to process.")
 
-        logger.info(f"!!! SCRIPT EXECUTION REACHED MAIN ALBUM LOOP !!!")
-
         # --- Main Loop for Album Processing ---
-        for i, album_file_path_str in enumerate(album_html_files):
+        # Results arrive in input order, so the CSVs match a serial run
+        progress = ExtractionProgress("Albums", len(album_html_files))
+        for i, (album_file_path_str, parsed_data, seconds, cache_hit) in enumerate(
+                _iter_parsed('album', album_html_files, executor, workers)):
+            progress.update(album_file_path_str, seconds, cache_hit)
             album_file_path = Path(album_file_path_str) # Ensure it's a Path object
-            logger.info(f"Processing album {i+1}/{len(album_html_files)}: {album_file_path.name}")
             try:
-                album_id = album_file_path.stem.replace('album', '') # album_id from filename like 'albumXXXX'
-
-                # Parse album data
-                parsed_data = scraper.get_album_data(album_file_path) # Pass Path object
-
                 if not parsed_data or 'error' in parsed_data:
                     logger.error(f"Error processing album {album_file_path}: {parsed_data.get('error', 'No data returned') if parsed_data else 'No data returned'}")
                     continue
 
-                # Extract album info
-                album_info = {
-                    'pa_album_id': album_id,
-                    'raw_album_title': parsed_data.get('album_title', ''),
-                    'raw_artist_name': parsed_data.get('artist_name', ''),
-                    'raw_release_year': parsed_data.get('year'),
-                    'raw_recording_type': parsed_data.get('album_type', ''),
-                    'raw_subgenre_string': parsed_data.get('genre', ''), # This is the main genre string
-                    'pa_average_rating': parsed_data.get('rating_value'),
-                    'pa_rating_count': parsed_data.get('rating_count'),
-                    'pa_review_count': parsed_data.get('review_count'), # Total reviews for the album
-                    'pa_cover_image_url': parsed_data.get('cover_image_url', ''),
-                    'pa_artist_page_link': parsed_data.get('artist_page_link_local', ''), # Store the local link
-                    'pa_all_reviews_page_link': parsed_data.get('all_reviews_page_link_local', '') # Local link to all reviews page
-                }
+                album_info, tracks, reviews, lineups = build_album_records(album_file_path, parsed_data, i)
                 all_albums_data.append(album_info)
+                all_tracks_data.extend(tracks)
+                all_reviews_data.extend(reviews)
+                all_lineups_data.extend(lineups)
 
                 # Collect artist page link for later processing
                 artist_link_local = parsed_data.get('artist_page_link_local')
                 if artist_link_local:
-                    unique_artist_page_links.add(artist_link_local)
-
-                # Extract tracks
-                if 'tracks' in parsed_data and parsed_data['tracks']:
-                    for track_num, track_info in enumerate(parsed_data['tracks'], 1):
-                        all_tracks_data.append({
-                            'pa_album_id': album_id,
-                            'raw_track_title': track_info.get('title', ''),
-                            'raw_track_length': track_info.get('duration', ''),
-                            'raw_track_number': track_info.get('number', track_num) # Use number if present, else enumerate
-                        })
-
-                # Extract reviews from main album page
-                if 'reviews' in parsed_data and parsed_data['reviews']:
-                    for review_info in parsed_data['reviews']:
-                        all_reviews_data.append({
-                            'pa_album_id': album_id, # Link review to album
-                            'pa_review_id': review_info.get('review_id', ''),
-                            'raw_reviewer_name': review_info.get('reviewer', ''),
-                            'raw_review_date': review_info.get('date', ''),
-                            'raw_review_rating': review_info.get('rating'),
-                            'raw_review_text': review_info.get('text', ''),
-                            'pa_review_source_page': album_file_path.name # Source: main album page
-                        })
-                
-                # Extract lineup if available (assuming it's part of main album data for now)
-                # The scraper's get_album_data might need to be augmented if lineups are separate.
-                # For now, let's assume 'lineup' is a list of dicts like {'musician': name, 'instruments': roles_str}
-                if i == 0: # For the very first album
-                    print(f"DEBUG PRINT: Album {album_id} - Attempting to get lineup data from parsed_data. Keys: {list(parsed_data.keys())}")
-                
-                album_lineup_data = parsed_data.get('lineup')
-                
-                if i < 5: # Log for the first 5 albums
-                    #This log should appear if the print statement above appears
-                    logger.info(f"Album {album_id} (extract_progarchives_data.py) - Lineup data from scraper: {album_lineup_data}")
-
-                if album_lineup_data: # Check if lineup_data is not None and not empty
-                    for lineup_member in album_lineup_data:
-                        all_lineups_data.append({
-                            'pa_album_id': album_id,
-                            'raw_musician_name': lineup_member.get('musician', ''),
-                            'raw_instruments_roles': lineup_member.get('instruments', '')
-                        })
-                elif i < 5: # Log if lineup_data is missing or empty for the first 5 albums
-                    logger.warning(f"Album {album_id} (extract_progarchives_data.py) - No lineup data found or lineup data is empty.")
-                
-                # TODO: Handle dedicated review pages if 'all_reviews_page_link_local' is present and scraper supports it
+                    unique_artist_page_links[artist_link_local] = None
 
             except Exception as e:
                 logger.error(f"Unhandled exception processing album {album_file_path}: {e}", exc_info=True)
+        progress.summary()
 
         logger.info(f"Finished processing {len(all_albums_data)} albums.")
         logger.info(f"Found {len(unique_artist_page_links)} unique artist page links to process.")
 
         # --- Artist Data Processing ---
+        # Links that differ only in query params point at the same page, so each
+        # artist file is parsed once no matter how many albums or workers reference it
+        links_by_artist_file = {}
+        for artist_link_local in unique_artist_page_links:
+            # artist_link_local is like "artistXXXX.html?id=YYY" or just "artistXXXX.html"
+            artist_base_filename = artist_link_local.split('?')[0]
+            links_by_artist_file.setdefault(artist_base_filename, []).append(artist_link_local)
+
+        artist_file_paths = [str(Path(PROGARCHIVES_HTML_BASE_DIR) / name) for name in links_by_artist_file]
         artist_id_counter = 1 # Simple counter for pa_artist_id if no natural ID from filename
-        processed_artist_links = set()
-
-        for i, artist_link_local in enumerate(unique_artist_page_links):
-            if not artist_link_local or artist_link_local in processed_artist_links:
-                continue
-            
-            logger.info(f"Processing artist {i+1}/{len(unique_artist_page_links)}: {artist_link_local}")
-            try:
-                # artist_link_local is like "artistXXXX.html?id=YYY" or just "artistXXXX.html"
-                # We need the base filename for the scraper's get_band_details
-                artist_base_filename = artist_link_local.split('?')[0]
-                artist_file_path_to_parse = Path(PROGARCHIVES_HTML_BASE_DIR) / artist_base_filename
-
-                # Use artist_link_local as the key for all_artists_data to avoid duplicates if scraper is called multiple times
-                # for the same artist link due to different query params (though we expect only base filename here)
-                if artist_link_local in all_artists_data: 
-                    logger.debug(f"Skipping already processed (or queued for processing) artist link: {artist_link_local}")
-                    continue
-
-                parsed_artist_data = scraper.get_band_details(artist_file_path_to_parse) # Pass Path object
-
-                if not parsed_artist_data or 'error' in parsed_artist_data:
-                    logger.error(f"Error processing artist file {artist_file_path_to_parse} (from link {artist_link_local}): {parsed_artist_data.get('error', 'No data returned') if parsed_artist_data else 'No data returned'}")
-                    all_artists_data[artist_link_local] = {'error': f"Failed to parse {artist_file_path_to_parse}"} # Store error
-                    continue
-                
-                # Extract PA Artist ID from filename if possible (e.g., artistXXXX.html -> XXXX)
-                pa_artist_id_from_file = re.search(r'artist([a-zA-Z0-9]+)', artist_base_filename)
-                pa_artist_id = pa_artist_id_from_file.group(1) if pa_artist_id_from_file else f"generated_{artist_id_counter}"
-                if not pa_artist_id_from_file:
-                    artist_id_counter += 1
-
-                artist_info = {
-                    'pa_artist_id': pa_artist_id, # From filename or generated
-                    'raw_artist_name_canonical': parsed_artist_data.get('name', ''), # Corrected key to 'name'
-                    'raw_artist_country': parsed_artist_data.get('country', ''),
-                    'raw_artist_style_main': parsed_artist_data.get('genre', ''), # Corrected key to 'genre'
-                    'raw_artist_style_secondary': parsed_artist_data.get('secondary_genre', ''), # Secondary genre
-                    'raw_artist_status': parsed_artist_data.get('status', ''),
-                    'pa_artist_page_link_original': artist_link_local, # The original link including params
-                    'raw_artist_formation_year': parsed_artist_data.get('formation_year'),
-                    'raw_artist_location': parsed_artist_data.get('location_info'), # City, State etc.
-                    'raw_artist_related_artists_summary': ", ".join(parsed_artist_data.get('related_artists', [])), # Comma-sep string
-                    'raw_artist_lineup_current_summary': parsed_artist_data.get('current_lineup_summary', ''),
-                    'raw_artist_lineup_past_summary': parsed_artist_data.get('past_members_summary', ''),
-                    'raw_artist_biography_summary': parsed_artist_data.get('biography', ''), # Corrected key to 'biography'
-                    # Add other fields from get_band_details as needed
-                }
-                # Store artist data using the unique artist_link_local as key to avoid duplicates
-                all_artists_data[artist_link_local] = artist_info
-                processed_artist_links.add(artist_link_local)
-
-            except Exception as e:
-                logger.error(f"Unhandled exception processing artist link {artist_link_local}: {e}", exc_info=True)
-                all_artists_data[artist_link_local] = {'error': f"Exception processing artist link {artist_link_local}"}
 
+        progress = ExtractionProgress("Artists", len(artist_file_paths))
+        for artist_base_filename, (artist_file_path_to_parse, parsed_artist_data, seconds, cache_hit) in zip(
+                links_by_artist_file, _iter_parsed('artist', artist_file_paths, executor, workers)):
+            progress.update(artist_file_path_to_parse, seconds, cache_hit)
+            for artist_link_local in links_by_artist_file[artist_base_filename]:
+                try:
+                    if not parsed_artist_data or 'error' in parsed_artist_data:
+                        logger.error(f"Error processing artist file {artist_file_path_to_parse} (from link {artist_link_local}): {parsed_artist_data.get('error', 'No data returned') if parsed_artist_data else 'No data returned'}")
+                        all_artists_data[artist_link_local] = {'error': f"Failed to parse {artist_file_path_to_parse}"} # Store error
+                        continue
+
+                    # Extract PA Artist ID from filename if possible (e.g., artistXXXX.html -> XXXX)
+                    pa_artist_id_from_file = re.search(r'artist([a-zA-Z0-9]+)', artist_base_filename)
+                    pa_artist_id = pa_artist_id_from_file.group(1) if pa_artist_id_from_file else f"generated_{artist_id_counter}"
+                    if not pa_artist_id_from_file:
+                        artist_id_counter += 1
+
+                    # Store artist data using the unique artist_link_local as key to avoid duplicates
+                    all_artists_data[artist_link_local] = build_artist_record(artist_link_local, parsed_artist_data, pa_artist_id)
+
+                except Exception as e:
+                    logger.error(f"Unhandled exception processing artist link {artist_link_local}: {e}", exc_info=True)
+                    all_artists_data[artist_link_local] = {'error': f"Exception processing artist link {artist_link_local}"}
+        progress.summary()
 
         logger.info(f"Finished processing artists. Collected data for {len(all_artists_data) - sum(1 for ad in all_artists_data.values() if 'error' in ad)} unique artists.")
         
@@ -361,10 +457,18 @@ def main():
         logger.info("Phase 2: Data Extraction script finished.")
 
     finally:
+        if executor is not None:
+            executor.shutdown()
+        elif _worker_scraper is not None:
+            _worker_scraper.close()
         # Ensure all handlers are flushed and closed.
         for handler in logging.getLogger().handlers[:]: # Iterate over a copy
             handler.close()
             logging.getLogger().removeHandler(handler)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Extract raw CSVs from the local ProgArchives HTML pages.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes used for HTML parsing (default: 1, serial)")
+    args = parser.parse_args()
+    main(workers=max(1, args.workers)) 
\ No newline at end of file
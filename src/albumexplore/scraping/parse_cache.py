@@ -0,0 +1,169 @@
+"""Content-addressed cache for parsed ProgArchives pages.
+
+Entries are keyed by a SHA-256 digest of the page kind, the resolved file
+path and the parser version, so keys are stable across interpreter runs.
+Each entry also stores a fingerprint (mtime and size) of every file that
+went into it, e.g. an album page plus its dedicated reviews page; a lookup
+only hits when all of them are unchanged. Files that were looked for but
+missing are recorded as absent, so creating one later misses as well. Everything lives in a single
+SQLite file that is trimmed back under ``max_bytes`` by evicting the least
+recently used entries.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Fraction of max_bytes to shrink to once the limit is exceeded
+EVICTION_TARGET = 0.9
+# Hit timestamps are written in batches to keep warm runs read-only
+TOUCH_FLUSH_THRESHOLD = 500
+
+
+def file_fingerprint(paths: Iterable[Union[str, Path]]) -> str:
+    """Digest of path, mtime and size for each file; missing files count as absent."""
+    digest = hashlib.sha256()
+    for path in paths:
+        try:
+            st = os.stat(path)
+            state = f"{st.st_mtime_ns}\0{st.st_size}"
+        except OSError:
+            state = "absent"
+        digest.update(f"{Path(path).resolve()}\0{state}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """SQLite-backed LRU cache of parsed page dicts."""
+
+    def __init__(self, db_path: Path, parser_version: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = Path(db_path)
+        self.parser_version = parser_version
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._pending_touches: Dict[str, float] = {}
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily so the scraper stays cheap to create in worker processes
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " fingerprint TEXT NOT NULL,"
+                " deps TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_last_access ON entries (last_access)")
+            conn.commit()
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def make_key(self, kind: str, path: Union[str, Path]) -> str:
+        raw = f"{kind}\0{Path(path).resolve()}\0{self.parser_version}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, kind: str, path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Return the cached result if none of its source files changed."""
+        try:
+            conn = self._connection()
+            key = self.make_key(kind, path)
+            row = conn.execute("SELECT fingerprint, deps, data FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            fingerprint, deps, data = row
+            if file_fingerprint(json.loads(deps)) != fingerprint:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._pending_touches[key] = time.time()
+            if len(self._pending_touches) >= TOUCH_FLUSH_THRESHOLD:
+                self._flush_touches()
+            return json.loads(data)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Failed to read parse cache for {path}: {e}")
+            return None
+
+    def put(self, kind: str, path: Union[str, Path], data: Dict[str, Any],
+            deps: Optional[List[Union[str, Path]]] = None):
+        """Store a parsed result together with the files it was built from."""
+        dep_paths = [str(Path(p).resolve()) for p in (deps or [path])]
+        fingerprint = file_fingerprint(dep_paths)
+        try:
+            conn = self._connection()
+            key = self.make_key(kind, path)
+            payload = json.dumps(data)
+            size = len(payload)
+            old = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, fingerprint, deps, data, size, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, fingerprint, json.dumps(dep_paths), payload, size, time.time())
+                )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Failed to cache result for {path}: {e}")
+
+    def _flush_touches(self):
+        if not self._pending_touches or self._conn is None:
+            return
+        touches = [(t, key) for key, t in self._pending_touches.items()]
+        self._pending_touches.clear()
+        with self._conn:
+            self._conn.executemany("UPDATE entries SET last_access = ? WHERE key = ?", touches)
+
+    def _evict(self):
+        """Drop least recently used entries until under the eviction target."""
+        self._flush_touches()
+        conn = self._conn
+        target = int(self.max_bytes * EVICTION_TARGET)
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        with conn:
+            conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        logger.info(f"Evicted {len(evicted)} parse cache entries ({self._total_bytes} bytes remain)")
+
+    def clear(self):
+        conn = self._connection()
+        self._pending_touches.clear()
+        with conn:
+            conn.execute("DELETE FROM entries")
+        self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        conn = self._connection()
+        entries = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {'entries': entries, 'bytes': self._total_bytes, 'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._flush_touches()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to update parse cache access times: {e}")
+            self._conn.close()
+            self._conn = None
@@ -1,14 +1,18 @@
 """ProgArchives.com scraper for local HTML files."""
 import logging
 import re
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Union, Any, Tuple
 from bs4 import BeautifulSoup, NavigableString, Tag
 
+from albumexplore.scraping.parse_cache import ParseCache, DEFAULT_MAX_BYTES
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever parsing changes so previously cached results are not reused
+PARSER_VERSION = "1"
+
 class ProgArchivesScraper:
     """Parser for local ProgArchives.com HTML files."""
     
@@ -18,7 +22,8 @@ class ProgArchivesScraper:
     def __init__(
         self,
         local_data_root: Optional[Path] = None, # Made local_data_root optional again
-        cache_dir: Optional[Path] = None # Made cache_dir optional again
+        cache_dir: Optional[Path] = None, # Made cache_dir optional again
+        cache_max_bytes: int = DEFAULT_MAX_BYTES
     ):
         """Initialize scraper with path to local ProgArchives.com HTML files."""
         self.local_data_root = local_data_root if local_data_root else self.LOCAL_DATA_ROOT
@@ -27,6 +32,7 @@ class ProgArchivesScraper:
         # Keep a simplified cache for parsed results
         self.cache_dir = Path(cache_dir) if cache_dir else Path("cache/progarchives")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.parse_cache = ParseCache(self.cache_dir / "parse_cache.sqlite", PARSER_VERSION, cache_max_bytes)
 
         # Regex for matching album links (e.g., albumXXXX.html or albumXXXX.html?id=YYYY)
         # Allows for alphanumeric characters, dots, and hyphens in the album identifier part.
@@ -85,25 +91,17 @@ class ProgArchivesScraper:
         logger.debug(f"Could not precisely normalize album type for header: '{header_text}'. Processed header: '{lower_header}'. Defaulting to 'Album'.")
         return "Album"
 
-    def _get_cached_result(self, file_path: str) -> Optional[Dict]:
-        """Get cached result for file path."""
-        cache_file = self.cache_dir / f"{hash(file_path)}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load cache for {file_path}: {e}")
-        return None
+    def _get_cached_result(self, file_path: str, kind: str) -> Optional[Dict]:
+        """Get cached result for file path if the file has not changed since it was parsed."""
+        return self.parse_cache.get(kind, file_path)
 
-    def _save_to_cache(self, file_path: str, data: Dict):
-        """Save result to cache."""
-        cache_file = self.cache_dir / f"{hash(file_path)}.json"
-        try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.warning(f"Failed to cache result for {file_path}: {e}")
+    def _save_to_cache(self, file_path: str, data: Dict, kind: str, deps: Optional[List[Path]] = None):
+        """Save result to cache along with the files it was parsed from."""
+        self.parse_cache.put(kind, file_path, data, deps)
+
+    def close(self):
+        """Flush and close the parse cache."""
+        self.parse_cache.close()
 
     def _read_local_html_content(self, file_path: Path) -> Optional[str]:
         """Read HTML content from local file, trying multiple encodings."""
@@ -194,7 +192,7 @@ class ProgArchivesScraper:
 
             # Check cache
             if use_cache:
-                cached = self._get_cached_result(str(self.current_artist_file_path))
+                cached = self._get_cached_result(str(self.current_artist_file_path), 'artist')
                 if cached:
                     return cached
             
@@ -475,7 +473,7 @@ class ProgArchivesScraper:
             }
             
             if use_cache:
-                self._save_to_cache(str(self.current_artist_file_path), details)
+                self._save_to_cache(str(self.current_artist_file_path), details, 'artist')
             
             return details
             
@@ -496,7 +494,7 @@ class ProgArchivesScraper:
             logger.debug(f"Resolved path for get_album_data: {resolved_f_path}")
 
             if use_cache:
-                cached = self._get_cached_result(str(resolved_f_path))
+                cached = self._get_cached_result(str(resolved_f_path), 'album')
                 if cached:
                     logger.info(f"Cache hit for album: {resolved_f_path}")
                     return cached
@@ -550,6 +548,7 @@ class ProgArchivesScraper:
             # Parse reviews from the main album page
             reviews = self._parse_reviews_from_page(soup, source_file_path=resolved_f_path)
             processed_review_files = {resolved_f_path.name} # Keep track of files already processed for reviews
+            source_files = [resolved_f_path] # Files the cached result depends on
             
             # --- Attempt to parse dedicated reviews page (album-reviewsXXXX.html) ---
             dedicated_reviews_link_tag = soup.find('a', href=re.compile(r"album-reviews[a-zA-Z0-9.-]+\.html"))
@@ -563,6 +562,7 @@ class ProgArchivesScraper:
                     if dedicated_reviews_file_path.name not in processed_review_files and dedicated_reviews_file_path.exists():
                         logger.info(f"Dedicated reviews page (album-reviews type) found locally: {dedicated_reviews_file_path}")
                         reviews_html_content = self._read_local_html_content(dedicated_reviews_file_path)
+                        source_files.append(dedicated_reviews_file_path)
                         if reviews_html_content:
                             reviews_soup = BeautifulSoup(reviews_html_content, 'html.parser')
                             additional_reviews = self._parse_reviews_from_page(reviews_soup, source_file_path=dedicated_reviews_file_path)
@@ -577,6 +577,7 @@ class ProgArchivesScraper:
                     elif dedicated_reviews_file_path.name in processed_review_files:
                         logger.debug(f"Skipping already processed file for album-reviews link: {dedicated_reviews_file_path.name}")
                     else:
+                        source_files.append(dedicated_reviews_file_path) # Downloading it later invalidates the cache entry
                         logger.warning(f"Dedicated reviews page (album-reviews type) file not found locally: {dedicated_reviews_file_path}")
             else:
                 logger.info("No link to a dedicated 'album-reviews...' page found on the main album page.")
@@ -600,6 +601,7 @@ class ProgArchivesScraper:
             for review_filename in unique_review_files_to_parse:
                 logger.debug(f"Looping for review_filename: {review_filename}") # DETAIL LOG 1
                 individual_review_file_path = resolved_f_path.parent / review_filename
+                source_files.append(individual_review_file_path) # Also when missing, so downloading it invalidates the cache entry
                 logger.debug(f"Attempting to load individual review from: {individual_review_file_path}")
                 if individual_review_file_path.exists():
                     logger.info(f"Individual review file exists: {individual_review_file_path}") # DETAIL LOG 2 (changed from .info to .debug for consistency if preferred, but .info is fine here)
@@ -652,7 +654,7 @@ class ProgArchivesScraper:
             }
 
             if use_cache:
-                self._save_to_cache(str(resolved_f_path), data)
+                self._save_to_cache(str(resolved_f_path), data, 'album', source_files)
             
             logger.info(f"Successfully parsed album data for: {album_title} by {artist_name}")
             return data
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+"""Benchmark BitSet and TagFilter against the original implementation.
+
+Builds a synthetic tag->album map with a skewed tag distribution (a few
+dense genre tags, many sparse ones) plus a long tail of rare tags with a
+handful of albums each, and times AND/OR/NOT evaluation,
+``matching_counts_for_visible`` and ``samples_for`` through ``TagFilter``
+for both. Both must return the same results. The current NOT uses the
+cached universe; the ``universe`` row times building it from scratch.
+It also reports the bytes held per tag by both, for the skewed tags and
+for the long tail.
+"""
+import argparse
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from albumexplore.gui.utils.bitset import BitSet
+from albumexplore.gui.utils.tag_filter import TagFilter
+
+
+class IntBitSet:
+    """The original BitSet backed by a single Python int."""
+
+    def __init__(self, bits: int = 0):
+        self._bits = bits
+
+    def union(self, other):
+        return IntBitSet(self._bits | other._bits)
+
+    def intersect(self, other):
+        return IntBitSet(self._bits & other._bits)
+
+    def difference(self, other):
+        return IntBitSet(self._bits & ~other._bits)
+
+    def size(self) -> int:
+        return self._bits.bit_count()
+
+    def to_list(self) -> List[int]:
+        out: List[int] = []
+        bits = self._bits
+        idx = 0
+        while bits:
+            if bits & 1:
+                out.append(idx)
+            bits >>= 1
+            idx += 1
+        return out
+
+    def clone(self):
+        # The original rebuilt the set from to_list() bit by bit
+        bits = 0
+        for i in self.to_list():
+            bits |= (1 << i)
+        return IntBitSet(bits)
+
+    @classmethod
+    def from_ids(cls, ids: np.ndarray, n_ids: int) -> 'IntBitSet':
+        # Built via packbits; the original per-id constructor is quadratic at this size
+        mask = np.zeros(n_ids, dtype=bool)
+        mask[ids] = True
+        return cls(int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little'))
+
+
+class IntTagFilter:
+    """The original TagFilter evaluation over IntBitSet (no cached universe)."""
+
+    def __init__(self, tag_map: Dict[str, IntBitSet]):
+        self.tag_map = tag_map
+
+    def evaluate(self, expr) -> IntBitSet:
+        t = expr.get('type')
+        if t == 'tag':
+            return self.tag_map.get(expr.get('tag'), IntBitSet())
+        if t == 'and':
+            return self.evaluate(expr['left']).intersect(self.evaluate(expr['right']))
+        if t == 'or':
+            return self.evaluate(expr['left']).union(self.evaluate(expr['right']))
+        if t == 'not':
+            return self.universe().difference(self.evaluate(expr['expr']))
+        return IntBitSet()
+
+    def universe(self) -> IntBitSet:
+        out: Optional[IntBitSet] = None
+        for k in self.tag_map:
+            out = self.tag_map[k].clone() if out is None else out.union(self.tag_map[k])
+        return out or IntBitSet()
+
+    def matching_counts_for_visible(self, expr, visible_tags: List[str]):
+        base = self.evaluate(expr)
+        return [{'tag': tag, 'count': base.intersect(self.tag_map.get(tag, IntBitSet())).size()}
+                for tag in visible_tags]
+
+    def samples_for(self, expr, limit=5) -> List[int]:
+        return self.evaluate(expr).to_list()[:limit]
+
+
+def build_tag_ids(n_ids: int, n_tags: int, tail_tags: int = 0, seed: int = 42) -> Dict[str, np.ndarray]:
+    """
+    Album ids per tag; tag i covers roughly 30% / (i + 1)^0.8 of the albums.
+    Long-tail tag i is on 1-50 random albums, Zipf-distributed, like the
+    user-entered tags that appear on a single release.
+    """
+    rng = np.random.default_rng(seed)
+    tag_ids = {}
+    for i in range(n_tags):
+        density = 0.3 / (i + 1) ** 0.8
+        tag_ids[f"tag{i}"] = np.flatnonzero(rng.random(n_ids) < density)
+    for i, count in enumerate(np.minimum(rng.zipf(1.6, tail_tags), 50)):
+        tag_ids[f"tail{i}"] = np.unique(rng.integers(0, n_ids, count))
+    return tag_ids
+
+
+def _tag(name):
+    return {'type': 'tag', 'tag': name}
+
+
+EXPRESSIONS = {
+    'AND': {'type': 'and', 'left': _tag('tag0'), 'right': _tag('tag3')},
+    'OR': {'type': 'or', 'left': _tag('tag1'), 'right': _tag('tag20')},
+    'NOT': {'type': 'not', 'expr': _tag('tag0')},
+    'AND tail': {'type': 'and', 'left': _tag('tag0'), 'right': _tag('tail0')},
+    'OR tail': {'type': 'or', 'left': _tag('tail0'), 'right': _tag('tail1')},
+}
+
+
+def _best_of(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _tag_bytes(tag_map, tags: List[str], nbytes) -> float:
+    return sum(nbytes(tag_map[tag]) for tag in tags) / max(len(tags), 1)
+
+
+def run_benchmark(n_ids: int, n_tags: int = 200, tail_tags: int = 5000, visible: int = 50, repeat: int = 3,
+                  slow_legacy: bool = True) -> Dict[str, Dict[str, float]]:
+    tag_ids = build_tag_ids(n_ids, n_tags, tail_tags)
+    current = TagFilter({tag: BitSet(ids) for tag, ids in tag_ids.items()})
+    legacy = IntTagFilter({tag: IntBitSet.from_ids(ids, n_ids) for tag, ids in tag_ids.items()})
+    visible_tags = [f"tag{i}" for i in range(min(visible, n_tags))]
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, expr in EXPRESSIONS.items():
+        if 'tail' in name and tail_tags < 2:
+            continue
+        if name == 'NOT' and not slow_legacy:
+            legacy_s = float('nan')
+        else:
+            if current.evaluate(expr).size() != legacy.evaluate(expr).size():
+                raise AssertionError(f"{name} results differ")
+            legacy_s = _best_of(lambda: legacy.evaluate(expr), repeat)
+        current_s = _best_of(lambda: current.evaluate(expr), repeat)
+        results[name] = {'legacy_s': legacy_s, 'current_s': current_s}
+
+    counts_expr = EXPRESSIONS['AND']
+    if current.matching_counts_for_visible(counts_expr, visible_tags) != legacy.matching_counts_for_visible(counts_expr, visible_tags):
+        raise AssertionError("matching_counts_for_visible results differ")
+    results['counts'] = {
+        'legacy_s': _best_of(lambda: legacy.matching_counts_for_visible(counts_expr, visible_tags), repeat),
+        'current_s': _best_of(lambda: current.matching_counts_for_visible(counts_expr, visible_tags), repeat),
+    }
+
+    def cold_universe():
+        current.invalidate_universe()
+        return current.universe()
+
+    results['universe'] = {
+        'legacy_s': _best_of(legacy.universe, 1) if slow_legacy else float('nan'),
+        'current_s': _best_of(cold_universe, repeat),
+    }
+
+    if slow_legacy:
+        if current.samples_for(counts_expr) != legacy.samples_for(counts_expr):
+            raise AssertionError("samples_for results differ")
+        legacy_s = _best_of(lambda: legacy.samples_for(counts_expr), 1)
+    else:
+        legacy_s = float('nan')
+    results['samples'] = {'legacy_s': legacy_s,
+                          'current_s': _best_of(lambda: current.samples_for(counts_expr), repeat)}
+
+    # Bytes per tag, reported in the same columns as the timings
+    def legacy_nbytes(b):
+        return (b._bits.bit_length() + 7) // 8
+
+    for name, tags in (('head', [f"tag{i}" for i in range(n_tags)]),
+                       ('tail', [f"tail{i}" for i in range(tail_tags)])):
+        if tags:
+            results[f"{name} B"] = {'legacy_s': _tag_bytes(legacy.tag_map, tags, legacy_nbytes),
+                                    'current_s': _tag_bytes(current.tag_map, tags, lambda b: b.nbytes)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the current vs the original BitSet')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000], help='Album id counts to test')
+    parser.add_argument('--tags', type=int, default=200, help='Number of synthetic tags')
+    parser.add_argument('--tail-tags', type=int, default=5000, help='Number of long-tail tags with 1-50 albums')
+    parser.add_argument('--visible', type=int, default=50, help='Visible tags for matching_counts_for_visible')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per operation (best is reported)')
+    parser.add_argument('--skip-slow-legacy', action='store_true',
+                        help='Skip legacy NOT and samples_for, whose bit-by-bit to_list is quadratic in the id range')
+    args = parser.parse_args()
+
+    for n_ids in args.sizes:
+        results = run_benchmark(n_ids, args.tags, args.tail_tags, args.visible, args.repeat,
+                                not args.skip_slow_legacy)
+        print(f"{n_ids:,} album ids, {args.tags} tags, {args.tail_tags} long-tail tags:")
+        for name, r in results.items():
+            if name.endswith(' B'):
+                print(f"  {name:>8}: original {r['legacy_s']:10.0f} B/tag current {r['current_s']:8.0f} B/tag")
+                continue
+            legacy_ms, current_ms = r['legacy_s'] * 1000, r['current_s'] * 1000
+            speedup = f"{legacy_ms / current_ms:.1f}x" if current_ms > 0 and legacy_ms == legacy_ms else 'n/a'
+            print(f"  {name:>8}: original {legacy_ms:10.2f} ms  current {current_ms:8.2f} ms  speedup {speedup}")
+
+
+if __name__ == '__main__':
+    main()
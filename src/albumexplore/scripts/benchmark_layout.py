@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""Benchmark the array and multilevel force layouts against the existing engines.
+
+Builds a synthetic album graph (albums in genre communities, most edges
+inside a community) and times a full ``ArrayForceLayout`` and
+``MultiLevelLayout`` run per size.
+The existing engines repel every pair of nodes in Python. So for them this
+times a single step, on sizes up to ``--legacy-max``, and extrapolates a
+full run from their iteration limit. Layout quality is reported as the
+ratio of mean edge length to mean distance between random node pairs
+(lower means connected albums ended up closer together).
+"""
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from albumexplore.visualization.array_layout import ArrayForceLayout
+from albumexplore.visualization.layout import ForceDirectedLayout, MultiLevelLayout
+from albumexplore.visualization.models import VisualEdge, VisualNode
+from albumexplore.visualization.physics.force_params import ForceParams
+from albumexplore.visualization.physics_system import PhysicsSystem
+
+WIDTH, HEIGHT = 1600.0, 1200.0
+
+
+def build_graph(n_nodes: int, avg_degree: float = 4.0, communities: int = 40,
+                seed: int = 42) -> Tuple[List[VisualNode], List[VisualEdge]]:
+    """Album nodes in communities; 90% of edges stay inside a community."""
+    rng = np.random.default_rng(seed)
+    community = rng.integers(0, communities, n_nodes)
+    members = [np.flatnonzero(community == c) for c in range(communities)]
+    n_edges = int(n_nodes * avg_degree / 2)
+    sources = rng.integers(0, n_nodes, n_edges)
+    targets = rng.integers(0, n_nodes, n_edges)
+    inside = rng.random(n_edges) < 0.9
+    for e in np.flatnonzero(inside):
+        group = members[community[sources[e]]]
+        targets[e] = group[rng.integers(0, len(group))]
+    nodes = [VisualNode(id=f"album{i}", label=f"Album {i}") for i in range(n_nodes)]
+    edges = [VisualEdge(source=f"album{s}", target=f"album{t}", weight=1.0)
+             for s, t in zip(sources.tolist(), targets.tolist()) if s != t]
+    return nodes, edges
+
+
+def edge_length_ratio(nodes: List[VisualNode], edges: List[VisualEdge], seed: int = 0) -> float:
+    index = {node.id: i for i, node in enumerate(nodes)}
+    pos = np.array([(node.pos['x'], node.pos['y']) for node in nodes])
+    s = np.array([index[e.source] for e in edges])
+    t = np.array([index[e.target] for e in edges])
+    edge_len = np.linalg.norm(pos[s] - pos[t], axis=1).mean()
+    rng = np.random.default_rng(seed)
+    a, b = rng.integers(0, len(nodes), (2, 10000))
+    return float(edge_len / np.linalg.norm(pos[a] - pos[b], axis=1).mean())
+
+
+def time_array_layout(n_nodes: int, iterations: int) -> Dict[str, float]:
+    nodes, edges = build_graph(n_nodes)
+    layout = ArrayForceLayout(iterations=iterations)
+    start = time.perf_counter()
+    layout.compute_layout(nodes, edges, WIDTH, HEIGHT)
+    return {'seconds': time.perf_counter() - start, 'iterations': layout.iteration,
+            'edge_ratio': edge_length_ratio(nodes, edges)}
+
+
+def time_multilevel_layout(n_nodes: int, refine_iterations: int) -> Dict[str, float]:
+    nodes, edges = build_graph(n_nodes)
+    layout = MultiLevelLayout(refine_iterations=refine_iterations)
+    start = time.perf_counter()
+    layout.compute_layout(nodes, edges, WIDTH, HEIGHT)
+    return {'seconds': time.perf_counter() - start, 'levels': len(layout.levels),
+            'edge_ratio': edge_length_ratio(nodes, edges)}
+
+
+def time_legacy_step(n_nodes: int) -> Dict[str, float]:
+    """Seconds per step of the existing engines."""
+    nodes, edges = build_graph(n_nodes)
+    physics = PhysicsSystem(ForceParams())
+    physics.initialize(nodes, WIDTH, HEIGHT)
+    start = time.perf_counter()
+    physics.step(nodes, edges, WIDTH, HEIGHT)
+    physics_s = time.perf_counter() - start
+
+    directed = ForceDirectedLayout(ForceParams())
+    directed.initialize(nodes, WIDTH, HEIGHT)
+    start = time.perf_counter()
+    directed.step(nodes, edges, WIDTH, HEIGHT)
+    directed_s = time.perf_counter() - start
+    return {'physics_step_s': physics_s, 'directed_step_s': directed_s}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the array force layout')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5_000, 10_000, 20_000], help='Node counts to lay out')
+    parser.add_argument('--iterations', type=int, default=300, help='Iteration budget of the array layout')
+    parser.add_argument('--refine-iterations', type=int, default=60,
+                        help='Refinement iterations per level of the multilevel layout')
+    parser.add_argument('--legacy-max', type=int, default=2_000,
+                        help='Largest size the existing engines are stepped at')
+    args = parser.parse_args()
+
+    max_iterations = ForceParams().max_iterations
+    for n_nodes in args.sizes:
+        result = time_array_layout(n_nodes, args.iterations)
+        print(f"{n_nodes:,} nodes: array layout {result['seconds']:.2f} s "
+              f"({result['iterations']} iterations, edge/random length {result['edge_ratio']:.2f})")
+        multilevel = time_multilevel_layout(n_nodes, args.refine_iterations)
+        print(f"  multilevel layout {multilevel['seconds']:.2f} s "
+              f"({multilevel['levels']} levels, edge/random length {multilevel['edge_ratio']:.2f})")
+        if n_nodes <= args.legacy_max:
+            legacy = time_legacy_step(n_nodes)
+            print(f"  PhysicsSystem {legacy['physics_step_s'] * 1000:.0f} ms/step "
+                  f"(~{legacy['physics_step_s'] * max_iterations:.0f} s for {max_iterations} steps), "
+                  f"ForceDirectedLayout {legacy['directed_step_s'] * 1000:.0f} ms/step")
+
+
+if __name__ == '__main__':
+    main()
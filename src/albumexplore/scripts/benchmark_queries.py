@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+"""Benchmark the album/tag queries against the unkeyed link-table schema.
+
+Builds two SQLite files with the same synthetic albums, tags and links:
+one with the current schema (keyed link tables, (tag, album) indexes,
+album column indexes, connection pragmas) and one with the link tables
+and album columns as they were before, without keys, indexes or pragmas.
+Then times the joins in ``database/queries.py`` and ``TagFilter`` on
+both. Both must return the same albums.
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from albumexplore.database import configure_sqlite
+from albumexplore.database import queries
+from albumexplore.database.models import (
+    Album, AtomicTag, Base, Tag, TagDecomposition, album_atomic_tags, album_tags
+)
+from albumexplore.tags.filters.tag_filter import TagFilter
+
+COUNTRIES = ['UK', 'USA', 'Sweden', 'Finland', 'Italy', 'Germany', 'Japan', 'Norway', 'Canada', 'France']
+
+LEGACY_DDL = (
+    "DROP TABLE album_tags",
+    "CREATE TABLE album_tags (album_id VARCHAR REFERENCES albums (id), tag_id VARCHAR REFERENCES tags (id))",
+    "DROP TABLE album_atomic_tags",
+    "CREATE TABLE album_atomic_tags (album_id VARCHAR REFERENCES albums (id), "
+    "atomic_tag_id VARCHAR REFERENCES atomic_tags (id), source_tag_id VARCHAR REFERENCES tags (id), "
+    "confidence FLOAT NOT NULL, created_at DATETIME NOT NULL)",
+    "DROP INDEX ix_albums_release_year",
+    "DROP INDEX ix_albums_country",
+    "DROP INDEX ix_albums_genre",
+)
+
+
+def build_rows(n_albums: int, n_tags: int, n_atomic: int, seed: int = 42) -> Dict[str, List[dict]]:
+    """Albums with a skewed tag distribution: a few tags on many albums, most on few."""
+    rng = random.Random(seed)
+    created_at = datetime(2024, 1, 1)
+    tag_weights = [1.0 / (i + 1) for i in range(n_tags)]
+    atomic_weights = [1.0 / (i + 1) for i in range(n_atomic)]
+    rows = {
+        'tags': [{'id': f't{i}', 'name': f'tag {i}', 'normalized_name': f'tag {i}', 'is_composite': i % 3 == 0}
+                 for i in range(n_tags)],
+        'atomic': [{'id': f'a{i}', 'name': f'atomic {i}'} for i in range(n_atomic)],
+        'albums': [], 'links': [], 'atomic_links': [],
+        'decompositions': [{'composite_tag_id': f't{i}', 'atomic_tag_id': f'a{(i * 7) % n_atomic}'}
+                           for i in range(0, n_tags, 3)],
+    }
+    for i in range(n_albums):
+        album_id = f'al{i}'
+        rows['albums'].append({'id': album_id, 'title': f'Album {i}', 'pa_artist_name_on_album': f'Artist {i % 5000}',
+                               'release_year': rng.randint(1965, 2024), 'country': rng.choice(COUNTRIES),
+                               'genre': f'Genre {rng.randint(0, 40)}'})
+        for t in set(rng.choices(range(n_tags), tag_weights, k=rng.randint(2, 8))):
+            rows['links'].append({'album_id': album_id, 'tag_id': f't{t}'})
+        for a in set(rng.choices(range(n_atomic), atomic_weights, k=rng.randint(1, 6))):
+            rows['atomic_links'].append({'album_id': album_id, 'atomic_tag_id': f'a{a}', 'confidence': 1.0,
+                                         'created_at': created_at})
+    return rows
+
+
+def build_database(path: Path, rows: Dict[str, List[dict]], legacy: bool) -> sessionmaker:
+    engine = create_engine(f'sqlite:///{path}')
+    if not legacy:
+        configure_sqlite(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        if legacy:
+            for statement in LEGACY_DDL:
+                conn.execute(text(statement))
+        conn.execute(insert(Tag), rows['tags'])
+        conn.execute(insert(AtomicTag), rows['atomic'])
+        conn.execute(insert(Album), rows['albums'])
+        conn.execute(insert(album_tags), rows['links'])
+        conn.execute(insert(album_atomic_tags), rows['atomic_links'])
+        conn.execute(insert(TagDecomposition), rows['decompositions'])
+        conn.execute(text("ANALYZE"))
+    return sessionmaker(bind=engine)
+
+
+def album_ids(result) -> List[str]:
+    return sorted(item[0].id if isinstance(item, tuple) else item.id for item in result)
+
+
+def cases(rows: Dict[str, List[dict]]) -> List[Tuple[str, Callable[[Session], list]]]:
+    rng = random.Random(7)
+    albums = [row['id'] for row in rows['albums']]
+    related = rng.sample(albums, 2)
+    # A mid-frequency tag and atomic tag, so results stay a few hundred albums
+    tag, other_tag = 't40', 't41'
+    return [
+        ('get_related_albums (2 albums)',
+         lambda s: [a for album_id in related for a in queries.get_related_albums(s, album_id)]),
+        ('TagFilter.filter_albums_by_tags',
+         lambda s: TagFilter(s).filter_albums_by_tags([tag, other_tag])),
+        ('TagFilter.filter_by_multiple_criteria',
+         lambda s: TagFilter(s).filter_by_multiple_criteria(
+             {'tags': ['t2', 't5'], 'match_all_tags': True, 'year_range': (1990, 2000), 'country': 'Sweden'})),
+        ('TagFilter.filter_by_date_range',
+         lambda s: TagFilter(s).filter_by_date_range(1971, 1972)),
+        ('TagFilter.filter_by_country',
+         lambda s: TagFilter(s).filter_by_country('Japan')),
+        ('filter_albums_by_atomic_components (all)',
+         lambda s: queries.filter_albums_by_atomic_components(s, ['atomic 1', 'atomic 2'], match_all=True)),
+        ('get_albums_by_atomic_tag',
+         lambda s: queries.get_albums_by_atomic_tag(s, 'atomic 30')),
+        ('search_albums_by_atomic_tags (with composites)',
+         lambda s: queries.search_albums_by_atomic_tags(s, ['atomic 28', 'atomic 35'])),
+    ]
+
+
+def time_case(factory: sessionmaker, query: Callable[[Session], list], repeats: int) -> Tuple[float, List[str]]:
+    times = []
+    for _ in range(repeats):
+        session = factory()
+        start = time.perf_counter()
+        result = query(session)
+        times.append(time.perf_counter() - start)
+        ids = album_ids(result)
+        session.close()
+    return statistics.median(times), ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark album/tag queries with and without link-table keys')
+    parser.add_argument('--albums', type=int, default=20_000, help='Number of albums')
+    parser.add_argument('--tags', type=int, default=1_000, help='Number of composite tags')
+    parser.add_argument('--atomic-tags', type=int, default=300, help='Number of atomic tags')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per query (median is reported)')
+    args = parser.parse_args()
+
+    rows = build_rows(args.albums, args.tags, args.atomic_tags)
+    print(f"{len(rows['albums']):,} albums, {len(rows['links']):,} tag links, "
+          f"{len(rows['atomic_links']):,} atomic tag links")
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = build_database(Path(tmp) / 'legacy.db', rows, legacy=True)
+        keyed = build_database(Path(tmp) / 'keyed.db', rows, legacy=False)
+        print(f"{'query':<48} {'unkeyed':>10} {'keyed':>10} {'speedup':>8} {'albums':>7}")
+        for name, query in cases(rows):
+            legacy_s, legacy_ids = time_case(legacy, query, args.repeats)
+            keyed_s, keyed_ids = time_case(keyed, query, args.repeats)
+            if legacy_ids != keyed_ids:
+                raise AssertionError(f"{name}: results differ between the schemas")
+            print(f"{name:<48} {legacy_s * 1000:>8.1f}ms {keyed_s * 1000:>8.1f}ms "
+                  f"{legacy_s / keyed_s:>7.1f}x {len(keyed_ids):>7}")
+        legacy.kw['bind'].dispose()
+        keyed.kw['bind'].dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""Benchmark compiled tag rule lookups against the original linear scans.
+
+Normalizes every distinct genre tag found in the yearly CSV files with both
+the compiled ``TagRulesConfig`` and the linear-scan implementation it
+replaced, checks that both agree and reports the throughput of each.
+"""
+import argparse
+import csv
+import re
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+from albumexplore.tags.config.tag_rules_config import TagRulesConfig
+
+_TAG_SPLIT_PATTERN = re.compile(r'[;,]')
+DEFAULT_CSV_DIR = Path(__file__).resolve().parents[3] / 'csv'
+
+
+def collect_distinct_tags(csv_dir: Path) -> Set[str]:
+    """Collect every distinct genre tag from the CSV files in a directory."""
+    tags: Set[str] = set()
+    for csv_file in sorted(csv_dir.glob('*.csv')):
+        with open(csv_file, 'r', encoding='utf-8', errors='replace') as f:
+            genre_index = None
+            for row in csv.reader(f):
+                if genre_index is None:
+                    # Skip the preamble until the header row
+                    if row and row[0].strip() == 'Artist':
+                        genre_index = next((i for i, col in enumerate(row) if 'genre' in col.lower()), None)
+                    continue
+                if genre_index < len(row):
+                    tags.update(t.strip().lower() for t in _TAG_SPLIT_PATTERN.split(row[genre_index]) if t.strip())
+    return tags
+
+
+def linear_normalized_form(config: Dict, tag: str) -> str:
+    """The original linear-scan ``get_normalized_form``."""
+    tag = tag.lower()
+    for normalized, variants in config.get('compound_terms', {}).items():
+        if tag in variants:
+            return normalized
+    for correct, variants in config.get('common_misspellings', {}).items():
+        if tag in variants:
+            return correct
+    single_instance = config.get('single_instance_mappings', {})
+    if tag in single_instance:
+        return single_instance[tag]
+    for prefix, patterns in config.get('prefix_patterns', {}).items():
+        for pattern in patterns:
+            if tag.startswith(pattern):
+                tag = prefix + tag[len(pattern):]
+                break
+    for suffix, patterns in config.get('suffix_patterns', {}).items():
+        for pattern in patterns:
+            if tag.endswith(pattern):
+                tag = tag[:-len(pattern)] + suffix
+                break
+    return tag
+
+
+def linear_category(config: Dict, tag: str) -> Optional[str]:
+    """The original linear-scan ``get_category_for_tag`` (without caching)."""
+    tag = tag.lower()
+    for category, info in config.get('categories', {}).items():
+        if any(term in tag for term in info.get('core_terms', [])):
+            return category
+        if tag in info.get('primary_genres', []):
+            return category
+        for genre in info.get('primary_genres', []):
+            if genre in tag:
+                for modifier in info.get('modifiers', []):
+                    if modifier in tag:
+                        return category
+    return None
+
+
+def _time_calls(func, tags: Iterable[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for tag in tags:
+            func(tag)
+    return time.perf_counter() - start
+
+
+def run_benchmark(csv_dir: Path, repeat: int = 5, test_mode: bool = False) -> Dict[str, float]:
+    rules = TagRulesConfig(test_mode=test_mode)
+    config = rules._config
+    compiled = rules.compiled
+    tags = sorted(collect_distinct_tags(csv_dir))
+
+    mismatches = [t for t in tags if linear_normalized_form(config, t) != compiled.normalize(t)]
+    mismatches += [t for t in tags if linear_category(config, t) != compiled.category_for(t)]
+    if mismatches:
+        raise AssertionError(f"Compiled rules disagree with linear scan for: {mismatches[:10]}")
+
+    calls = len(tags) * repeat
+    results = {
+        'tags': len(tags),
+        'linear_normalize_s': _time_calls(lambda t: linear_normalized_form(config, t), tags, repeat),
+        'compiled_normalize_s': _time_calls(compiled.normalize, tags, repeat),
+        'linear_category_s': _time_calls(lambda t: linear_category(config, t), tags, repeat),
+        'compiled_category_s': _time_calls(compiled.category_for, tags, repeat),
+    }
+    for kind in ('normalize', 'category'):
+        for impl in ('linear', 'compiled'):
+            seconds = results[f'{impl}_{kind}_s']
+            results[f'{impl}_{kind}_per_s'] = calls / seconds if seconds > 0 else float('inf')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compiled tag rule lookups')
+    parser.add_argument('--csv-dir', type=Path, default=DEFAULT_CSV_DIR, help='Directory with the yearly CSV files')
+    parser.add_argument('--repeat', type=int, default=5, help='Passes over the distinct tag set')
+    parser.add_argument('--test-rules', action='store_true', help='Use the test rule set (has prefix/suffix/category rules)')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.csv_dir, args.repeat, args.test_rules)
+    print(f"Distinct tags: {results['tags']} (x{args.repeat} passes)")
+    for kind in ('normalize', 'category'):
+        linear = results[f'linear_{kind}_per_s']
+        compiled = results[f'compiled_{kind}_per_s']
+        print(f"{kind:>10}: linear {linear:,.0f}/s  compiled {compiled:,.0f}/s  speedup {compiled / linear:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
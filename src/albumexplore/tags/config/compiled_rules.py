@@ -0,0 +1,151 @@
+"""Compiled, index-backed form of the tag normalization rules.
+
+``TagRulesConfig`` keeps the rules as the nested dicts/lists loaded from
+``tag_rules.json``. Scanning those for every tag is linear in the size of the
+rule set, so the config is compiled once into:
+
+- a reverse lookup dict (variant -> canonical) for compound terms,
+  misspellings and single instance mappings,
+- a prefix trie and a reversed-suffix trie for the prefix/suffix patterns,
+- per-category regexes and sets for category detection.
+
+Every lookup produces exactly the same result as the original linear scans.
+"""
+import re
+from typing import Dict, List, Optional, Tuple, Pattern, Set
+
+
+class PatternTrie:
+    """Character trie over the patterns of ordered rule groups.
+
+    Each pattern is stored with its ``(group_index, pattern_index)`` so that a
+    single walk over a tag can find the first matching pattern of the first
+    matching group, mirroring nested ``for group: for pattern:`` loops.
+    """
+
+    def __init__(self):
+        self._root: Dict = {}
+
+    def add(self, pattern: str, group_index: int, pattern_index: int, replacement: str) -> None:
+        node = self._root
+        for char in pattern:
+            node = node.setdefault(char, {})
+        # The same pattern may appear in several groups
+        node.setdefault(None, []).append((group_index, pattern_index, len(pattern), replacement))
+
+    def first_match(self, text: str, min_group: int = 0) -> Optional[Tuple[int, int, str]]:
+        """Return ``(group_index, match_length, replacement)`` for the best match.
+
+        The best match is the one with the lowest group index (not below
+        ``min_group``) and, within that group, the lowest pattern index.
+        """
+        best = None
+        node = self._root
+        position = 0
+        while True:
+            for entry in node.get(None, ()):
+                if entry[0] >= min_group and (best is None or entry[:2] < best[:2]):
+                    best = entry
+            if position == len(text):
+                break
+            node = node.get(text[position])
+            if node is None:
+                break
+            position += 1
+        if best is None:
+            return None
+        return best[0], best[2], best[3]
+
+
+class CompiledTagRules:
+    """Lookup structures compiled from a tag rules configuration dict."""
+
+    def __init__(self, config: Dict):
+        self.variant_map: Dict[str, str] = {}
+        self.misspelling_word_map: Dict[str, str] = {}
+        self._prefix_trie = PatternTrie()
+        self._suffix_trie = PatternTrie()
+        self._categories: List[Tuple[str, Optional[Pattern], Set[str], Optional[Pattern], Optional[Pattern]]] = []
+        self._compile(config)
+
+    def _compile(self, config: Dict) -> None:
+        # Precedence: compound terms, then misspellings, then single instance
+        # mappings. Within a section the first canonical listing a variant wins.
+        for section in ('compound_terms', 'common_misspellings'):
+            for canonical, variants in config.get(section, {}).items():
+                for variant in variants:
+                    self.variant_map.setdefault(variant, canonical)
+        for tag, mapped in config.get('single_instance_mappings', {}).items():
+            self.variant_map.setdefault(tag, mapped)
+
+        # Word-level misspelling corrections; later entries override earlier ones
+        for correct, variants in config.get('common_misspellings', {}).items():
+            for variant in variants:
+                self.misspelling_word_map[variant.lower()] = correct
+
+        for group_index, (prefix, patterns) in enumerate(config.get('prefix_patterns', {}).items()):
+            for pattern_index, pattern in enumerate(patterns):
+                self._prefix_trie.add(pattern, group_index, pattern_index, prefix)
+
+        for group_index, (suffix, patterns) in enumerate(config.get('suffix_patterns', {}).items()):
+            for pattern_index, pattern in enumerate(patterns):
+                self._suffix_trie.add(pattern[::-1], group_index, pattern_index, suffix)
+
+        for category, info in config.get('categories', {}).items():
+            self._categories.append((
+                category,
+                self._substring_pattern(info.get('core_terms', [])),
+                set(info.get('primary_genres', [])),
+                self._substring_pattern(info.get('primary_genres', [])),
+                self._substring_pattern(info.get('modifiers', []))
+            ))
+
+    @staticmethod
+    def _substring_pattern(terms: List[str]) -> Optional[Pattern]:
+        """Build a regex that matches if any of the terms occurs in a string."""
+        if not terms:
+            return None
+        return re.compile('|'.join(re.escape(term) for term in set(terms)))
+
+    def normalize(self, tag: str) -> str:
+        """Return the normalized form of an already lowercased tag."""
+        mapped = self.variant_map.get(tag)
+        if mapped is not None:
+            return mapped
+
+        # Each prefix group may rewrite the tag once, in group order
+        group = 0
+        while True:
+            match = self._prefix_trie.first_match(tag, group)
+            if match is None:
+                break
+            group_index, length, prefix = match
+            tag = prefix + tag[length:]
+            group = group_index + 1
+
+        group = 0
+        while True:
+            match = self._suffix_trie.first_match(tag[::-1], group)
+            if match is None:
+                break
+            group_index, length, suffix = match
+            tag = tag[:-length] + suffix
+            group = group_index + 1
+
+        return tag
+
+    def category_for(self, tag: str) -> Optional[str]:
+        """Return the first category matching an already lowercased tag."""
+        for category, core_pattern, primary_genres, genre_pattern, modifier_pattern in self._categories:
+            if core_pattern is not None and core_pattern.search(tag):
+                return category
+            if tag in primary_genres:
+                return category
+            if (genre_pattern is not None and modifier_pattern is not None
+                    and genre_pattern.search(tag) and modifier_pattern.search(tag)):
+                return category
+        return None
+
+    def correct_misspelled_words(self, tag: str) -> str:
+        """Correct misspellings word by word in a multi-word tag."""
+        return ' '.join(self.misspelling_word_map.get(word, word) for word in tag.split())
@@ -5,6 +5,8 @@ import logging
 from typing import Dict, List, Optional, Set
 from pathlib import Path
 
+from .compiled_rules import CompiledTagRules
+
 logger = logging.getLogger(__name__)
 
 class TagRulesConfig:
@@ -18,33 +20,48 @@ class TagRulesConfig:
         """
         self._config: Dict = {}
         self._cache: Dict = {}
+        self._compiled = CompiledTagRules({})
         self._test_mode = test_mode
         self._load_config()
         
-    def _load_config(self):
-        """Load configuration from JSON file."""
+    @property
+    def config_path(self) -> str:
+        """Path of the JSON rules file backing this configuration."""
         if self._test_mode:
             # Use test configuration
-            config_path = str(Path(__file__).parent.parent.parent.parent.parent / 'tests' / 'test_data' / 'tag_rules_test.json')
-        else:
-            # Use production configuration
-            config_path = os.path.join(os.path.dirname(__file__), '../../config/tag_rules.json')
+            return str(Path(__file__).parent.parent.parent.parent.parent / 'tests' / 'test_data' / 'tag_rules_test.json')
+        # Use production configuration
+        return os.path.join(os.path.dirname(__file__), '../../config/tag_rules.json')
+        
+    def _load_config(self):
+        """Load configuration from JSON file."""
+        config_path = self.config_path
         
         try:
             with open(config_path, 'r') as f:
                 self._config = json.load(f)
-            # Clear cache when config is reloaded
-            self._cache.clear()
         except FileNotFoundError:
             logger.warning(f"Config file not found at {config_path}, using empty configuration")
             self._config = {}
         except Exception as e:
             logger.error(f"Error loading tag rules config: {e}")
             self._config = {}
+        # Compiling also clears the category cache
+        self.recompile()
             
     def reload(self):
         """Reload configuration from file."""
         self._load_config()
+
+    def recompile(self):
+        """Rebuild the compiled lookup structures after the rules changed."""
+        self._compiled = CompiledTagRules(self._config)
+        self._cache.clear()
+
+    @property
+    def compiled(self) -> CompiledTagRules:
+        """Compiled lookup form of the current rules."""
+        return self._compiled
         
     def get_category_info(self, category: str) -> Optional[Dict]:
         """Get information about a specific category."""
@@ -89,72 +106,17 @@ class TagRulesConfig:
             return self._cache[tag]
             
         tag = tag.lower()
-        for category, info in self._config.get('categories', {}).items():
-            # Check core terms
-            if any(term in tag for term in info.get('core_terms', [])):
-                self._cache[tag] = category
-                return category
-                
-            # Check primary genres
-            if tag in info.get('primary_genres', []):
-                self._cache[tag] = category
-                return category
-                
-            # Check if it's a modified primary genre
-            for genre in info.get('primary_genres', []):
-                if genre in tag:
-                    for modifier in info.get('modifiers', []):
-                        if modifier in tag:
-                            self._cache[tag] = category
-                            return category
-        
-        # No category found
-        self._cache[tag] = None
-        return None
+        category = self._compiled.category_for(tag)
+        self._cache[tag] = category
+        return category
         
     def get_normalized_form(self, tag: str) -> str:
         """Get the normalized form of a tag based on all rules."""
-        tag = tag.lower()
-        
-        # Check compound terms first
-        compound_terms = self.get_compound_terms()
-        for normalized, variants in compound_terms.items():
-            if tag in variants:
-                return normalized
-                
-        # Check misspellings
-        misspellings = self.get_misspellings()
-        for correct, variants in misspellings.items():
-            if tag in variants:
-                return correct
-                
-        # Check single instance mappings
-        single_instance = self.get_single_instance_mappings()
-        if tag in single_instance:
-            return single_instance[tag]
-            
-        # Apply prefix standardization
-        for prefix, patterns in self.get_all_prefix_patterns().items():
-            for pattern in patterns:
-                if tag.startswith(pattern):
-                    tag = prefix + tag[len(pattern):]
-                    break
-                    
-        # Apply suffix standardization
-        for suffix, patterns in self.get_all_suffix_patterns().items():
-            for pattern in patterns:
-                if tag.endswith(pattern):
-                    tag = tag[:-len(pattern)] + suffix
-                    break
-        
-        return tag
+        return self._compiled.normalize(tag.lower())
         
     def save_changes(self) -> bool:
         """Save current configuration back to file."""
-        if self._test_mode:
-            config_path = str(Path(__file__).parent.parent.parent.parent.parent / 'tests' / 'test_data' / 'tag_rules_test.json')
-        else:
-            config_path = os.path.join(os.path.dirname(__file__), '../../config/tag_rules.json')
+        config_path = self.config_path
             
         try:
             # Ensure directory exists
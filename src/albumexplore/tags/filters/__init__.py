@@ -9,11 +9,15 @@ from .tag_filter_state import (
     GroupOperator,
     FilterOperator
 )
+from .tag_index import TagPostingIndex, IncrementalTagFilter, FilterDelta
 
 __all__ = [
     'TagFilterGroup',
     'TagFilterState',
     'SavedQuery',
     'GroupOperator',
-    'FilterOperator'
+    'FilterOperator',
+    'TagPostingIndex',
+    'IncrementalTagFilter',
+    'FilterDelta'
 ]
\ No newline at end of file
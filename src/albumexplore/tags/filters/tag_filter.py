@@ -1,6 +1,7 @@
 from typing import List, Dict, Set, Optional
 from sqlalchemy.orm import Session
-from ...database import models
+from sqlalchemy import distinct, func
+from ...database import models, tag_closure
 from ..analysis.tag_analyzer import TagAnalyzer
 
 class TagFilter:
@@ -26,12 +27,28 @@ class TagFilter:
 			(models.TagRelation.strength >= min_strength)
 		).all()
 
-	def filter_albums_by_tags(self, tag_ids: List[str], match_all: bool = False) -> List[models.Album]:
+	def filter_albums_by_tags(self, tag_ids: List[str], match_all: bool = False,
+							  include_subgenres: bool = False) -> List[models.Album]:
 		"""
 		Filter albums by tags.
 		If match_all is True, albums must have all specified tags.
 		If match_all is False, albums must have any of the specified tags.
+		If include_subgenres is True, a subgenre of a tag counts as the tag.
 		"""
+		if include_subgenres:
+			# One join against the tags and their descendants from the closure table
+			subgenres = tag_closure.subgenre_expansion(tag_ids)
+			query = self.db.query(models.Album).join(
+				models.album_tags
+			).join(
+				subgenres, subgenres.c.descendant_id == models.album_tags.c.tag_id
+			)
+			if match_all:
+				return query.group_by(models.Album.id).having(
+					func.count(distinct(subgenres.c.tag_id)) == len(set(tag_ids))
+				).all()
+			return query.distinct().all()
+
 		query = self.db.query(models.Album).join(
 			models.album_tags
 		).join(
@@ -43,7 +60,7 @@ class TagFilter:
 		if match_all:
 			# Count matching tags per album and filter for those matching all tags
 			query = query.group_by(models.Album.id).having(
-				models.db.func.count(models.Tag.id) == len(tag_ids)
+				func.count(models.Tag.id) == len(tag_ids)
 			)
 
 		return query.all()
@@ -88,7 +105,17 @@ class TagFilter:
 		"""Filter albums by multiple criteria simultaneously."""
 		query = self.db.query(models.Album)
 		
-		if 'tags' in criteria:
+		if 'tags' in criteria and criteria.get('include_subgenres', False):
+			subgenres = tag_closure.subgenre_expansion(criteria['tags'])
+			tagged = self.db.query(models.album_tags.c.album_id).join(
+				subgenres, subgenres.c.descendant_id == models.album_tags.c.tag_id
+			)
+			if criteria.get('match_all_tags', False):
+				tagged = tagged.group_by(models.album_tags.c.album_id).having(
+					func.count(distinct(subgenres.c.tag_id)) == len(set(criteria['tags']))
+				)
+			query = query.filter(models.Album.id.in_(tagged))
+		elif 'tags' in criteria:
 			if criteria.get('match_all_tags', False):
 				# For match_all, we need to ensure the album has all specified tags
 				for tag_id in criteria['tags']:
@@ -0,0 +1,262 @@
+"""
+Tag posting index for fast filter evaluation.
+
+Albums are identified by their position in the album list. Each tag maps to
+a sorted array of album positions, and filters are evaluated as NumPy
+boolean masks over all albums, so a filter click costs a handful of
+vectorized operations instead of re-splitting and re-normalizing every
+album's tags.
+
+IncrementalTagFilter keeps the previous result on top of an index and
+reports each filter edit as a delta (albums that entered or left, tags whose
+matching count changed), so views only need to touch what changed.
+"""
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .tag_filter_state import FilterOperator, GroupOperator, TagFilterGroup, TagFilterState
+
+
+class TagPostingIndex:
+    """
+    Tag -> album position postings built from a tag -> album nodes mapping.
+
+    Filter semantics match the tag explorer:
+        (ANY include tag) AND (panel groups) AND NOT (ANY exclude tag)
+    where panel groups follow TagFilterState (AND/OR within a group, groups
+    combined by the state's group operator).
+    """
+
+    def __init__(self, albums: Sequence, postings: Dict[str, np.ndarray]):
+        self.albums = albums
+        self.album_count = len(albums)
+        self.postings = postings
+        self._tags = list(postings)
+
+        # Flattened (tag, album) pairs so matching counts are a single bincount
+        lengths = [len(p) for p in postings.values()]
+        self._entry_tags = np.repeat(np.arange(len(self._tags), dtype=np.int32), lengths)
+        self._entry_albums = (np.concatenate(list(postings.values())) if postings
+                              else np.empty(0, dtype=np.int32))
+
+    @classmethod
+    def from_nodes(cls, albums: Sequence, tag_to_nodes: Dict[str, Iterable]) -> 'TagPostingIndex':
+        """
+        Build the index from album nodes and a tag -> nodes mapping.
+
+        Nodes are matched by identity; nodes not present in ``albums`` are ignored
+        and an album listed twice under the same tag is counted once.
+        """
+        position = {id(node): i for i, node in enumerate(albums)}
+        postings = {}
+        for tag, nodes in tag_to_nodes.items():
+            ids = [position[id(node)] for node in nodes if id(node) in position]
+            if ids:
+                postings[tag] = np.unique(np.array(ids, dtype=np.int32))
+        return cls(albums, postings)
+
+    def posting(self, tag: str) -> np.ndarray:
+        return self.postings.get(tag, np.empty(0, dtype=np.int32))
+
+    def any_of(self, tags: Iterable[str]) -> np.ndarray:
+        """Mask of albums having at least one of the tags."""
+        mask = np.zeros(self.album_count, dtype=bool)
+        for tag in tags:
+            mask[self.posting(tag)] = True
+        return mask
+
+    def all_of(self, tags: Iterable[str]) -> np.ndarray:
+        """Mask of albums having every one of the tags."""
+        # Start from the rarest tag so the intersection shrinks quickly
+        ordered = sorted(tags, key=lambda t: len(self.posting(t)))
+        if not ordered:
+            return np.ones(self.album_count, dtype=bool)
+        ids = self.posting(ordered[0])
+        for tag in ordered[1:]:
+            if len(ids) == 0:
+                break
+            ids = np.intersect1d(ids, self.posting(tag), assume_unique=True)
+        mask = np.zeros(self.album_count, dtype=bool)
+        mask[ids] = True
+        return mask
+
+    def group_mask(self, group: TagFilterGroup) -> np.ndarray:
+        if group.operator == GroupOperator.OR:
+            return self.any_of(group.tags)
+        return self.all_of(group.tags)
+
+    def state_mask(self, filter_state: TagFilterState) -> Optional[np.ndarray]:
+        """Mask for the groups of a filter state, or None if they do not restrict anything."""
+        if not filter_state.active:
+            return None
+        enabled_groups = [g for g in filter_state.groups if g.enabled and not g.is_empty()]
+        if not enabled_groups:
+            return None
+        if filter_state.group_operator == FilterOperator.AND:
+            mask = np.ones(self.album_count, dtype=bool)
+            for group in enabled_groups:
+                mask &= self.group_mask(group)
+        else:
+            mask = np.zeros(self.album_count, dtype=bool)
+            for group in enabled_groups:
+                mask |= self.group_mask(group)
+        return mask
+
+    def evaluate(self, include_tags: Set[str] = frozenset(), exclude_tags: Set[str] = frozenset(),
+                 filter_state: Optional[TagFilterState] = None) -> np.ndarray:
+        """Boolean mask over album positions for the combined filters."""
+        mask = self.any_of(include_tags) if include_tags else np.ones(self.album_count, dtype=bool)
+        if filter_state is not None:
+            groups = self.state_mask(filter_state)
+            if groups is not None:
+                mask &= groups
+        if exclude_tags:
+            mask &= ~self.any_of(exclude_tags)
+        return mask
+
+    def albums_for(self, mask: np.ndarray) -> List:
+        """Albums selected by a mask, in original order."""
+        return [self.albums[i] for i in np.flatnonzero(mask)]
+
+    def matching_counts(self, mask: np.ndarray) -> Counter:
+        """Number of selected albums carrying each tag."""
+        selected = mask[self._entry_albums]
+        counts = np.bincount(self._entry_tags[selected], minlength=len(self._tags))
+        return Counter({self._tags[i]: int(counts[i]) for i in np.flatnonzero(counts)})
+
+
+@dataclass
+class FilterDelta:
+    """Change in the filtered result between two evaluations."""
+    entered: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    left: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    # Tag -> new matching count, only for tags whose count changed
+    changed_counts: Dict[str, int] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return len(self.entered) == 0 and len(self.left) == 0
+
+    @property
+    def size(self) -> int:
+        return len(self.entered) + len(self.left)
+
+
+class IncrementalTagFilter:
+    """
+    Re-evaluates filters on a TagPostingIndex relative to the previous result.
+
+    Clause masks (the include set, each panel group, the exclusion set) are
+    cached, and a clause that only gained tags since it was last computed is
+    derived from its previous mask: OR clauses widen with the new postings,
+    AND clauses narrow by them. Matching counts are updated from the tags of
+    the albums that entered or left the result, not recounted.
+    """
+
+    CLAUSE_CACHE_SIZE = 64
+
+    def __init__(self, index: TagPostingIndex):
+        self.index = index
+        self.mask = np.ones(index.album_count, dtype=bool)
+        self._counts = np.bincount(index._entry_tags, minlength=len(index._tags)).astype(np.int64)
+        self._clauses: 'OrderedDict[Tuple[str, FrozenSet[str]], np.ndarray]' = OrderedDict()
+        self._last_clause: Dict[str, Tuple[FrozenSet[str], np.ndarray]] = {}
+
+        # Album -> tag ids (CSR) so a delta's counts only touch the changed albums
+        order = np.argsort(index._entry_albums, kind='stable')
+        self._album_tags = index._entry_tags[order]
+        self._album_offsets = np.searchsorted(index._entry_albums[order], np.arange(index.album_count + 1))
+
+    def _clause(self, kind: str, tags: Iterable[str]) -> np.ndarray:
+        key = (kind, frozenset(tags))
+        cached = self._clauses.get(key)
+        if cached is not None:
+            self._clauses.move_to_end(key)
+            return cached
+
+        index = self.index
+        previous = self._last_clause.get(kind)
+        if previous is not None and previous[0] < key[1]:
+            added = key[1] - previous[0]
+            if kind == 'any':
+                mask = previous[1] | index.any_of(added)
+            else:
+                mask = previous[1] & index.all_of(added)
+        else:
+            mask = index.any_of(key[1]) if kind == 'any' else index.all_of(key[1])
+
+        self._clauses[key] = mask
+        if len(self._clauses) > self.CLAUSE_CACHE_SIZE:
+            self._clauses.popitem(last=False)
+        self._last_clause[kind] = (key[1], mask)
+        return mask
+
+    def _state_mask(self, filter_state: TagFilterState) -> Optional[np.ndarray]:
+        if not filter_state.active:
+            return None
+        enabled_groups = [g for g in filter_state.groups if g.enabled and not g.is_empty()]
+        if not enabled_groups:
+            return None
+        masks = [self._clause('any' if g.operator == GroupOperator.OR else 'all', g.tags)
+                 for g in enabled_groups]
+        if filter_state.group_operator == FilterOperator.AND:
+            return np.logical_and.reduce(masks)
+        return np.logical_or.reduce(masks)
+
+    def evaluate(self, include_tags: Set[str] = frozenset(), exclude_tags: Set[str] = frozenset(),
+                 filter_state: Optional[TagFilterState] = None) -> np.ndarray:
+        """Mask for the filters using cached clauses; does not change the current result."""
+        mask = np.ones(self.index.album_count, dtype=bool)
+        if include_tags:
+            mask &= self._clause('any', include_tags)
+        if filter_state is not None:
+            groups = self._state_mask(filter_state)
+            if groups is not None:
+                mask &= groups
+        if exclude_tags:
+            mask &= ~self._clause('any', exclude_tags)
+        return mask
+
+    def _tags_of(self, positions: np.ndarray) -> np.ndarray:
+        starts = self._album_offsets[positions]
+        lengths = self._album_offsets[positions + 1] - starts
+        if lengths.sum() == 0:
+            return np.empty(0, dtype=self._album_tags.dtype)
+        # Gather the CSR slices of all positions in one pass
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return self._album_tags[offsets + np.arange(lengths.sum())]
+
+    def update(self, include_tags: Set[str] = frozenset(), exclude_tags: Set[str] = frozenset(),
+               filter_state: Optional[TagFilterState] = None) -> FilterDelta:
+        """Move to the result of the given filters and return what changed."""
+        new_mask = self.evaluate(include_tags, exclude_tags, filter_state)
+        changed = new_mask ^ self.mask
+        if not changed.any():
+            return FilterDelta()
+
+        entered = np.flatnonzero(changed & new_mask)
+        left = np.flatnonzero(changed & self.mask)
+        self.mask = new_mask
+
+        entered_tags, left_tags = self._tags_of(entered), self._tags_of(left)
+        np.add.at(self._counts, entered_tags, 1)
+        np.subtract.at(self._counts, left_tags, 1)
+        tags = self.index._tags
+        changed_counts = {tags[i]: int(self._counts[i])
+                          for i in np.unique(np.concatenate([entered_tags, left_tags]))}
+        return FilterDelta(entered, left, changed_counts)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Album positions in the current result, in original order."""
+        return np.flatnonzero(self.mask)
+
+    def albums(self) -> List:
+        return self.index.albums_for(self.mask)
+
+    def matching_counts(self) -> Counter:
+        tags = self.index._tags
+        return Counter({tags[i]: int(self._counts[i]) for i in np.flatnonzero(self._counts)})
@@ -1,4 +1,4 @@
 """Tag normalization package."""
-from .tag_normalizer import TagNormalizer
+from .tag_normalizer import TagNormalizer, get_shared_normalizer
 
-__all__ = ['TagNormalizer']
\ No newline at end of file
+__all__ = ['TagNormalizer', 'get_shared_normalizer']
\ No newline at end of file
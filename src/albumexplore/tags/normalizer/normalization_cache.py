@@ -0,0 +1,159 @@
+"""Persistent on-disk cache for tag normalization results.
+
+Normalization and atomic decomposition results only depend on the rule files,
+so they are stored in a small SQLite file keyed by a hash of those files.
+When the rules change the hash changes and the stored entries are discarded.
+One cache per rule hash is shared by every ``TagNormalizer`` in the process.
+The file lives in the per-user cache directory, or in ``ALBUMEXPLORE_CACHE_DIR``
+when that is set.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from albumexplore.utils.paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Bump when the normalization code changes in a way that alters results
+CACHE_FORMAT_VERSION = 1
+
+CACHE_FILE_NAME = 'tag_normalization.sqlite'
+
+_caches: Dict[str, 'NormalizationCache'] = {}
+_caches_lock = threading.Lock()
+
+
+def default_cache_path() -> Path:
+    """Cache file in ALBUMEXPLORE_CACHE_DIR, else in the per-user cache directory."""
+    return get_cache_dir() / CACHE_FILE_NAME
+
+
+def compute_rules_hash(paths: Iterable[Path]) -> str:
+    """Hash the contents of the rule files together with the cache format version."""
+    digest = hashlib.sha256(f"v{CACHE_FORMAT_VERSION}".encode())
+    for path in paths:
+        digest.update(str(Path(path).name).encode())
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(b'<missing>')
+    return digest.hexdigest()
+
+
+class NormalizationCache:
+    """In-memory normalization dicts backed by a SQLite file."""
+
+    def __init__(self, path: Path, rules_hash: str):
+        self.path = Path(path)
+        self.rules_hash = rules_hash
+        self.variants: Dict[str, str] = {}
+        self.atomic: Dict[str, List[str]] = {}
+        self._persisted_variants = set()
+        self._persisted_atomic = set()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS variants (tag TEXT PRIMARY KEY, normalized TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS atomic (tag TEXT PRIMARY KEY, components TEXT)")
+        return conn
+
+    def load(self) -> None:
+        """Load stored entries, discarding them if they were built from other rules."""
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open normalization cache {self.path}: {e}")
+            return
+        try:
+            with conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'rules_hash'").fetchone()
+                if row is None or row[0] != self.rules_hash:
+                    conn.execute("DELETE FROM variants")
+                    conn.execute("DELETE FROM atomic")
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('rules_hash', ?)", (self.rules_hash,))
+                    if row is not None:
+                        logger.info("Tag rules changed, discarded persistent normalization cache")
+                    return
+
+            variants = dict(conn.execute("SELECT tag, normalized FROM variants"))
+            atomic = {tag: json.loads(components) for tag, components in conn.execute("SELECT tag, components FROM atomic")}
+            with self._lock:
+                # Entries computed before the load take precedence
+                for tag, normalized in variants.items():
+                    self.variants.setdefault(tag, normalized)
+                for tag, components in atomic.items():
+                    self.atomic.setdefault(tag, components)
+                self._persisted_variants.update(variants)
+                self._persisted_atomic.update(atomic)
+            logger.info(f"Loaded {len(variants)} normalized and {len(atomic)} atomic tags from {self.path}")
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Could not read normalization cache {self.path}: {e}")
+        finally:
+            conn.close()
+
+    def save(self) -> int:
+        """Write entries added since the last load/save. Returns the number written."""
+        with self._lock:
+            new_variants = [(tag, value) for tag, value in list(self.variants.items())
+                            if tag not in self._persisted_variants]
+            new_atomic = [(tag, json.dumps(value)) for tag, value in list(self.atomic.items())
+                          if tag not in self._persisted_atomic]
+        if not new_variants and not new_atomic:
+            return 0
+
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not open normalization cache {self.path}: {e}")
+            return 0
+        try:
+            with conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'rules_hash'").fetchone()
+                if row is not None and row[0] != self.rules_hash:
+                    # Another process has rebuilt the cache for different rules
+                    logger.info("Normalization cache belongs to other tag rules, not saving")
+                    return 0
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('rules_hash', ?)", (self.rules_hash,))
+                conn.executemany("INSERT OR REPLACE INTO variants (tag, normalized) VALUES (?, ?)", new_variants)
+                conn.executemany("INSERT OR REPLACE INTO atomic (tag, components) VALUES (?, ?)", new_atomic)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write normalization cache {self.path}: {e}")
+            return 0
+        finally:
+            conn.close()
+
+        with self._lock:
+            self._persisted_variants.update(tag for tag, _ in new_variants)
+            self._persisted_atomic.update(tag for tag, _ in new_atomic)
+        return len(new_variants) + len(new_atomic)
+
+
+def get_normalization_cache(rules_hash: str, path: Optional[Path] = None) -> NormalizationCache:
+    """Return the process-wide cache for a rule hash, loading it on first use."""
+    path = Path(path) if path else default_cache_path()
+    key = f"{path}:{rules_hash}"
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = NormalizationCache(path, rules_hash)
+            cache.load()
+            _caches[key] = cache
+    return cache
+
+
+@atexit.register
+def save_all_caches() -> None:
+    """Persist every loaded cache. Registered to run at interpreter exit."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.save()
@@ -3,24 +3,35 @@ import re
 import json
 import os
 import logging
+import threading
+from pathlib import Path
 from typing import Dict, Optional, List, Set, Tuple
 from collections import defaultdict
 from albumexplore.tags.config.tag_rules_config import TagRulesConfig
+from albumexplore.tags.normalizer.normalization_cache import compute_rules_hash, get_normalization_cache
 
 logger = logging.getLogger(__name__)
 
+_shared_normalizer: Optional['TagNormalizer'] = None
+_shared_normalizer_lock = threading.Lock()
+
 class TagNormalizer:
     """Handles tag normalization and variant consolidation with atomic tag support."""
     
-    def __init__(self, test_mode: bool = False, enable_atomic_tags: bool = True):
+    def __init__(self, test_mode: bool = False, enable_atomic_tags: bool = True,
+                 persistent_cache: bool = False):
         """Initialize the normalizer with rules.
         
         Args:
             test_mode: If True, use test configuration instead of production rules
             enable_atomic_tags: If True, enable atomic tag decomposition
+            persistent_cache: If True, share the process-wide normalization
+                caches that are persisted on disk and keyed by the rules hash
         """
         self._rules_config = TagRulesConfig(test_mode=test_mode)
         self._variant_cache = {}
+        self._manual_variants = {}
+        self._persistent_cache = None
         self._single_instance_tags = set()
         self._merge_history = []
         self._similarity_threshold = 0.7
@@ -66,10 +77,38 @@ class TagNormalizer:
             'core': {'deathcore', 'metalcore', 'grindcore', 'hardcore', 'emocore', 'mathcore'},
             'wave': {'darkwave', 'coldwave', 'chillwave', 'synthwave', 'dolewave'},
         }
+        self._compound_lookup = self._build_compound_lookup()
         
         if self._enable_atomic_tags:
             self._load_atomic_config()
         
+        if persistent_cache:
+            self._attach_persistent_cache()
+        
+    def _atomic_config_path(self) -> str:
+        """Path of the rules file the atomic decomposition rules are read from."""
+        # Navigate from tags/normalizer/ to the config directory
+        current_file_dir = os.path.dirname(os.path.abspath(__file__))
+        albumexplore_dir = os.path.dirname(os.path.dirname(current_file_dir))  # Go up from tags/normalizer/ to albumexplore/
+        return os.path.join(albumexplore_dir, 'config', 'tag_rules.json')
+    
+    def _rules_hash(self) -> str:
+        """Hash of every rules file that influences normalization results."""
+        return compute_rules_hash([Path(self._rules_config.config_path), Path(self._atomic_config_path())])
+    
+    def _attach_persistent_cache(self):
+        """Use the process-wide on-disk caches for the current rules."""
+        cache = get_normalization_cache(self._rules_hash())
+        self._persistent_cache = cache
+        self._variant_cache = cache.variants
+        self._atomic_decomposition_cache = cache.atomic
+    
+    def save_persistent_cache(self) -> int:
+        """Write new cache entries to disk. Returns the number of entries written."""
+        if self._persistent_cache is None:
+            return 0
+        return self._persistent_cache.save()
+        
     def set_active(self, active: bool):
         """Set the active state of the normalizer."""
         self._active = active
@@ -89,6 +128,10 @@ class TagNormalizer:
         if not self._active:
             return original_cleaned_tag # Return cleaned original if normalization is off
             
+        # Variants registered at runtime are kept out of the shared cache
+        if original_cleaned_tag in self._manual_variants:
+            return self._manual_variants[original_cleaned_tag]
+            
         # Check cache first
         if original_cleaned_tag in self._variant_cache:
             return self._variant_cache[original_cleaned_tag]
@@ -152,7 +195,7 @@ class TagNormalizer:
         """Register a new variant mapping."""
         variant = variant.lower().strip()
         canonical = canonical.lower().strip()
-        self._variant_cache[variant] = canonical
+        self._manual_variants[variant] = canonical
         
         # If it was a single-instance tag, remove it
         if variant in self._single_instance_tags:
@@ -175,10 +218,14 @@ class TagNormalizer:
             config['single_instance_mappings'] = {}
             
         config['single_instance_mappings'][tag] = normalized_tag
-        self._variant_cache[tag] = normalized_tag
+        self._rules_config.recompile()
+        self._manual_variants[tag] = normalized_tag
         
         # Save changes to config file
         self._rules_config.save_changes()
+        if self._persistent_cache is not None:
+            # The rules file changed, so cached results for other tags may be stale
+            self._attach_persistent_cache()
         
         # If it was in single-instance tags set, remove it
         if tag in self._single_instance_tags:
@@ -189,13 +236,23 @@ class TagNormalizer:
         return self._merge_history
     
     def clear_cache(self):
-        """Clear the variant cache."""
-        self._variant_cache.clear()
+        """Clear this instance's variant cache and runtime variants.
+
+        The shared persistent cache is keyed by the rules hash, so its
+        entries stay valid and are left to the other instances.
+        """
+        self._manual_variants.clear()
+        if self._persistent_cache is None:
+            self._variant_cache.clear()
         
     def reload_config(self):
         """Reload the configuration file."""
         self._rules_config.reload()
-        self.clear_cache()
+        if self._persistent_cache is not None:
+            # Switch to the cache matching the reloaded rules
+            self._attach_persistent_cache()
+        else:
+            self.clear_cache()
         
     def _get_timestamp(self) -> str:
         """Get current timestamp for merge history."""
@@ -207,11 +264,7 @@ class TagNormalizer:
     def _load_atomic_config(self):
         """Load atomic tag configuration from the main config file."""
         try:
-            # Get the config file path relative to this module
-            # Navigate from tags/normalizer/ to the config directory
-            current_file_dir = os.path.dirname(os.path.abspath(__file__))
-            albumexplore_dir = os.path.dirname(os.path.dirname(current_file_dir))  # Go up from tags/normalizer/ to albumexplore/
-            config_path = os.path.join(albumexplore_dir, 'config', 'tag_rules.json')
+            config_path = self._atomic_config_path()
             
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
@@ -273,30 +326,36 @@ class TagNormalizer:
         # Clean and normalize basic format
         cleaned_tag = tag.lower().strip()
         
+        # The fallback depends on this instance's runtime variants and active
+        # state, so those results stay out of the (possibly shared) cache
+        if not self._active or cleaned_tag in self._manual_variants:
+            atomic_components = self._atomic_rule_components(cleaned_tag)
+            return atomic_components if atomic_components is not None else [self.normalize(tag)]
+        
         # Check cache first
         if cleaned_tag in self._atomic_decomposition_cache:
             return self._atomic_decomposition_cache[cleaned_tag]
         
+        atomic_components = self._atomic_rule_components(cleaned_tag)
+        if atomic_components is None:
+            # If no decomposition rule found, return normalized single tag
+            atomic_components = [self.normalize(tag)]
+        self._atomic_decomposition_cache[cleaned_tag] = atomic_components
+        return atomic_components
+    
+    def _atomic_rule_components(self, cleaned_tag: str) -> Optional[List[str]]:
+        """Components of the decomposition rule matching a cleaned tag, or None."""
         # Apply atomic decomposition if rule exists
         if cleaned_tag in self._atomic_config:
-            atomic_components = self._atomic_config[cleaned_tag].copy()
-            self._atomic_decomposition_cache[cleaned_tag] = atomic_components
-            return atomic_components
+            return self._atomic_config[cleaned_tag].copy()
         
         # Check for case variations and format variations
         normalized_for_lookup = cleaned_tag.replace('-', ' ').replace('_', ' ')
         for rule_tag, components in self._atomic_config.items():
             rule_normalized = rule_tag.replace('-', ' ').replace('_', ' ')
             if rule_normalized == normalized_for_lookup:
-                atomic_components = components.copy()
-                self._atomic_decomposition_cache[cleaned_tag] = atomic_components
-                return atomic_components
-        
-        # If no decomposition rule found, return normalized single tag
-        normalized_single = self.normalize(tag)
-        result = [normalized_single]
-        self._atomic_decomposition_cache[cleaned_tag] = result
-        return result
+                return components.copy()
+        return None
     
     def normalize_tag_list_to_atomic(self, tags: List[str]) -> List[str]:
         """Normalize a list of tags using atomic decomposition.
@@ -358,14 +417,18 @@ class TagNormalizer:
         }
     
     def clear_atomic_cache(self):
-        """Clear the atomic decomposition cache."""
-        self._atomic_decomposition_cache.clear()
+        """Clear the atomic decomposition cache of this instance (not the shared one)."""
+        if self._persistent_cache is None:
+            self._atomic_decomposition_cache.clear()
     
     def reload_atomic_config(self):
         """Reload the atomic tag configuration."""
         if self._enable_atomic_tags:
             self._load_atomic_config()
-            self.clear_atomic_cache()
+            if self._persistent_cache is not None:
+                self._attach_persistent_cache()
+            else:
+                self.clear_atomic_cache()
     
     # ===== ENHANCED NORMALIZATION METHODS =====
     
@@ -417,26 +480,7 @@ class TagNormalizer:
         
         Example: "atmosheric black metal" -> "atmospheric black metal"
         """
-        misspellings = self._rules_config.get_misspellings()
-        
-        # Build a reverse mapping: variant -> correct
-        variant_map = {}
-        for correct, variants in misspellings.items():
-            for variant in variants:
-                variant_map[variant.lower()] = correct
-        
-        # Split tag into words and correct each
-        words = tag.split()
-        corrected_words = []
-        
-        for word in words:
-            # Check if this word is a misspelling
-            if word in variant_map:
-                corrected_words.append(variant_map[word])
-            else:
-                corrected_words.append(word)
-        
-        return ' '.join(corrected_words)
+        return self._rules_config.compiled.correct_misspelled_words(tag)
     
     def _normalize_whitespace(self, tag: str) -> str:
         """Normalize whitespace and remove extra spaces."""
@@ -455,30 +499,30 @@ class TagNormalizer:
         """
         Normalize hyphen vs space for known compound tags.
         
-        Priority:
-        1. Check suffix compounds (should be no hyphen/space)
-        2. If exact match in hyphen_compounds, use hyphen
-        3. Otherwise, check normalized versions
+        The spaced form is looked up in ``_compound_lookup``, where suffix
+        compounds (no hyphen/space) win over hyphen compounds.
         """
         tag_normalized = tag.replace('-', ' ').replace('_', ' ')
         tag_normalized = ' '.join(tag_normalized.split())  # Normalize spaces
         
-        # Check suffix compounds first (blackgaze, doomgaze, etc.)
+        # Canonical spelling of a known compound, else the spaced form
+        return self._compound_lookup.get(tag_normalized, tag_normalized)
+    
+    def _build_compound_lookup(self) -> Dict[str, str]:
+        """Map spaced forms of known compounds to their canonical spelling."""
+        lookup = {}
+        for compound in self._hyphen_compounds:
+            lookup.setdefault(compound.replace('-', ' '), compound)
+        
+        # Suffix compounds take priority (blackgaze, doomgaze, etc.)
+        suffix_lookup = {}
         for suffix, compounds in self._suffix_compounds.items():
             for compound in compounds:
-                # Create spaced version for comparison
                 compound_spaced = re.sub(f'{suffix}$', f' {suffix}', compound)
-                if tag_normalized == compound_spaced or tag_normalized == compound:
-                    return compound  # Return without space/hyphen
-        
-        # Check if it matches a hyphen compound
-        for compound in self._hyphen_compounds:
-            compound_normalized = compound.replace('-', ' ')
-            if tag_normalized == compound_normalized:
-                return compound
-        
-        # No match, return with spaces normalized
-        return tag_normalized
+                suffix_lookup.setdefault(compound_spaced, compound)
+                suffix_lookup.setdefault(compound, compound)
+        lookup.update(suffix_lookup)
+        return lookup
     
     def split_multi_tags(self, tag: str) -> List[str]:
         """
@@ -551,3 +595,16 @@ class TagNormalizer:
             'reduction_count': len(tags) - unique_normalized,
         }
 
+
+def get_shared_normalizer() -> TagNormalizer:
+    """Return the process-wide normalizer backed by the persistent cache.
+
+    Callers that toggle normalization or atomic mode should create their own
+    ``TagNormalizer(persistent_cache=True)`` instead, which shares the caches
+    but keeps its own mode flags.
+    """
+    global _shared_normalizer
+    with _shared_normalizer_lock:
+        if _shared_normalizer is None:
+            _shared_normalizer = TagNormalizer(persistent_cache=True)
+        return _shared_normalizer
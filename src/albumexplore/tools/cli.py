@@ -2,6 +2,7 @@
 import argparse
 import logging
 from pathlib import Path
+from typing import Optional
 from albumexplore.tools.scrape_random_albums import main as scrape_random
 
 def setup_logging(verbose: bool = False):
@@ -12,6 +13,23 @@ def setup_logging(verbose: bool = False):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+def search_albums(query: str, limit: int = 20, database_url: Optional[str] = None):
+    """Print the albums best matching a full-text query."""
+    from albumexplore.database import get_session, init_db
+    from albumexplore.database.search import search_albums as search
+
+    init_db(database_url)
+    session = get_session()
+    try:
+        results = search(session, query, limit=limit)
+        if not results:
+            print("No matching albums.")
+        for album, score in results:
+            year = f" ({album.release_year})" if album.release_year else ""
+            print(f"{score:6.2f}  {album.pa_artist_name_on_album or 'Unknown'} - {album.title}{year}")
+    finally:
+        session.close()
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(description='Album Explorer Tools')
@@ -28,6 +46,16 @@ def main():
     scrape_parser.add_argument('-v', '--verbose', action='store_true',
                               help='Enable verbose logging')
     
+    # Full-text album search command
+    search_parser = subparsers.add_parser('search', help='Search albums, artists, tags and reviews')
+    search_parser.add_argument('query', nargs='+',
+                               help='Words to match; "quoted phrases" and prefix* terms are supported')
+    search_parser.add_argument('--limit', type=int, default=20,
+                               help='Maximum number of results (default: 20)')
+    search_parser.add_argument('--database', help='Database URL (default: the application database)')
+    search_parser.add_argument('-v', '--verbose', action='store_true',
+                               help='Enable verbose logging')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -40,6 +68,8 @@ def main():
     # Run appropriate command
     if args.command == 'scrape-random':
         scrape_random()
+    elif args.command == 'search':
+        search_albums(' '.join(args.query), args.limit, args.database)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -92,7 +92,7 @@ def analyze_tag_relationships(tag_counts: Counter, db_session: Session) -> Dict:
 def analyze_normalized_tags(tag_counts: Counter) -> Dict:
     """Analyze tags using the tag normalizer."""
     print("Analyzing tags using normalizer...")
-    normalizer = TagNormalizer()
+    normalizer = TagNormalizer(persistent_cache=True)
     
     normalization_stats = {
         "total": len(tag_counts),
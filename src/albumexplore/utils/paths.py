@@ -4,8 +4,13 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+from platformdirs import user_cache_dir
+
 logger = logging.getLogger(__name__)
 
+# Overrides the per-user cache directory
+CACHE_DIR_ENV = 'ALBUMEXPLORE_CACHE_DIR'
+
 def get_project_root() -> Path:
     """Get the absolute path to the project root directory."""
     current_dir = Path(__file__).resolve().parent
@@ -32,6 +37,10 @@ def get_log_dir() -> Path:
         log_dir.mkdir(parents=True)
     return log_dir
 
+def get_cache_dir() -> Path:
+    """Get the directory for derived caches: ALBUMEXPLORE_CACHE_DIR, else the per-user cache directory."""
+    return Path(os.environ.get(CACHE_DIR_ENV) or user_cache_dir("albumexplore"))
+
 def resolve_input_file(filename: str) -> Optional[Path]:
     """Resolve a data input file path."""
     # Check absolute path first
@@ -1,6 +1,7 @@
 """Visualization package for AlbumExplore."""
 from .layout import ForceDirectedLayout
+from .array_layout import ArrayForceLayout
 from .models import VisualNode, VisualEdge
 from .physics.force_params import ForceParams
 
-__all__ = ['ForceDirectedLayout', 'ForceParams', 'VisualNode', 'VisualEdge']
\ No newline at end of file
+__all__ = ['ForceDirectedLayout', 'ArrayForceLayout', 'ForceParams', 'VisualNode', 'VisualEdge']
\ No newline at end of file
@@ -0,0 +1,250 @@
+"""Columnar in-memory album store shared by the album views.
+
+All albums are read with one SQL query (one row per album, its tag names
+joined by group_concat) into one array per column plus CSR arrays of tag
+indices: the tags of album ``i`` are
+``tag_names[tag_indices[tag_indptr[i]:tag_indptr[i + 1]]]``. Nothing is
+materialized per album up front; renderers and views hold an AlbumView,
+an array of row positions into the store, and only build a row dict when
+a row is actually read.
+
+Stores are cached per database and rebuilt when the album or link tables
+change, like the co-occurrence matrices.
+"""
+import threading
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.orm import Session
+
+from ..database.change_tracking import change_counter
+from ..database.models import Album, AtomicTag, Tag, album_atomic_tags, album_tags
+from albumexplore.gui.gui_logging import db_logger
+
+# String columns kept per album, named as in the table rows
+TEXT_COLUMNS = ('artist', 'title', 'genre', 'country', 'vocal_style', 'raw_tags')
+
+# Joins the tag names of an album in the query result
+_SEPARATOR = '\x1f'
+
+
+def _csr(joined: Sequence[Optional[str]], vocabulary: Optional[np.ndarray] = None
+         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Indptr, sorted de-duplicated tag indices and vocabulary from one joined name string per album."""
+    lists = [names.split(_SEPARATOR) if names else [] for names in joined]
+    flat = [name for names in lists for name in names]
+    if vocabulary is None:
+        vocabulary = np.array(sorted(set(flat)), dtype=object)
+    positions = {name: i for i, name in enumerate(vocabulary.tolist())}
+    if not flat:
+        return np.zeros(len(lists) + 1, dtype=np.int64), np.empty(0, dtype=np.int32), vocabulary
+    counts = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    albums = np.repeat(np.arange(len(lists), dtype=np.int64), counts)
+    codes = np.fromiter(map(positions.__getitem__, flat), dtype=np.int64, count=len(flat))
+    keys = np.sort(albums * len(vocabulary) + codes)
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]]
+    rows, cols = np.divmod(keys, len(vocabulary))
+    indptr = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(lists)), out=indptr[1:])
+    return indptr, cols.astype(np.int32), vocabulary
+
+
+class AlbumStore:
+    """Album columns as arrays, tags as CSR arrays into a sorted name vocabulary."""
+
+    def __init__(self, ids: np.ndarray, years: np.ndarray, columns: Dict[str, np.ndarray],
+                 tag_names: np.ndarray, tag_indptr: np.ndarray, tag_indices: np.ndarray,
+                 atomic_indptr: Optional[np.ndarray] = None, atomic_indices: Optional[np.ndarray] = None):
+        self.ids = ids
+        # Release year, 0 when unknown
+        self.years = years
+        self.columns = columns
+        self.tag_names = tag_names
+        self.tag_indptr, self.tag_indices = tag_indptr, tag_indices
+        self.atomic_indptr, self.atomic_indices = atomic_indptr, atomic_indices
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence, atomic: bool = False) -> 'AlbumStore':
+        """
+        Build from one (id, artist, title, genre, country, vocal_style,
+        raw_tags, year, tag names[, atomic tag names]) row per album, tag
+        names joined with the unit separator.
+        """
+        columns = list(zip(*rows)) if rows else [()] * (len(TEXT_COLUMNS) + 4)
+        ids = np.array(columns[0], dtype=object)
+        text = {name: np.array([v or '' for v in columns[1 + i]], dtype=object)
+                for i, name in enumerate(TEXT_COLUMNS)}
+        years = np.array([y or 0 for y in columns[1 + len(TEXT_COLUMNS)]], dtype=np.int32)
+
+        tag_columns = columns[2 + len(TEXT_COLUMNS):]
+        if atomic:
+            # One vocabulary for both, so an atomic tag named like a composite one shares its index
+            all_names = [_SEPARATOR.join(filter(None, pair)) for pair in zip(*tag_columns)]
+            _, _, vocabulary = _csr(all_names)
+        else:
+            vocabulary = None
+        tag_indptr, tag_indices, vocabulary = _csr(tag_columns[0], vocabulary)
+        atomic_indptr = atomic_indices = None
+        if atomic:
+            atomic_indptr, atomic_indices, _ = _csr(tag_columns[1], vocabulary)
+        return cls(ids, years, text, vocabulary, tag_indptr, tag_indices, atomic_indptr, atomic_indices)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def has_atomic_tags(self) -> bool:
+        return self.atomic_indptr is not None
+
+    def position(self, album_id: str) -> Optional[int]:
+        """Row of an album id, or None."""
+        if self._positions is None:
+            self._positions = {album_id: i for i, album_id in enumerate(self.ids.tolist())}
+        return self._positions.get(album_id)
+
+    def tags(self, i: int) -> List[str]:
+        return self.tag_names[self.tag_indices[self.tag_indptr[i]:self.tag_indptr[i + 1]]].tolist()
+
+    def atomic_tags(self, i: int) -> List[str]:
+        if self.atomic_indptr is None:
+            return []
+        return self.tag_names[self.atomic_indices[self.atomic_indptr[i]:self.atomic_indptr[i + 1]]].tolist()
+
+    def tag_counts(self) -> np.ndarray:
+        """Number of composite tags per album."""
+        return np.diff(self.tag_indptr)
+
+    def valid_mask(self) -> np.ndarray:
+        """Albums with an artist and title (placeholder 'nan' values count as missing)."""
+        mask = np.ones(len(self), dtype=bool)
+        for name in ('artist', 'title'):
+            values = self.columns[name]
+            mask &= np.array([bool(v) and str(v).lower() != 'nan' for v in values.tolist()], dtype=bool)
+        return mask
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Table row dict of album ``i``."""
+        columns = self.columns
+        title = columns['title'][i]
+        vocal_style = columns['vocal_style'][i]
+        year = int(self.years[i])
+        return {
+            'id': str(self.ids[i]),
+            'artist': columns['artist'][i],
+            'album': title,
+            'title': title,
+            'year': str(year) if year else '',
+            'country': columns['country'][i],
+            'genre': columns['genre'][i],
+            'vocal_style': vocal_style,
+            'vocal_styles': [style.strip() for style in vocal_style.split(',') if style.strip()],
+            'raw_tags': columns['raw_tags'][i] or columns['genre'][i],
+            'tags': self.tags(i),
+            'atomic_tags': self.atomic_tags(i),
+            'type': 'row',
+        }
+
+    def view(self, indices: Optional[np.ndarray] = None) -> 'AlbumView':
+        """View over the given rows (all rows by default)."""
+        if indices is None:
+            indices = np.arange(len(self), dtype=np.intp)
+        return AlbumView(self, indices)
+
+
+class AlbumView(Sequence):
+    """
+    Read-only sequence of table rows over a subset of an AlbumStore.
+
+    Holds only an array of row positions; indexing builds the row dict of
+    a single album, and column arrays are gathered with one take.
+    """
+
+    def __init__(self, store: AlbumStore, indices: np.ndarray):
+        self.store = store
+        self.indices = np.asarray(indices, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Dict[str, Any], 'AlbumView']:
+        if isinstance(item, slice):
+            return AlbumView(self.store, self.indices[item])
+        return self.store.row(int(self.indices[item]))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        row = self.store.row
+        for i in self.indices.tolist():
+            yield row(i)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.store.ids[self.indices]
+
+    @property
+    def years(self) -> np.ndarray:
+        return self.store.years[self.indices]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.store.columns[name][self.indices]
+
+    def tags(self, position: int) -> List[str]:
+        return self.store.tags(int(self.indices[position]))
+
+    def take(self, selector: np.ndarray) -> 'AlbumView':
+        """Sub-view from a boolean mask or positions within this view."""
+        return AlbumView(self.store, self.indices[selector])
+
+    def valid(self) -> 'AlbumView':
+        """Rows with an artist and title."""
+        return self.take(self.store.valid_mask()[self.indices])
+
+
+def _joined_names(link_table, tag_column, model):
+    """Tag names of each album joined into one string (SQLite group_concat)."""
+    return (
+        select(link_table.c.album_id, func.group_concat(model.name, _SEPARATOR).label('names'))
+        .join(model, model.id == link_table.c[tag_column])
+        .group_by(link_table.c.album_id)
+        .subquery()
+    )
+
+
+def _album_rows_query(atomic: bool):
+    year = func.coalesce(Album.release_year, cast(func.strftime('%Y', Album.release_date), Integer))
+    tags = _joined_names(album_tags, 'tag_id', Tag)
+    columns = [Album.id, Album.pa_artist_name_on_album, Album.title, Album.genre, Album.country,
+               Album.vocal_style, Album.raw_tags, year, tags.c.names]
+    query = select(*columns).outerjoin(tags, tags.c.album_id == Album.id)
+    if atomic:
+        atomic_tags = _joined_names(album_atomic_tags, 'atomic_tag_id', AtomicTag)
+        query = query.add_columns(atomic_tags.c.names).outerjoin(atomic_tags, atomic_tags.c.album_id == Album.id)
+    return query.order_by(Album.id)
+
+
+_cache: Dict[Tuple[int, bool], Tuple[Tuple[int, ...], AlbumStore]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_album_store(session: Session, atomic: bool = False) -> AlbumStore:
+    """Album store of the session's database, cached until the album, tag or link tables change."""
+    tables = [Album.__table__, Tag.__table__, album_tags]
+    if atomic:
+        tables += [AtomicTag.__table__, album_atomic_tags]
+    key = (id(session.get_bind()), atomic)
+    version = change_counter(session, *tables)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        store = AlbumStore.from_rows(session.execute(_album_rows_query(atomic)).all(), atomic=atomic)
+        _cache[key] = (version, store)
+        db_logger.info(f"Built album store: {len(store)} albums, {len(store.tag_indices)} tag links")
+        return store
+
+
+def clear_album_store_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,338 @@
+"""Vectorized force-directed layout.
+
+Positions, velocities and edge endpoints live in NumPy arrays indexed by
+node position, so one iteration is a fixed number of array operations
+instead of Python loops over node pairs.
+
+Repulsion is split the way cell-list/particle-mesh codes do it. Nodes are
+binned into a square grid of about CELL_OCCUPANCY nodes per cell.
+Neighbours in the same or adjacent cells repel each other exactly.
+Everything further away comes from the grid: cell masses are convolved
+with the inverse-square kernel by FFT, and the field is sampled bilinearly
+at each node. A step therefore costs O(n + g log g) for g grid cells
+instead of O(n^2), with a median force error of a few percent.
+"""
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import fft
+
+from .models import VisualNode, VisualEdge, Point
+from .physics.force_params import ForceParams
+from albumexplore.gui.gui_logging import graphics_logger
+
+# Target nodes per grid cell; the grid is refined if the near field gets too large
+CELL_OCCUPANCY = 4
+# Finest grid is 2**MAX_LEVELS cells per side
+MAX_LEVELS = 9
+# Near-field pair budget per node before the grid is refined further
+NEAR_PAIRS_PER_NODE = 32
+# Cost of one padded FFT grid cell relative to one near-field pair
+FFT_CELL_COST = 1.0
+
+
+def _cell_coords(pos: np.ndarray, origin: np.ndarray, extent: float, level: int) -> np.ndarray:
+    side = 1 << level
+    cells = np.floor((pos - origin) * (side / extent)).astype(np.int64)
+    return np.clip(cells, 0, side - 1)
+
+
+def _near_pairs(cells: np.ndarray, side: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pairs of nodes in the same or adjacent cells, each unordered pair once.
+
+    Returns ``order`` (nodes sorted by cell) and pair indices (i, j) into that
+    order, which keeps the gathers over pairs close to sequential.
+    """
+    flat = cells[:, 0] * side + cells[:, 1]
+    order = np.argsort(flat, kind='stable').astype(np.int32)
+    counts = np.bincount(flat, minlength=side * side).astype(np.int32)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int32)
+    occupied = np.flatnonzero(counts)
+    ox, oy = occupied // side, occupied % side
+
+    sources, targets = [], []
+    # Half of the neighbourhood; the mirrored offsets would repeat the same pairs
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        nx, ny = ox + dx, oy + dy
+        valid = (nx >= 0) & (nx < side) & (ny >= 0) & (ny < side)
+        a = occupied[valid]
+        b = nx[valid] * side + ny[valid]
+        ca, cb = counts[a], counts[b]
+        keep = cb > 0
+        a, b, ca, cb = a[keep], b[keep], ca[keep], cb[keep]
+        block_sizes = ca * cb
+        total = int(block_sizes.sum())
+        if total == 0:
+            continue
+        # Enumerate each block of ca x cb pairs as (row, column) of its flat index
+        k = np.arange(total, dtype=np.int32) - np.repeat(np.cumsum(block_sizes) - block_sizes, block_sizes)
+        row, col = np.divmod(k, np.repeat(cb, block_sizes))
+        i = np.repeat(starts[a], block_sizes) + row
+        j = np.repeat(starts[b], block_sizes) + col
+        if dx == 0 and dy == 0:
+            i, j = i[i < j], j[i < j]
+        sources.append(i)
+        targets.append(j)
+    if not sources:
+        empty = np.empty(0, dtype=np.int32)
+        return order, empty, empty
+    return order, np.concatenate(sources), np.concatenate(targets)
+
+
+def _near_pair_count(cells: np.ndarray, side: int) -> int:
+    """Number of pairs _near_pairs would return, without building them."""
+    counts = np.zeros((side + 2, side + 2), dtype=np.int64)
+    counts[1:-1, 1:-1] = np.bincount(cells[:, 0] * side + cells[:, 1], minlength=side * side).reshape(side, side)
+    inner = counts[1:-1, 1:-1]
+    neighbourhood = sum(counts[1 + dx:side + 1 + dx, 1 + dy:side + 1 + dy]
+                        for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+    return int((inner * neighbourhood).sum() - inner.sum()) // 2
+
+
+class ArrayForceLayout:
+    """Force-directed layout over NumPy arrays with grid-approximated repulsion.
+
+    Uses the force laws of PhysicsSystem (inverse-square repulsion, linear
+    springs with a natural length, weak centre gravity). Each iteration's
+    step is capped by a temperature that cools geometrically, so the run
+    converges within ``iterations`` steps. The result is scaled to fit
+    the requested width and height.
+    """
+
+    def __init__(self, params: Optional[ForceParams] = None, iterations: int = 300,
+                 tolerance: float = 1e-3, seed: Optional[int] = 0):
+        self.params = params or ForceParams()
+        self.iterations = min(iterations, self.params.max_iterations)
+        # Stop once the largest move falls below this fraction of the layout's extent
+        self.tolerance = tolerance
+        self.seed = seed
+        self.positions = np.empty((0, 2))
+        self.velocities = np.empty((0, 2))
+        self.edge_sources = np.empty(0, dtype=np.int64)
+        self.edge_targets = np.empty(0, dtype=np.int64)
+        self.edge_weights = np.empty(0)
+        self.fixed = np.empty(0, dtype=bool)
+        self.node_ids: List[str] = []
+        self.iteration = 0
+        self._kernels: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def initial_positions(self, n: int) -> np.ndarray:
+        """Random positions on a disc sized for ``n`` nodes at the natural spring length."""
+        rng = np.random.default_rng(self.seed)
+        radius = self.params.spring_length * math.sqrt(max(n, 1))
+        angle = rng.uniform(0.0, 2 * math.pi, n)
+        dist = radius * np.sqrt(rng.uniform(0.0, 1.0, n))
+        return np.column_stack((dist * np.cos(angle), dist * np.sin(angle)))
+
+    def load(self, positions: np.ndarray, edge_sources: np.ndarray, edge_targets: np.ndarray,
+             edge_weights: np.ndarray):
+        """Start from the given positions and edge index arrays."""
+        self.positions = np.asarray(positions, dtype=float)
+        self.velocities = np.zeros_like(self.positions)
+        self.fixed = np.zeros(len(self.positions), dtype=bool)
+        self.edge_sources = np.asarray(edge_sources, dtype=np.int64)
+        self.edge_targets = np.asarray(edge_targets, dtype=np.int64)
+        self.edge_weights = np.asarray(edge_weights, dtype=float)
+        self.iteration = 0
+
+    def initialize(self, nodes: List[VisualNode], edges: List[VisualEdge]):
+        """Load nodes and edges into arrays; nodes without a position start on a random disc."""
+        self.node_ids = [node.id for node in nodes]
+        index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+        positions = self.initial_positions(len(nodes))
+        has_pos = np.array([bool(node.pos) and (node.pos.get('x', 0.0) or node.pos.get('y', 0.0)) != 0.0
+                            for node in nodes], dtype=bool)
+        if has_pos.any():
+            positions[has_pos] = [(nodes[i].pos['x'], nodes[i].pos['y']) for i in np.flatnonzero(has_pos)]
+
+        pairs = [(index[e.source], index[e.target], e.weight) for e in edges
+                 if e.source in index and e.target in index and e.source != e.target]
+        if pairs:
+            sources, targets, weights = zip(*pairs)
+        else:
+            sources, targets, weights = (), (), ()
+        self.load(positions, sources, targets, weights)
+
+    def _levels(self, pos: np.ndarray, origin: np.ndarray, extent: float) -> int:
+        """Grid depth with the cheapest mix of near-field pairs and FFT cells."""
+        n = len(pos)
+        levels = max(2, math.ceil(math.log(max(n / CELL_OCCUPANCY, 1.0), 4)))
+        best, best_cost = levels, None
+        while levels <= MAX_LEVELS:
+            side = 1 << levels
+            pairs = _near_pair_count(_cell_coords(pos, origin, extent, levels), side)
+            cost = pairs + FFT_CELL_COST * (2 * side) ** 2
+            if best_cost is not None and cost >= best_cost:
+                break
+            best, best_cost = levels, cost
+            # Finer grids only pay off while the near field is large
+            if pairs <= NEAR_PAIRS_PER_NODE * n:
+                break
+            levels += 1
+        return best
+
+    def _kernel_spectra(self, side: int) -> Tuple[np.ndarray, np.ndarray]:
+        """FFT of the far-field force kernel for a grid of unit cells, cached per grid size."""
+        spectra = self._kernels.get(side)
+        if spectra is None:
+            offsets = np.arange(-side + 1, side, dtype=float)
+            ox, oy = np.meshgrid(offsets, offsets, indexing='ij')
+            dist_sq = ox * ox + oy * oy
+            kernel = np.zeros_like(dist_sq)
+            far = (np.abs(ox) > 1) | (np.abs(oy) > 1)
+            kernel[far] = 1.0 / (dist_sq[far] * np.sqrt(dist_sq[far]))
+            shape = (2 * side, 2 * side)
+            spectra = tuple(fft.rfft2((o * kernel).astype(np.float32), shape) for o in (ox, oy))
+            self._kernels[side] = spectra
+        return spectra
+
+    def repulsion_forces(self, pos: np.ndarray) -> np.ndarray:
+        """Approximate inverse-square repulsion on every node."""
+        n = len(pos)
+        forces = np.zeros_like(pos)
+        if n < 2:
+            return forces
+        origin = pos.min(axis=0)
+        extent = float((pos.max(axis=0) - origin).max()) * 1.0001 + 1e-9
+        levels = self._levels(pos, origin, extent)
+        side = 1 << levels
+        cell_size = extent / side
+        cells = _cell_coords(pos, origin, extent, levels)
+        strength = self.params.repulsion
+
+        # Far field: cell masses convolved with the force kernel, sampled bilinearly at each node
+        mass = np.bincount(cells[:, 0] * side + cells[:, 1], minlength=side * side).reshape(side, side)
+        shape = (2 * side, 2 * side)
+        mass_spectrum = fft.rfft2(mass.astype(np.float32), shape)
+        scale = strength / (cell_size * cell_size)
+        sample = (pos - origin) / cell_size - 0.5
+        base = np.clip(np.floor(sample).astype(np.int64), 0, side - 2)
+        t = np.clip(sample - base, 0.0, 1.0)
+        bx, by = base[:, 0], base[:, 1]
+        for axis, kernel in enumerate(self._kernel_spectra(side)):
+            field = fft.irfft2(mass_spectrum * kernel, shape)[side - 1:2 * side - 1, side - 1:2 * side - 1]
+            forces[:, axis] = scale * (
+                field[bx, by] * (1 - t[:, 0]) * (1 - t[:, 1]) + field[bx + 1, by] * t[:, 0] * (1 - t[:, 1])
+                + field[bx, by + 1] * (1 - t[:, 0]) * t[:, 1] + field[bx + 1, by + 1] * t[:, 0] * t[:, 1])
+
+        # Near field: exact pairwise repulsion within adjacent cells
+        order, i, j = _near_pairs(cells, side)
+        if len(i):
+            x, y = pos[order, 0], pos[order, 1]
+            dx, dy = x[i] - x[j], y[i] - y[j]
+            dist_sq = dx * dx + dy * dy
+            # Coincident nodes are pushed apart along a fixed direction
+            coincident = dist_sq < 1e-4
+            if coincident.any():
+                dx[coincident], dy[coincident], dist_sq[coincident] = 0.01, 0.0, 1e-4
+            pair_scale = strength / (dist_sq * np.sqrt(dist_sq))
+            for axis, d in enumerate((dx, dy)):
+                f = d * pair_scale
+                forces[order, axis] += np.bincount(i, weights=f, minlength=n) - np.bincount(j, weights=f, minlength=n)
+        return forces
+
+    def spring_forces(self, pos: np.ndarray) -> np.ndarray:
+        n = len(pos)
+        forces = np.zeros_like(pos)
+        if len(self.edge_sources) == 0:
+            return forces
+        d = pos[self.edge_targets] - pos[self.edge_sources]
+        dist = np.sqrt((d * d).sum(axis=1))
+        dist = np.maximum(dist, 0.01)
+        magnitude = self.params.spring_coefficient * (dist - self.params.spring_length) * self.edge_weights
+        f = d * (magnitude / dist)[:, None]
+        for axis in (0, 1):
+            forces[:, axis] += np.bincount(self.edge_sources, weights=f[:, axis], minlength=n)
+            forces[:, axis] -= np.bincount(self.edge_targets, weights=f[:, axis], minlength=n)
+        return forces
+
+    def step(self, temperature: float) -> float:
+        """Advance one iteration; returns the largest node displacement."""
+        pos = self.positions
+        forces = self.repulsion_forces(pos) + self.spring_forces(pos)
+        # Gravity is spread over all nodes so the graph can spread out, but nodes beyond twice
+        # the RMS radius (mostly isolated ones) are pulled back at full strength so they do not
+        # stretch the repulsion grid
+        offset = pos - pos.mean(axis=0)
+        radius = np.sqrt((offset * offset).sum(axis=1))
+        limit = 2.0 * math.sqrt(float((radius * radius).mean()))
+        pull = self.params.gravitational_constant * (
+            1.0 / len(pos) + np.maximum(radius - limit, 0.0) / np.maximum(radius, 1e-9))
+        forces -= offset * pull[:, None]
+
+        vel = (self.velocities + forces * self.params.time_step) * self.params.damping
+        speed = np.sqrt((vel * vel).sum(axis=1))
+        too_fast = speed > temperature
+        vel[too_fast] *= (temperature / speed[too_fast])[:, None]
+        vel[self.fixed] = 0.0
+        self.velocities = vel
+        self.positions = pos + vel
+        self.iteration += 1
+        return float(np.minimum(speed, temperature)[~self.fixed].max(initial=0.0))
+
+    def run(self, iterations: Optional[int] = None, start_temperature: Optional[float] = None) -> int:
+        """Iterate until the moves fall below tolerance or the step budget is spent.
+
+        By default the first step may move a node by 10% of the layout's extent;
+        refining an already good layout should pass a smaller ``start_temperature``.
+        """
+        n = len(self.positions)
+        if n < 2:
+            return 0
+        iterations = self.iterations if iterations is None else iterations
+        extent = float(np.ptp(self.positions, axis=0).max()) or self.params.spring_length
+        if start_temperature is None:
+            start_temperature = extent * 0.1
+        # Cool so the final steps move at most 1% of the starting temperature
+        cooling = 0.01 ** (1.0 / max(iterations, 1))
+        for it in range(iterations):
+            moved = self.step(start_temperature * cooling ** it)
+            if moved < self.tolerance * extent:
+                break
+        return self.iteration
+
+    def fit(self, width: float, height: float, margin: float = 20.0) -> np.ndarray:
+        """Positions scaled uniformly and centred in a width x height area."""
+        pos = self.positions
+        if len(pos) == 0:
+            return pos
+        low, high = pos.min(axis=0), pos.max(axis=0)
+        span = np.maximum(high - low, 1e-9)
+        scale = min((width - 2 * margin) / span[0], (height - 2 * margin) / span[1])
+        offset = np.array([width, height]) / 2 - (low + high) / 2 * scale
+        return pos * scale + offset
+
+    def compute_layout(self, nodes: List[VisualNode], edges: List[VisualEdge],
+                       width: float, height: float) -> Dict[str, Point]:
+        """Compute a layout and write it to ``node.pos``."""
+        self.initialize(nodes, edges)
+        iterations = self.run()
+        graphics_logger.debug(f"Array layout: {len(nodes)} nodes, {len(self.edge_sources)} edges, "
+                              f"{iterations} iterations")
+        return self.write_positions(nodes, width, height)
+
+    def write_positions(self, nodes: List[VisualNode], width: float, height: float) -> Dict[str, Point]:
+        """Fit the current positions to the area and store them on ``nodes`` (same order)."""
+        positions = {}
+        for node, (x, y) in zip(nodes, self.fit(width, height).tolist()):
+            node.pos = {'x': x, 'y': y}
+            positions[node.id] = Point(x, y)
+        return positions
+
+    def update_layout(self, nodes: List[VisualNode], edges: List[VisualEdge],
+                      fixed_nodes: Dict[str, Point]) -> bool:
+        """Run one iteration from the nodes' current positions with some nodes pinned."""
+        self.initialize(nodes, edges)
+        index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        for node_id, point in fixed_nodes.items():
+            i = index.get(node_id)
+            if i is not None:
+                self.positions[i] = (point.x, point.y)
+                self.fixed[i] = True
+        extent = float(np.ptp(self.positions, axis=0).max()) if len(self.positions) else 0.0
+        moved = self.step(max(extent * 0.01, 1.0))
+        for node, (x, y) in zip(nodes, self.positions.tolist()):
+            node.pos = {'x': x, 'y': y}
+        return moved > self.tolerance * max(extent, 1.0)
@@ -1,7 +1,8 @@
 """Node clustering engine for network visualization."""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from .models import VisualNode
+from .spatial_index import SpatialIndex, node_position
 import math
 
 @dataclass
@@ -16,17 +17,57 @@ class ClusterNode:
 class ClusterEngine:
     """Handles node clustering based on spatial proximity."""
     
-    def __init__(self):
+    def __init__(self, index: Optional[SpatialIndex] = None):
         self.clusters: Dict[str, ClusterNode] = {}
         self.min_distance = 50.0
         self.max_cluster_size = 20
+        # An index the caller keeps on these nodes, e.g. ViewOptimizer.spatial_index;
+        # a private one is built if none is given or it lacks some of the nodes
+        self.index = index
         
     def update_clusters(self, nodes: List[VisualNode], scale: float) -> Dict[str, ClusterNode]:
-        """Update clusters based on current viewport scale."""
+        """Update clusters based on current viewport scale.
+
+        Nodes closer than ``min_distance`` on screen are grouped: the largest
+        unclustered node collects its nearest unclustered neighbours within
+        ``min_distance / scale`` in layout space, up to ``max_cluster_size``.
+        Nodes left on their own are not reported.
+        """
         if scale > 0.5:  # Don't cluster when zoomed in
             return {}
             
         self.clusters.clear()
-        return self.clusters
+        if not nodes:
+            return self.clusters
 
+        index = self.index
+        if index is None or any(node.id not in index for node in nodes):
+            index = SpatialIndex(cell_size=self.min_distance / max(scale, 1e-6))
+            index.build_nodes(nodes)
+        else:
+            # Layouts move nodes in place; pick up where they are now
+            index.update_nodes(nodes)
+        radius = self.min_distance / max(scale, 1e-6)
+        node_ids = {node.id for node in nodes}
 
+        assigned = set()
+        for node in sorted(nodes, key=lambda n: n.size, reverse=True):
+            if node.id in assigned:
+                continue
+            x, y = node_position(node)
+            # A shared index may hold nodes that are not being clustered
+            members = [other for _, other in index.within(x, y, radius)
+                       if other.id in node_ids and other.id not in assigned][:self.max_cluster_size]
+            if len(members) < 2:
+                continue
+            assigned.update(member.id for member in members)
+            positions = [node_position(member) for member in members]
+            cluster_id = f"cluster_{len(self.clusters)}"
+            self.clusters[cluster_id] = ClusterNode(
+                id=cluster_id,
+                center_x=sum(p[0] for p in positions) / len(positions),
+                center_y=sum(p[1] for p in positions) / len(positions),
+                nodes=members,
+                size=math.sqrt(sum(member.size ** 2 for member in members))
+            )
+        return self.clusters
@@ -1,15 +1,18 @@
 """Data interface for visualization system."""
 from typing import Dict, Any, List, Tuple, Optional, Set
 from dataclasses import dataclass
+import numpy as np
 from sqlalchemy.orm import Session
 from ..database.queries import (
-    get_albums_with_tags, get_related_albums, get_album_tags,
+    get_related_albums, get_album_tags,
     get_albums_with_atomic_tags, get_atomic_tag_breakdown,
     filter_albums_by_atomic_components, get_atomic_tag_statistics,
     search_albums_by_atomic_tags
 )
+from ..database.co_occurrence import get_co_occurrence
 from ..database.models import Album, Tag, AtomicTag
 from .models import VisualNode, VisualEdge
+from .album_store import AlbumStore, AlbumView, get_album_store
 
 @dataclass
 class DataConfig:
@@ -21,6 +24,8 @@ class DataConfig:
     filter_by_year: Optional[int] = None
     filter_by_genre: Optional[str] = None
     tag_threshold: int = 2
+    # Tags shown in the chord and arc co-occurrence views
+    max_co_occurrence_tags: int = 40
     # Atomic tag configuration
     use_atomic_tags: bool = False
     show_atomic_breakdown: bool = True
@@ -56,28 +61,61 @@ class DataInterface:
         self._atomic_tag_cache.clear()
         self._atomic_breakdown_cache.clear()
     
+    def get_album_view(self) -> AlbumView:
+        """Albums with an artist and title, as a view over the shared album store."""
+        if not self.session:
+            return AlbumStore.from_rows([]).view()
+        store = get_album_store(self.session, atomic=self._config.use_atomic_tags)
+        return store.view().valid()
+
     def get_visible_data(self) -> Tuple[List[VisualNode], List[VisualEdge]]:
         """Get currently visible nodes and edges."""
         if not self.session:
             return [], []
         
-        # Choose data source based on atomic tag configuration
-        if self._config.use_atomic_tags:
-            albums = get_albums_with_atomic_tags(self.session)
-        else:
-            albums = get_albums_with_tags(self.session)
-        
-        nodes = []
+        store = get_album_store(self.session, atomic=self._config.use_atomic_tags)
+        nodes = [self._node_from_store(store, i) for i in range(len(store))]
+        return nodes, []
+    
+    def get_tag_co_occurrence_graph(self) -> Tuple[List[VisualNode], List[VisualEdge]]:
+        """Most frequent tags as nodes, joined by edges weighted by how many albums share them."""
+        if not self.session:
+            return [], []
+
+        atomic = self._config.use_atomic_tags
+        co_occurrence = get_co_occurrence(self.session, atomic=atomic)
+        tag_ids = co_occurrence.top_tags(self._config.max_co_occurrence_tags)
+        if not tag_ids:
+            return [], []
+
+        model = AtomicTag if atomic else Tag
+        names = dict(self.session.query(model.id, model.name).filter(model.id.in_(tag_ids)).all())
+        frequencies = dict(zip(co_occurrence.tag_ids, co_occurrence.frequencies))
+        nodes = [
+            VisualNode(
+                id=str(tag_id),
+                label=names.get(tag_id, str(tag_id)),
+                size=10.0 + 2.0 * np.log1p(frequencies[tag_id]),
+                data={'type': 'tag', 'album_count': int(frequencies[tag_id])}
+            )
+            for tag_id in tag_ids
+        ]
+
+        pairs = co_occurrence.pairs(self._config.tag_threshold, tag_ids)[:self._config.max_edges]
+        max_count = pairs[0][2] if pairs else 1
         edges = []
-        
-        # Create nodes for each album
-        for album in albums:
-            node = self._create_or_get_node(album)
-            if node:
-                nodes.append(node)
-        
+        for tag1_id, tag2_id, count in pairs:
+            weight = count / max_count
+            thickness = 1.0 + weight * 2.0
+            edges.append(VisualEdge(
+                source=str(tag1_id),
+                target=str(tag2_id),
+                weight=weight,
+                thickness=thickness,
+                data={'count': count, 'initial_weight': weight, 'initial_thickness': thickness}
+            ))
         return nodes, edges
-    
+
     def get_atomic_tag_data(self) -> Dict[str, Any]:
         """Get atomic tag statistics and breakdown data."""
         if not self.session:
@@ -194,6 +232,26 @@ class DataInterface:
         self._node_cache[album.id] = node
         return node
     
+    def _node_from_store(self, store: AlbumStore, i: int) -> VisualNode:
+        """Create or get the cached node of album ``i`` of the store."""
+        album_id = store.ids[i]
+        if album_id in self._node_cache:
+            return self._node_cache[album_id]
+
+        node_data = store.row(i)
+        node_data['year'] = int(store.years[i]) or None
+        if not self._config.include_tags:
+            node_data['tags'], node_data['atomic_tags'] = [], []
+        node = VisualNode(
+            id=node_data.pop('id'),
+            label=f"{node_data['artist']} - {node_data['title']}",
+            size=10.0 + len(node_data['tags']) + len(node_data['atomic_tags']),
+            color="#4287f5",  # Default blue
+            data=node_data
+        )
+        self._node_cache[album_id] = node
+        return node
+
     def _create_or_get_edge(self, source_id: str, target_id: str, weight: float) -> Optional[VisualEdge]:
         """Create or get cached edge."""
         key = (source_id, target_id) if source_id < target_id else (target_id, source_id)
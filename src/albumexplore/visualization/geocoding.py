@@ -0,0 +1,249 @@
+"""Geocoding and location aggregates for the world map.
+
+Coordinates come from ``config/locations.tsv``, read once per process and
+indexed by the exact string and a normalized form (case, accents,
+whitespace and separators folded). Strings not in the table are resolved
+by trying each part of a multi-location string ("USA / Finland"), a fuzzy
+match among the entries of the same region, and finally the region alone
+("Kennett, MO" -> "MO"). Every distinct string is resolved once.
+
+LocationAggregates groups albums by coordinates and indexes them by genre
+and year, so a filter change is answered with a binary search per
+location instead of a scan over all albums.
+"""
+import difflib
+import json
+import os
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from albumexplore.gui.gui_logging import graphics_logger
+
+LOCATIONS_FILE = os.path.join(os.path.dirname(__file__), '..', 'config', 'locations.tsv')
+
+# Minimum difflib ratio between place names (the part before the region) for a fuzzy match
+FUZZY_CUTOFF = 0.88
+
+_SEPARATORS = re.compile(r'\s*([,/&])\s*')
+_MULTI_SPLIT = re.compile(r'\s*(?:/|&|\+|;)\s*')
+_SPACES = re.compile(r'\s+')
+
+Coordinates = Tuple[float, float]
+
+
+def normalize_location(text: str) -> str:
+    """Case-, accent- and spacing-insensitive form of a location string."""
+    text = unicodedata.normalize('NFKD', str(text))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    text = _SEPARATORS.sub(r'\1 ', text)
+    return _SPACES.sub(' ', text).strip(' ,/&.')
+
+
+def _split_region(key: str) -> Tuple[str, str]:
+    """(place, region) of a normalized location; region is "" if there is no comma."""
+    head, sep, tail = key.rpartition(', ')
+    return (head, tail) if sep else (key, '')
+
+
+@lru_cache(maxsize=None)
+def load_location_table(path: str = LOCATIONS_FILE) -> Tuple[Dict[str, Coordinates], Dict[str, Coordinates],
+                                                              Dict[str, Tuple[str, ...]]]:
+    """Exact and normalized lookups plus place names grouped by region, read once per file."""
+    exact: Dict[str, Coordinates] = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            name, lat, lon = line.rstrip('\n').split('\t')[:3]
+            exact[name] = (float(lat), float(lon))
+
+    normalized: Dict[str, Coordinates] = {}
+    for name, coords in exact.items():
+        normalized.setdefault(normalize_location(name), coords)
+    by_region: Dict[str, List[str]] = {}
+    for key in normalized:
+        place, region = _split_region(key)
+        by_region.setdefault(region, []).append(place)
+    return exact, normalized, {region: tuple(keys) for region, keys in by_region.items()}
+
+
+class LocationCache:
+    """Cache for geocoded locations."""
+
+    def __init__(self, path: str = LOCATIONS_FILE):
+        self._table, self._normalized, self._by_region = load_location_table(path)
+        # Locations added at runtime, on top of the shared table
+        self._added: Dict[str, Coordinates] = {}
+        # Every string resolved so far, including misses
+        self._resolved: Dict[str, Optional[Coordinates]] = {}
+
+    def __len__(self) -> int:
+        return len(self._table) + len(self._added)
+
+    def _lookup(self, location: str) -> Optional[Coordinates]:
+        coords = self._added.get(location) or self._table.get(location)
+        if coords:
+            return coords
+        return self._normalized.get(normalize_location(location))
+
+    def _fuzzy(self, key: str) -> Optional[Coordinates]:
+        """Closest misspelling of a place within the same region ("Birgmingham, England")."""
+        place, region = _split_region(key)
+        match = difflib.get_close_matches(place, self._by_region.get(region, ()), n=1, cutoff=FUZZY_CUTOFF)
+        if not match:
+            return None
+        return self._normalized[f"{match[0]}, {region}" if region else match[0]]
+
+    def _resolve(self, location: str) -> Optional[Coordinates]:
+        coords = self._lookup(location)
+        if coords:
+            return coords
+
+        # Multi-location strings ("USA / Finland", "OR & AK"): first part that resolves
+        parts = [p for p in _MULTI_SPLIT.split(location) if p]
+        if len(parts) > 1:
+            for part in parts:
+                coords = self._lookup(part)
+                if coords:
+                    return coords
+
+        key = normalize_location(parts[0] if parts else location)
+        coords = self._fuzzy(key)
+        if coords:
+            return coords
+
+        # "City, Region": fall back to the region
+        region = _split_region(key)[1]
+        if region:
+            return self._normalized.get(region)
+        return None
+
+    def get_coordinates(self, location: str) -> Optional[Coordinates]:
+        """Get lat/long coordinates for a location string."""
+        if not location:
+            return None
+        try:
+            return self._resolved[location]
+        except KeyError:
+            pass
+        coords = self._resolve(location)
+        if coords is None:
+            graphics_logger.debug(f"Location '{location}' not found in cache")
+        self._resolved[location] = coords
+        return coords
+
+    def add_location(self, location: str, lat: float, lon: float):
+        """Add a location to the cache."""
+        self._added[location] = (lat, lon)
+        self._resolved.clear()
+
+
+@dataclass
+class LocationGroup:
+    """Albums at one map location that pass the current filters."""
+    coords: Coordinates
+    location: str
+    count: int
+    # Up to the requested number of matching albums, newest first
+    albums: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def encode_groups(groups: Sequence[LocationGroup]) -> str:
+    """Compact JSON of location groups: [lat, lon, count, location, [[artist, album, year, genre], ...]]."""
+    rows = []
+    for group in groups:
+        albums = [[str(a.get('artist') or ''), str(a.get('label') or ''),
+                   str(a.get('year')) if a.get('year') else '', str(a.get('genre') or '')]
+                  for a in group.albums]
+        rows.append([group.coords[0], group.coords[1], group.count, str(group.location), albums])
+    return json.dumps(rows, ensure_ascii=False, separators=(',', ':'))
+
+
+def _year_value(year) -> Optional[int]:
+    """Album year as int; None for a missing year, -1 for one that cannot be parsed."""
+    if not year:
+        return None
+    try:
+        return int(year)
+    except (ValueError, TypeError):
+        return -1
+
+
+class LocationAggregates:
+    """
+    Albums grouped by coordinates and indexed by genre and year.
+
+    For each genre (and for all genres together) dated albums are sorted by
+    (location, year), so the albums of every location within a year range
+    are a contiguous slice found by two vectorized binary searches. Albums
+    without a year pass every year range; albums with an unparseable year
+    never do.
+    """
+
+    def __init__(self, albums_by_location: Dict[Coordinates, Sequence[Dict[str, Any]]]):
+        self.coords: List[Coordinates] = list(albums_by_location)
+        self.locations = [albums[0].get('location', '') if albums else '' for albums in albums_by_location.values()]
+        self.albums: List[Dict[str, Any]] = []
+        buckets, years, genres = [], [], []
+        for bucket, albums in enumerate(albums_by_location.values()):
+            for album in albums:
+                self.albums.append(album)
+                buckets.append(bucket)
+                year = _year_value(album.get('year'))
+                years.append(-2 if year is None else year)
+                genres.append(album.get('genre'))
+
+        self.genres = sorted({g for g in genres if g}, key=str)
+        buckets = np.array(buckets, dtype=np.int64)
+        years = np.array(years, dtype=np.int64)
+        genre_ids = {genre: i for i, genre in enumerate(self.genres)}
+        genre_of = np.array([genre_ids.get(g, -1) for g in genres], dtype=np.int64)
+
+        self._index = {None: self._build(np.arange(len(self.albums)), buckets, years)}
+        for genre, gid in genre_ids.items():
+            self._index[genre] = self._build(np.flatnonzero(genre_of == gid), buckets, years)
+
+    # Sort key stride: years are offset so a location's albums occupy one block
+    _YEAR_SPAN = 1 << 20
+
+    def _build(self, members: np.ndarray, buckets: np.ndarray, years: np.ndarray):
+        dated = members[years[members] >= 0]
+        keys = buckets[dated] * self._YEAR_SPAN + years[dated]
+        order = np.argsort(keys, kind='stable')
+        undated = members[years[members] == -2]
+        undated_counts = np.bincount(buckets[undated], minlength=len(self.coords))
+        undated_by_bucket: Dict[int, List[int]] = {}
+        for i in undated.tolist():
+            undated_by_bucket.setdefault(int(buckets[i]), []).append(i)
+        present = np.unique(buckets[members])
+        return keys[order], dated[order], undated_counts, undated_by_bucket, present
+
+    def query(self, genre: Optional[str] = None, year_min: int = 0, year_max: int = 9999,
+              limit: int = 15) -> List[LocationGroup]:
+        """Locations with albums of ``genre`` (None for all) released in [year_min, year_max]."""
+        index = self._index.get(genre)
+        if index is None:
+            return []
+        keys, album_ids, undated_counts, undated_by_bucket, present = index
+        year_min = max(int(year_min), 0)
+        year_max = min(int(year_max), self._YEAR_SPAN - 1)
+        start = np.searchsorted(keys, present * self._YEAR_SPAN + year_min, side='left')
+        stop = np.searchsorted(keys, present * self._YEAR_SPAN + year_max, side='right')
+        dated_counts = np.maximum(stop - start, 0)
+        counts = dated_counts + undated_counts[present]
+
+        groups = []
+        for bucket, lo, hi, count in zip(present.tolist(), start.tolist(), stop.tolist(), counts.tolist()):
+            if count == 0:
+                continue
+            sample = album_ids[max(lo, hi - limit):hi][::-1].tolist() if hi > lo else []
+            if len(sample) < limit:
+                sample += undated_by_bucket.get(bucket, [])[:limit - len(sample)]
+            groups.append(LocationGroup(self.coords[bucket], self.locations[bucket], count,
+                                        [self.albums[i] for i in sample]))
+        return groups
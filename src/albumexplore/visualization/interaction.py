@@ -1,10 +1,13 @@
 from typing import Dict, Any, Optional, Set
 from .state import StateManager
+from .spatial_index import SpatialIndex, node_position
 
 
 class InteractionHandler:
-	def __init__(self, state_manager: StateManager):
+	def __init__(self, state_manager: StateManager, spatial_index: Optional[SpatialIndex] = None):
 		self.state_manager = state_manager
+		# Index of the displayed nodes, e.g. ViewOptimizer.spatial_index; without one every node is tested
+		self.spatial_index = spatial_index
 		self.drag_start: Optional[Dict[str, float]] = None
 		self.selected_ids: Set[str] = set()
 
@@ -71,9 +74,11 @@ class InteractionHandler:
 		view_pos = current_view.position
 		x = (position["x"] + view_pos["x"]) / zoom
 		y = (position["y"] + view_pos["y"]) / zoom
+		if self.spatial_index is not None:
+			node = self.spatial_index.hit_test(x, y, zoom)
+			return node.id if node else None
 		for node in self.state_manager.nodes:
-			node_x = node.data.get("x", 0)
-			node_y = node.data.get("y", 0)
+			node_x, node_y = node_position(node)
 			size = node.size * zoom
 			if (x - node_x)**2 + (y - node_y)**2 <= size**2:
 				return node.id
@@ -2,108 +2,127 @@ from typing import List, Dict, Any, Tuple, Set, Protocol, Optional
 import math
 import random
 import time
-from collections import defaultdict
+
+import numpy as np
 from .models import VisualNode, VisualEdge, Point
 from .physics.force_params import ForceParams
 from .physics_system import PhysicsSystem
+from .array_layout import ArrayForceLayout
 from albumexplore.gui.gui_logging import graphics_logger
 
 
 class MultiLevelLayout:
-	"""Handles multilevel force-directed layout"""
-	def __init__(self, nodes: List[VisualNode], edges: List[VisualEdge]):
-		self.nodes = nodes
-		self.edges = edges
-		self.levels: List[Tuple[List[VisualNode], List[VisualEdge]]] = []
-		
+	"""
+	Multilevel force-directed layout.
+
+	The graph is coarsened by heavy-edge matching until it is small, the
+	coarsest graph is laid out from scratch, and every finer level starts
+	from its super-node's position so a few refinement iterations suffice.
+	Levels are kept as index arrays: ``levels[k]`` holds the edge sources,
+	targets and weights of level k and ``parents[k]`` maps each node of
+	level k to its super-node in level k + 1.
+	"""
+	# Stop coarsening once a level is this small
+	COARSEST_SIZE = 100
+	# Stop coarsening when a level keeps more than this fraction of its nodes
+	MIN_REDUCTION = 0.9
+
+	def __init__(self, nodes: Optional[List[VisualNode]] = None, edges: Optional[List[VisualEdge]] = None,
+				 params: Optional[ForceParams] = None, refine_iterations: int = 60, seed: Optional[int] = 0):
+		self.nodes = nodes or []
+		self.edges = edges or []
+		self.params = params or ForceParams()
+		self.refine_iterations = refine_iterations
+		self.seed = seed
+		self.levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+		self.parents: List[np.ndarray] = []
+		self.sizes: List[np.ndarray] = []
+		self.engine = ArrayForceLayout(self.params, seed=seed)
+
 	def coarsen(self) -> None:
 		"""Create hierarchical levels of the graph"""
-		current_nodes = self.nodes.copy()
-		current_edges = self.edges.copy()
-		
-		while len(current_nodes) > 100:  # Increased threshold
-			matches = self._find_matches(current_nodes, current_edges)
-			if not matches:
-				break
-			new_nodes, new_edges = self._collapse_matches(current_nodes, current_edges, matches)
-			self.levels.append((current_nodes, current_edges))
-			current_nodes = new_nodes
-			current_edges = new_edges
-		self.levels.append((current_nodes, current_edges))
+		index = {node.id: i for i, node in enumerate(self.nodes)}
+		pairs = [(index[e.source], index[e.target], e.weight) for e in self.edges
+				 if e.source in index and e.target in index and e.source != e.target]
+		sources = np.array([p[0] for p in pairs], dtype=np.int64)
+		targets = np.array([p[1] for p in pairs], dtype=np.int64)
+		weights = np.array([p[2] for p in pairs], dtype=float)
+		sizes = np.array([node.size for node in self.nodes], dtype=float)
 
+		self.levels, self.parents, self.sizes = [(sources, targets, weights)], [], [sizes]
+		while len(sizes) > self.COARSEST_SIZE:
+			matches = self._find_matches(len(sizes), sources, targets, weights)
+			if len(sizes) - len(matches) > self.MIN_REDUCTION * len(sizes):
+				break
+			parent, (sources, targets, weights), sizes = self._collapse_matches(
+				sizes, sources, targets, weights, matches)
+			self.parents.append(parent)
+			self.levels.append((sources, targets, weights))
+			self.sizes.append(sizes)
 
-	def _find_matches(self, nodes: List[VisualNode], 
-					 edges: List[VisualEdge]) -> List[Tuple[str, str]]:
-		"""Find pairs of nodes to collapse based on edge weights"""
-		edge_weights = defaultdict(float)
-		for edge in edges:
-			edge_weights[(edge.source, edge.target)] = edge.weight
-			
+	def _find_matches(self, n_nodes: int, sources: np.ndarray, targets: np.ndarray,
+					 weights: np.ndarray) -> np.ndarray:
+		"""Greedy heavy-edge matching; returns (k, 2) pairs of node positions"""
+		used = bytearray(n_nodes)
 		matches = []
-		used_nodes = set()
-		
-		# Sort edges by weight for better matching
-		sorted_edges = sorted(edges, key=lambda e: e.weight, reverse=True)
-		
-		for edge in sorted_edges:
-			if (edge.source not in used_nodes and 
-				edge.target not in used_nodes):
-				matches.append((edge.source, edge.target))
-				used_nodes.add(edge.source)
-				used_nodes.add(edge.target)
-				
-		return matches
+		order = np.argsort(-weights, kind='stable')
+		for a, b in zip(sources[order].tolist(), targets[order].tolist()):
+			if not used[a] and not used[b]:
+				used[a] = used[b] = 1
+				matches.append((a, b))
+		return np.array(matches, dtype=np.int64).reshape(-1, 2)
+
+	def _collapse_matches(self, sizes: np.ndarray, sources: np.ndarray, targets: np.ndarray,
+						 weights: np.ndarray, matches: np.ndarray):
+		"""Collapse matched nodes into super-nodes.
+
+		Returns the parent of every node, the coarse edges (parallel edges
+		merged with summed weights, self-loops dropped) and the super-node sizes.
+		"""
+		parent = np.arange(len(sizes))
+		parent[matches[:, 1]] = matches[:, 0]
+		_, parent = np.unique(parent, return_inverse=True)
+		n_coarse = int(parent.max()) + 1 if len(parent) else 0
+		coarse_sizes = np.bincount(parent, weights=sizes, minlength=n_coarse)
+
+		s, t = parent[sources], parent[targets]
+		keep = s != t
+		low, high = np.minimum(s[keep], t[keep]), np.maximum(s[keep], t[keep])
+		keys, inverse = np.unique(low * n_coarse + high, return_inverse=True)
+		coarse_weights = np.bincount(inverse, weights=weights[keep], minlength=len(keys))
+		return parent, (keys // n_coarse, keys % n_coarse, coarse_weights), coarse_sizes
+
+	def _interpolate(self, coarse_pos: np.ndarray, parent: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+		"""Place every node near its super-node, spread out for the larger node count."""
+		centre = coarse_pos.mean(axis=0)
+		scale = math.sqrt(len(parent) / max(len(coarse_pos), 1))
+		jitter = rng.uniform(-0.5, 0.5, (len(parent), 2)) * self.params.spring_length
+		return centre + (coarse_pos[parent] - centre) * scale + jitter
+
+	def compute_layout(self, nodes: List[VisualNode], edges: List[VisualEdge],
+					   width: float, height: float) -> Dict[str, Point]:
+		"""Lay out the coarsest level, then interpolate and refine level by level."""
+		self.nodes, self.edges = nodes, edges
+		self.coarsen()
+		rng = np.random.default_rng(self.seed)
+		engine = self.engine
+		coarsest = len(self.levels) - 1
+		engine.load(engine.initial_positions(len(self.sizes[coarsest])), *self.levels[coarsest])
+		iterations = engine.run()
+		for level in range(coarsest - 1, -1, -1):
+			positions = self._interpolate(engine.positions, self.parents[level], rng)
+			engine.load(positions, *self.levels[level])
+			iterations += engine.run(self.refine_iterations, start_temperature=self.params.spring_length)
+
+		graphics_logger.debug(f"Multilevel layout: {len(nodes)} nodes, {len(self.levels)} levels, "
+							  f"{iterations} iterations")
+		engine.node_ids = [node.id for node in nodes]
+		return engine.write_positions(nodes, width, height)
 
-	def _collapse_matches(self, nodes: List[VisualNode], 
-						 edges: List[VisualEdge],
-						 matches: List[Tuple[str, str]]) -> Tuple[List[VisualNode], List[VisualEdge]]:
-		"""Collapse matched nodes into super-nodes"""
-		new_nodes = []
-		node_map = {}  # Maps original nodes to super-nodes
-		
-		# Create super-nodes
-		for n1_id, n2_id in matches:
-			super_id = f"super_{n1_id}_{n2_id}"
-			super_node = VisualNode(
-				id=super_id,
-				label=f"SN_{len(new_nodes)}",
-				size=sum(n.size for n in nodes if n.id in (n1_id, n2_id)),
-				color=nodes[0].color,
-				shape=nodes[0].shape,
-				data={}
-			)
-			new_nodes.append(super_node)
-			node_map[n1_id] = super_id
-			node_map[n2_id] = super_id
-			
-		# Add unmatched nodes
-		matched_ids = {id for pair in matches for id in pair}
-		for node in nodes:
-			if node.id not in matched_ids:
-				new_nodes.append(node)
-				node_map[node.id] = node.id
-				
-		# Create new edges
-		new_edges = []
-		edge_weights = defaultdict(float)
-		
-		for edge in edges:
-			source = node_map[edge.source]
-			target = node_map[edge.target]
-			if source != target:
-				edge_weights[(source, target)] += edge.weight
-				
-		for (source, target), weight in edge_weights.items():
-			new_edges.append(VisualEdge(
-				source=source,
-				target=target,
-				weight=weight,
-				thickness=math.sqrt(weight),
-				color=edges[0].color,
-				data={}
-			))
-			
-		return new_nodes, new_edges
+	def update_layout(self, nodes: List[VisualNode], edges: List[VisualEdge],
+					  fixed_nodes: Dict[str, Point]) -> bool:
+		"""Update existing layout with fixed nodes."""
+		return self.engine.update_layout(nodes, edges, fixed_nodes)
 
 def create_bundled_edge(edges: List[VisualEdge]) -> VisualEdge:
 	"""Create a bundled edge from multiple edges."""
@@ -381,6 +400,8 @@ def create_layout_engine(layout_type: str = "force", params: ForceParams = None)
     """Create layout engine based on type."""
     engines = {
         "force": lambda: ForceLayout(params),
+        "array": lambda: ArrayForceLayout(params),
+        "multilevel": lambda: MultiLevelLayout(params=params),
         "radial": RadialLayout
     }
     
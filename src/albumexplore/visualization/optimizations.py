@@ -1,9 +1,10 @@
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Hashable, List, Tuple, Optional
 import copy
 from dataclasses import dataclass
 from enum import IntEnum
 from .models import VisualNode, VisualEdge
 from .state import ViewState, ViewType
+from .spatial_index import Rect, SpatialIndex, edge_bounds, node_position
 import math
 from collections import defaultdict
 
@@ -39,6 +40,44 @@ class ViewOptimizer:
 		self._detail_level_cache = {}
 		self._edge_bundle_cache = {}
 		self._visibility_cache = {}
+		# Can be handed to InteractionHandler and ClusterEngine; rebuilt when a different node list is optimized
+		self.spatial_index = SpatialIndex()
+		self._indexed_nodes: Optional[List[VisualNode]] = None
+		self._positions_version: Optional[Hashable] = None
+		self._edge_index = SpatialIndex()
+		self._indexed_edges: Optional[List[VisualEdge]] = None
+		self._edge_index_key = None
+
+	def index_nodes(self, nodes: List[VisualNode],
+					positions_version: Optional[Hashable] = None) -> SpatialIndex:
+		"""Index the nodes' positions, keeping the index across calls.
+
+		A different list is indexed from scratch. For the same list the
+		layouts may have moved nodes in place, so positions are re-read and
+		only the nodes that moved touch the grid. A caller that knows when
+		its layout last moved nodes can pass that as ``positions_version``;
+		the re-read is skipped while it is unchanged.
+		"""
+		if nodes is not self._indexed_nodes:
+			self.spatial_index.build_nodes(nodes)
+			self._indexed_nodes = nodes
+		elif positions_version is None or positions_version != self._positions_version:
+			self.update_positions(nodes)
+		self._positions_version = positions_version
+		return self.spatial_index
+
+	def update_positions(self, nodes: List[VisualNode]) -> None:
+		"""Report nodes that moved since they were indexed."""
+		self.spatial_index.update_nodes(nodes)
+
+	def _edge_bounds(self, edge: VisualEdge) -> Rect:
+		"""Bounds of the edge's endpoints as indexed, else of the coordinates in its data."""
+		source = self.spatial_index.bounds(edge.source)
+		target = self.spatial_index.bounds(edge.target)
+		if source is None or target is None:
+			return edge_bounds(edge)
+		return (min(source[0], target[0]), min(source[1], target[1]),
+				max(source[2], target[2]), max(source[3], target[3]))
 
 	def get_detail_level(self, zoom: float, node_count: int, viewport: Viewport) -> DetailLevel:
 		"""Determine detail level with caching."""
@@ -69,44 +108,54 @@ class ViewOptimizer:
 
 
 
-	def optimize_nodes(self, nodes: List[VisualNode], viewport: Viewport) -> List[VisualNode]:
+	def optimize_nodes(self, nodes: List[VisualNode], viewport: Viewport,
+					   positions_version: Optional[Hashable] = None) -> List[VisualNode]:
 		"""Optimize nodes based on viewport and detail level"""
 		detail_level = self.get_detail_level(viewport.zoom, len(nodes), viewport)
-		visible_nodes = []
-
-		for node in nodes:
-			if self._is_in_viewport(node, viewport):
-				optimized_node = self._optimize_node(node, detail_level)
-				visible_nodes.append(optimized_node)
-
-		return visible_nodes
+		margin = 50 * viewport.zoom
+		visible = self.index_nodes(nodes, positions_version).query(
+			viewport.x - margin, viewport.y - margin,
+			viewport.x + viewport.width + margin, viewport.y + viewport.height + margin)
+		return [self._optimize_node(node, detail_level) for node in visible]
 
 	def optimize_edges(self, edges: List[VisualEdge], viewport: Viewport, 
 					  view_type: ViewType) -> List[VisualEdge]:
-		"""Optimize edges for rendering."""
+		"""Optimize edges for rendering.
+
+		Edges are placed by their endpoints' positions in the node index, so
+		call this after optimize_nodes for the frame.
+		"""
 		if not edges:
 			return []
 
 		detail_level = self.get_detail_level(viewport.zoom, len(edges), viewport)
 		optimized = []
 
-		# Bundle edges based on view type
-		bundled_edges = self.bundle_edges(edges, view_type, detail_level)
+		# Bundle edges based on view type; the bundles of the same edge list are
+		# indexed again only when their endpoints move
+		index_key = (view_type, detail_level, self.spatial_index.version)
+		if edges is not self._indexed_edges or index_key != self._edge_index_key:
+			self._edge_index.clear()
+			for i, edge in enumerate(self.bundle_edges(edges, view_type, detail_level)):
+				self._edge_index.insert(i, edge, self._edge_bounds(edge))
+			self._indexed_edges, self._edge_index_key = edges, index_key
 
-		for edge in bundled_edges:
-			if self._is_edge_in_viewport(edge, viewport):
-				# Use initial thickness if available, otherwise use base thickness
-				base_thickness = edge.data.get('initial_thickness', 2.0) if edge.data else 2.0
-				
-				# Create optimized edge with fixed thickness
-				optimized_edge = copy.deepcopy(edge)
-				optimized_edge.thickness = base_thickness
-				optimized_edge.data.update({
-					'optimized_thickness': base_thickness,
-					'optimized_weight': edge.weight,
-					'original_thickness': edge.thickness
-				})
-				optimized.append(optimized_edge)
+		margin = 100 * viewport.zoom  # Add margin to prevent pop-in
+		for edge in self._edge_index.query(viewport.x - margin, viewport.y - margin,
+										   viewport.x + viewport.width + margin,
+										   viewport.y + viewport.height + margin):
+			# Use initial thickness if available, otherwise use base thickness
+			base_thickness = edge.data.get('initial_thickness', 2.0) if edge.data else 2.0
+			
+			# Create optimized edge with fixed thickness
+			optimized_edge = copy.deepcopy(edge)
+			optimized_edge.thickness = base_thickness
+			optimized_edge.data.update({
+				'optimized_thickness': base_thickness,
+				'optimized_weight': edge.weight,
+				'original_thickness': edge.thickness
+			})
+			optimized.append(optimized_edge)
 
 		return self._filter_edge_crossings(optimized, detail_level)
 
@@ -116,7 +165,7 @@ class ViewOptimizer:
 		if not edges:
 			return []
 			
-		cache_key = (tuple(e.id for e in edges), view_type, detail_level)
+		cache_key = (tuple((e.source, e.target, e.weight) for e in edges), view_type, detail_level)
 		if cache_key in self._edge_bundle_cache:
 			return self._edge_bundle_cache[cache_key]
 			
@@ -133,7 +182,6 @@ class ViewOptimizer:
 				total_weight = sum(e.weight for e in edges_group)
 				base_edge = edges_group[0]
 				bundled_edge = VisualEdge(
-					id=f"bundle_{base_edge.source}_{base_edge.target}",
 					source=base_edge.source,
 					target=base_edge.target,
 					weight=total_weight,
@@ -151,8 +199,7 @@ class ViewOptimizer:
 
 	def is_node_visible(self, node: VisualNode, view_bounds: Dict) -> bool:
 		"""Check if node is within view bounds."""
-		x = float(node.data.get("x", 0))
-		y = float(node.data.get("y", 0))
+		x, y = node_position(node)
 		margin = 50 * view_bounds['zoom']  # Margin to prevent pop-in
 		
 		return not (x < view_bounds['x'] - margin or 
@@ -246,8 +293,7 @@ class ViewOptimizer:
 		if cache_key in self._visibility_cache:
 			return self._visibility_cache[cache_key]
 			
-		x = float(node.data.get("x", 0))
-		y = float(node.data.get("y", 0))
+		x, y = node_position(node)
 		margin = 50 * viewport.zoom
 		
 		result = not (x < viewport.x - margin or 
@@ -1,6 +1,7 @@
 """Renderer implementations."""
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
+from .album_store import AlbumView
 from .models import VisualNode, VisualEdge, Viewport
 from .state import ViewType
 from .chord_renderer import ChordRenderer
@@ -16,11 +17,19 @@ class TableRenderer(RendererBase):
         self.config = config
         logger.debug("Initialized table renderer")
     
-    def render(self, nodes: List[VisualNode], edges: List[VisualEdge],
+    def render(self, nodes: Union[AlbumView, List[VisualNode]], edges: List[VisualEdge],
                viewport: Viewport) -> Dict[str, Any]:
         """Render table visualization data."""
         logger.debug("Rendering table view with %d nodes", len(nodes))
         
+        if isinstance(nodes, AlbumView):
+            # Rows are read from the album store when the view asks for them
+            return {
+                'type': 'table',
+                'rows': nodes,
+                'selected_ids': getattr(viewport, 'selected_ids', set())
+            }
+        
         # DEBUG: Print year values from nodes to help troubleshoot
         logger.debug("YEAR VALUES IN NODES:")
         for i, node in enumerate(nodes[:10]):  # Show first 10 nodes only
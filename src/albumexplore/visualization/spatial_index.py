@@ -0,0 +1,222 @@
+"""Spatial index for viewport culling, hit testing and clustering.
+
+Items (nodes as points, edges as bounding boxes) are bucketed into a
+uniform grid of square cells. A query only visits the cells overlapping
+the query rectangle, so its cost follows the number of items near the
+rectangle rather than the total. Items move incrementally: ``move`` and
+``update_node`` only touch the grid when an item changes cells.
+
+Items spanning more than MAX_SPAN_CELLS cells per side (long edges) are
+kept in a separate list that every query checks, so a few long edges
+cannot fill the whole grid.
+"""
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .models import VisualNode, VisualEdge
+
+Rect = Tuple[float, float, float, float]
+
+# Items wider or taller than this many cells are not bucketed
+MAX_SPAN_CELLS = 16
+
+
+def node_position(node: VisualNode) -> Tuple[float, float]:
+    """Position written by the layouts (``node.pos``), else the legacy ``data['x']``/``data['y']``."""
+    pos = node.pos or {}
+    x, y = pos.get('x', 0.0), pos.get('y', 0.0)
+    if x == 0.0 and y == 0.0 and isinstance(node.data, dict) and 'x' in node.data:
+        return float(node.data.get('x', 0)), float(node.data.get('y', 0))
+    return float(x), float(y)
+
+
+def edge_bounds(edge: VisualEdge) -> Rect:
+    """Bounding box of an edge from the endpoint coordinates stored in its data."""
+    data = edge.data or {}
+    x1, x2 = float(data.get('source_x', 0)), float(data.get('target_x', 0))
+    y1, y2 = float(data.get('source_y', 0)), float(data.get('target_y', 0))
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+class SpatialIndex:
+    """Uniform grid over items with axis-aligned bounds."""
+
+    def __init__(self, cell_size: float = 100.0):
+        self.cell_size = float(cell_size)
+        self.cells: Dict[Tuple[int, int], Dict[Hashable, Any]] = {}
+        self.oversized: Dict[Hashable, Any] = {}
+        # key -> (item, bounds, cell range or None, insertion order)
+        self._entries: Dict[Hashable, Tuple[Any, Rect, Optional[Tuple[int, int, int, int]], int]] = {}
+        self._counter = 0
+        # Largest node size seen, bounds the search radius of hit tests
+        self.max_size = 0.0
+        # Bumped whenever an item is added, removed or moved
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def bounds(self, key: Hashable) -> Optional[Rect]:
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def _cell_range(self, bounds: Rect) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (int(bounds[0] // size), int(bounds[1] // size),
+                int(bounds[2] // size), int(bounds[3] // size))
+
+    def _add(self, key: Hashable, item: Any, bounds: Rect, order: int) -> None:
+        col0, row0, col1, row1 = span = self._cell_range(bounds)
+        if col1 - col0 >= MAX_SPAN_CELLS or row1 - row0 >= MAX_SPAN_CELLS:
+            self.oversized[key] = item
+            span = None
+        else:
+            for col in range(col0, col1 + 1):
+                for row in range(row0, row1 + 1):
+                    self.cells.setdefault((col, row), {})[key] = item
+        self._entries[key] = (item, bounds, span, order)
+        self.version += 1
+
+    def _discard(self, key: Hashable) -> None:
+        _, _, span, _ = self._entries.pop(key)
+        self.version += 1
+        if span is None:
+            self.oversized.pop(key, None)
+            return
+        col0, row0, col1, row1 = span
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                cell = self.cells.get((col, row))
+                if cell is not None:
+                    cell.pop(key, None)
+                    if not cell:
+                        del self.cells[(col, row)]
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.oversized.clear()
+        self._entries.clear()
+        self._counter = 0
+        self.max_size = 0.0
+        self.version += 1
+
+    def insert(self, key: Hashable, item: Any, bounds: Rect) -> None:
+        """Add an item, replacing any item stored under the same key."""
+        order = self._counter
+        if key in self._entries:
+            order = self._entries[key][3]
+            self._discard(key)
+        else:
+            self._counter += 1
+        self._add(key, item, bounds, order)
+
+    def move(self, key: Hashable, bounds: Rect) -> None:
+        """Update an item's bounds; the grid is only touched if its cells change."""
+        item, old_bounds, span, order = self._entries[key]
+        if bounds == old_bounds:
+            return
+        new_span = self._cell_range(bounds)
+        if span is not None and new_span == span:
+            self._entries[key] = (item, bounds, span, order)
+            self.version += 1
+            return
+        self._discard(key)
+        self._add(key, item, bounds, order)
+
+    def remove(self, key: Hashable) -> None:
+        if key in self._entries:
+            self._discard(key)
+
+    def insert_node(self, node: VisualNode) -> None:
+        x, y = node_position(node)
+        self.max_size = max(self.max_size, float(node.size))
+        self.insert(node.id, node, (x, y, x, y))
+
+    def update_node(self, node: VisualNode) -> None:
+        """Re-read a node's position after it moved (inserts unknown or replaced nodes)."""
+        entry = self._entries.get(node.id)
+        if entry is None or entry[0] is not node:
+            self.insert_node(node)
+            return
+        x, y = node_position(node)
+        self.max_size = max(self.max_size, float(node.size))
+        self.move(node.id, (x, y, x, y))
+
+    def update_nodes(self, nodes: Iterable[VisualNode]) -> None:
+        """``update_node`` for many nodes; nodes that did not move cost one comparison."""
+        entries = self._entries
+        max_size = self.max_size
+        for node in nodes:
+            entry = entries.get(node.id)
+            pos = node.pos
+            # Nodes at the origin may carry legacy data coordinates, see node_position
+            if entry is not None and pos and entry[0] is node and node.size <= max_size:
+                x, y = pos.get('x', 0.0), pos.get('y', 0.0)
+                bounds = entry[1]
+                if x == bounds[0] and y == bounds[1] and (x != 0.0 or y != 0.0):
+                    continue
+            self.update_node(node)
+
+    def build_nodes(self, nodes: Iterable[VisualNode]) -> None:
+        self.clear()
+        for node in nodes:
+            self.insert_node(node)
+
+    def build_edges(self, edges: Iterable[VisualEdge]) -> None:
+        self.clear()
+        for i, edge in enumerate(edges):
+            self.insert(i, edge, edge_bounds(edge))
+
+    def _query_keys(self, x0: float, y0: float, x1: float, y1: float) -> List[Hashable]:
+        col0, row0, col1, row1 = self._cell_range((x0, y0, x1, y1))
+        candidates: Dict[Hashable, Any] = dict(self.oversized)
+        if (col1 - col0 + 1) * (row1 - row0 + 1) > len(self.cells):
+            # Wider than the occupied grid: walk the occupied cells instead
+            for (col, row), cell in self.cells.items():
+                if col0 <= col <= col1 and row0 <= row <= row1:
+                    candidates.update(cell)
+        else:
+            for col in range(col0, col1 + 1):
+                for row in range(row0, row1 + 1):
+                    cell = self.cells.get((col, row))
+                    if cell:
+                        candidates.update(cell)
+
+        entries = self._entries
+        hits = []
+        for key in candidates:
+            _, (bx0, by0, bx1, by1), _, order = entries[key]
+            if bx0 <= x1 and bx1 >= x0 and by0 <= y1 and by1 >= y0:
+                hits.append((order, key))
+        hits.sort(key=lambda hit: hit[0])
+        return [key for _, key in hits]
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> List[Any]:
+        """Items whose bounds intersect the rectangle (inclusive), in insertion order."""
+        entries = self._entries
+        return [entries[key][0] for key in self._query_keys(x0, y0, x1, y1)]
+
+    def within(self, x: float, y: float, radius: float) -> List[Tuple[float, Any]]:
+        """(squared distance, item) for items whose bounds' corner lies within ``radius``, nearest first.
+
+        Meant for point items such as nodes.
+        """
+        found = []
+        r_sq = radius * radius
+        for key in self._query_keys(x - radius, y - radius, x + radius, y + radius):
+            item, (bx, by, _, _), _, _ = self._entries[key]
+            d_sq = (bx - x) ** 2 + (by - y) ** 2
+            if d_sq <= r_sq:
+                found.append((d_sq, item))
+        found.sort(key=lambda pair: pair[0])
+        return found
+
+    def hit_test(self, x: float, y: float, scale: float = 1.0) -> Optional[VisualNode]:
+        """Nearest node whose circle (``node.size * scale``) contains (x, y)."""
+        for d_sq, node in self.within(x, y, self.max_size * scale):
+            radius = node.size * scale
+            if d_sq <= radius * radius:
+                return node
+        return None
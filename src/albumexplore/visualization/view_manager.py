@@ -1,6 +1,7 @@
 """View management for visualization system."""
-from typing import Dict, Any, List, Set, Optional
+from typing import Dict, Any, List, Set, Optional, Tuple, Union
 from PyQt6.QtCore import QObject, pyqtSignal # Ensure QObject and pyqtSignal are imported
+from .album_store import AlbumView
 from .models import VisualNode, VisualEdge, Viewport
 from .state import ViewType, ViewState, StateManager
 from .data_interface import DataInterface
@@ -50,10 +51,11 @@ class ViewManager(QObject): # Inherit from QObject
         old_type = self.state_manager.current_view.view_type
         graphics_logger.debug(f"Switching view from {old_type.value} to {view_type.value}")
 
-        nodes, edges = self.data_interface.get_visible_data()
+        nodes, edges = self._get_view_data(view_type)
 
+        # Album rows have no positions to carry over
         transition_data = self.integration_manager.prepare_transition(
-            nodes, edges,
+            [] if isinstance(nodes, AlbumView) else nodes, edges,
             self.state_manager.current_view,
             view_type
         )
@@ -92,29 +94,36 @@ class ViewManager(QObject): # Inherit from QObject
         )
         
         # Re-render with updated selection
-        nodes, edges = self.data_interface.get_visible_data()
+        nodes, edges = self._get_view_data()
         return self._render_view(nodes, edges)
     
     def update_data(self) -> Dict[str, Any]:
         """Update data and re-render."""
         graphics_logger.debug("Updating data")
-        nodes, edges = self.data_interface.get_visible_data()
+        nodes, edges = self._get_view_data()
         return self._render_view(nodes, edges)
     
     def update_dimensions(self, width: float, height: float) -> Dict[str, Any]:
         """Update viewport dimensions."""
         graphics_logger.debug(f"Updating dimensions: {width}x{height}")
         self.state_manager.update_viewport(width, height)
-        nodes, edges = self.data_interface.get_visible_data()
+        nodes, edges = self._get_view_data()
         return self._render_view(nodes, edges)
     
-    def _render_view(self, nodes: List[VisualNode], edges: List[VisualEdge]) -> Dict[str, Any]:
+    def _get_view_data(self, view_type: Optional[ViewType] = None) -> Tuple[Union[AlbumView, List[VisualNode]], List[VisualEdge]]:
+        """Nodes and edges for a view type: tags and co-occurrences for chord/arc, an album view otherwise."""
+        view_type = view_type or self.state_manager.current_view.view_type
+        if view_type in (ViewType.CHORD, ViewType.ARC):
+            return self.data_interface.get_tag_co_occurrence_graph()
+        return self.data_interface.get_album_view(), []
+
+    def _render_view(self, nodes: Union[AlbumView, List[VisualNode]], edges: List[VisualEdge]) -> Dict[str, Any]:
         """Render current view and cache it."""
         view_type = self.state_manager.current_view.view_type
         
         graphics_logger.info(f"[ViewManager._render_view] Rendering for view type: {view_type.value}")
         graphics_logger.debug(f"[ViewManager._render_view] Input: {len(nodes)} VisualNode objects, {len(edges)} VisualEdge objects.")
-        if nodes:
+        if nodes and isinstance(nodes, list):
             # Corrected to access x and y from node.pos dictionary
             graphics_logger.debug(f"[ViewManager._render_view] First input VisualNode: id={nodes[0].id}, x={nodes[0].pos['x']}, y={nodes[0].pos['y']}, label={nodes[0].label}")
 
@@ -138,20 +147,9 @@ class ViewManager(QObject): # Inherit from QObject
         # Adapt TableRenderer output for TagExplorerView if necessary
         if view_type == ViewType.TAG_EXPLORER and result and 'rows' in result and 'nodes' not in result:
             graphics_logger.info(f"[ViewManager._render_view] Adapting 'rows' to 'nodes' for TagExplorerView.")
-            # The 'rows' from TableRenderer are dictionaries.
-            # TagExplorerView.update_data was refactored to handle nodes that are dicts
-            # and access tags via node.get('tags', []) if node.data is not present.
-            
-            # Create a 'nodes' key and populate it with the data from 'rows'.
-            # Each item in 'rows' is a dictionary representing an album's properties.
-            adapted_nodes = []
-            for row_data in result['rows']:
-                adapted_nodes.append(row_data)
-            result['nodes'] = adapted_nodes
-            
-            # Optionally, remove the 'rows' key if it's no longer needed,
-            # though simply ensuring 'nodes' is present is the primary goal.
-            # del result['rows'] 
+            # The 'rows' from TableRenderer are dictionaries (or an AlbumView yielding them);
+            # TagExplorerView.update_data handles nodes that are dicts.
+            result['nodes'] = result['rows']
             graphics_logger.info(f"[ViewManager._render_view] Adapted {len(result['nodes'])} items from 'rows' to 'nodes'.")
 
         if result and 'nodes' in result and result['nodes']:
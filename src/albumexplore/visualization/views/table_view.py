@@ -1,9 +1,10 @@
 """Table visualization view module."""
 from typing import List, Dict, Any, Set
-from PyQt6.QtWidgets import (QTableWidget, QTableWidgetItem, QHeaderView, 
+from PyQt6.QtWidgets import (QTableView, QHeaderView, QAbstractItemView,
                             QVBoxLayout, QSizePolicy, QScrollBar)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QItemSelection, QItemSelectionModel
 from albumexplore.gui.gui_logging import gui_logger
+from albumexplore.gui.models import AlbumTableModel
 
 from .base_view import BaseView
 from ..state import ViewType, ViewState
@@ -28,31 +29,32 @@ class TableView(BaseView):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
-        # Create table widget with minimum size
-        self.table = QTableWidget(self)
+        # Create table view with minimum size; the model formats visible rows only
+        self.table = QTableView(self)
         self.table.setMinimumSize(800, 600)  # Set minimum size to ensure proper initial display
         layout.addWidget(self.table, stretch=1)
         
         # Configure table properties
-        self.table.setColumnCount(5)  # Reduced from 6 to 5 (removed Genre column)
-        self.table.setHorizontalHeaderLabels(["Artist", "Album", "Year", "Country", "Tags"])
+        self.model = AlbumTableModel([("Artist", "artist"), ("Album", "album"), ("Year", "year"),
+                                      ("Country", "country"), ("Tags", "tags")], parent=self)
+        self.table.setModel(self.model)
         self.table.setShowGrid(True)
         # Disable alternating row colors to fix visibility issue
         self.table.setAlternatingRowColors(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.MultiSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         
         # Set a stylesheet to ensure all rows have consistent, visible backgrounds
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 alternate-background-color: #f0f0f0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 background-color: white;
                 color: black;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d7;
                 color: white;
             }
@@ -83,7 +85,7 @@ class TableView(BaseView):
         self.selected_ids = set()
         
         # Connect signals
-        self.table.itemSelectionChanged.connect(self._handle_selection)
+        self.table.selectionModel().selectionChanged.connect(self._handle_selection)
         header.sectionClicked.connect(self._handle_sort)
         
         gui_logger.debug("TableView initialized")
@@ -95,28 +97,7 @@ class TableView(BaseView):
             if 'rows' not in data_or_nodes:
                 return
                 
-            rows = data_or_nodes['rows']
-            self.table.setRowCount(len(rows))
-            
-            for row_idx, row in enumerate(rows):
-                # Artist
-                item = QTableWidgetItem(row.get('artist', ''))
-                item.setData(Qt.ItemDataRole.UserRole, row.get('id'))
-                self.table.setItem(row_idx, 0, item)
-                
-                # Album - use 'album' key or 'title' as fallback
-                self.table.setItem(row_idx, 1, QTableWidgetItem(row.get('album', row.get('title', ''))))
-                
-                # Year - ensure it's displayed as a string
-                year_str = str(row.get('year', ''))
-                self.table.setItem(row_idx, 2, QTableWidgetItem(year_str))
-                
-                # Country
-                self.table.setItem(row_idx, 3, QTableWidgetItem(row.get('country', '')))
-                
-                # Tags
-                tags = row.get('tags', [])
-                self.table.setItem(row_idx, 4, QTableWidgetItem(', '.join(str(t) for t in tags)))
+            self.model.set_rows(data_or_nodes['rows'])
             
             # Update selection
             if 'selected_ids' in data_or_nodes:
@@ -124,42 +105,11 @@ class TableView(BaseView):
                 self._update_selection()
         else:
             # Handle direct nodes/edges update
-            self.table.blockSignals(True)
-            
-            try:
-                self.table.clearContents()
-                valid_nodes = [n for n in data_or_nodes if n.data.get("type") == "row"]
-                self.table.setRowCount(len(valid_nodes))
-                
-                for row, node in enumerate(valid_nodes):
-                    # Artist
-                    artist_item = QTableWidgetItem(str(node.data.get("artist", "")))
-                    artist_item.setData(Qt.ItemDataRole.UserRole, node.id)
-                    self.table.setItem(row, 0, artist_item)
-                    
-                    # Album - use 'title' key for album data
-                    album_title = str(node.data.get("title", ""))
-                    self.table.setItem(row, 1, QTableWidgetItem(album_title))
-                    
-                    # Year - ensure it's displayed as a string
-                    year_str = str(node.data.get("year", ""))
-                    self.table.setItem(row, 2, QTableWidgetItem(year_str))
-                    
-                    # Country
-                    self.table.setItem(row, 3, QTableWidgetItem(str(node.data.get("country", ""))))
-                    
-                    # Tags
-                    tags = node.data.get("tags", [])
-                    self.table.setItem(row, 4, QTableWidgetItem(', '.join(str(t) for t in tags)))
-            finally:
-                # Re-enable signals
-                self.table.setUpdatesEnabled(True)
-                self.table.blockSignals(False)
-                # Force a complete repaint
-                self.table.viewport().update()
-                self.table.updateGeometry()
+            rows = [dict(n.data, id=n.id) for n in data_or_nodes if n.data.get("type") == "row"]
+            self.model.set_rows(rows)
+            self._update_selection()
                 
-        gui_logger.debug(f"Updated table view with {self.table.rowCount()} rows")
+        gui_logger.debug(f"Updated table view with {self.model.rowCount()} rows")
 
     def resizeEvent(self, event):
         """Handle resize events."""
@@ -187,13 +137,13 @@ class TableView(BaseView):
 
     def _update_selection(self):
         """Update table selection state."""
-        self.table.clearSelection()
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.ItemDataRole.UserRole) in self.selected_ids:
-                self.table.selectRow(row)
+        selection = QItemSelection()
+        last_column = self.model.columnCount() - 1
+        for row in self.model.rows_for_ids(self.selected_ids):
+            selection.select(self.model.index(row, 0), self.model.index(row, last_column))
+        self.table.selectionModel().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
 
-    def _handle_selection(self):
+    def _handle_selection(self, selected=None, deselected=None):
         """Handle table selection changes."""
         # Use instance variable for recursion protection
         if self._is_processing_selection:
@@ -203,8 +153,8 @@ class TableView(BaseView):
             self._is_processing_selection = True
             
             selected_ids = set()
-            for item in self.table.selectedItems():
-                node_id = item.data(Qt.ItemDataRole.UserRole)
+            for index in self.table.selectionModel().selectedRows():
+                node_id = self.model.album_id(index.row())
                 if node_id:
                     selected_ids.add(node_id)
             
@@ -223,7 +173,7 @@ class TableView(BaseView):
             self.sort_column = column_index
             self.sort_direction = "asc"
         
-        self.table.sortItems(
+        self.model.sort(
             column_index,
             Qt.SortOrder.AscendingOrder if self.sort_direction == "asc" else Qt.SortOrder.DescendingOrder
         )
\ No newline at end of file
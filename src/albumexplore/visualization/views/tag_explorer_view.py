@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import (QTableWidget, QTableWidgetItem, QHeaderView, 
+from PyQt6.QtWidgets import (QTableWidget, QTableWidgetItem, QTableView, QHeaderView, 
                            QVBoxLayout, QHBoxLayout, QSizePolicy, QScrollBar,
                            QWidget, QPushButton, QLabel, QMenu, QSplitter,
                            QComboBox, QRadioButton, QButtonGroup, QToolButton, 
@@ -12,6 +12,8 @@ from collections import Counter, defaultdict
 import pandas as pd # Added pandas import
 import re # Added re import
 import logging # Added logging import
+import time
+import numpy as np
 
 from .base_view import BaseView
 from ..state import ViewType, ViewState
@@ -23,8 +25,9 @@ from .tag_cloud_widget import TagCloudWidget
 from .single_instance_dialog import SingleInstanceDialog # Added import
 from ...gui.widgets.atomic_tag_widget import AtomicTagWidget # Added atomic tag widget
 from ...gui.widgets.tag_filter_panel import TagFilterPanel # Added filter panel
-from ...tags.filters import TagFilterState # Added filter state
+from ...tags.filters import TagFilterState, TagPostingIndex, IncrementalTagFilter, FilterDelta # Added filter state
 from albumexplore.gui.gui_logging import graphics_logger # Added import
+from albumexplore.gui.models import AlbumTableModel
 
 # Ensure we're properly importing tag cloud widget
 try:
@@ -152,7 +155,7 @@ class TagExplorerView(BaseView):
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
         self.setUpdatesEnabled(False)
         self.view_state = ViewState(ViewType.TAG_EXPLORER)
-        self.tag_normalizer = TagNormalizer()
+        self.tag_normalizer = TagNormalizer(persistent_cache=True)
         # Enable atomic mode by default for better tag consolidation
         self.tag_normalizer.set_atomic_mode(True)
         
@@ -168,6 +171,14 @@ class TagExplorerView(BaseView):
         self.raw_tag_to_album_nodes = defaultdict(list)
         # Inverted index: processed tag -> list of album node dicts (used for fast previews and lookups)
         self.tag_to_album_nodes = defaultdict(list)
+        # Posting index over album_nodes_original, built lazily from tag_to_album_nodes
+        self._filter_index = None
+        # Evaluator holding the last filter result on _filter_index, for delta updates
+        self._filter_evaluator = None
+        self._filtered_positions = np.empty(0, dtype=np.intp)
+        # Table items of the current rows, so deltas can update them in place
+        self._tag_row_items = {}           # tag -> (tag item, matching item, filter item)
+        self._shown_tag_filters = {}       # tag_filters as last rendered in the tag table
         self.single_instance_tags = set()  # Tags that appear only once
         self.tag_mode = self.MODE_TABLE    # Current tag visualization mode
         
@@ -512,17 +523,10 @@ class TagExplorerView(BaseView):
         self.album_count_label.setMaximumHeight(25)  # Keep album header compact
         album_panel_layout.addWidget(self.album_count_label)
 
-        self.album_table = QTableWidget() # Definition of self.album_table
-        self.album_table.setColumnCount(7)
-        self.album_table.setHorizontalHeaderLabels([
-            "Artist",
-            "Album",
-            "Year",
-            "Genre",
-            "Country",
-            "Vocal Style",
-            "Tags"
-        ])
+        # Virtualized album table: the model formats only the rows on screen
+        self.album_table = QTableView() # Definition of self.album_table
+        self.album_model = AlbumTableModel(parent=self)
+        self.album_table.setModel(self.album_model)
         self.album_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.album_table.setMinimumHeight(200)  # Ensure minimum usable height for album table
         album_header = self.album_table.horizontalHeader()
@@ -548,9 +552,10 @@ class TagExplorerView(BaseView):
         self.album_table.setSortingEnabled(True)
         self.album_table.setAlternatingRowColors(True)
         self.album_table.setShowGrid(True)
-        self.album_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.album_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.album_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.album_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         # Tidy album rows and hide vertical header
+        self.album_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.album_table.verticalHeader().setDefaultSectionSize(26)
         self.album_table.verticalHeader().setVisible(False)
         
@@ -694,6 +699,7 @@ class TagExplorerView(BaseView):
         self.raw_tag_to_album_nodes.clear()
         # Reset processed mapping; it will be rebuilt during finalization
         self.tag_to_album_nodes = defaultdict(list)
+        self._invalidate_filter_index()
         tag_splitter = re.compile(r'[;,]')
 
         for node in self.album_nodes_original:
@@ -761,6 +767,7 @@ class TagExplorerView(BaseView):
 
         # Replace processed tag-to-node mapping with the freshly built version
         self.tag_to_album_nodes = processed_mapping
+        self._invalidate_filter_index()
 
         # Update single instance tags after reprocessing
         if self.tag_analyzer:
@@ -856,122 +863,112 @@ class TagExplorerView(BaseView):
         has_panel_filters = filter_panel_state and not filter_panel_state.is_empty()
         has_filters = has_legacy_filters or has_panel_filters
 
-        self.filtered_albums.clear()
-        self.matching_counts.clear()
+        start_time = time.perf_counter()
+        index = self._get_filter_index()
+        evaluator = self._filter_evaluator
+        reset = evaluator is None or evaluator.index is not index
+        if reset:
+            evaluator = self._filter_evaluator = IncrementalTagFilter(index)
 
-        is_normalization_active = self.tag_normalizer.is_active()
-        
-        # Pre-compile regex for better performance if needed
-        tag_splitter = re.compile(r'[;,]')
-        
-        # Batch process albums for better performance
-        total_albums = len(self.album_nodes_original)
-        batch_size = 1000
-        processed_albums = 0
-        
-        for batch_start in range(0, total_albums, batch_size):
-            batch_end = min(batch_start + batch_size, total_albums)
-            batch_filtered_albums = []
-            batch_matching_counts = Counter()
-            
-            for i in range(batch_start, batch_end):
-                node = self.album_nodes_original[i]
-                
-                # Get raw tags from the node data - optimized
-                raw_tags_str = node.get('raw_tags') or node.get('genre', '')
-                if not raw_tags_str:
-                    # No tags means no match if include filters exist
-                    if not include_filters:
-                        batch_filtered_albums.append(node)
-                    continue
-                
-                # Split tags efficiently
-                node_raw_tags = [tag.strip() for tag in tag_splitter.split(raw_tags_str) if tag.strip()]
-                if not node_raw_tags:
-                    if not include_filters:
-                        batch_filtered_albums.append(node)
-                    continue
-                
-                # Determine the set of processed tags for the current node, based on normalization state
-                if is_normalization_active:
-                    # Use cached normalization mapping where possible
-                    current_node_processed_tags = []
-                    for tag in node_raw_tags:
-                        normalized_tag = self._get_normalized_tag_for_processing(tag)
-                        if normalized_tag == tag and tag not in self.normalized_mapping:
-                            # Fallback to enhanced normalization if not in cache
-                            fallback_normalized = self.tag_normalizer.normalize_enhanced(tag)
-                            if fallback_normalized:
-                                self.normalized_mapping[tag] = fallback_normalized
-                                normalized_tag = fallback_normalized
-                        if normalized_tag:
-                            current_node_processed_tags.append(normalized_tag)
-                else:
-                    # In non-normalized mode, use cached mapping or create it
-                    current_node_processed_tags = []
-                    for tag in node_raw_tags:
-                        processed_tag = self._get_normalized_tag_for_processing(tag)
-                        current_node_processed_tags.append(processed_tag)
-
-                # Early exit if no filters are active
-                if not has_filters:
-                    batch_filtered_albums.append(node)
-                    for tag in current_node_processed_tags:
-                        batch_matching_counts[tag] += 1
-                    continue
-
-                # Convert to set for faster membership testing
-                node_tags_set = set(current_node_processed_tags)
-
-                # Check exclusions first (from both sources)
-                if all_exclusions and all_exclusions.intersection(node_tags_set):
-                    continue
-
-                # Check legacy include filters (from tag table)
-                legacy_match = True
-                if include_filters:
-                    legacy_match = bool(include_filters.intersection(node_tags_set))
-                
-                # Check filter panel groups (if active)
-                panel_match = True
-                if filter_panel_state and not filter_panel_state.is_empty():
-                    # Pass the tag set to the filter state matches method
-                    panel_match = filter_panel_state.matches(node_tags_set)
-                
-                # Album must match BOTH legacy filters AND panel filters (if active)
-                if not legacy_match or not panel_match:
-                    continue
+        if has_filters:
+            delta = evaluator.update(include_filters, all_exclusions,
+                                     filter_panel_state if has_panel_filters else None)
+        else:
+            delta = evaluator.update()
 
-                # If we reach here, the node matches all active filters
-                batch_filtered_albums.append(node)
-                for tag in current_node_processed_tags:
-                    batch_matching_counts[tag] += 1
-            
-            # Merge batch results
-            self.filtered_albums.extend(batch_filtered_albums)
-            self.matching_counts.update(batch_matching_counts)
-            
-            processed_albums = batch_end
-            
-            # Log progress for large datasets
-            if total_albums > 5000 and processed_albums % 5000 == 0:
-                graphics_logger.debug(f"TagExplorerView: Filtered {processed_albums}/{total_albums} albums...")
+        self.filtered_albums = evaluator.albums()
+        self._filtered_positions = evaluator.positions
+        if reset:
+            self.matching_counts = evaluator.matching_counts()
+        else:
+            for tag, count in delta.changed_counts.items():
+                if count:
+                    self.matching_counts[tag] = count
+                else:
+                    self.matching_counts.pop(tag, None)
+        graphics_logger.debug(
+            f"TagExplorerView: Filtered {len(self.filtered_albums)}/{index.album_count} albums "
+            f"({len(delta.entered)} entered, {len(delta.left)} left) "
+            f"in {(time.perf_counter() - start_time) * 1000:.1f} ms"
+        )
 
-        # Update views efficiently
-        self._update_tag_views() 
-        self._update_album_table_display()
+        # Update views: full rebuild after data changes, otherwise only what changed
+        if reset:
+            self._update_tag_views()
+            self._update_album_table_display()
+        else:
+            self._update_tag_views(delta)
+            self._update_album_table_display(delta)
         
         # Update status bar with filter summary
         self._update_status_bar()
 
         self.setUpdatesEnabled(True)
-    
-    def _update_tag_views(self):
-        """Update the tag views (table and cloud) with the current tag data. Optimized for performance."""
+
+    def _get_filter_index(self) -> TagPostingIndex:
+        """Return the posting index for the current albums, building it if needed."""
+        if self._filter_index is None:
+            start_time = time.perf_counter()
+            self._filter_index = TagPostingIndex.from_nodes(self.album_nodes_original, self.tag_to_album_nodes)
+            graphics_logger.debug(
+                f"TagExplorerView: Built filter index for {len(self._filter_index.postings)} tags "
+                f"in {(time.perf_counter() - start_time) * 1000:.1f} ms"
+            )
+        return self._filter_index
+
+    def _invalidate_filter_index(self):
+        """Drop the posting index after albums or tag mappings change."""
+        self._filter_index = None
+        self._filter_evaluator = None
+
+    def _style_tag_filter_items(self, tag_item, filter_q_item, filter_state):
+        """Apply the highlight and filter column text for a tag's filter state."""
+        # Highlight if this tag has an active filter
+        font = tag_item.font()
+        font.setBold(filter_state != self.FILTER_NEUTRAL)
+        tag_item.setFont(font)
+        if filter_state == self.FILTER_INCLUDE:
+            tag_item.setBackground(QColor(40, 80, 40))  # Dark green tint
+        elif filter_state == self.FILTER_EXCLUDE:
+            tag_item.setBackground(QColor(80, 40, 40))  # Dark red tint
+        else:
+            tag_item.setData(Qt.ItemDataRole.BackgroundRole, None)
+
+        # Filter column (Column 3) - with color coding
+        filter_text = "Neutral"
+        filter_color = QColor(128, 128, 128)  # Gray
+        
+        if filter_state == self.FILTER_INCLUDE:
+            filter_text = "Include"
+            filter_color = QColor(76, 175, 80)  # Green
+        elif filter_state == self.FILTER_EXCLUDE:
+            filter_text = "Exclude"
+            filter_color = QColor(244, 67, 54)  # Red
+        
+        filter_q_item.setText(filter_text)
+        filter_q_item.setData(Qt.ItemDataRole.UserRole, filter_state)
+        filter_q_item.setToolTip(f"Filter state: {filter_text}")
+        filter_q_item.setForeground(filter_color)
+
+    def _set_matching_item(self, matching_item, matching_count):
+        matching_item.setText(self._format_number(matching_count))
+        matching_item.setData(Qt.ItemDataRole.UserRole, int(matching_count))
+        matching_item.setToolTip(f"Matching albums with current filters: {self._format_number(matching_count)}")
+
+    def _update_tag_views(self, delta: Optional[FilterDelta] = None):
+        """Update the tag views (table and cloud) with the current tag data. Optimized for performance.
+
+        With a delta from an incremental filter update, only the rows whose matching
+        count or filter state changed are touched.
+        """
+        if delta is not None and self._apply_tag_view_delta(delta):
+            return
+
         self.setUpdatesEnabled(False)
         
         # Clear table efficiently
         self.tags_table.setRowCount(0)
+        self._tag_row_items = {}
         
         # Prepare data for batch insertion
         tag_data = []
@@ -988,18 +985,6 @@ class TagExplorerView(BaseView):
             # Tag column (Column 0) - bold and highlight if filtered
             tag_item = SortableTableWidgetItem(tag)
             tag_item.setToolTip(f"Tag: {tag}\nClick to cycle filter state\nCtrl+Click for multi-select")
-            
-            # Highlight if this tag has an active filter
-            if filter_state != self.FILTER_NEUTRAL:
-                font = tag_item.font()
-                font.setBold(True)
-                tag_item.setFont(font)
-                # Light background color for filtered tags
-                if filter_state == self.FILTER_INCLUDE:
-                    tag_item.setBackground(QColor(40, 80, 40))  # Dark green tint
-                elif filter_state == self.FILTER_EXCLUDE:
-                    tag_item.setBackground(QColor(80, 40, 40))  # Dark red tint
-            
             self.tags_table.setItem(row_position, 0, tag_item)
 
             # Count column (Column 1) - with formatting and right alignment
@@ -1011,31 +996,18 @@ class TagExplorerView(BaseView):
             
             # Matching column (Column 2) - with formatting and right alignment
             matching_item = SortableTableWidgetItem(self._format_number(matching_count))
-            matching_item.setData(Qt.ItemDataRole.UserRole, int(matching_count))
-            matching_item.setToolTip(f"Matching albums with current filters: {self._format_number(matching_count)}")
+            self._set_matching_item(matching_item, matching_count)
             matching_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             self.tags_table.setItem(row_position, 2, matching_item)
 
-            # Filter column (Column 3) - with color coding
-            filter_text = "Neutral"
-            filter_color = QColor(128, 128, 128)  # Gray
-            
-            if filter_state == self.FILTER_INCLUDE:
-                filter_text = "Include"
-                filter_color = QColor(76, 175, 80)  # Green
-            elif filter_state == self.FILTER_EXCLUDE:
-                filter_text = "Exclude"
-                filter_color = QColor(244, 67, 54)  # Red
-            
-            filter_q_item = QTableWidgetItem(filter_text)
-            filter_q_item.setData(Qt.ItemDataRole.UserRole, filter_state)
-            filter_q_item.setToolTip(f"Filter state: {filter_text}")
-            filter_q_item.setForeground(filter_color)
+            filter_q_item = QTableWidgetItem()
             filter_q_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
             font = filter_q_item.font()
             font.setBold(True)
             filter_q_item.setFont(font)
+            self._style_tag_filter_items(tag_item, filter_q_item, filter_state)
             self.tags_table.setItem(row_position, 3, filter_q_item)
+            self._tag_row_items[tag] = (tag_item, matching_item, filter_q_item)
 
         # Update tag cloud widget efficiently
         if hasattr(self.tag_cloud_widget, 'update_tags'):
@@ -1044,8 +1016,40 @@ class TagExplorerView(BaseView):
         
         # Sort the table based on the current sort column and order
         self.tags_table.sortItems(self.tags_sort_column, self.tags_sort_order)
+        self._shown_tag_filters = dict(self.tag_filters)
         
         self.setUpdatesEnabled(True)
+
+    def _apply_tag_view_delta(self, delta: FilterDelta) -> bool:
+        """Update changed tag rows in place. Returns False if a full rebuild is needed."""
+        changed_filters = {tag for tag in self._shown_tag_filters.keys() | self.tag_filters.keys()
+                           if self._shown_tag_filters.get(tag) != self.tag_filters.get(tag)}
+        changed_tags = changed_filters | delta.changed_counts.keys()
+        if any(tag in self.tag_counts and tag not in self._tag_row_items for tag in changed_tags):
+            return False
+
+        self.setUpdatesEnabled(False)
+        for tag, count in delta.changed_counts.items():
+            items = self._tag_row_items.get(tag)
+            if items is not None:
+                self._set_matching_item(items[1], count)
+        for tag in changed_filters:
+            items = self._tag_row_items.get(tag)
+            if items is not None:
+                self._style_tag_filter_items(items[0], items[2], self.tag_filters.get(tag, self.FILTER_NEUTRAL))
+        self._shown_tag_filters = dict(self.tag_filters)
+
+        if changed_filters and hasattr(self.tag_cloud_widget, 'update_filter_states'):
+            self.tag_cloud_widget.update_filter_states(self.tag_filters)
+
+        # Only the matching column changes, so the order is stale only when sorted by it
+        if delta.changed_counts and self.tags_sort_column == 2:
+            self.tags_table.sortItems(self.tags_sort_column, self.tags_sort_order)
+            if self.tag_search_input.text().strip():
+                self._handle_tag_search()
+
+        self.setUpdatesEnabled(True)
+        return True
     
     def _update_album_count_label(self):
         """Update the album count label in the album panel."""
@@ -1079,197 +1083,25 @@ class TagExplorerView(BaseView):
         
         self.status_bar.setText("  •  ".join(status_parts))
     
-    def _update_album_table_display(self):
-        """Populate the album_table with data from self.filtered_albums. Optimized for performance."""
-        # Disable sorting during bulk updates for better performance
-        sorting_enabled = self.album_table.isSortingEnabled()
-        self.album_table.setSortingEnabled(False)
-        self.setUpdatesEnabled(False)
-        
-        # Clear existing rows efficiently
-        self.album_table.setRowCount(0)
-        
-        # Set row count once for all albums
-        num_albums = len(self.filtered_albums)
-        
-        # For very large datasets, consider virtual scrolling or pagination
-        if num_albums > 10000:
-            graphics_logger.info(f"Large album dataset ({num_albums} albums), using optimized display")
-            self._update_album_table_large_dataset()
-            self.setUpdatesEnabled(True)
-            return
-        
-        self.album_table.setRowCount(num_albums)
-        
-        # Show progress for large datasets
-        show_progress = num_albums > 2000
-        if show_progress:
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setMaximum(num_albums)
-            self.progress_bar.setValue(0)
-        
-        # Optimized batch processing with larger batches
-        batch_size = 2000  # Increased from 1000 for better throughput
-        
-        for batch_start in range(0, num_albums, batch_size):
-            batch_end = min(batch_start + batch_size, num_albums)
-            
-            # Pre-create all items for this batch for better memory locality
-            batch_items = []
-            
-            # Process batch
-            for i in range(batch_start, batch_end):
-                album_node = self.filtered_albums[i]
-                row_position = i
-                
-                artist = album_node.get('artist', '')
-                album_title = album_node.get('album', album_node.get('title', ''))
-                
-                # Get year value efficiently
-                year_value_from_node = album_node.get('release_year') or album_node.get('year')
-                year_display_string = ""
-                year_sort_integer = None
-                
-                if year_value_from_node is not None and str(year_value_from_node).strip():
-                    year_display_string = str(year_value_from_node)
-                    try:
-                        year_sort_integer = int(float(year_value_from_node))
-                    except (ValueError, TypeError):
-                        pass  # Silent failure, no need to log for every item
-                
-                genre_display = str(album_node.get('genre', '') or '')
-                country_display = str(album_node.get('country', '') or '')
-
-                vocal_style_display = album_node.get('vocal_style') or ''
-                if not vocal_style_display and album_node.get('vocal_styles'):
-                    vocal_style_display = ", ".join(str(v) for v in album_node['vocal_styles'] if v)
-
-                # Format tags efficiently with full list in tooltip
-                tags_list = album_node.get('tags', [])
-                if isinstance(tags_list, list):
-                    if tags_list:
-                        tags_str = ", ".join(map(str, tags_list))
-                        # Only create detailed tooltip if there are many tags
-                        tags_tooltip = "\n".join(map(str, tags_list)) if len(tags_list) > 3 else tags_str
-                    else:
-                        tags_str = ""
-                        tags_tooltip = ""
-                else:
-                    tags_str = str(tags_list)
-                    tags_tooltip = tags_str
-                
-                # Store items for batch insertion
-                tags_tooltip_text = f"All Tags:\n{tags_tooltip}" if tags_tooltip else "All Tags: (none)"
-
-                batch_items.append((
-                    row_position,
-                    (artist, artist),
-                    (album_title, album_title),
-                    (year_display_string, year_sort_integer, f"Release Year: {year_display_string}"),
-                    (genre_display, genre_display),
-                    (country_display, country_display),
-                    (vocal_style_display, vocal_style_display),
-                    (tags_str, tags_tooltip_text)
-                ))
-            
-            # Batch insert all items
-            for row_pos, artist_data, album_data, year_data, genre_data, country_data, vocal_data, tags_data in batch_items:
-                # Artist
-                artist_item = QTableWidgetItem(artist_data[0])
-                artist_item.setToolTip(artist_data[1])
-                self.album_table.setItem(row_pos, 0, artist_item)
-
-                # Album
-                album_item = QTableWidgetItem(album_data[0])
-                album_item.setToolTip(album_data[1])
-                self.album_table.setItem(row_pos, 1, album_item)
-
-                # Year
-                year_item = QTableWidgetItem(year_data[0])
-                if year_data[1] is not None:
-                    year_item.setData(Qt.ItemDataRole.UserRole, year_data[1])
-                year_item.setToolTip(year_data[2])
-                self.album_table.setItem(row_pos, 2, year_item)
-
-                # Genre
-                genre_item = QTableWidgetItem(genre_data[0])
-                genre_item.setToolTip(genre_data[1])
-                self.album_table.setItem(row_pos, 3, genre_item)
-
-                # Country
-                country_item = QTableWidgetItem(country_data[0])
-                country_item.setToolTip(country_data[1])
-                self.album_table.setItem(row_pos, 4, country_item)
-
-                # Vocal style
-                vocal_item = QTableWidgetItem(vocal_data[0])
-                vocal_item.setToolTip(vocal_data[1])
-                self.album_table.setItem(row_pos, 5, vocal_item)
-
-                # Tags
-                tags_item = QTableWidgetItem(tags_data[0])
-                tags_item.setToolTip(tags_data[1])
-                self.album_table.setItem(row_pos, 6, tags_item)
-            
-            # Update progress less frequently
-            if show_progress and batch_end % 4000 == 0:
-                self.progress_bar.setValue(batch_end)
-        
-        # Final progress update
-        if show_progress:
-            self.progress_bar.setValue(num_albums)
-            self.progress_bar.setVisible(False)
-        
-        # Re-enable sorting
-        self.album_table.setSortingEnabled(sorting_enabled)
-        self.setUpdatesEnabled(True)
+    def _update_album_table_display(self, delta: Optional[FilterDelta] = None):
+        """Show self.filtered_albums in the album_table.
+
+        The album model reads rows straight from the filter index's album list, so a
+        filter change (with or without a delta) only hands it the new position array.
+        """
+        evaluator = self._filter_evaluator
+        positions = self._filtered_positions
+        if evaluator is not None and len(positions) == len(self.filtered_albums):
+            albums = evaluator.index.albums
+            if self.album_model.rows is albums:
+                self.album_model.set_filter(positions)
+            else:
+                self.album_model.set_rows(albums, positions)
+        else:
+            self.album_model.set_rows(self.filtered_albums)
         
         # Update album count label
         self._update_album_count_label()
-        
-    def _update_album_table_large_dataset(self):
-        """Handle very large datasets with simplified display."""
-        # For datasets over 10k albums, show a simplified view with pagination
-        max_display = 5000
-        actual_count = len(self.filtered_albums)
-        
-        # Show only first N albums
-        display_albums = self.filtered_albums[:max_display]
-        self.album_table.setRowCount(len(display_albums))
-
-        # Populate with simplified data
-        for i, album_node in enumerate(display_albums):
-            artist = album_node.get('artist', '')
-            album_title = album_node.get('album', album_node.get('title', ''))
-            year = str(album_node.get('release_year') or album_node.get('year') or '')
-            genre_display = str(album_node.get('genre', '') or '')
-            country_display = str(album_node.get('country', '') or '')
-            vocal_display = album_node.get('vocal_style') or ''
-            if not vocal_display and album_node.get('vocal_styles'):
-                vocal_display = ", ".join(str(v) for v in album_node['vocal_styles'] if v)
-
-            # Simplified tags display
-            tags_list = album_node.get('tags', [])
-            if isinstance(tags_list, list) and len(tags_list) > 3:
-                tags_str = f"{', '.join(map(str, tags_list[:3]))}... (+{len(tags_list)-3} more)"
-            elif isinstance(tags_list, list):
-                tags_str = ", ".join(map(str, tags_list))
-            else:
-                tags_str = str(tags_list)
-
-            self.album_table.setItem(i, 0, QTableWidgetItem(artist))
-            self.album_table.setItem(i, 1, QTableWidgetItem(album_title))
-            self.album_table.setItem(i, 2, QTableWidgetItem(year))
-            self.album_table.setItem(i, 3, QTableWidgetItem(genre_display))
-            self.album_table.setItem(i, 4, QTableWidgetItem(country_display))
-            self.album_table.setItem(i, 5, QTableWidgetItem(vocal_display))
-            self.album_table.setItem(i, 6, QTableWidgetItem(tags_str))
-        
-        # Update label to show limitation
-        self.album_count_label.setText(f"Albums: {actual_count} (showing first {max_display})")
-        
-        # Log the limitation
-        graphics_logger.info(f"Large dataset: showing {max_display} of {actual_count} albums for performance")
 
     def _process_updates(self):
         """Process pending updates to tag and album data."""
@@ -1322,6 +1154,8 @@ class TagExplorerView(BaseView):
     def _add_album_data(self, data_node):
         """Add new album data to the view's original data store."""
         self.album_nodes_original.append(data_node)
+        self._invalidate_filter_index()
+        self._album_nodes_changed()
         # Maintain inverted index incrementally for responsiveness
         try:
             self._index_album_node(data_node)
@@ -1333,6 +1167,8 @@ class TagExplorerView(BaseView):
         """Remove album data from the view's original data store."""
         try:
             self.album_nodes_original.remove(data_node)
+            self._invalidate_filter_index()
+            self._album_nodes_changed()
             # Maintain inverted index
             try:
                 self._unindex_album_node(data_node)
@@ -1355,6 +1191,8 @@ class TagExplorerView(BaseView):
                 # Update in place and maintain index
                 old_node = self.album_nodes_original[i]
                 self.album_nodes_original[i] = data_node
+                self._invalidate_filter_index()
+                self._album_nodes_changed()
                 try:
                     self._unindex_album_node(old_node)
                     self._index_album_node(data_node)
@@ -1363,8 +1201,14 @@ class TagExplorerView(BaseView):
                 return
         graphics_logger.warning(f"Attempted to modify a node not found in album_nodes_original: ID {node_id_to_modify}")
 
+    def _album_nodes_changed(self):
+        """Let the album table reread album_nodes_original after an in-place change."""
+        if self.album_model.rows is self.album_nodes_original:
+            self.album_model.rows_changed()
+
     def _index_album_node(self, node):
         """Add an album node to the inverted index based on processed tags."""
+        self._invalidate_filter_index()
         raw_tags_str = node.get('raw_tags') or node.get('genre', '')
         if not raw_tags_str:
             return
@@ -1383,6 +1227,12 @@ class TagExplorerView(BaseView):
             return
 
         if self.tag_normalizer.get_atomic_mode():
+            # Atomic tags precomputed at ingest need no decomposition here
+            precomputed = node.get('atomic_tags')
+            if precomputed:
+                for component in precomputed:
+                    self.tag_to_album_nodes[component].append(node)
+                return
             for tag in tags:
                 atomic_components = self.tag_normalizer.normalize_to_atomic(tag)
                 if atomic_components:
@@ -1405,6 +1255,7 @@ class TagExplorerView(BaseView):
 
     def _unindex_album_node(self, node):
         """Remove an album node from the inverted index."""
+        self._invalidate_filter_index()
         raw_tags_str = node.get('raw_tags') or node.get('genre', '')
         if not raw_tags_str:
             return
@@ -1431,6 +1282,15 @@ class TagExplorerView(BaseView):
             return
 
         if self.tag_normalizer.get_atomic_mode():
+            precomputed = node.get('atomic_tags')
+            if precomputed:
+                for component in precomputed:
+                    node_list = self.tag_to_album_nodes.get(component)
+                    if node_list:
+                        self.tag_to_album_nodes[component] = [n for n in node_list if n is not node]
+                        if not self.tag_to_album_nodes[component]:
+                            del self.tag_to_album_nodes[component]
+                return
             for tag in tags:
                 atomic_components = self.tag_normalizer.normalize_to_atomic(tag)
                 if atomic_components:
@@ -1597,41 +1457,13 @@ class TagExplorerView(BaseView):
         layout.addWidget(info_label)
         
         # Preview table
-        preview_table = QTableWidget()
-        preview_table.setColumnCount(7)
-        preview_table.setHorizontalHeaderLabels([
-            "Artist",
-            "Album",
-            "Year",
-            "Genre",
-            "Country",
-            "Vocal Style",
-            "Tags"
-        ])
-        preview_table.setRowCount(len(nodes))
+        preview_table = QTableView()
+        preview_model = AlbumTableModel(parent=preview_table)
+        preview_model.set_rows(nodes)
+        preview_table.setModel(preview_model)
         preview_table.setAlternatingRowColors(True)
         preview_table.setSortingEnabled(True)
-        preview_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        
-        # Populate preview table
-        for i, node in enumerate(nodes):
-            artist = node.get('artist', '')
-            album = node.get('album', node.get('title', ''))
-            year = str(node.get('release_year') or node.get('year') or '')
-            genre = str(node.get('genre', '') or '')
-            country = str(node.get('country', '') or '')
-            vocal = node.get('vocal_style') or ''
-            if not vocal and node.get('vocal_styles'):
-                vocal = ", ".join(str(v) for v in node['vocal_styles'] if v)
-            tags = ', '.join(map(str, node.get('tags', [])))
-            
-            preview_table.setItem(i, 0, QTableWidgetItem(artist))
-            preview_table.setItem(i, 1, QTableWidgetItem(album))
-            preview_table.setItem(i, 2, QTableWidgetItem(year))
-            preview_table.setItem(i, 3, QTableWidgetItem(genre))
-            preview_table.setItem(i, 4, QTableWidgetItem(country))
-            preview_table.setItem(i, 5, QTableWidgetItem(vocal))
-            preview_table.setItem(i, 6, QTableWidgetItem(tags))
+        preview_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         
         preview_table.resizeColumnsToContents()
         layout.addWidget(preview_table)
@@ -2296,6 +2128,7 @@ class TagExplorerView(BaseView):
 
         # Store the new nodes; existing data is implicitly cleared by _reprocess_base_tag_data
         self.album_nodes_original = list(nodes) # Make a copy if nodes is an iterator or shared
+        self._invalidate_filter_index()
         
         # Clear caches
         self._clear_performance_caches()
@@ -2417,6 +2250,7 @@ class TagExplorerView(BaseView):
 
             # Reset processed mapping before finalization
             self.tag_to_album_nodes = defaultdict(list)
+            self._invalidate_filter_index()
 
             # Hide progress UI (dialog or inline bar)
             try:
@@ -2919,17 +2753,17 @@ class TagExplorerView(BaseView):
                 border: 1px solid {accent_hex};
                 background-color: {accent_hex};
             }}
-            QTableWidget {{
+            QTableView {{
                 gridline-color: {border_hex};
                 background-color: {surface_hex};
                 alternate-background-color: {raised_hex};
                 selection-background-color: {accent_hex};
                 selection-color: {background_hex};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 4px;
             }}
-            QTableWidget::item:hover {{
+            QTableView::item:hover {{
                 background-color: {hover_hex};
             }}
             QHeaderView::section {{
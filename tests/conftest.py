@@ -57,6 +57,15 @@ def db_session(engine, tables):
     transaction.rollback()
     connection.close()
 
+@pytest.fixture(autouse=True)
+def normalization_cache_dir(tmp_path, monkeypatch):
+    """Keep the derived caches, tag normalization included, in the test's tmp_path."""
+    from albumexplore.tags.normalizer import normalization_cache, tag_normalizer
+    from albumexplore.utils.paths import CACHE_DIR_ENV
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(normalization_cache, '_caches', {})
+    monkeypatch.setattr(tag_normalizer, '_shared_normalizer', None)
+
 @pytest.fixture(autouse=True)
 def setup_test_environment(db_session):
     """Set up test environment before each test."""
@@ -0,0 +1,98 @@
+"""Tests for the similarity bar chart view."""
+
+import time
+import pytest
+from PyQt6.QtWidgets import QApplication
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from albumexplore.database import Base, models
+from albumexplore.database.similarity import invalidate_similarity_engines
+from albumexplore.gui.views.similarity_bar_view import (
+    MAX_RESULTS, SimilarityBarChartView, SimilarityWorker
+)
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def session(tmp_path):
+    invalidate_similarity_engines()
+    # A file database, so the worker thread's connections see the same data
+    engine = create_engine(f"sqlite:///{tmp_path / 'albums.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    tags = [models.Tag(id=f"t{i}", name=f"tag {i}") for i in range(6)]
+    session.add_all(tags)
+    for i in range(30):
+        album = models.Album(id=f"al{i:02d}", title=f"Album {i}", pa_artist_name_on_album=f"Artist {i}",
+                             genre="Prog" if i % 2 else "Jazz", release_year=1970 + i)
+        album.tags = list({tags[i % 6], tags[(i * 7) % 6], tags[i % 3]})
+        session.add(album)
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def wait_for(app, condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for the similarity worker"
+        app.processEvents()
+        time.sleep(0.01)
+
+
+def test_scores_in_background_and_reslices_cached_results(app, session):
+    view = SimilarityBarChartView()
+    view.set_session(session)
+    try:
+        view.set_album('al01')
+        view._perform_refresh()
+        assert view.results_label.text() == "Calculating similar albums..."
+        wait_for(app, lambda: 'al01' in view._results_cache and view.table.rowCount() > 0)
+
+        cached = view._results_cache['al01']
+        assert 0 < len(cached) <= MAX_RESULTS
+        scores = [score for _, score, _ in cached]
+        assert scores == sorted(scores, reverse=True)
+        assert view.similarities == [r for r in cached if r[1] >= 0.3][:20]
+
+        # The top match is prefetched
+        top_id = view.similarities[0][0].id
+        wait_for(app, lambda: top_id in view._results_cache)
+
+        # Threshold and limit changes re-slice the cache without a new request
+        generation = view._generation
+        view.threshold_slider.setValue(0)
+        view.limit_combo.setCurrentText('10')
+        assert view._generation == generation
+        assert view.similarities == cached[:10]
+        assert view.table.rowCount() == min(10, len(cached))
+    finally:
+        view.shutdown()
+
+
+def test_stale_requests_are_dropped(app, session):
+    worker = SimilarityWorker(sessionmaker(bind=session.get_bind()))
+    finished = []
+    worker.finished.connect(lambda generation, album_id, results: finished.append((generation, album_id)))
+    worker.latest_generation = 2
+    worker.compute(1, 'al02')
+    worker.compute(2, 'al03')
+    assert finished == [(2, 'al03')]
+
+    view = SimilarityBarChartView()
+    view.set_session(session)
+    try:
+        for album_id in ('al02', 'al03', 'al04'):
+            view.set_album(album_id)
+            view._perform_refresh()
+        wait_for(app, lambda: 'al04' in view._results_cache and view.table.rowCount() > 0)
+        # Only the latest album is shown, whatever finished first
+        assert view.similarities == [r for r in view._results_cache['al04'] if r[1] >= 0.3][:20]
+    finally:
+        view.shutdown()
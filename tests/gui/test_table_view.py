@@ -61,24 +61,27 @@ def test_update_data_table(table_view):
     # Update the view with test data
     table_view.update_data(test_data)
     
-    # Verify the table was updated
-    assert table_view.table.rowCount() == 2
-    assert table_view.table.columnCount() == 6
+    # Verify the model was updated
+    model = table_view.model()
+    assert model.rowCount() == 2
+    assert model.columnCount() == 7
     
     # Check cell data
-    assert table_view.table.item(0, 0).text() == 'Artist 1'
-    assert table_view.table.item(0, 1).text() == 'Album 1'
-    assert table_view.table.item(0, 2).text() == '2023'
-    assert table_view.table.item(0, 3).text() == 'Progressive Rock'
-    assert table_view.table.item(0, 4).text() == 'USA'
-    assert table_view.table.item(0, 5).text() == 'rock, prog'
+    def cell(row, field):
+        return model.data(model.index(row, model.fieldColumn(field)))
+    assert cell(0, 'artist') == 'Artist 1'
+    assert cell(0, 'album') == 'Album 1'
+    assert cell(0, 'year') == '2023'
+    assert cell(0, 'genre') == 'Progressive Rock'
+    assert cell(0, 'country') == 'USA'
+    assert cell(0, 'tags') == 'rock, prog'
     
-    assert table_view.table.item(1, 0).text() == 'Artist 2'
-    assert table_view.table.item(1, 1).text() == 'Album 2'
+    assert cell(1, 'artist') == 'Artist 2'
+    assert cell(1, 'album') == 'Album 2'
     
     # Check ID storage in user role
-    assert table_view.table.item(0, 0).data(Qt.ItemDataRole.UserRole) == '1'
-    assert table_view.table.item(1, 0).data(Qt.ItemDataRole.UserRole) == '2'
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.UserRole) == '1'
+    assert model.data(model.index(1, 0), Qt.ItemDataRole.UserRole) == '2'
 
 
 def test_selection(table_view):
@@ -113,6 +116,43 @@ def test_selection(table_view):
     table_view.update_data(test_data)
     
     # Check if the correct row is selected (row with id='2', index 1)
-    assert table_view.table.item(1, 0).isSelected() is True
-    assert table_view.table.item(0, 0).isSelected() is False
-    assert table_view.table.item(2, 0).isSelected() is False
\ No newline at end of file
+    selection = table_view.table.selectionModel()
+    assert selection.isRowSelected(1, QModelIndex()) is True
+    assert selection.isRowSelected(0, QModelIndex()) is False
+    assert selection.isRowSelected(2, QModelIndex()) is False
+
+
+def test_search_box_filters_rows(table_view):
+    """Test that the search box shows only full-text matches."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from albumexplore.database import Base, models
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        models.Album(id='1', title='Fragile', pa_artist_name_on_album='Yes', genre='Symphonic Prog'),
+        models.Album(id='2', title='Blackwater Park', pa_artist_name_on_album='Opeth', genre='Progressive Metal'),
+    ])
+    session.add(models.Review(id='r1', album_id='2', review_text='Growls and acoustic passages'))
+    session.commit()
+    table_view.set_session(session)
+    table_view.update_data({'rows': [
+        {'id': '1', 'artist': 'Yes', 'album': 'Fragile', 'genre': 'Symphonic Prog'},
+        {'id': '2', 'artist': 'Opeth', 'album': 'Blackwater Park', 'genre': 'Progressive Metal'},
+    ]})
+
+    # The last word is a prefix while typing
+    table_view.search_input.setText('symph')
+    table_view._apply_search()
+    assert table_view.model().album_ids() == ['1']
+
+    table_view.search_input.setText('acoustic')
+    table_view._apply_search()
+    assert table_view.model().album_ids() == ['2']
+
+    table_view.search_input.clear()
+    table_view._apply_search()
+    assert table_view.model().rowCount() == 2
+    session.close()
@@ -0,0 +1,108 @@
+import random
+from datetime import datetime
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, delete, insert, select, update
+from sqlalchemy.orm import sessionmaker
+from albumexplore.database import Base, models
+from albumexplore.visualization.album_store import AlbumView, clear_album_store_cache, get_album_store
+from albumexplore.visualization.data_interface import DataInterface
+from albumexplore.visualization.models import Viewport
+from albumexplore.visualization.renderer import RenderConfig, TableRenderer
+
+@pytest.fixture
+def session():
+	clear_album_store_cache()
+	engine = create_engine('sqlite:///:memory:')
+	Base.metadata.create_all(engine)
+	session = sessionmaker(bind=engine)()
+	rng = random.Random(5)
+	tags = [models.Tag(id=f"t{i:02d}", name=f"tag {i}") for i in range(10)]
+	atomic = [models.AtomicTag(id=f"a{i}", name=f"atomic {i}") for i in range(4)]
+	session.add_all(tags + atomic)
+	for i in range(40):
+		album = models.Album(id=f"al{i:02d}", title=f"Album {i}", pa_artist_name_on_album=f"Artist {i % 7}",
+			genre=rng.choice(["Prog", "Jazz", None]), country=rng.choice(["UK", "Finland", None]),
+			vocal_style=rng.choice(["Clean, Harsh", "", None]))
+		if i % 3 == 0:
+			album.release_year = 1970 + i
+		elif i % 3 == 1:
+			album.release_date = datetime(1980 + i, 5, 1)
+		album.tags = rng.sample(tags, rng.randint(0, 4))
+		album.atomic_tags = rng.sample(atomic, rng.randint(0, 2))
+		session.add(album)
+	session.add(models.Album(id="nan-row", title="nan", pa_artist_name_on_album="nan"))
+	session.commit()
+	yield session
+	session.close()
+
+def test_store_matches_orm(session):
+	store = get_album_store(session, atomic=True)
+	albums = {a.id: a for a in session.query(models.Album).all()}
+	assert sorted(store.ids.tolist()) == sorted(albums)
+	for i, album_id in enumerate(store.ids.tolist()):
+		album = albums[album_id]
+		row = store.row(i)
+		assert row['artist'] == (album.pa_artist_name_on_album or '')
+		assert row['title'] == album.title
+		assert row['tags'] == sorted(t.name for t in album.tags)
+		assert row['atomic_tags'] == sorted(t.name for t in album.atomic_tags)
+		year = album.release_year or (album.release_date.year if album.release_date else None)
+		assert row['year'] == (str(year) if year else '')
+		assert row['vocal_styles'] == [s.strip() for s in (album.vocal_style or '').split(',') if s.strip()]
+	# Cached until the link tables change
+	assert get_album_store(session, atomic=True) is store
+	album = albums['al01']
+	album.tags = album.tags + [session.get(models.Tag, 't09')] if 't09' not in {t.id for t in album.tags} else []
+	session.commit()
+	assert get_album_store(session, atomic=True) is not store
+
+def test_store_rebuilds_after_edits_in_place(session):
+	store = get_album_store(session)
+	session.get(models.Album, 'al02').title = "Renamed"
+	session.commit()
+	store, previous = get_album_store(session), store
+	assert store is not previous and store.row(store.ids.tolist().index('al02'))['title'] == "Renamed"
+
+	# Renaming a tag changes neither row count nor rowid
+	tag_id = session.scalar(select(models.album_tags.c.tag_id))
+	session.execute(update(models.Tag).where(models.Tag.id == tag_id).values(name="zeuhl"))
+	session.commit()
+	store, previous = get_album_store(session), store
+	assert store is not previous and "zeuhl" in store.tag_names.tolist()
+
+	# Swapping the newest link for another reuses its rowid
+	album_id, tag_id = session.execute(
+		select(models.album_tags.c.album_id, models.album_tags.c.tag_id).order_by(models.album_tags.c.album_id.desc())
+	).first()
+	linked = set(session.scalars(select(models.album_tags.c.tag_id).where(models.album_tags.c.album_id == album_id)))
+	other = next(t for t in (f"t{i:02d}" for i in range(10)) if t not in linked)
+	session.execute(delete(models.album_tags).where(models.album_tags.c.album_id == album_id,
+	                                                models.album_tags.c.tag_id == tag_id))
+	session.execute(insert(models.album_tags).values(album_id=album_id, tag_id=other))
+	session.commit()
+	assert get_album_store(session) is not store
+
+def test_table_renderer_takes_album_view(session):
+	interface = DataInterface(session)
+	view = interface.get_album_view()
+	assert isinstance(view, AlbumView)
+	assert len(view) == 40 and 'nan-row' not in view.ids.tolist()
+	viewport = Viewport(width=800, height=600)
+	viewport.selected_ids = {'al03'}
+	result = TableRenderer(RenderConfig()).render(view, [], viewport)
+	assert result['rows'] is view and result['selected_ids'] == {'al03'}
+
+	# Same rows as the node-based path
+	nodes, _ = interface.get_visible_data()
+	legacy = TableRenderer(RenderConfig()).render(nodes, [], viewport)['rows']
+	keys = ['id', 'artist', 'album', 'year', 'country', 'genre', 'vocal_style', 'vocal_styles', 'raw_tags']
+	by_id = {row['id']: row for row in legacy}
+	for row in view:
+		assert {k: row[k] for k in keys} == {k: by_id[row['id']][k] for k in keys}
+		assert sorted(row['tags']) == sorted(by_id[row['id']]['tags'])
+
+	sub = view.take(view.years > 2000)
+	assert all(int(row['year']) > 2000 for row in sub)
+	assert view[2:5].ids.tolist() == view.ids[2:5].tolist()
+	assert np.array_equal(view.column('title'), np.array([r['title'] for r in view], dtype=object))
@@ -0,0 +1,86 @@
+import numpy as np
+from PyQt6.QtCore import Qt, QModelIndex, QPersistentModelIndex
+from albumexplore.gui.models import AlbumTableModel
+from albumexplore.visualization.album_store import AlbumStore
+
+def make_rows():
+	return [
+		{'id': 'a', 'artist': 'beta', 'album': 'One', 'year': 1999, 'tags': ['prog', 'rock']},
+		{'id': 'b', 'artist': 'Alpha', 'title': 'Two', 'year': None, 'vocal_styles': ['Clean', 'Harsh']},
+		{'id': 'c', 'artist': 'gamma', 'album': 'Three', 'release_year': 1975, 'tags': []},
+		{'id': 'd', 'artist': 'alpha', 'album': 'Four', 'year': '2010', 'tags': ['jazz']},
+	]
+
+def column_values(model, field):
+	column = model.fieldColumn(field)
+	return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+def test_sort_and_filter_over_index_arrays():
+	rows = make_rows()
+	model = AlbumTableModel()
+	model.set_rows(rows)
+	assert column_values(model, 'album') == ['One', 'Two', 'Three', 'Four']
+	assert column_values(model, 'vocal_style') == ['', 'Clean, Harsh', '', '']
+	assert model.data(model.index(0, model.fieldColumn('tags')), Qt.ItemDataRole.ToolTipRole) == "All Tags:\nprog, rock"
+
+	model.sort(model.fieldColumn('year'), Qt.SortOrder.DescendingOrder)
+	assert column_values(model, 'year') == ['2010', '1999', '1975', '']
+	model.sort(model.fieldColumn('artist'))
+	# Case-insensitive and stable
+	assert model.album_ids() == ['b', 'd', 'a', 'c']
+
+	# A filter keeps the sort order and leaves the rows untouched
+	model.set_filter(np.array([2, 1, 3]))
+	assert model.album_ids() == ['b', 'd', 'c']
+	assert model.rows is rows
+	assert model.rows_for_ids({'c', 'zzz'}) == [2]
+	model.set_filter(None)
+	assert model.rowCount() == 4
+
+def test_album_view_rows_are_read_lazily():
+	store = AlbumStore.from_rows([
+		('x1', 'Zed', 'Later', 'Prog', 'UK', 'Clean', None, 2001, 'b\x1fa'),
+		('x2', 'Abe', 'Earlier', 'Jazz', 'US', '', None, 1960, None),
+		('x3', 'Mid', 'Middle', 'Prog', 'FI', '', None, None, 'a'),
+	])
+	view = store.view()
+	reads = []
+	row = store.row
+	store.row = lambda i: reads.append(i) or row(i)
+
+	model = AlbumTableModel()
+	model.set_rows(view, np.array([0, 1]))
+	model.sort(model.fieldColumn('year'))
+	assert model.album_ids() == ['x2', 'x1']
+	model.sort(model.fieldColumn('artist'))
+	assert model.album_ids() == ['x2', 'x1']
+	# Ids and sort keys come from the store columns, not from row dicts
+	assert reads == []
+	assert model.data(model.index(1, model.fieldColumn('tags'))) == 'a, b'
+	assert reads == [0]
+
+def test_rows_changed_in_place_are_reread():
+	rows = make_rows()
+	model = AlbumTableModel()
+	model.set_rows(rows)
+	model.sort(model.fieldColumn('artist'))
+	assert column_values(model, 'album') == ['Two', 'Four', 'One', 'Three']
+
+	rows[0] = {'id': 'z', 'artist': 'zz', 'album': 'ZZ', 'year': 2020}
+	model.rows_changed()
+	model.set_filter(np.array([0, 1, 2, 3]))
+	assert column_values(model, 'album') == ['Two', 'Four', 'Three', 'ZZ']
+
+	del rows[1]
+	model.rows_changed()
+	model.set_filter(np.array([0, 1, 2]))
+	assert model.album_ids() == ['d', 'c', 'z']
+
+def test_sort_moves_persistent_indexes_with_their_album():
+	model = AlbumTableModel()
+	model.set_rows(make_rows())
+	current = QPersistentModelIndex(model.index(0, 1))
+	assert model.data(QModelIndex(current)) == 'One'
+	model.sort(model.fieldColumn('artist'))
+	assert current.row() == 2
+	assert model.data(QModelIndex(current)) == 'One'
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from albumexplore.visualization.array_layout import ArrayForceLayout
+from albumexplore.visualization.layout import create_layout_engine
+from albumexplore.visualization.models import Point
+from .utils import community_graph
+
+def exact_repulsion(pos, strength):
+	d = pos[:, None, :] - pos[None, :, :]
+	dist_sq = (d * d).sum(axis=-1)
+	np.fill_diagonal(dist_sq, np.inf)
+	return (d * (strength / (dist_sq * np.sqrt(dist_sq)))[..., None]).sum(axis=1)
+
+@pytest.mark.parametrize("n", [50, 1500])
+def test_repulsion_approximates_all_pairs(n):
+	rng = np.random.default_rng(n)
+	# A dense cluster inside a sparse background exercises both near and far field
+	pos = np.concatenate([rng.normal(0, 50, (n // 2, 2)), rng.uniform(-1000, 1000, (n - n // 2, 2))])
+	layout = ArrayForceLayout()
+	exact = exact_repulsion(pos, layout.params.repulsion)
+	approx = layout.repulsion_forces(pos)
+	error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+	assert np.median(error) < 0.1
+
+# The multilevel layout needs enough nodes to coarsen
+@pytest.mark.parametrize("layout_type, communities, size", [("array", 4, 25), ("multilevel", 8, 50)])
+def test_compute_layout_pulls_linked_nodes_together(layout_type, communities, size):
+	nodes, edges = community_graph(communities, size)
+	positions = create_layout_engine(layout_type).compute_layout(nodes, edges, 800, 600)
+	assert set(positions) == {n.id for n in nodes}
+	pos = np.array([(n.pos['x'], n.pos['y']) for n in nodes])
+	assert (pos >= 0).all() and (pos[:, 0] <= 800).all() and (pos[:, 1] <= 600).all()
+
+	index = {n.id: i for i, n in enumerate(nodes)}
+	s = np.array([index[e.source] for e in edges])
+	t = np.array([index[e.target] for e in edges])
+	edge_length = np.linalg.norm(pos[s] - pos[t], axis=1).mean()
+	pair_distance = np.linalg.norm(pos[:, None, :] - pos[None, :, :], axis=-1).mean()
+	assert edge_length < 0.5 * pair_distance
+
+def test_update_layout_keeps_fixed_nodes():
+	nodes, edges = community_graph()
+	layout = ArrayForceLayout()
+	layout.compute_layout(nodes, edges, 800, 600)
+	layout.update_layout(nodes, edges, {"n0": Point(10.0, 20.0)})
+	assert (nodes[0].pos['x'], nodes[0].pos['y']) == (10.0, 20.0)
@@ -0,0 +1,73 @@
+import json
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from albumexplore.database import Base, models, queries
+from albumexplore.database.atomic_ingest import build_atomic_tags
+from albumexplore.database.optimized_csv_loader import load_dataframe_data_optimized
+
+@pytest.fixture
+def Session(tmp_path):
+	engine = create_engine(f"sqlite:///{tmp_path / 'albums.db'}")
+	Base.metadata.create_all(engine)
+	yield sessionmaker(bind=engine)
+	engine.dispose()
+
+def frame(rows):
+	return pd.DataFrame(rows, columns=['Artist', 'Album', 'Genre / Subgenres'])
+
+def atomic_links(session):
+	return sorted(session.execute(
+		select(models.Album.title, models.AtomicTag.name)
+		.join(models.album_atomic_tags, models.album_atomic_tags.c.album_id == models.Album.id)
+		.join(models.AtomicTag)
+	).all())
+
+def test_ingest_links_atomic_tags(Session):
+	load_dataframe_data_optimized(frame([
+		("Opeth", "Blackwater Park", "Progressive Metal"),
+		("Meshuggah", "Nothing", "Djent, Heavy Metal"),
+	]), Session())
+
+	session = Session()
+	assert atomic_links(session) == [
+		("Blackwater Park", "metal"), ("Blackwater Park", "progressive"),
+		("Nothing", "djent"), ("Nothing", "heavy"), ("Nothing", "metal"),
+	]
+	tag = session.query(models.Tag).filter_by(name="progressive metal").one()
+	assert tag.is_composite and not tag.is_atomic
+	assert len(json.loads(tag.atomic_components)) == 2
+	assert session.query(models.Tag).filter_by(name="djent").one().is_atomic
+	assert queries.get_atomic_tag_breakdown(session, "heavy metal")['component_count'] == 2
+
+	assert sorted(a.title for a in queries.filter_albums_by_atomic_components(session, ["metal"], match_all=False)) \
+		== ["Blackwater Park", "Nothing"]
+	assert [a.title for a in queries.filter_albums_by_atomic_components(session, ["progressive", "metal"])] \
+		== ["Blackwater Park"]
+	assert sorted(a.title for a in queries.search_albums_by_atomic_tags(session, ["heavy", "progressive"])) \
+		== ["Blackwater Park", "Nothing"]
+	session.close()
+
+	# A later ingest decomposes only the tags it introduces
+	load_dataframe_data_optimized(frame([("Gojira", "Magma", "Progressive Metal, Sludge Metal")]), Session())
+	session = Session()
+	assert session.query(models.TagDecomposition).filter(
+		models.TagDecomposition.composite_tag_id == tag.id).count() == 2
+	assert [name for title, name in atomic_links(session) if title == "Magma"] == ["metal", "progressive", "sludge"]
+	session.close()
+
+def test_backfill_links_existing_albums(Session):
+	session = Session()
+	tag = models.Tag(id="t1", name="art rock", normalized_name="art rock")
+	session.add_all([tag, models.Album(id="a1", title="Selling England", tags=[tag]),
+	                 models.Album(id="a2", title="Foxtrot", tags=[tag])])
+	session.commit()
+
+	assert build_atomic_tags(session) == {'tags': 1, 'links': 4}
+	session.commit()
+	assert atomic_links(session) == [("Foxtrot", "art"), ("Foxtrot", "rock"),
+	                                 ("Selling England", "art"), ("Selling England", "rock")]
+	# Nothing left to do on a second run
+	assert build_atomic_tags(session) == {'tags': 0, 'links': 0}
+	session.close()
@@ -0,0 +1,99 @@
+import random
+import pytest
+from albumexplore.gui.utils.bitset import BitSet
+from albumexplore.gui.utils.tag_filter import TagFilter
+
+def random_ids(rng, n, high):
+    return {rng.randrange(high) for _ in range(n)}
+
+@pytest.mark.parametrize("n", [10, 5000, 60000])
+def test_set_operations_match_python_sets(n):
+    rng = random.Random(n)
+    a_ids, b_ids = random_ids(rng, n, 200000), random_ids(rng, n, 200000)
+    a, b = BitSet(a_ids), BitSet(b_ids)
+
+    assert a.to_list() == sorted(a_ids)
+    assert list(a) == sorted(a_ids)
+    assert a.size() == len(a_ids)
+    assert a.union(b).to_list() == sorted(a_ids | b_ids)
+    assert a.intersect(b).to_list() == sorted(a_ids & b_ids)
+    assert a.intersection_size(b) == len(a_ids & b_ids)
+    assert a.difference(b).to_list() == sorted(a_ids - b_ids)
+    assert BitSet.union_all([a, b, BitSet()]) == a.union(b)
+    assert BitSet.from_bytes(a.to_bytes()) == a
+
+def test_dense_and_sparse_sets():
+    dense_ids = set(range(0, 20000, 2))
+    sparse_ids = set(range(0, 20000, 7))
+    dense, sparse = BitSet(dense_ids), BitSet(sparse_ids)
+    for x, y, x_ids, y_ids in ((dense, sparse, dense_ids, sparse_ids), (sparse, dense, sparse_ids, dense_ids)):
+        assert x.intersect(y).to_list() == sorted(x_ids & y_ids)
+        assert x.intersection_size(y) == len(x_ids & y_ids)
+        assert x.union(y).to_list() == sorted(x_ids | y_ids)
+        assert x.difference(y).to_list() == sorted(x_ids - y_ids)
+
+def test_sparse_sets_are_stored_as_id_arrays():
+    rare_ids = {999_000, 3, 500_000}
+    dense_ids = set(range(0, 1_000_000, 3))
+    rare, dense = BitSet(rare_ids), BitSet(dense_ids)
+    assert rare.is_sparse and not dense.is_sparse
+    assert rare.nbytes == 24 and dense.nbytes > 100_000
+
+    for x, y, x_ids, y_ids in ((rare, dense, rare_ids, dense_ids), (dense, rare, dense_ids, rare_ids)):
+        assert x.intersect(y).to_list() == sorted(x_ids & y_ids)
+        assert x.intersection_size(y) == len(x_ids & y_ids)
+        assert x.union(y).to_list() == sorted(x_ids | y_ids)
+        assert x.difference(y).to_list() == sorted(x_ids - y_ids)
+    assert rare.intersect(dense).is_sparse and rare.difference(dense).is_sparse
+    assert BitSet.union_all([rare, BitSet([70000])]).is_sparse
+    assert BitSet.union_all([rare, dense]).to_list() == sorted(rare_ids | dense_ids)
+
+    assert BitSet.from_bytes(rare.to_bytes()) == rare and BitSet.from_bytes(rare.to_bytes()).is_sparse
+    assert rare == BitSet._from_bits(rare._as_bits()) and hash(rare) == hash(BitSet._from_bits(rare._as_bits()))
+
+    # Filling the range switches to the int
+    grown = BitSet([100])
+    for i in range(3):
+        grown.add(i)
+    assert not grown.is_sparse and grown.to_list() == [0, 1, 2, 100]
+    assert grown.has(100) and not grown.has(50)
+    rare.remove(3)
+    assert rare.to_list() == [500_000, 999_000] and 999_000 in rare and 3 not in rare
+
+def test_add_remove_does_not_affect_copies():
+    dense = BitSet(range(8192))
+    copy = dense.clone()
+    joined = dense.union(BitSet([70000]))
+
+    dense.add(12288)
+    dense.remove(0)
+    assert dense.has(12288) and not dense.has(0)
+    assert copy.has(0) and not copy.has(12288)
+
+    sparse = BitSet([5, 90000])
+    sparse_copy = sparse.clone()
+    sparse.add(7)
+    sparse.remove(5)
+    assert sparse.to_list() == [7, 90000] and sparse_copy.to_list() == [5, 90000]
+    assert joined.has(0) and joined.has(70000)
+
+    for i in range(8192):
+        dense.remove(i)
+    assert dense.to_list() == [12288]
+    assert not dense.has(-1)
+
+def test_empty_sets_are_truthy_and_sets_hash_by_value():
+    # Like the original API, an empty set is not falsy
+    assert BitSet()
+    assert BitSet([]).to_list() == [] and BitSet([-1]).size() == 0
+    assert {BitSet([1, 5]), BitSet([5, 1])} == {BitSet([1, 5])}
+
+def test_tag_filter_caches_universe():
+    tf = TagFilter({'metal': BitSet([1, 2, 3]), 'rock': BitSet([3, 4])})
+    assert tf.evaluate({'type': 'not', 'expr': {'type': 'tag', 'tag': 'metal'}}).to_list() == [4]
+    tf.evaluate(None).add(99)  # results are independent of the cache
+    assert tf.universe().to_list() == [1, 2, 3, 4]
+
+    tf.tag_map = {'jazz': BitSet([7])}
+    assert tf.universe().to_list() == [7]
+    assert tf.matching_counts_for_visible({'type': 'tag', 'tag': 'jazz'}, ['jazz']) == [{'tag': 'jazz', 'count': 1}]
@@ -0,0 +1,113 @@
+import pytest
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from albumexplore.database import Base, models
+from albumexplore.database.bulk_ingest import BulkIngestBuffer
+from albumexplore.database.csv_loader import load_dataframe_data
+
+@pytest.fixture
+def engine():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    return engine
+
+@pytest.fixture
+def session(engine):
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame({
+        'Artist': ['Artist A', 'Artist B', 'Artist A'],
+        'Album': ['First', 'Second', 'First'],
+        'Release Date': ['2023-01-05', 'Feb 3', '2023-01-05'],
+        'Genre / Subgenres': ['Progressive Metal, Djent', 'progressive metal', 'Progressive Metal'],
+        'Vocal Style': ['Clean', 'Harsh', 'Clean'],
+        'Country / State': ['Sweden', 'Norway', 'Sweden'],
+        '_source_file': ['2023.csv'] * 3
+    })
+
+def _snapshot(engine):
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    try:
+        tags = sorted(t.name for t in session.query(models.Tag).all())
+        links = sorted(
+            (album.pa_artist_name_on_album, album.title, tag.name)
+            for album in session.query(models.Album).all()
+            for tag in album.tags
+        )
+        return tags, links
+    finally:
+        session.close()
+
+def test_buffer_reuses_existing_tags(session):
+    session.add(models.Tag(id="t1", name="djent", normalized_name="djent"))
+    session.commit()
+
+    buffer = BulkIngestBuffer(session)
+    buffer.add_album({'title': 'X', 'pa_artist_name_on_album': 'Y'}, ["djent", "post-metal", "djent"])
+    counts = buffer.flush()
+    session.commit()
+
+    assert counts == {'albums': 1, 'tags': 1, 'links': 2}
+    album = session.query(models.Album).one()
+    assert sorted(t.name for t in album.tags) == ["djent", "post-metal"]
+    assert session.query(models.Tag).filter_by(name="djent").one().id == "t1"
+
+def test_bulk_matches_row_by_row(sample_df):
+    engines = []
+    for bulk in (False, True):
+        engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(engine)
+        load_dataframe_data(sample_df.copy(), sessionmaker(bind=engine)(), bulk=bulk)
+        engines.append(engine)
+
+    row_by_row, bulk = (_snapshot(e) for e in engines)
+    assert row_by_row == bulk
+    assert len(bulk[1]) > 0
+
+def test_failed_flush_is_not_retried(session):
+    buffer = BulkIngestBuffer(session)
+    buffer.add_album({'id': 'a1', 'title': 'X', 'pa_artist_name_on_album': 'Y'}, ["djent"])
+    buffer.flush()
+    session.commit()
+
+    # The album id is taken, so the whole batch fails, new tag included
+    buffer.add_album({'id': 'a1', 'title': 'X', 'pa_artist_name_on_album': 'Y'}, ["zeuhl"])
+    with pytest.raises(Exception):
+        buffer.flush()
+    session.rollback()
+    assert "zeuhl" not in buffer.tag_ids
+
+    buffer.add_album({'title': 'Z', 'pa_artist_name_on_album': 'Y'}, ["zeuhl"])
+    assert buffer.flush() == {'albums': 1, 'tags': 1, 'links': 1}
+    session.commit()
+    assert session.query(models.Tag).filter_by(name="zeuhl").count() == 1
+
+def test_file_that_fails_part_way_is_left_out(tmp_path, monkeypatch):
+    from albumexplore.database import csv_loader
+    engine = create_engine(f"sqlite:///{tmp_path / 'albums.db'}")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(csv_loader, "get_session", sessionmaker(bind=engine))
+    for name in ("2023.csv", "2024.csv", "2025.csv"):
+        (tmp_path / name).write_text("")
+
+    def process(csv_file, year, session, bulk_buffer):
+        bulk_buffer.add_album({'title': f"Album {year}", 'pa_artist_name_on_album': 'Y'}, [f"tag {year}"])
+        if year == 2024:
+            raise RuntimeError("broken file")
+        bulk_buffer.flush(label=csv_file.name)
+        return {"processed": 1}
+
+    monkeypatch.setattr(csv_loader, "_process_csv_file", process)
+    csv_loader.load_csv_data(tmp_path, bulk=True)
+
+    tags, links = _snapshot(engine)
+    assert tags == ["tag 2023", "tag 2025"]
+    assert links == [("Y", "Album 2023", "tag 2023"), ("Y", "Album 2025", "tag 2025")]
+    engine.dispose()
@@ -0,0 +1,64 @@
+import random
+from collections import Counter
+from itertools import combinations
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from albumexplore.database import Base, models
+from albumexplore.database.co_occurrence import CoOccurrenceMatrix, get_co_occurrence
+from albumexplore.database.queries import get_tag_co_occurrences, get_atomic_tag_co_occurrences
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    rng = random.Random(11)
+    tags = [models.Tag(id=f"t{i:02d}", name=f"tag {i}") for i in range(12)]
+    atomic = [models.AtomicTag(id=f"a{i}", name=f"atomic {i}") for i in range(6)]
+    session.add_all(tags + atomic)
+    for i in range(60):
+        album = models.Album(id=f"al{i}", title=f"Album {i}")
+        album.tags = rng.sample(tags, rng.randint(0, 5))
+        album.atomic_tags = rng.sample(atomic, rng.randint(0, 3))
+        session.add(album)
+    session.commit()
+    yield session
+    session.close()
+
+def brute_force(albums, attr, min_count):
+    counts = Counter()
+    for album in albums:
+        for a, b in combinations(sorted(t.id for t in getattr(album, attr)), 2):
+            counts[(a, b)] += 1
+    return {pair: c for pair, c in counts.items() if c >= min_count}
+
+def test_counts_match_per_album_pairs(session):
+    albums = session.query(models.Album).all()
+    results = get_tag_co_occurrences(session, min_count=2)
+    assert {(a.id, b.id): c for a, b, c in results} == brute_force(albums, 'tags', 2)
+    assert [c for _, _, c in results] == sorted((c for _, _, c in results), reverse=True)
+    assert all(isinstance(a, models.Tag) for a, _, _ in results)
+
+    atomic = get_atomic_tag_co_occurrences(session, min_count=1)
+    assert {(a.id, b.id): c for a, b, c in atomic} == brute_force(albums, 'atomic_tags', 1)
+
+def test_duplicate_links_and_subsets():
+    matrix = CoOccurrenceMatrix([("x", "b"), ("x", "a"), ("x", "a"), ("y", "a"), ("y", "b"), ("y", "c")])
+    assert matrix.pairs() == [("a", "b", 2), ("a", "c", 1), ("b", "c", 1)]
+    assert matrix.pairs(tag_ids=["a", "c"]) == [("a", "c", 1)]
+    assert matrix.neighbours("a") == {"b": 2, "c": 1}
+    assert matrix.top_tags(2) == ["a", "b"]
+    assert CoOccurrenceMatrix([]).pairs() == []
+
+def test_cache_rebuilds_after_link_changes(session):
+    matrix = get_co_occurrence(session)
+    assert get_co_occurrence(session) is matrix
+
+    album = session.get(models.Album, "al0")
+    album.tags = [session.get(models.Tag, "t00"), session.get(models.Tag, "t01")]
+    session.commit()
+    rebuilt = get_co_occurrence(session)
+    assert rebuilt is not matrix
+    albums = session.query(models.Album).all()
+    assert {(a, b): c for a, b, c in rebuilt.pairs()} == brute_force(albums, 'tags', 1)
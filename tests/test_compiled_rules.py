@@ -0,0 +1,51 @@
+import pytest
+from albumexplore.tags.config.compiled_rules import CompiledTagRules
+
+@pytest.fixture
+def rules():
+    return CompiledTagRules({
+        "compound_terms": {"progressive metal": ["progmetal", "prog metal"]},
+        "common_misspellings": {
+            "progressive": ["progresive", "prog metal"],
+            "atmospheric": ["atmosheric"]
+        },
+        "single_instance_mappings": {"tech death": "technical death metal"},
+        "prefix_patterns": {
+            "prog-": ["progressive-", "prog "],
+            "post-": ["post "]
+        },
+        "suffix_patterns": {"core": ["-core", " core"]},
+        "categories": {
+            "metal": {
+                "core_terms": ["metal"],
+                "primary_genres": ["djent"],
+                "modifiers": ["progressive"]
+            },
+            "rock": {
+                "core_terms": ["rock"],
+                "primary_genres": ["psychedelic"],
+                "modifiers": ["neo"]
+            }
+        }
+    })
+
+def test_variant_lookup_precedence(rules):
+    # Compound terms win over misspellings listing the same variant
+    assert rules.normalize("prog metal") == "progressive metal"
+    assert rules.normalize("progresive") == "progressive"
+    assert rules.normalize("tech death") == "technical death metal"
+
+def test_prefix_and_suffix_patterns(rules):
+    assert rules.normalize("progressive-rock") == "prog-rock"
+    assert rules.normalize("post hard core") == "post-hardcore"
+    assert rules.normalize("metal-core") == "metalcore"
+    assert rules.normalize("shoegaze") == "shoegaze"
+
+def test_category_detection(rules):
+    assert rules.category_for("death metal") == "metal"
+    assert rules.category_for("djent") == "metal"
+    assert rules.category_for("neo psychedelic") == "rock"
+    assert rules.category_for("jazz") is None
+
+def test_word_level_misspellings(rules):
+    assert rules.correct_misspelled_words("atmosheric black metal") == "atmospheric black metal"
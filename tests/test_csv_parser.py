@@ -101,3 +101,15 @@ def test_data_validation(sample_csv_path):
 	assert len(validator.validation_errors) == 0
 	# We expect warnings for single-use tags
 	assert "single-use tags" in str(validator.validation_warnings)
+
+def test_parallel_parse_matches_serial(tmp_path, sample_csv_path):
+	"""Worker processes return the same rows, in file order, as a serial parse."""
+	content = sample_csv_path.read_text()
+	(tmp_path / "2024.csv").write_text(content.replace('Test Album', 'Older Album'))
+	(tmp_path / "2026.csv").write_text(content)
+	
+	serial = CSVParser(tmp_path).parse_multiple_csv(tmp_path)
+	parallel = CSVParser(tmp_path, workers=2).parse_multiple_csv(tmp_path)
+	pd.testing.assert_frame_equal(parallel, serial)
+	# Duplicates keep the row from the first file
+	assert list(parallel['_source_file']) == ['2024.csv', '2024.csv', '2026.csv']
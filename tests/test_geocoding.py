@@ -0,0 +1,70 @@
+import json
+import random
+from albumexplore.visualization.geocoding import (LocationAggregates, LocationCache, LocationGroup,
+	encode_groups, normalize_location)
+
+def test_location_lookup_fallbacks():
+	cache = LocationCache()
+	london = cache.get_coordinates("London, UK")
+	assert london is not None
+	# Case, spacing and accents are folded
+	assert cache.get_coordinates("london ,  uk") == london
+	assert cache.get_coordinates("Munster, Germany") == cache.get_coordinates("Münster, Germany")
+	# Multi-location strings use the first part that resolves
+	assert cache.get_coordinates("UK / Australia") == cache.get_coordinates("UK")
+	# Misspelled places match within their region; unknown places fall back to the region
+	assert cache.get_coordinates("Londn, UK") == london
+	assert cache.get_coordinates("Nowhereville, Germany") == cache.get_coordinates("Germany")
+	assert cache.get_coordinates("Atlantis") is None
+	cache.add_location("Atlantis", 1.0, 2.0)
+	assert cache.get_coordinates("Atlantis") == (1.0, 2.0)
+
+def test_normalize_location():
+	assert normalize_location("  Québec City ,Canada ") == "quebec city, canada"
+	assert normalize_location("USA/Finland") == "usa/ finland"
+
+def brute_force(albums_by_location, genre, year_min, year_max):
+	counts = {}
+	for coords, albums in albums_by_location.items():
+		n = 0
+		for album in albums:
+			if genre is not None and album['genre'] != genre:
+				continue
+			year = album['year']
+			if year:
+				try:
+					if not year_min <= int(year) <= year_max:
+						continue
+				except ValueError:
+					continue
+			n += 1
+		if n:
+			counts[coords] = n
+	return counts
+
+def test_aggregates_match_album_scan():
+	rng = random.Random(0)
+	genres = ["Prog Metal", "Prog Rock", "Djent"]
+	albums_by_location = {}
+	for i in range(300):
+		coords = (float(rng.randint(0, 30)), float(rng.randint(0, 30)))
+		year = rng.choice([None, "", "bad", 1975, 1999, "2005", 2019, 2024])
+		albums_by_location.setdefault(coords, []).append(
+			{'id': str(i), 'genre': rng.choice(genres), 'year': year, 'location': str(coords)})
+	aggregates = LocationAggregates(albums_by_location)
+	assert aggregates.genres == sorted(genres)
+
+	for genre in [None] + genres:
+		for year_min, year_max in [(1900, 2030), (1990, 2010), (2020, 2030), (2010, 2000)]:
+			groups = aggregates.query(genre, year_min, year_max, limit=3)
+			assert {g.coords: g.count for g in groups} == brute_force(albums_by_location, genre, year_min, year_max)
+			for group in groups:
+				assert len(group.albums) == min(3, group.count)
+				assert all(genre is None or a['genre'] == genre for a in group.albums)
+
+def test_encode_groups():
+	groups = [LocationGroup((51.5, -0.1), "London, UK", 40, [{'artist': 'A & B', 'label': '<X>', 'year': 2020, 'genre': 'Prog'}]),
+		LocationGroup((60.2, 24.9), "Helsinki, Finland", 1, [{'artist': 'C', 'year': None}])]
+	rows = json.loads(encode_groups(groups))
+	assert rows == [[51.5, -0.1, 40, "London, UK", [["A & B", "<X>", "2020", "Prog"]]],
+		[60.2, 24.9, 1, "Helsinki, Finland", [["C", "", "", ""]]]]
@@ -0,0 +1,21 @@
+import numpy as np
+from albumexplore.visualization.layout import MultiLevelLayout
+from .utils import community_graph
+
+def test_coarsen_builds_consistent_levels():
+	nodes, edges = community_graph(8, 50)
+	layout = MultiLevelLayout(nodes, edges)
+	layout.coarsen()
+	assert len(layout.levels) > 1
+	assert len(layout.sizes[-1]) <= MultiLevelLayout.COARSEST_SIZE
+	for level, parent in enumerate(layout.parents):
+		fine, coarse = layout.sizes[level], layout.sizes[level + 1]
+		assert len(parent) == len(fine) and parent.max() == len(coarse) - 1
+		# Super-nodes carry the total size of their members
+		assert np.allclose(np.bincount(parent, weights=fine), coarse)
+		sources, targets, weights = layout.levels[level + 1]
+		assert (sources < targets).all()
+		# Only edges inside a super-node are dropped
+		fine_sources, fine_targets, fine_weights = layout.levels[level]
+		internal = parent[fine_sources] == parent[fine_targets]
+		assert np.isclose(weights.sum(), fine_weights[~internal].sum())
@@ -0,0 +1,73 @@
+import pytest
+from albumexplore.tags.normalizer.normalization_cache import NormalizationCache, compute_rules_hash
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / "tag_rules.json"
+    path.write_text('{"compound_terms": {}}')
+    return path
+
+def test_entries_survive_reload(tmp_path, rules_file):
+    db_path = tmp_path / "cache.sqlite"
+    rules_hash = compute_rules_hash([rules_file])
+
+    cache = NormalizationCache(db_path, rules_hash)
+    cache.load()
+    cache.variants["prog metal"] = "progressive metal"
+    cache.atomic["prog metal"] = ["progressive", "metal"]
+    assert cache.save() == 2
+    assert cache.save() == 0  # nothing new to write
+
+    reloaded = NormalizationCache(db_path, rules_hash)
+    reloaded.load()
+    assert reloaded.variants == {"prog metal": "progressive metal"}
+    assert reloaded.atomic == {"prog metal": ["progressive", "metal"]}
+
+def test_rule_change_invalidates_cache(tmp_path, rules_file):
+    db_path = tmp_path / "cache.sqlite"
+    cache = NormalizationCache(db_path, compute_rules_hash([rules_file]))
+    cache.load()
+    cache.variants["prog metal"] = "progressive metal"
+    cache.save()
+
+    rules_file.write_text('{"compound_terms": {"prog": ["progg"]}}')
+    new_hash = compute_rules_hash([rules_file])
+    assert new_hash != cache.rules_hash
+
+    reloaded = NormalizationCache(db_path, new_hash)
+    reloaded.load()
+    assert reloaded.variants == {}
+
+    # The stale instance must not overwrite the rebuilt cache
+    cache.variants["tech death"] = "technical death metal"
+    assert cache.save() == 0
+
+def test_shared_normalizer_is_created_on_first_use(tmp_path):
+    from albumexplore.database import optimized_csv_loader  # noqa: F401
+    from albumexplore.tags.normalizer import normalization_cache, tag_normalizer
+    assert tag_normalizer._shared_normalizer is None
+    assert normalization_cache.default_cache_path() == tmp_path / "tag_normalization.sqlite"
+
+    normalizer = tag_normalizer.get_shared_normalizer()
+    assert normalizer._persistent_cache.path == tmp_path / "tag_normalization.sqlite"
+
+def test_instance_state_stays_out_of_shared_cache():
+    # conftest points the shared cache at the test's tmp_path
+    from albumexplore.tags.normalizer.tag_normalizer import TagNormalizer
+
+    private = TagNormalizer(persistent_cache=True)
+    private.add_variant("zzqq tag", "my private canon")
+    assert private.normalize_to_atomic("zzqq tag") == ["my private canon"]
+    inactive = TagNormalizer(persistent_cache=True)
+    inactive.set_active(False)
+    assert inactive.normalize_to_atomic("bluegras") == ["bluegras"]
+
+    other = TagNormalizer(persistent_cache=True)
+    assert other.normalize_to_atomic("zzqq tag") == ["zzqq tag"]
+    assert other.normalize_to_atomic("bluegras") == ["bluegrass"]
+
+    # Clearing one instance leaves the shared entries to the others
+    private.clear_cache()
+    private.clear_atomic_cache()
+    assert other._atomic_decomposition_cache["bluegras"] == ["bluegrass"]
+    assert other._variant_cache["bluegras"] == "bluegrass"
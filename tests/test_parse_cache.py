@@ -0,0 +1,60 @@
+import pytest
+from albumexplore.scraping.parse_cache import ParseCache
+
+@pytest.fixture
+def page(tmp_path):
+    path = tmp_path / "album1.html"
+    path.write_text("<html>v1</html>")
+    return path
+
+def test_hit_survives_new_instance(tmp_path, page):
+    db_path = tmp_path / "cache.sqlite"
+    cache = ParseCache(db_path, "1")
+    cache.put("album", page, {"title": "One"})
+    cache.close()
+
+    # Keys must not depend on the interpreter's randomized str hash
+    reopened = ParseCache(db_path, "1")
+    assert reopened.make_key("album", page) == cache.make_key("album", page)
+    assert reopened.get("album", page) == {"title": "One"}
+    assert reopened.get("artist", page) is None
+
+def test_changed_source_or_parser_version_misses(tmp_path, page):
+    db_path = tmp_path / "cache.sqlite"
+    reviews = tmp_path / "album-reviews1.html"
+    reviews.write_text("<html>reviews</html>")
+    cache = ParseCache(db_path, "1")
+    cache.put("album", page, {"title": "One"}, deps=[page, reviews])
+    assert cache.get("album", page) == {"title": "One"}
+
+    reviews.write_text("<html>more reviews</html>")
+    assert cache.get("album", page) is None
+
+    cache.put("album", page, {"title": "One"}, deps=[page, reviews])
+    assert ParseCache(db_path, "2").get("album", page) is None
+
+def test_lru_eviction(tmp_path):
+    cache = ParseCache(tmp_path / "cache.sqlite", "1", max_bytes=350)
+    pages = []
+    for i in range(4):
+        path = tmp_path / f"album{i}.html"
+        path.write_text("x")
+        pages.append(path)
+    cache.put("album", pages[0], {"text": "a" * 80})
+    cache.put("album", pages[1], {"text": "b" * 80})
+    cache.get("album", pages[0])  # pages[1] becomes least recently used
+    cache.put("album", pages[2], {"text": "c" * 80})
+    cache.put("album", pages[3], {"text": "d" * 80})
+
+    assert cache.get("album", pages[1]) is None
+    assert cache.get("album", pages[0]) == {"text": "a" * 80}
+    assert cache.stats()["bytes"] <= 350
+
+def test_missing_source_that_appears_misses(tmp_path, page):
+    cache = ParseCache(tmp_path / "cache.sqlite", "1")
+    review = tmp_path / "review1234.html"
+    cache.put("album", page, {"title": "One"}, deps=[page, review])
+    assert cache.get("album", page) == {"title": "One"}
+
+    review.write_text("<html>review</html>")
+    assert cache.get("album", page) is None
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from albumexplore.database import Base, models, queries
+from albumexplore.database.search import fts_query, search_album_ids, search_albums
+
+@pytest.fixture
+def session():
+	engine = create_engine("sqlite:///:memory:")
+	Base.metadata.create_all(engine)
+	session = sessionmaker(bind=engine)()
+	session.add_all([
+		models.Album(id="a1", title="Close to the Edge", pa_artist_name_on_album="Yes",
+		             genre="Symphonic Prog", raw_tags="symphonic prog; progressive rock"),
+		models.Album(id="a2", title="Moonmadness", pa_artist_name_on_album="Camel",
+		             genre="Symphonic Prog", raw_tags="symphonic prog"),
+		models.Album(id="a3", title="Blackwater Park", pa_artist_name_on_album="Opeth",
+		             genre="Progressive Metal", raw_tags="prog-metal; death metal"),
+	])
+	session.add(models.Review(id="r1", album_id="a2",
+	                          review_text="A dreamy record, the closest Camel came to the edge of jazz fusion."))
+	session.commit()
+	yield session
+	session.close()
+	engine.dispose()
+
+def ids(hits):
+	return [album_id for album_id, _ in hits]
+
+def test_fts_query():
+	assert fts_query('close "to the edge"') == '"close" "to the edge"'
+	assert fts_query('prog-metal prog*') == '"prog metal" "prog" *'
+	assert fts_query('yes OR NEAR(', prefix_last=True) == '"yes" "OR" "NEAR" *'
+	assert fts_query('  "" ') is None
+
+def test_ranked_phrase_and_prefix_search(session):
+	# The album title outranks a review that mentions the phrase
+	assert ids(search_album_ids(session, '"to the edge"')) == ["a1", "a2"]
+	assert ids(search_album_ids(session, "jazz fusion")) == ["a2"]
+	assert ids(search_album_ids(session, "moon*")) == ["a2"]
+	assert ids(search_album_ids(session, "moon")) == []
+	assert ids(search_album_ids(session, "prog-metal")) == ["a3"]
+	assert ids(search_album_ids(session, "edge", columns=("title",))) == ["a1"]
+	scores = [score for _, score in search_albums(session, "symphonic prog")]
+	assert len(scores) == 2 and all(score > 0 for score in scores)
+
+def test_index_follows_edits(session):
+	album = session.get(models.Album, "a3")
+	album.title = "Damnation"
+	session.add(models.Album(id="a4", title="Still Life", pa_artist_name_on_album="Opeth"))
+	session.delete(session.get(models.Review, "r1"))
+	session.commit()
+	assert ids(search_album_ids(session, "blackwater")) == []
+	assert ids(search_album_ids(session, "damnation")) == ["a3"]
+	assert sorted(ids(search_album_ids(session, "opeth"))) == ["a3", "a4"]
+	assert ids(search_album_ids(session, "fusion")) == []
+
+	session.delete(session.get(models.Album, "a4"))
+	session.commit()
+	assert ids(search_album_ids(session, "opeth")) == ["a3"]
+
+def test_queries_use_the_index(session):
+	assert [a.id for a in queries.search_albums(session, "cam")] == ["a2"]
+	assert sorted(a.id for a in queries.get_albums_by_genre(session, "symphonic")) == ["a1", "a2"]
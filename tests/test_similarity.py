@@ -0,0 +1,91 @@
+import random
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from albumexplore.database import Base, models
+from albumexplore.database.similarity import (
+    SimilarityEngine, WEIGHTS, calculate_album_similarity_optimized, get_similarity_engine
+)
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    rng = random.Random(5)
+    tags = [models.Tag(id=f"t{i}", name=f"tag {i}") for i in range(15)]
+    atomic = [models.AtomicTag(id=f"a{i}", name=f"atomic {i}") for i in range(8)]
+    session.add_all(tags + atomic)
+    for i in range(80):
+        album = models.Album(id=f"al{i:02d}", title=f"Album {i}", pa_artist_name_on_album=f"Artist {i % 7}",
+                             genre=rng.choice(["Prog Rock", "Prog Metal", None]),
+                             release_year=rng.choice([None, *range(1970, 2020)]),
+                             country=rng.choice(["Sweden", "UK", ""]))
+        album.tags = rng.sample(tags, rng.randint(0, 4))
+        album.atomic_tags = rng.sample(atomic, rng.randint(0, 3))
+        session.add(album)
+    session.commit()
+    yield session
+    session.close()
+
+def reference_scores(session, album_id):
+    """Pairwise scores computed directly from the ORM objects."""
+    target = session.get(models.Album, album_id)
+    tags = {t.id for t in target.tags}
+    atomic = {t.id for t in target.atomic_tags}
+    scores = {}
+    for other in session.query(models.Album).filter(models.Album.id != album_id):
+        other_tags, other_atomic = {t.id for t in other.tags}, {t.id for t in other.atomic_tags}
+        if tags and not tags & other_tags:
+            continue
+        jaccard = lambda a, b: len(a & b) / len(a | b) if a | b else 0.0
+        year = (max(0.0, 1 - abs(target.release_year - other.release_year) / 20)
+                if target.release_year and other.release_year else 0.0)
+        scores[other.id] = (jaccard(tags, other_tags) * WEIGHTS['composite_tags'] +
+                            jaccard(atomic, other_atomic) * WEIGHTS['atomic_tags'] +
+                            bool(target.genre and target.genre == other.genre) * WEIGHTS['genre'] +
+                            year * WEIGHTS['year'] +
+                            bool(target.country and target.country == other.country) * WEIGHTS['country'])
+    return scores
+
+def test_scores_match_reference(session):
+    engine = SimilarityEngine.from_session(session)
+    for album_id in ("al00", "al07", "al33", "al61"):
+        expected = {k: v for k, v in reference_scores(session, album_id).items() if v >= 0.2}
+        results = engine.similar(album_id, limit=100, min_similarity=0.2)
+        assert {a.id: pytest.approx(score) for a, score, _ in results} == expected
+        assert [score for _, score, _ in results] == sorted((s for _, s, _ in results), reverse=True)
+
+def test_top_k_persistence_gives_same_results(session, tmp_path):
+    engine = SimilarityEngine.from_session(session)
+    expected = {album.id: engine.similar(album.id, limit=5, min_similarity=0.1) for album in engine.albums}
+    engine.precompute_top_k(k=10, min_similarity=0.1)
+    engine.save_top_k(tmp_path / "top_k.npz")
+
+    reloaded = SimilarityEngine.from_session(session)
+    assert reloaded.load_top_k(tmp_path / "top_k.npz")
+    for album_id, results in expected.items():
+        assert reloaded.similar(album_id, limit=5, min_similarity=0.1) == results
+
+    album = session.get(models.Album, "al00")
+    album.tags.append(models.Tag(id="t99", name="new tag"))
+    session.commit()
+    assert not SimilarityEngine.from_session(session).load_top_k(tmp_path / "top_k.npz")
+
+def test_orm_wrapper_and_engine_cache(session):
+    engine = get_similarity_engine(session)
+    assert get_similarity_engine(session) is engine
+    results = calculate_album_similarity_optimized(session, "al07", limit=3, min_similarity=0.0)
+    assert [a.id for a, _, _ in results] == [a.id for a, _, _ in engine.similar("al07", 3, 0.0)]
+    assert all(isinstance(a, models.Album) for a, _, _ in results)
+
+    session.add(models.Album(id="zz", title="New"))
+    session.commit()
+    assert get_similarity_engine(session) is not engine
+
+def test_top_k_default_path_is_in_cache_dir(session, tmp_path):
+    engine = SimilarityEngine.from_session(session)
+    engine.precompute_top_k(k=5, min_similarity=0.1)
+    engine.save_top_k()
+    assert (tmp_path / "similarity_top_k.npz").exists()
+    assert SimilarityEngine.from_session(session).load_top_k()
@@ -0,0 +1,47 @@
+import os
+import pandas as pd
+import pytest
+from albumexplore.data.parsers import CSVParser
+from albumexplore.data.parsers.snapshot_cache import ParsedCSVCache, SNAPSHOT_VERSION
+
+pytest.importorskip("pyarrow")
+
+CSV_CONTENT = '''Artist,Album,Release Date,Length,Genre / Subgenres,Vocal Style,Country / State,Bandcamp,Spotify,YouTube,Amazon,Apple Music
+Test Band,Test Album,2025-01-01,LP,Progressive Metal | unique-tag,Clean,US,BC,S,,,
+Another Band,Second Album,2025-01-02,EP,"Black metal, Death metal",Harsh,"London, UK",BC,S,,,
+'''
+
+@pytest.fixture
+def csv_file(tmp_path):
+	path = tmp_path / "albums.csv"
+	path.write_text(CSV_CONTENT)
+	return path
+
+def test_snapshot_round_trip(tmp_path, csv_file):
+	cache = ParsedCSVCache(tmp_path / "snapshots", "1")
+	parsed = CSVParser(csv_file, cache).parse_single_csv(csv_file)
+	assert cache.misses == 1 and cache.hits == 0
+
+	cached = CSVParser(csv_file, cache).parse_single_csv(csv_file)
+	assert cache.hits == 1
+	pd.testing.assert_frame_equal(cached, parsed)
+	assert isinstance(cached['tags'].iloc[0], list)
+
+def test_changed_source_or_version_misses(tmp_path, csv_file):
+	snapshots = tmp_path / "snapshots"
+	cache = ParsedCSVCache(snapshots, "1")
+	CSVParser(csv_file, cache).parse_single_csv(csv_file)
+	assert ParsedCSVCache(snapshots, "2").get(csv_file) is None
+
+	csv_file.write_text(CSV_CONTENT + "Third Band,Third Album,2025-02-01,LP,Djent,Clean,US,,,,,\n")
+	st = os.stat(csv_file)
+	os.utime(csv_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+	assert cache.get(csv_file) is None
+	assert len(CSVParser(csv_file, cache).parse_single_csv(csv_file)) == 3
+	# The snapshot of the previous version is replaced, not kept alongside
+	assert len(list(snapshots.glob("*.parquet"))) == 1
+
+def test_default_dir_and_version(tmp_path):
+	cache = ParsedCSVCache()
+	assert cache.cache_dir == tmp_path / "csv_snapshots"
+	assert cache.version == SNAPSHOT_VERSION
@@ -0,0 +1,113 @@
+import os
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from albumexplore.database import Base, models
+from albumexplore.database.source_manifest import SourceManifest, ingest_sources
+
+@pytest.fixture
+def session(tmp_path):
+	engine = create_engine(f"sqlite:///{tmp_path / 'albums.db'}")
+	Base.metadata.create_all(engine)
+	session = sessionmaker(bind=engine)()
+	yield session
+	session.close()
+	engine.dispose()
+
+def write_csv(path, albums):
+	path.write_text("Artist,Album,Genre / Subgenres\n" + "".join(f"{a},{b},Progressive Rock\n" for a, b in albums))
+	return path
+
+def parsed(*files):
+	"""Rows as the data loader produces them."""
+	frames = []
+	for path in files:
+		df = pd.read_csv(path)
+		df['_source_file'] = path.name
+		frames.append(df)
+	return pd.concat(frames, ignore_index=True)
+
+def titles(session):
+	return sorted(session.query(models.Album.source_file, models.Album.title).all())
+
+def test_only_new_or_changed_files_are_ingested(session, tmp_path):
+	a = write_csv(tmp_path / "2023.csv", [("Yes", "Fragile"), ("Camel", "Moonmadness")])
+	b = write_csv(tmp_path / "2024.csv", [("Genesis", "Foxtrot")])
+	manifest = SourceManifest(session)
+	assert manifest.pending([a, b]) == [a, b]
+
+	ingest_sources(session, parsed(a, b), [a, b])
+	assert titles(session) == [("2023.csv", "Fragile"), ("2023.csv", "Moonmadness"), ("2024.csv", "Foxtrot")]
+	assert {e.album_count for e in manifest.entries().values()} == {1, 2}
+	assert manifest.pending([a, b]) == []
+
+	# A touched but unchanged file is recognised by its hash
+	st = a.stat()
+	os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+	assert manifest.pending([a, b]) == []
+	assert manifest.entries()[str(a.resolve())].mtime_ns == a.stat().st_mtime_ns
+
+	# A changed file replaces its albums; a new file is added
+	write_csv(a, [("Yes", "Close to the Edge"), ("Camel", "Moonmadness")])
+	c = write_csv(tmp_path / "2025.csv", [("Opeth", "Damnation")])
+	pending = manifest.pending([a, b, c])
+	assert pending == [a, c]
+	ingest_sources(session, parsed(*pending), pending)
+	assert titles(session) == [("2023.csv", "Close to the Edge"), ("2023.csv", "Moonmadness"),
+	                           ("2024.csv", "Foxtrot"), ("2025.csv", "Damnation")]
+	assert manifest.pending([a, b, c]) == []
+	# The replaced album's tag links went with it
+	linked = {album_id for album_id, in session.query(models.album_tags.c.album_id)}
+	assert linked == {album.id for album in session.query(models.Album)}
+
+def test_same_named_files_keep_their_own_albums(session, tmp_path):
+	(tmp_path / "old").mkdir()
+	(tmp_path / "new").mkdir()
+	a = write_csv(tmp_path / "old" / "2023.csv", [("Yes", "Fragile")])
+	b = write_csv(tmp_path / "new" / "2023.csv", [("Genesis", "Foxtrot")])
+	ingest_sources(session, parsed(a), [a])
+	ingest_sources(session, parsed(b), [b])
+	write_csv(a, [("Yes", "Relayer")])
+	ingest_sources(session, parsed(a), [a])
+	assert sorted(session.query(models.Album.source_path, models.Album.title).all()) == [
+		(str(b.resolve()), "Foxtrot"), (str(a.resolve()), "Relayer")]
+	assert SourceManifest(session).album_counts([a, b]) == {str(a.resolve()): 1, str(b.resolve()): 1}
+
+def test_excluded_files_stay_out_until_loaded(session, tmp_path):
+	a = write_csv(tmp_path / "2023.csv", [("Yes", "Fragile")])
+	b = write_csv(tmp_path / "2024.csv", [("Genesis", "Foxtrot")])
+	ingest_sources(session, parsed(a), [a], excluded=[b])
+	manifest = SourceManifest(session)
+	c = write_csv(tmp_path / "2025.csv", [("Opeth", "Damnation")])
+	os.utime(c, ns=(0, 0))  # Older than the last ingest, still new
+	assert manifest.pending([a, b, c]) == [c]
+	# Leaving out an ingested file removes its albums and excludes it
+	ingest_sources(session, parsed(b), [b], excluded=[a])
+	assert titles(session) == [("2024.csv", "Foxtrot")]
+	assert manifest.excluded() == {str(a.resolve())}
+	assert set(manifest.entries()) == {str(b.resolve())}
+	write_csv(a, [("Yes", "Relayer")])
+	assert manifest.pending([a, b, c]) == [c]
+
+	ingest_sources(session, parsed(a), [a])
+	assert manifest.excluded() == set()
+	assert titles(session) == [("2023.csv", "Relayer"), ("2024.csv", "Foxtrot")]
+
+def test_older_databases_get_source_paths(tmp_path):
+	engine = create_engine(f"sqlite:///{tmp_path / 'albums.db'}")
+	Base.metadata.create_all(engine)
+	with engine.begin() as conn:
+		conn.exec_driver_sql("DROP INDEX ix_albums_source_path")
+		conn.exec_driver_sql("ALTER TABLE albums DROP COLUMN source_path")
+		for path in ("/a/2023.csv", "/b/2023.csv", "/a/2024.csv"):
+			conn.exec_driver_sql(
+				"INSERT INTO source_files (path, size, mtime_ns, content_hash) VALUES (?, 0, 0, '')", (path,))
+		for album_id, name in (("x", "2023.csv"), ("y", "2024.csv")):
+			conn.exec_driver_sql("INSERT INTO albums (id, title, source_file) VALUES (?, ?, ?)", (album_id, album_id, name))
+	Base.metadata.create_all(engine)
+	session = sessionmaker(bind=engine)()
+	# An ambiguous name is left without a path
+	assert sorted(session.query(models.Album.id, models.Album.source_path).all()) == [("x", None), ("y", "/a/2024.csv")]
+	session.close()
+	engine.dispose()
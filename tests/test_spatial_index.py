@@ -0,0 +1,98 @@
+import numpy as np
+from albumexplore.visualization.spatial_index import SpatialIndex
+from albumexplore.visualization.cluster_engine import ClusterEngine
+from albumexplore.visualization.models import VisualNode, VisualEdge
+from albumexplore.visualization.optimizations import ViewOptimizer, Viewport
+from albumexplore.visualization.state import ViewType
+
+def make_nodes(n, seed=0):
+	rng = np.random.default_rng(seed)
+	nodes = []
+	for i, (x, y) in enumerate(rng.uniform(-1000, 1000, (n, 2)).tolist()):
+		nodes.append(VisualNode(id=f"n{i}", label=f"n{i}", pos={'x': x, 'y': y}))
+	return nodes
+
+def brute_force(nodes, x0, y0, x1, y1):
+	return [n for n in nodes if x0 <= n.pos['x'] <= x1 and y0 <= n.pos['y'] <= y1]
+
+def test_query_matches_linear_scan_after_moves():
+	nodes = make_nodes(2000)
+	index = SpatialIndex(cell_size=50)
+	index.build_nodes(nodes)
+	rng = np.random.default_rng(1)
+	for node in nodes[::3]:
+		node.pos['x'] += rng.uniform(-300, 300)
+		node.pos['y'] += rng.uniform(-300, 300)
+		index.update_node(node)
+	index.remove(nodes[0].id)
+	expected = [n for n in brute_force(nodes[1:], -200, -100, 300, 250)]
+	assert index.query(-200, -100, 300, 250) == expected
+	# A query wider than the occupied grid walks the occupied cells
+	assert len(index.query(-1e6, -1e6, 1e6, 1e6)) == len(nodes) - 1
+
+def test_edges_are_found_by_bounding_box():
+	edges = [
+		VisualEdge(source="a", target="b", data={'source_x': -5000, 'source_y': 0, 'target_x': 5000, 'target_y': 10}),
+		VisualEdge(source="c", target="d", data={'source_x': 0, 'source_y': 0, 'target_x': 40, 'target_y': 40}),
+		VisualEdge(source="e", target="f", data={'source_x': 900, 'source_y': 900, 'target_x': 950, 'target_y': 950}),
+	]
+	index = SpatialIndex(cell_size=50)
+	index.build_edges(edges)
+	assert index.query(10, -20, 20, 20) == edges[:2]
+	assert index.query(890, 890, 1000, 1000) == edges[2:]
+
+def test_hit_test_returns_nearest_node_under_point():
+	nodes = [VisualNode(id="a", label="a", size=10, pos={'x': 0.0, 'y': 0.0}),
+			 VisualNode(id="b", label="b", size=10, pos={'x': 8.0, 'y': 0.0})]
+	index = SpatialIndex(cell_size=5)
+	index.build_nodes(nodes)
+	assert index.hit_test(6.0, 0.0).id == "b"
+	assert index.hit_test(1.0, 0.0).id == "a"
+	assert index.hit_test(100.0, 0.0) is None
+
+def test_clusters_group_nearby_nodes_when_zoomed_out():
+	nodes = []
+	for c, (cx, cy) in enumerate([(0, 0), (1000, 0), (0, 1000)]):
+		for i in range(5):
+			nodes.append(VisualNode(id=f"c{c}_{i}", label="", pos={'x': cx + i * 3.0, 'y': cy}))
+	engine = ClusterEngine()
+	assert engine.update_clusters(nodes, scale=1.0) == {}
+	clusters = engine.update_clusters(nodes, scale=0.25)
+	assert sorted(len(c.nodes) for c in clusters.values()) == [5, 5, 5]
+	for cluster in clusters.values():
+		assert len({n.id.split('_')[0] for n in cluster.nodes}) == 1
+
+def test_optimizer_follows_nodes_moved_in_place():
+	nodes = make_nodes(500)
+	edges = [VisualEdge(source=a.id, target=b.id) for a, b in zip(nodes[::2], nodes[1::2])]
+	optimizer = ViewOptimizer()
+	viewport = Viewport(x=-100, y=-100, width=200, height=200, zoom=1.0)
+	margin = 50
+	optimizer.optimize_nodes(nodes, viewport)
+	optimizer.optimize_edges(edges, viewport, ViewType.ARC)
+
+	# A layout step moves nodes inside the same list
+	nodes[0].pos = {'x': 0.0, 'y': 0.0}
+	nodes[1].pos = {'x': 5000.0, 'y': 5000.0}
+	for node in nodes[2:200]:
+		node.pos['x'] += 400
+	visible = optimizer.optimize_nodes(nodes, viewport)
+	assert visible == brute_force(nodes, -100 - margin, -100 - margin, 100 + margin, 100 + margin)
+	# The edge stretched out to the moved endpoint is still found
+	assert (edges[0].source, edges[0].target) in {(e.source, e.target) for e in optimizer.optimize_edges(edges, viewport, ViewType.ARC)}
+
+	# With an unchanged positions version the re-read is skipped until the version changes
+	optimizer.optimize_nodes(nodes, viewport, positions_version=1)
+	nodes[0].pos = {'x': 9000.0, 'y': 9000.0}
+	assert nodes[0] in optimizer.optimize_nodes(nodes, viewport, positions_version=1)
+	assert nodes[0] not in optimizer.optimize_nodes(nodes, viewport, positions_version=2)
+
+def test_clusters_use_shared_index_at_current_positions():
+	nodes = [VisualNode(id=f"n{i}", label="", pos={'x': i * 3.0, 'y': 0.0}) for i in range(4)]
+	others = [VisualNode(id=f"o{i}", label="", pos={'x': 1.0, 'y': 1.0}) for i in range(3)]
+	index = SpatialIndex()
+	index.build_nodes(nodes + others)
+	engine = ClusterEngine(index)
+	nodes[3].pos = {'x': 5000.0, 'y': 0.0}
+	clusters = engine.update_clusters(nodes, scale=0.25)
+	assert [sorted(n.id for n in c.nodes) for c in clusters.values()] == [["n0", "n1", "n2"]]
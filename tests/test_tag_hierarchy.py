@@ -102,4 +102,85 @@ def test_get_tag_children(session, create_tag):
     children = get_tag_children(session, root.id)
     assert len(children) == 2
     children_ids = {tag.id for tag in children}
-    assert children_ids == {'prog-metal', 'death-metal'}
\ No newline at end of file
+    assert children_ids == {'prog-metal', 'death-metal'}
+def closure(session):
+    return {(a, d): depth for a, d, depth in session.query(
+        models.tag_closure.c.ancestor_id, models.tag_closure.c.descendant_id, models.tag_closure.c.depth)}
+
+def test_closure_follows_links(session, create_tag):
+    # metal -> prog-metal -> djent, metal -> djent directly, and rock -> prog-metal
+    for tag_id in ('metal', 'rock', 'prog-metal', 'djent'):
+        create_tag({'id': tag_id, 'name': tag_id})
+    add_parent_tag(session, 'prog-metal', 'metal')
+    add_parent_tag(session, 'djent', 'prog-metal')
+    add_parent_tag(session, 'prog-metal', 'rock')
+    assert closure(session) == {('metal', 'prog-metal'): 1, ('metal', 'djent'): 2, ('prog-metal', 'djent'): 1,
+                                ('rock', 'prog-metal'): 1, ('rock', 'djent'): 2}
+
+    # A shorter path lowers the depth, and links that would close a cycle are refused
+    add_parent_tag(session, 'djent', 'metal')
+    assert closure(session)[('metal', 'djent')] == 1
+    assert add_parent_tag(session, 'metal', 'djent') is False
+    assert add_parent_tag(session, 'metal', 'metal') is False
+
+    assert [t.id for t in get_inherited_tags(session, 'djent')] == ['metal', 'prog-metal', 'rock']
+    assert [t.id for t in get_inherited_tags(session, 'djent', depth=1)] == ['metal', 'prog-metal']
+    assert [t.id for t in get_tag_children(session, 'rock', depth=1)] == ['prog-metal']
+
+    # Removing a link keeps pairs that still have another path
+    remove_parent_tag(session, 'prog-metal', 'metal')
+    assert closure(session) == {('metal', 'djent'): 1, ('prog-metal', 'djent'): 1,
+                                ('rock', 'prog-metal'): 1, ('rock', 'djent'): 2}
+    remove_parent_tag(session, 'djent', 'prog-metal')
+    assert closure(session) == {('metal', 'djent'): 1, ('rock', 'prog-metal'): 1}
+
+    # The incremental updates agree with a rebuild from the links
+    from albumexplore.database.tag_closure import rebuild_tag_closure
+    before = closure(session)
+    rebuild_tag_closure(session.connection())
+    assert closure(session) == before
+
+def test_include_subgenres_filter(session, create_tag):
+    from albumexplore.tags.filters.tag_filter import TagFilter
+    for tag_id in ('metal', 'prog-metal', 'djent', 'jazz'):
+        create_tag({'id': tag_id, 'name': tag_id})
+    add_parent_tag(session, 'prog-metal', 'metal')
+    add_parent_tag(session, 'djent', 'prog-metal')
+    tags = {t.id: t for t in session.query(models.Tag)}
+    for album_id, tag_ids in (('a1', ['metal']), ('a2', ['djent']), ('a3', ['jazz']), ('a4', ['djent', 'jazz'])):
+        session.add(models.Album(id=album_id, title=album_id, tags=[tags[t] for t in tag_ids]))
+    session.commit()
+
+    tag_filter = TagFilter(session)
+    assert sorted(a.id for a in tag_filter.filter_albums_by_tags(['metal'])) == ['a1']
+    assert sorted(a.id for a in tag_filter.filter_albums_by_tags(['metal'], include_subgenres=True)) == ['a1', 'a2', 'a4']
+    assert sorted(a.id for a in tag_filter.filter_albums_by_tags(
+        ['metal', 'jazz'], match_all=True, include_subgenres=True)) == ['a4']
+    assert sorted(a.id for a in tag_filter.filter_by_multiple_criteria(
+        {'tags': ['prog-metal'], 'include_subgenres': True})) == ['a2', 'a4']
+
+def test_merging_tags_drops_their_closure_paths(session, create_tag, monkeypatch):
+    from albumexplore.database import tag_migration
+    from albumexplore.database.tag_consolidation import TagConsolidator
+    # metal -> prog metal -> djent, with a duplicate "prog-metal" holding the albums
+    for tag_id, name in (('metal', 'metal'), ('prog', 'prog metal'), ('prog2', 'prog-metal'), ('djent', 'djent')):
+        create_tag({'id': tag_id, 'name': name})
+    add_parent_tag(session, 'prog', 'metal')
+    add_parent_tag(session, 'djent', 'prog')
+    session.add(models.Album(id='a1', title='A', tags=[session.get(models.Tag, 'prog2')]))
+    session.commit()
+    assert ('metal', 'djent') in closure(session)
+
+    tags = [session.get(models.Tag, 'prog'), session.get(models.Tag, 'prog2')]
+    TagConsolidator(session)._merge_tag_group('progressive metal', tags)
+    assert closure(session) == {}
+    assert get_inherited_tags(session, 'djent') == []
+
+    # The one-time migration merges the same way
+    add_parent_tag(session, 'djent', 'metal')
+    create_tag({'id': 'djent2', 'name': 'Djent'})
+    session.add(models.Album(id='a2', title='B', tags=[session.get(models.Tag, 'djent2')]))
+    session.commit()
+    monkeypatch.setattr(tag_migration, 'get_session', lambda: session)
+    tag_migration.TagMigrationManager()._consolidate_duplicate_tags()
+    assert closure(session) == {}
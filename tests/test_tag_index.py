@@ -0,0 +1,88 @@
+import random
+import pytest
+from albumexplore.tags.filters import (
+    TagFilterGroup, TagFilterState, TagPostingIndex, IncrementalTagFilter, GroupOperator, FilterOperator
+)
+
+TAGS = [f"tag{i}" for i in range(12)]
+
+@pytest.fixture
+def albums():
+    rng = random.Random(7)
+    return [{'id': i, 'tags': set(rng.sample(TAGS, rng.randint(0, 4)))} for i in range(300)]
+
+def build_index(albums):
+    tag_to_nodes = {}
+    for album in albums:
+        for tag in album['tags']:
+            tag_to_nodes.setdefault(tag, []).append(album)
+    # Duplicate postings and unknown nodes must not affect results
+    tag_to_nodes['tag0'].append(tag_to_nodes['tag0'][0])
+    tag_to_nodes.setdefault('tag1', []).append({'id': -1, 'tags': {'tag1'}})
+    return TagPostingIndex.from_nodes(albums, tag_to_nodes)
+
+def brute_force(albums, include, exclude, state):
+    out = []
+    for album in albums:
+        tags = album['tags']
+        if include and not include & tags:
+            continue
+        if exclude & tags:
+            continue
+        if state is not None and not state.matches(tags):
+            continue
+        out.append(album)
+    return out
+
+@pytest.mark.parametrize("group_operator", [FilterOperator.AND, FilterOperator.OR])
+def test_evaluate_matches_brute_force(albums, group_operator):
+    index = build_index(albums)
+    state = TagFilterState(groups=[
+        TagFilterGroup(group_id="1", tags={'tag2', 'tag3'}, operator=GroupOperator.OR),
+        TagFilterGroup(group_id="2", tags={'tag4', 'tag5'}, operator=GroupOperator.AND),
+        TagFilterGroup(group_id="3", tags={'tag6'}, operator=GroupOperator.AND, enabled=False),
+    ], group_operator=group_operator)
+
+    for include, exclude, panel in [(set(), set(), None), ({'tag0', 'tag1'}, {'tag7'}, None),
+                                    (set(), {'tag8'}, state), ({'tag3'}, set(), state)]:
+        mask = index.evaluate(include, exclude, panel)
+        expected = brute_force(albums, include, exclude, panel)
+        assert index.albums_for(mask) == expected
+        counts = index.matching_counts(mask)
+        for tag in TAGS:
+            assert counts[tag] == sum(1 for a in expected if tag in a['tags'])
+
+def test_unknown_tags_and_inactive_state(albums):
+    index = build_index(albums)
+    assert not index.evaluate({'missing'}).any()
+    state = TagFilterState(groups=[TagFilterGroup(group_id="1", tags={'missing'})], active=False)
+    assert index.evaluate(filter_state=state).all()
+    assert index.all_of(['tag0', 'missing']).sum() == 0
+
+def test_incremental_updates_match_full_evaluation(albums):
+    index = build_index(albums)
+    evaluator = IncrementalTagFilter(index)
+    group = TagFilterGroup(group_id="1", tags={'tag2'}, operator=GroupOperator.AND)
+    state = TagFilterState(groups=[group])
+    steps = [({'tag0'}, set(), None), ({'tag0', 'tag1'}, set(), None), ({'tag0', 'tag1'}, {'tag7'}, None),
+             (set(), set(), state), (set(), {'tag9'}, state), ({'tag0'}, set(), None), (set(), set(), None)]
+
+    previous = set(range(len(albums)))
+    for step, (include, exclude, panel) in enumerate(steps):
+        if step == 4:
+            group.tags.add('tag3')  # AND group narrows from its cached mask
+        delta = evaluator.update(include, exclude, panel)
+        expected = brute_force(albums, include, exclude, panel)
+        current = {album['id'] for album in expected}
+
+        assert evaluator.albums() == expected
+        assert set(delta.entered.tolist()) == current - previous
+        assert set(delta.left.tolist()) == previous - current
+        counts = evaluator.matching_counts()
+        for tag in TAGS:
+            assert counts[tag] == sum(1 for a in expected if tag in a['tags'])
+        for tag, count in delta.changed_counts.items():
+            assert counts[tag] == count
+        previous = current
+
+    assert evaluator.update().is_empty()
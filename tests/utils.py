@@ -2,10 +2,13 @@
 import os
 import json
 import logging
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Any
 
+from albumexplore.visualization.models import VisualNode, VisualEdge
+
 # Configure logging for tests
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -175,4 +178,16 @@ def clear_test_data() -> None:
     session = get_session()
     session.query(Album).delete()
     session.query(Tag).delete()
-    session.commit()
\ No newline at end of file
+    session.commit()
+
+def community_graph(communities: int = 4, size: int = 25, seed: int = 0):
+    """Albums in communities; each album links to three others in its own community."""
+    rng = np.random.default_rng(seed)
+    nodes = [VisualNode(id=f"n{i}", label=f"n{i}") for i in range(communities * size)]
+    edges = []
+    for c in range(communities):
+        members = np.arange(c * size, (c + 1) * size)
+        for i in members:
+            for j in rng.choice(members[members != i], 3, replace=False):
+                edges.append(VisualEdge(source=f"n{i}", target=f"n{j}"))
+    return nodes, edges